@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark: AST Optimization Pipeline
+
+Parses a set of guest programs, runs each through the default optimization
+pipeline, and interprets both the original and the optimized AST. It reports
+the pipeline time, the rewrites per pass and the interpreter time before and
+after. Both runs must print the same output.
+
+The programs include nested functions that read and assign their enclosing
+function's locals, which calls must not be propagated or dead-stored across.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_ast_optimizer.py
+    PYTHONPATH=src python benchmarks/bench_ast_optimizer.py --loop 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import io
+import sys
+import time
+from typing import Any, Dict, Tuple
+
+from parsercraft.ast_optimizer import OptimizationPipeline
+from parsercraft.interpreter import ASTInterpreter
+from parsercraft.language_config import LanguageConfig
+from parsercraft.parser_generator import ParserGenerator
+
+PROGRAMS: Dict[str, str] = {
+    "straight_line": """
+function scaled(n) {
+    width = 8
+    height = width * 4
+    area = width * height
+    unused = area + 1
+    i = 0
+    total = 0
+    while i < n {
+        total = total + area
+        i = i + 1
+    }
+    return total
+}
+
+print(scaled(LOOP_N))
+""",
+    "nested_writes": """
+function counter(n) {
+    count = 1
+    function bump() {
+        count = count + 2
+    }
+    i = 0
+    while i < n {
+        bump()
+        i = i + 1
+    }
+    bump()
+    return count
+}
+
+function overwrite() {
+    x = 1
+    function set_two() {
+        x = 2
+    }
+    set_two()
+    return x
+}
+
+print(counter(LOOP_N), overwrite())
+""",
+    "nested_reads": """
+function shown() {
+    y = 1
+    function show() {
+        print(y)
+    }
+    y = 5
+    show()
+    y = 7
+    return y
+}
+
+print(shown())
+""",
+}
+
+
+def interpret(config: LanguageConfig, ast: Any) -> Tuple[str, float]:
+    output = io.StringIO()
+    start = time.perf_counter()
+    ASTInterpreter(config, output=output).run(ast)
+    return output.getvalue(), time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="AST optimizer benchmark")
+    parser.add_argument("--loop", type=int, default=20_000, help="Loop iterations per program")
+    args = parser.parse_args()
+
+    config = LanguageConfig()
+    pipeline = OptimizationPipeline(config)
+
+    print(f"AST optimizer: {len(PROGRAMS)} programs, {args.loop} loop iterations")
+    print("=" * 72)
+    print(f"  {'program':<16} {'rewrites':>8} {'optimize':>10} {'before':>10} {'after':>10}")
+    failures = 0
+    for name, source in PROGRAMS.items():
+        _, ast = ParserGenerator(config).parse(source.replace("LOOP_N", str(args.loop)))
+        optimized = copy.deepcopy(ast)
+        report = pipeline.run(optimized)
+
+        expected, before = interpret(config, ast)
+        actual, after = interpret(config, optimized)
+        rewrites = sum(stats.rewrites for stats in report.passes.values())
+        print(
+            f"  {name:<16} {rewrites:>8} {report.seconds * 1000:>8.2f}ms"
+            f" {before * 1000:>8.2f}ms {after * 1000:>8.2f}ms"
+        )
+        if actual != expected:
+            print(f"    outputs differ: {expected.strip()!r} before, {actual.strip()!r} after")
+            failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
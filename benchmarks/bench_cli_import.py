@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CLI Entry-Point Import Time
+
+Runs ``python -X importtime`` on the ``parsercraft`` entry point, parses the
+per-module timings and fails when startup regresses.
+
+Two budgets are checked:
+    - Forbidden modules: subsystems that must stay lazily imported
+      (configuration, runtime, YAML, readline, LSP, codegen, ...)
+    - Time budget: median cumulative import time of ``parsercraft.cli``
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_cli_import.py
+    PYTHONPATH=src python benchmarks/bench_cli_import.py --budget-ms 40 --runs 9
+    PYTHONPATH=src python benchmarks/bench_cli_import.py --top 15
+
+Exit status is 0 when within budget, 1 otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+ENTRY_MODULE = "parsercraft.cli"
+
+# Modules the CLI must not import until a subcommand needs them
+FORBIDDEN_MODULES = (
+    "parsercraft.language_config",
+    "parsercraft.language_runtime",
+    "parsercraft.lsp_server",
+    "parsercraft.codegen_c",
+    "parsercraft.codegen_wasm",
+    "parsercraft.type_system",
+    "parsercraft.module_system",
+    "parsercraft.package_registry",
+    "yaml",
+    "readline",
+    "subprocess",
+)
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output (times in microseconds)."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> Dict[str, ImportRecord]:
+    """Parse ``-X importtime`` output into records keyed by module name."""
+    records: Dict[str, ImportRecord] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].strip()
+        records[name] = ImportRecord(
+            name=name,
+            self_us=int(fields[0]),
+            cumulative_us=int(fields[1]),
+        )
+    return records
+
+
+def measure(python: str, module: str) -> Dict[str, ImportRecord]:
+    """Import ``module`` in a fresh interpreter and return its timings."""
+    src_dir = Path(__file__).resolve().parent.parent / "src"
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(src_dir), env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CLI import-time benchmark")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=60.0,
+        help="Maximum median cumulative import time of the CLI (default: 60)",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=7, help="Interpreter runs (default: 7)"
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="Show the N slowest modules"
+    )
+    parser.add_argument(
+        "--python", default=sys.executable, help="Interpreter to benchmark"
+    )
+    args = parser.parse_args()
+
+    # Warm-up run so bytecode caches are written before timing
+    measure(args.python, ENTRY_MODULE)
+
+    runs: List[Dict[str, ImportRecord]] = [
+        measure(args.python, ENTRY_MODULE) for _ in range(args.runs)
+    ]
+    totals_ms = [run[ENTRY_MODULE].cumulative_us / 1000 for run in runs]
+    median_ms = statistics.median(totals_ms)
+
+    print(f"Import time: {ENTRY_MODULE}")
+    print("=" * 70)
+    print(f"  Runs:   {args.runs}")
+    print(f"  Median: {median_ms:.1f} ms (min {min(totals_ms):.1f}, "
+          f"max {max(totals_ms):.1f})")
+    print(f"  Budget: {args.budget_ms:.1f} ms")
+
+    last = runs[-1]
+    slowest = sorted(last.values(), key=lambda r: r.self_us, reverse=True)
+    print("\nSlowest modules (self time, last run):")
+    for record in slowest[: args.top]:
+        print(f"  {record.self_us / 1000:8.2f} ms  {record.name}")
+
+    failures = []
+    leaked = [name for name in FORBIDDEN_MODULES if name in last]
+    if leaked:
+        failures.append(f"eagerly imported: {', '.join(leaked)}")
+    if median_ms > args.budget_ms:
+        failures.append(
+            f"median {median_ms:.1f} ms exceeds budget {args.budget_ms:.1f} ms"
+        )
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f"✗ {failure}")
+        return 1
+
+    print("✓ Within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
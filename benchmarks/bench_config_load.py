@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Configuration Loading
+
+Loads every config in ``configs/examples`` three ways and reports the mean
+time per file:
+
+    pure      yaml.SafeLoader / json + from_dict   (the old load path)
+    cloader   LanguageConfig.load(use_cache=False) (libyaml when available)
+    cached    LanguageConfig.load() with a warm sidecar cache
+
+Files that cannot be loaded by ``LanguageConfig.from_dict`` are listed and
+skipped. The sidecar cache is written to a temporary directory.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_config_load.py
+    PYTHONPATH=src python benchmarks/bench_config_load.py --repeat 50
+    PYTHONPATH=src python benchmarks/bench_config_load.py --dir configs
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import yaml
+
+from parsercraft.config_cache import CACHE_DIR_ENV
+from parsercraft.language_config import LanguageConfig
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_pure(path: Path) -> LanguageConfig:
+    """Load the way ``LanguageConfig.load`` did before the cache."""
+    with open(path, "r", encoding="utf-8") as handle:
+        if path.suffix in (".yaml", ".yml"):
+            data = yaml.load(handle, Loader=yaml.SafeLoader)
+        else:
+            data = json.load(handle)
+    return LanguageConfig.from_dict(data)
+
+
+def load_uncached(path: Path) -> LanguageConfig:
+    return LanguageConfig.load(path, use_cache=False)
+
+
+def load_cached(path: Path) -> LanguageConfig:
+    return LanguageConfig.load(path)
+
+
+def time_per_call(func: Callable[[Path], object], path: Path, repeat: int) -> float:
+    """Mean seconds per call of ``func(path)``."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(path)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Config loading benchmark")
+    parser.add_argument(
+        "--dir",
+        default=str(ROOT / "configs" / "examples"),
+        help="Directory of configs (default: configs/examples)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="Loads per file and method"
+    )
+    args = parser.parse_args()
+
+    files = sorted(
+        p
+        for p in Path(args.dir).iterdir()
+        if p.suffix in (".yaml", ".yml", ".json")
+    )
+
+    methods: Dict[str, Callable[[Path], object]] = {
+        "pure": load_pure,
+        "cloader": load_uncached,
+        "cached": load_cached,
+    }
+
+    print(f"Config loading: {args.dir}")
+    print(f"  libyaml: {'yes' if hasattr(yaml, 'CSafeLoader') else 'no'}")
+    print("=" * 70)
+    print(f"{'file':32} {'pure':>10} {'cloader':>10} {'cached':>10} {'speedup':>8}")
+
+    totals = {name: 0.0 for name in methods}
+    skipped: List[str] = []
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ[CACHE_DIR_ENV] = cache_dir
+
+        for path in files:
+            try:
+                load_cached(path)  # validate + warm the cache
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                skipped.append(f"{path.name}: {type(error).__name__}: {error}")
+                continue
+
+            timings = {
+                name: time_per_call(func, path, args.repeat)
+                for name, func in methods.items()
+            }
+            for name, seconds in timings.items():
+                totals[name] += seconds
+
+            speedup = timings["pure"] / timings["cached"]
+            print(
+                f"{path.name:32} "
+                f"{timings['pure'] * 1000:8.2f}ms "
+                f"{timings['cloader'] * 1000:8.2f}ms "
+                f"{timings['cached'] * 1000:8.2f}ms "
+                f"{speedup:7.1f}x"
+            )
+
+    print("-" * 70)
+    if totals["cached"]:
+        print(
+            f"{'total':32} "
+            f"{totals['pure'] * 1000:8.2f}ms "
+            f"{totals['cloader'] * 1000:8.2f}ms "
+            f"{totals['cached'] * 1000:8.2f}ms "
+            f"{totals['pure'] / totals['cached']:7.1f}x"
+        )
+
+    if skipped:
+        print(f"\nSkipped {len(skipped)} file(s) that do not load:")
+        for line in skipped:
+            print(f"  {line}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
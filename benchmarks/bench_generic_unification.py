@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Generic Type Argument Inference by Unification
+
+Builds a generic function with ``--params`` type parameters whose declared
+parameter types are random ``list``/``dict``/``set``/``tuple``/optional
+templates nested ``--depth`` deep, with the type parameters at the leaves.
+It substitutes concrete types for the parameters to get the argument types,
+then times ``GenericChecker.infer_type_arguments`` ``--calls`` times. The
+inferred bindings must be the substituted types.
+
+It also runs a chain of ``--chain`` type parameters (``T0 = T1``,
+``T1 = T2``, ...), which exercises union-find and path compression.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_generic_unification.py
+    PYTHONPATH=src python benchmarks/bench_generic_unification.py --depths 4 8 16 32 --params 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Dict, List
+
+from parsercraft.generics import GenericChecker, GenericFunction, TypeParameter
+from parsercraft.unification import Unifier
+
+CONCRETE = ("int", "float", "str", "bool")
+
+
+def template(rng: random.Random, depth: int, names: List[str]) -> str:
+    if depth == 0:
+        return rng.choice(names)
+    shape = rng.randrange(5)
+    if shape == 0:
+        return f"list[{template(rng, depth - 1, names)}]"
+    if shape == 1:
+        return f"dict[{template(rng, depth - 1, names)}, {template(rng, depth - 1, names)}]"
+    if shape == 2:
+        return f"set[{template(rng, depth - 1, names)}]"
+    if shape == 3:
+        return f"tuple[{template(rng, depth - 1, names)}, {template(rng, depth - 1, names)}]"
+    return f"{template(rng, depth - 1, names)}?"
+
+
+def substitute(text: str, solution: Dict[str, str]) -> str:
+    # Parameter names are P<number>; replace the longest first
+    for name in sorted(solution, key=len, reverse=True):
+        text = text.replace(name, solution[name])
+    return text
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generic unification benchmark")
+    parser.add_argument("--depths", type=int, nargs="+", default=[2, 4, 8, 12], help="Nesting depths")
+    parser.add_argument("--params", type=int, default=8, help="Type parameters (and arguments)")
+    parser.add_argument("--calls", type=int, default=200, help="Inferences per depth")
+    parser.add_argument("--chain", type=int, default=2000, help="Length of the variable chain")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    checker = GenericChecker()
+    names = [f"P{index}" for index in range(args.params)]
+    parameters = [TypeParameter(name) for name in names]
+
+    print(f"Generic inference: {args.params} type parameters, {args.calls} calls per depth")
+    print("=" * 66)
+    print(f"  {'depth':>5} {'chars/arg':>10} {'per call':>12}")
+    for depth in args.depths:
+        declared = {f"a{index}": template(rng, depth, names) for index in range(args.params)}
+        # Every parameter must appear somewhere to be inferable
+        declared.update({f"b{index}": f"list[{name}]" for index, name in enumerate(names)})
+        solution = {name: rng.choice(CONCRETE) for name in names}
+        actual = {arg: substitute(text, solution) for arg, text in declared.items()}
+        function = GenericFunction("f", parameters, declared, names[0])
+
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            inferred = checker.infer_type_arguments(function, actual)
+        seconds = time.perf_counter() - start
+
+        if inferred != solution:
+            print(f"  depth {depth}: inferred {inferred}, expected {solution}")
+            return 1
+        width = sum(map(len, actual.values())) // len(actual)
+        print(f"  {depth:>5} {width:>10} {seconds / args.calls * 1e6:>10.1f}us")
+
+    chain = [TypeParameter(f"T{index}") for index in range(args.chain)]
+    start = time.perf_counter()
+    unifier = Unifier(chain)
+    for index in range(args.chain - 1):
+        unifier.unify(f"list[T{index}]", f"list[T{index + 1}]")
+    unifier.unify(f"T{args.chain // 2}", "dict[str, int]")
+    bindings = unifier.solve()
+    seconds = time.perf_counter() - start
+    print(f"  chain of {args.chain}: {seconds * 1000:.2f}ms")
+    if unifier.errors or set(bindings.values()) != {"dict[str, int]"}:
+        print(f"  chain not solved: {unifier.errors[:3]}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
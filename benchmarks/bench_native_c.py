@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Native C vs. Interpreted Execution
+
+Parses one guest program and runs it two ways:
+
+    interpreted  ASTInterpreter on the parsed AST
+    native       ASTToCGenerator -> local C compiler -> executable
+
+The native time includes process start-up. Build time is reported separately,
+once cold (compiler run) and once warm (cache hit). Both outputs must match.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_native_c.py
+    PYTHONPATH=src python benchmarks/bench_native_c.py --fib 27 --loop 3000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from parsercraft.ast_integration import ASTToCGenerator
+from parsercraft.interpreter import ASTInterpreter
+from parsercraft.language_config import LanguageConfig, OperatorConfig
+from parsercraft.native_build import NativeBuilder, NativeBuildError
+from parsercraft.parser_generator import ParserGenerator
+
+PROGRAM = """
+function fib(n) {
+    if n < 2 {
+        return n
+    }
+    return fib(n - 1) + fib(n - 2)
+}
+
+function sum_squares(n) {
+    total = 0
+    i = 0
+    while i < n {
+        total = (total + i * i) % 1000003
+        i = i + 1
+    }
+    return total
+}
+
+print("fib", fib(FIB_N), "sum_squares", sum_squares(LOOP_N))
+"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Native C vs interpreter benchmark")
+    parser.add_argument("--fib", type=int, default=24, help="fib(n) argument")
+    parser.add_argument("--loop", type=int, default=1_000_000, help="Loop iterations")
+    args = parser.parse_args()
+
+    config = LanguageConfig()
+    config.operators["%"] = OperatorConfig("%", 20, "left")
+    source = PROGRAM.replace("FIB_N", str(args.fib)).replace("LOOP_N", str(args.loop))
+
+    start = time.perf_counter()
+    _, ast = ParserGenerator(config).parse(source)
+    parse_seconds = time.perf_counter() - start
+
+    output = io.StringIO()
+    start = time.perf_counter()
+    ASTInterpreter(config, output=output).run(ast)
+    interpreted_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    c_code = ASTToCGenerator(config).translate(ast)
+    lower_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        builder = NativeBuilder(cache_dir=Path(cache_dir))
+        try:
+            cold = builder.build(c_code)
+        except NativeBuildError as error:
+            print(f"Cannot build: {error}")
+            return 1
+        warm = builder.build(c_code)
+
+        start = time.perf_counter()
+        completed = builder.run(warm.executable)
+        native_seconds = time.perf_counter() - start
+
+    print(f"Native vs interpreted: fib({args.fib}), {args.loop} loop iterations")
+    print("=" * 60)
+    print(f"  parse            {parse_seconds * 1000:10.2f}ms")
+    print(f"  lower to C       {lower_seconds * 1000:10.2f}ms")
+    print(f"  build (cold)     {cold.seconds * 1000:10.2f}ms")
+    print(f"  build (cached)   {warm.seconds * 1000:10.2f}ms")
+    print("-" * 60)
+    print(f"  interpreted      {interpreted_seconds * 1000:10.2f}ms")
+    print(f"  native           {native_seconds * 1000:10.2f}ms")
+    print(f"  speedup          {interpreted_seconds / native_seconds:10.1f}x")
+
+    if completed.stdout != output.getvalue():
+        print("\nOutputs differ:")
+        print(f"  interpreted: {output.getvalue().strip()}")
+        print(f"  native:      {completed.stdout.strip()}")
+        return 1
+    print(f"\nOutput: {completed.stdout.strip()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
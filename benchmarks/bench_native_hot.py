@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Hot-Function Native Acceleration
+
+Runs one guest program three ways with ``HotFunctionAccelerator``:
+
+    interpreted  plain ASTInterpreter
+    profile      interpreted run with the call profiler
+    accelerated  interpreter dispatching the hottest numeric functions to a
+                 ctypes-loaded library built from generated C
+
+``report`` (which prints) and ``shout`` (a string) cannot be compiled, so
+they stay interpreted. Per-function speedups are measured on the arguments
+seen while profiling. Both program outputs must match.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_native_hot.py
+    PYTHONPATH=src python benchmarks/bench_native_hot.py --fib 27 --loop 1000000 --top 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from parsercraft.interpreter import ASTInterpreter
+from parsercraft.language_config import LanguageConfig, OperatorConfig
+from parsercraft.native_accel import HotFunctionAccelerator
+from parsercraft.native_build import DEFAULT_FLAGS, NativeBuilder, NativeBuildError
+from parsercraft.parser_generator import ParserGenerator
+
+PROGRAM = """
+function fib(n) {
+    if n < 2 {
+        return n
+    }
+    return fib(n - 1) + fib(n - 2)
+}
+
+function sum_squares(n) {
+    total = 0
+    i = 0
+    while i < n {
+        total = (total + i * i) % 1000003
+        i = i + 1
+    }
+    return total
+}
+
+function leibniz(terms) {
+    total = 0.0
+    sign = 1.0
+    k = 0
+    while k < terms {
+        total = total + sign / (2 * k + 1)
+        sign = 0.0 - sign
+        k = k + 1
+    }
+    return 4.0 * total
+}
+
+function shout(word) {
+    return word + "!"
+}
+
+function report(label, value) {
+    print(label, value)
+    return value
+}
+
+report("fib", fib(FIB_N))
+report("sum_squares", sum_squares(LOOP_N))
+report("pi", leibniz(LOOP_N))
+report("shout", shout("done"))
+"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Hot-function native acceleration benchmark")
+    parser.add_argument("--fib", type=int, default=22, help="fib(n) argument")
+    parser.add_argument("--loop", type=int, default=200_000, help="Loop iterations")
+    parser.add_argument("--top", type=int, default=3, help="Functions to accelerate")
+    args = parser.parse_args()
+
+    config = LanguageConfig()
+    config.operators["%"] = OperatorConfig("%", 20, "left")
+    source = PROGRAM.replace("FIB_N", str(args.fib)).replace("LOOP_N", str(args.loop))
+    _, ast = ParserGenerator(config).parse(source)
+
+    expected = io.StringIO()
+    start = time.perf_counter()
+    ASTInterpreter(config, output=expected).run(ast)
+    interpreted_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        builder = NativeBuilder(flags=DEFAULT_FLAGS + ("-fwrapv",), cache_dir=Path(cache_dir))
+        accelerator = HotFunctionAccelerator(config, top=args.top, builder=builder)
+
+        start = time.perf_counter()
+        profile = accelerator.profile(ast, output=io.StringIO())
+        profile_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            accelerated = accelerator.accelerate(ast)
+        except NativeBuildError as error:
+            print(f"Cannot build: {error}")
+            return 1
+        build_seconds = time.perf_counter() - start
+
+        output = io.StringIO()
+        start = time.perf_counter()
+        accelerator.interpreter(output=output).run(ast)
+        accelerated_seconds = time.perf_counter() - start
+        report = accelerator.measure()
+
+    print(f"Hot-function acceleration: fib({args.fib}), {args.loop} loop iterations")
+    print("=" * 72)
+    print("Profile (self time):")
+    for entry in profile:
+        print(f"  {entry.name:20} {entry.calls:8d} calls  {entry.seconds * 1000:10.2f}ms")
+    print(f"Accelerated: {', '.join(accelerated) or '(none)'}")
+    print(report.format())
+    print("-" * 72)
+    print(f"  interpreted      {interpreted_seconds * 1000:10.2f}ms")
+    print(f"  profile run      {profile_seconds * 1000:10.2f}ms")
+    print(f"  build + verify   {build_seconds * 1000:10.2f}ms")
+    print(f"  accelerated      {accelerated_seconds * 1000:10.2f}ms")
+    print(f"  speedup          {interpreted_seconds / accelerated_seconds:10.1f}x")
+
+    if output.getvalue() != expected.getvalue():
+        print("\nOutputs differ:")
+        print(f"  interpreted: {expected.getvalue().strip()}")
+        print(f"  accelerated: {output.getvalue().strip()}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
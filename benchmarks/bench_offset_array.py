@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Offset-Aware Arrays
+
+Compares ``OffsetArray`` with a naive wrapper. The wrapper asks
+``LanguageRuntime`` for the start index and the fractional-indexing flag on
+every access, which is what runtimes had to do before. Both containers use
+the same start index and fractional setting.
+
+Operations (per array of ``--size`` elements):
+
+    read        a[i] for every guest index
+    write       a[i] = v for every guest index
+    iterate     sum over the array
+    slice       a[start + 1 : stop - 1]
+    fractional  a[i + 0.5] for every guest index but the last
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_offset_array.py
+    PYTHONPATH=src python benchmarks/bench_offset_array.py --size 100000 --start 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import math
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from parsercraft.language_config import LanguageConfig
+from parsercraft.language_runtime import LanguageRuntime
+
+
+class NaiveArray:
+    """Index arithmetic and checks done in Python on every access."""
+
+    def __init__(self, values: List[Any]):
+        self.items = list(values)
+
+    def _position(self, index: Any) -> int:
+        start = LanguageRuntime.get_array_start_index()
+        if isinstance(index, float) and not index.is_integer():
+            raise TypeError("fractional index used as a position")
+        position = int(index) - start
+        if position < 0 or position >= len(self.items):
+            raise IndexError(f"array index {index} out of range")
+        return position
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            start = LanguageRuntime.get_array_start_index()
+            return NaiveArray(self.items[index.start - start : index.stop - start])
+        if isinstance(index, float) and not index.is_integer():
+            if not LanguageRuntime.is_fractional_indexing_enabled():
+                raise TypeError("fractional indexing is disabled")
+            floor = math.floor(index)
+            lower = self.items[self._position(floor)]
+            upper = self.items[self._position(floor + 1)]
+            return lower + (upper - lower) * (index - floor)
+        return self.items[self._position(index)]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self.items[self._position(index)] = value
+
+    def __iter__(self):
+        for position in range(len(self.items)):
+            yield self[position + LanguageRuntime.get_array_start_index()]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def operations(array: Any, first: int, size: int) -> Dict[str, Callable[[], Any]]:
+    indices = range(first, first + size)
+    halves = [index + 0.5 for index in range(first, first + size - 1)]
+
+    def read() -> None:
+        for index in indices:
+            array[index]
+
+    def write() -> None:
+        for index in indices:
+            array[index] = index
+
+    def fractional() -> None:
+        for index in halves:
+            array[index]
+
+    return {
+        "read": read,
+        "write": write,
+        "iterate": lambda: sum(array),
+        "slice": lambda: array[first + 1 : first + size - 1],
+        "fractional": fractional,
+    }
+
+
+def time_per_call(func: Callable[[], Any], repeat: int) -> float:
+    """Mean seconds per call of ``func()``."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offset array benchmark")
+    parser.add_argument("--size", type=int, default=10_000, help="Elements per array")
+    parser.add_argument("--start", type=int, default=-1, help="Array start index")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per operation")
+    args = parser.parse_args()
+
+    config = LanguageConfig()
+    config.syntax_options.array_start_index = args.start
+    config.syntax_options.allow_fractional_indexing = True
+    with contextlib.redirect_stdout(io.StringIO()):
+        LanguageRuntime.load_config(config)
+
+    values = list(range(args.size))
+    naive = operations(NaiveArray(values), args.start, args.size)
+    offset = operations(LanguageRuntime.new_array(values), args.start, args.size)
+
+    print(f"Offset arrays: {args.size} elements, start index {args.start}")
+    print("=" * 60)
+    print(f"{'operation':12} {'naive':>12} {'OffsetArray':>12} {'speedup':>8}")
+    for name in naive:
+        slow = time_per_call(naive[name], args.repeat)
+        fast = time_per_call(offset[name], args.repeat)
+        print(
+            f"{name:12} {slow * 1000:10.3f}ms {fast * 1000:10.3f}ms "
+            f"{slow / fast:7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Parallel Per-Function C Generation
+
+Generates C for a synthetic program of ``--functions`` independent numeric
+functions with ``ASTToCGenerator(jobs=N)`` for each N in ``--jobs``, and
+checks that every output is identical to the sequential one.
+
+Times cover ``translate`` on an already parsed AST, best of ``--repeat``.
+Symbol collection, resolution and type inference run once in the parent
+and are the same for every N; only function lowering is spread over the
+worker processes. Speedups need as many free cores as workers.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_parallel_codegen.py
+    PYTHONPATH=src python benchmarks/bench_parallel_codegen.py --functions 3000 --jobs 1 2 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+from parsercraft.ast_integration import ASTToCGenerator
+from parsercraft.language_config import LanguageConfig, OperatorConfig
+from parsercraft.parser_generator import ParserGenerator
+
+FUNCTION = """
+function f{index}(n) {{
+    total = {index}
+    i = 0
+    while i < n {{
+        if i % 3 == 0 {{
+            total = total + i * {index}
+        }} else {{
+            total = total - (i + {index}) % 7
+        }}
+        if total > 1000000 {{
+            total = total % 1000
+        }}
+        i = i + 1
+    }}
+    return total
+}}
+"""
+
+
+def build_source(functions: int) -> str:
+    parts = [FUNCTION.format(index=index) for index in range(functions)]
+    parts.append("result = 0\n")
+    parts.extend(f"result = result + f{index}(10)\n" for index in range(functions))
+    parts.append("print(result)\n")
+    return "".join(parts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Parallel C codegen benchmark")
+    parser.add_argument("--functions", type=int, default=1000, help="Functions in the program")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to time")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per worker count")
+    args = parser.parse_args()
+
+    config = LanguageConfig()
+    config.syntax_options.single_line_comment = "#"
+    config.operators["%"] = OperatorConfig("%", 20, "left")
+    source = build_source(args.functions)
+
+    print(f"Parallel C generation: {args.functions} functions, {os.cpu_count()} CPUs")
+    print("=" * 60)
+    expected = None
+    baseline = None
+    for jobs in args.jobs:
+        seconds = float("inf")
+        for _ in range(args.repeat):
+            _, ast = ParserGenerator(config).parse(source)
+            generator = ASTToCGenerator(config, jobs=jobs)
+            start = time.perf_counter()
+            c_code = generator.translate(ast)
+            seconds = min(seconds, time.perf_counter() - start)
+        if expected is None:
+            expected, baseline = c_code, seconds
+        elif c_code != expected:
+            print(f"  jobs={jobs}: output differs from jobs={args.jobs[0]}")
+            return 1
+        print(f"  jobs={jobs:<3} {seconds * 1000:10.2f}ms   {baseline / seconds:5.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
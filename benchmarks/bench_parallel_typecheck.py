@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Parallel Project-Wide Type Checking
+
+Writes a synthetic project of ``--modules`` modules in ``--layers`` layers
+(each module imports two modules of the layer below) and type checks it
+with ``ProjectTypeChecker.check(jobs=N)`` for each N in ``--jobs``, without
+the result cache. Every run must report the same diagnostics.
+
+Modules of one layer are independent, so at most ``modules / layers`` run
+at once. Speedups need as many free cores as workers.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_parallel_typecheck.py
+    PYTHONPATH=src python benchmarks/bench_parallel_typecheck.py --modules 400 --jobs 1 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from parsercraft.language_config import LanguageConfig, OperatorConfig
+from parsercraft.typecheck_cache import ProjectTypeChecker, collect_sources
+
+FUNCTION = """
+function m{module}_f{index}(n) {{
+    total = {index}
+    i = 0
+    while i < n {{
+        total = total + i * {index} % 7
+        i = i + 1
+    }}
+    return total
+}}
+"""
+
+
+def write_project(root: Path, modules: int, layers: int, functions: int) -> None:
+    width = max(1, modules // layers)
+    for module in range(modules):
+        layer = module // width
+        lines = []
+        if layer > 0:
+            below = (layer - 1) * width
+            for offset in (module % width, (module + 1) % width):
+                lines.append(f"import m{below + offset}")
+        lines.extend(FUNCTION.format(module=module, index=index) for index in range(functions))
+        if layer > 0:
+            lines.append(f"value = m{below + module % width}_f0(3) + m{module}_f0(2)")
+        (root / f"m{module}.lang").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Parallel type checking benchmark")
+    parser.add_argument("--modules", type=int, default=200, help="Modules in the project")
+    parser.add_argument("--layers", type=int, default=4, help="Import layers")
+    parser.add_argument("--functions", type=int, default=10, help="Functions per module")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to time")
+    args = parser.parse_args()
+
+    config = LanguageConfig()
+    config.syntax_options.single_line_comment = "#"
+    config.operators["%"] = OperatorConfig("%", 20, "left")
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        write_project(root, args.modules, args.layers, args.functions)
+        sources = collect_sources([root])
+
+        print(f"Parallel type checking: {args.modules} modules, {args.layers} layers, {os.cpu_count()} CPUs")
+        print("=" * 60)
+        expected = None
+        baseline = None
+        for jobs in args.jobs:
+            run = ProjectTypeChecker(config, search_paths=[str(root)]).check(sources, jobs=jobs)
+            diagnostics = [(result.path, [str(error) for error in result.errors]) for result in run.results]
+            if expected is None:
+                expected, baseline = diagnostics, run.seconds
+            elif diagnostics != expected:
+                print(f"  jobs={jobs}: diagnostics differ from jobs={args.jobs[0]}")
+                return 1
+            slowest = max(run.results, key=lambda result: result.seconds)
+            print(
+                f"  jobs={jobs:<3} {run.seconds * 1000:10.2f}ms   {baseline / run.seconds:5.2f}x   "
+                f"slowest file {slowest.seconds * 1000:.2f}ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
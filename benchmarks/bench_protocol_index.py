@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Bitset Protocol Index
+
+Registers ``--protocols`` random protocols. Each one requires 1-4 methods
+from a vocabulary of ``--methods`` names, each name with a few possible
+signatures. About one protocol in ``--property-every`` also requires a
+property. The benchmark then finds the matching protocols for
+``--types`` random structural types in two ways:
+
+    linear   conforms_to_protocol against every registered protocol
+             (the behaviour before the index)
+    indexed  ProtocolChecker.find_matching_protocols: a bitwise AND per
+             protocol, with full checks only for candidates that have
+             properties
+
+Both must return the same protocols in the same order.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_protocol_index.py
+    PYTHONPATH=src python benchmarks/bench_protocol_index.py --protocols 10000 --types 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from parsercraft.protocols import (
+    MethodSignature,
+    PropertyDef,
+    Protocol,
+    ProtocolChecker,
+    StructuralType,
+)
+
+TYPES = ("int", "str", "float", "bool", "Any")
+
+
+def signature(rng: random.Random, name: str) -> MethodSignature:
+    # Few shapes per name, so protocols share requirements
+    shape = random.Random(f"{name}-{rng.randrange(3)}")
+    params = [(f"p{index}", shape.choice(TYPES)) for index in range(shape.randrange(3))]
+    return MethodSignature(name, shape.choice(TYPES), params)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Protocol index benchmark")
+    parser.add_argument("--protocols", type=int, default=3000, help="Registered protocols")
+    parser.add_argument("--methods", type=int, default=60, help="Method name vocabulary")
+    parser.add_argument("--types", type=int, default=100, help="Structural types to match")
+    parser.add_argument("--property-every", type=int, default=5, help="Protocols per property requirement")
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    names = [f"m{index}" for index in range(args.methods)]
+    checker = ProtocolChecker()
+
+    start = time.perf_counter()
+    for number in range(args.protocols):
+        methods = {name: signature(rng, name) for name in rng.sample(names, rng.randint(1, 4))}
+        properties = {}
+        if number % args.property_every == 0:
+            prop = f"f{rng.randrange(8)}"
+            properties[prop] = PropertyDef(prop, rng.choice(TYPES[:2]))
+        checker.register_protocol(Protocol(f"P{number}", methods=methods, properties=properties))
+    register_seconds = time.perf_counter() - start
+
+    types = []
+    for _ in range(args.types):
+        methods = {name: signature(rng, name) for name in rng.sample(names, args.methods // 2)}
+        properties = {f"f{index}": PropertyDef(f"f{index}", rng.choice(TYPES[:2])) for index in range(4)}
+        types.append(StructuralType(methods=methods, properties=properties))
+
+    start = time.perf_counter()
+    expected = [
+        [name for name, protocol in checker.protocol_cache.items() if checker.conforms_to_protocol(struct_type, protocol)]
+        for struct_type in types
+    ]
+    linear_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [checker.find_matching_protocols(struct_type) for struct_type in types]
+    indexed_seconds = time.perf_counter() - start
+
+    matches = sum(map(len, actual))
+    print(f"Protocol index: {args.protocols} protocols, {args.types} types, {matches} matches")
+    print("=" * 66)
+    print(f"  register   {register_seconds * 1000:10.2f}ms   {checker.index.stats()}")
+    print(f"  linear     {linear_seconds * 1000:10.2f}ms")
+    print(f"  indexed    {indexed_seconds * 1000:10.2f}ms   {linear_seconds / indexed_seconds:5.2f}x")
+
+    if actual != expected:
+        print("Indexed matches differ from the linear scan")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Trampolined Tail Calls
+
+Runs two tail-recursive accumulator programs on ``ASTInterpreter`` with and
+without tail-call trampolining:
+
+    fact(n, acc)  = if n <= 1: acc else fact(n - 1, acc * n % M)
+    fib(n, a, b)  = if n == 0: a   else fib(n - 1, b, (a + b) % M)
+
+``shallow`` uses a depth that plain recursion can handle and compares time
+per call. ``deep`` uses a depth far beyond Python's recursion limit, which
+only the trampoline can finish.
+
+The ASTs are built directly in ``parser_generator`` shape, the form the
+interpreter consumes.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_tail_calls.py
+    PYTHONPATH=src python benchmarks/bench_tail_calls.py --shallow 200 --deep 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Any, Callable, List
+
+from parsercraft.interpreter import ASTInterpreter, GuestRuntimeError
+from parsercraft.parser_generator import ASTNode
+
+MODULUS = 1_000_000_007
+
+
+def ident(name: str) -> ASTNode:
+    return ASTNode("Identifier", name)
+
+
+def num(value: int) -> ASTNode:
+    return ASTNode("Number", str(value))
+
+
+def binop(op: str, left: ASTNode, right: ASTNode) -> ASTNode:
+    return ASTNode("BinaryOp", op, [left, right])
+
+
+def call(name: str, *args: ASTNode) -> ASTNode:
+    return ASTNode("FunctionCall", name, [ASTNode("Arguments", children=list(args))])
+
+
+def ret(value: ASTNode) -> ASTNode:
+    return ASTNode("ReturnStatement", children=[value])
+
+
+def function(name: str, params: List[str], body: List[ASTNode]) -> ASTNode:
+    return ASTNode(
+        "FunctionDef",
+        name,
+        [
+            ASTNode("Parameters", children=[ident(p) for p in params]),
+            ASTNode("Block", children=body),
+        ],
+    )
+
+
+def if_else(condition: ASTNode, then: ASTNode, otherwise: ASTNode) -> ASTNode:
+    return ASTNode(
+        "IfStatement",
+        children=[
+            condition,
+            ASTNode("Block", children=[then]),
+            ASTNode("Block", children=[otherwise]),
+        ],
+    )
+
+
+def factorial_program() -> ASTNode:
+    n, acc = ident("n"), ident("acc")
+    step = call(
+        "fact",
+        binop("-", n, num(1)),
+        binop("%", binop("*", acc, n), num(MODULUS)),
+    )
+    body = [if_else(binop("<=", n, num(1)), ret(acc), ret(step))]
+    return ASTNode("Program", children=[function("fact", ["n", "acc"], body)])
+
+
+def fib_program() -> ASTNode:
+    n, a, b = ident("n"), ident("a"), ident("b")
+    step = call(
+        "fib",
+        binop("-", n, num(1)),
+        b,
+        binop("%", binop("+", a, b), num(MODULUS)),
+    )
+    body = [if_else(binop("==", n, num(0)), ret(a), ret(step))]
+    return ASTNode("Program", children=[function("fib", ["n", "a", "b"], body)])
+
+
+PROGRAMS = {
+    "fact": (factorial_program, lambda n: (n, 1)),
+    "fib": (fib_program, lambda n: (n, 0, 1)),
+}
+
+
+def time_per_call(func: Callable[[], Any], repeat: int) -> float:
+    """Mean seconds per call of ``func()``."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Tail-call trampoline benchmark")
+    parser.add_argument(
+        "--shallow", type=int, default=100, help="Depth both modes can run"
+    )
+    parser.add_argument(
+        "--deep", type=int, default=100_000, help="Depth beyond the recursion limit"
+    )
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per timing")
+    args = parser.parse_args()
+
+    print(f"Tail calls (recursion limit {sys.getrecursionlimit()})")
+    print("=" * 70)
+    print(f"{'program':10} {'depth':>8} {'recursive':>12} {'trampoline':>12} {'speedup':>8}")
+
+    for name, (build, arguments) in PROGRAMS.items():
+        interpreters = {}
+        for mode in (False, True):
+            interpreter = ASTInterpreter(tail_calls=mode)
+            interpreter.run(build())
+            interpreters[mode] = interpreter
+
+        shallow_args = arguments(args.shallow)
+        expected = interpreters[False].call(name, *shallow_args)
+        if interpreters[True].call(name, *shallow_args) != expected:
+            print(f"{name}: results differ between modes")
+            return 1
+
+        timings = {
+            mode: time_per_call(
+                lambda i=interpreter: i.call(name, *shallow_args), args.repeat
+            )
+            for mode, interpreter in interpreters.items()
+        }
+        print(
+            f"{name:10} {args.shallow:8d} "
+            f"{timings[False] * 1e6:10.1f}us "
+            f"{timings[True] * 1e6:10.1f}us "
+            f"{timings[False] / timings[True]:7.2f}x"
+        )
+
+        deep_args = arguments(args.deep)
+        start = time.perf_counter()
+        result = interpreters[True].call(name, *deep_args)
+        elapsed = time.perf_counter() - start
+        try:
+            interpreters[False].call(name, *deep_args)
+            recursive = "ok"
+        except (GuestRuntimeError, RecursionError):
+            recursive = "overflow"
+        print(
+            f"{name:10} {args.deep:8d} {recursive:>12} "
+            f"{elapsed * 1000:10.1f}ms   result={result}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Interned Types and Memoized Compatibility
+
+Builds ``--types`` nested container/union types and checks every ordered
+pair for compatibility ``--rounds`` times, three ways:
+
+    structural  freshly built (uninterned) types, compared recursively
+                without the memo (the behaviour before interning)
+    interned    canonical types from the constructors; the first round
+                fills the memo, later rounds are dict lookups
+    parsed      the same types via ``parse_type`` on their annotation text,
+                which are identical objects to the interned ones
+
+All three must agree on every pair.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_type_interning.py
+    PYTHONPATH=src python benchmarks/bench_type_interning.py --types 120 --depth 4 --rounds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Any, List
+
+from parsercraft.type_system import Type, TypeKind, parse_type, type_interner
+
+LEAVES = ("int", "float", "str", "bool", "any")
+
+
+def random_annotation(rng: random.Random, depth: int) -> str:
+    if depth == 0 or rng.random() < 0.25:
+        return rng.choice(LEAVES)
+    shape = rng.randrange(4)
+    if shape == 0:
+        return f"list[{random_annotation(rng, depth - 1)}]"
+    if shape == 1:
+        return f"dict[{random_annotation(rng, depth - 1)}, {random_annotation(rng, depth - 1)}]"
+    if shape == 2:
+        return f"{random_annotation(rng, depth - 1)} | {random_annotation(rng, depth - 1)}"
+    return f"{random_annotation(rng, depth - 1)}?"
+
+
+def fresh(type_: Type) -> Type:
+    """An uninterned deep copy of ``type_``."""
+    return Type(
+        kind=type_.kind,
+        name=type_.name,
+        type_args=[fresh(arg) for arg in type_.type_args],
+        nullable=type_.nullable,
+    )
+
+
+def structural(source: Any, target: Any) -> bool:
+    """``is_compatible_with`` as it was before memoization."""
+    if source.kind == TypeKind.ANY or target.kind == TypeKind.ANY:
+        return True
+    if source.kind == target.kind:
+        if source.type_args and target.type_args:
+            return all(structural(a, b) for a, b in zip(source.type_args, target.type_args))
+        return True
+    if source.kind == TypeKind.OPTIONAL:
+        return structural(source.type_args[0], target)
+    return False
+
+
+def time_pairs(types: List[Any], rounds: int, check: Any) -> tuple:
+    results = []
+    start = time.perf_counter()
+    for _ in range(rounds):
+        results = [check(a, b) for a in types for b in types]
+    return time.perf_counter() - start, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Type interning benchmark")
+    parser.add_argument("--types", type=int, default=80, help="Distinct annotations")
+    parser.add_argument("--depth", type=int, default=3, help="Nesting depth")
+    parser.add_argument("--rounds", type=int, default=5, help="Passes over all pairs")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    annotations = [random_annotation(rng, args.depth) for _ in range(args.types)]
+    interned = [parse_type(text) for text in annotations]
+    uninterned = [fresh(type_) for type_ in interned]
+    type_interner().compatibility.clear()
+
+    structural_seconds, expected = time_pairs(uninterned, args.rounds, structural)
+    interned_seconds, actual = time_pairs(interned, args.rounds, Type.is_compatible_with)
+    start = time.perf_counter()
+    reparsed = [parse_type(text) for text in annotations]
+    parse_seconds = time.perf_counter() - start
+
+    pairs = args.types * args.types
+    print(f"Type interning: {args.types} types (depth {args.depth}), {pairs} pairs x {args.rounds} rounds")
+    print("=" * 66)
+    print(f"  structural   {structural_seconds * 1000:10.2f}ms")
+    print(f"  interned     {interned_seconds * 1000:10.2f}ms   {structural_seconds / interned_seconds:5.2f}x")
+    print(f"  re-parse     {parse_seconds * 1000:10.2f}ms   (memoized annotations)")
+    print(f"  interner     {type_interner().stats()}")
+
+    if actual != expected:
+        print("Compatibility results differ")
+        return 1
+    if any(a is not b for a, b in zip(reparsed, interned)):
+        print("Parsed types are not the interned instances")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
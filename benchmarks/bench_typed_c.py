@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Type-Specialized vs. Tagged C Output
+
+Lowers one numeric guest program to C twice:
+
+    tagged       ASTToCGenerator(specialize=False): every binding is a pc_value
+    specialized  ASTToCGenerator(): inferred int/float bindings are unboxed
+                 int64_t/double
+
+Both executables come from the local C compiler (cached by NativeBuilder) and
+their times include process start-up. Both outputs must match.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_typed_c.py
+    PYTHONPATH=src python benchmarks/bench_typed_c.py --fib 30 --loop 20000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from parsercraft.ast_integration import ASTToCGenerator
+from parsercraft.language_config import LanguageConfig, OperatorConfig
+from parsercraft.native_build import NativeBuilder, NativeBuildError
+from parsercraft.parser_generator import ParserGenerator
+
+PROGRAM = """
+function fib(n) {
+    if n < 2 {
+        return n
+    }
+    return fib(n - 1) + fib(n - 2)
+}
+
+function leibniz(n) {
+    total = 0.0
+    sign = 1.0
+    k = 0
+    while k < n {
+        total = total + sign / (2 * k + 1)
+        sign = -sign
+        k = k + 1
+    }
+    return 4 * total
+}
+
+function collatz_steps(limit) {
+    steps = 0
+    start = 1
+    while start < limit {
+        n = start
+        while n != 1 {
+            if n % 2 == 0 {
+                n = n // 2
+            } else {
+                n = 3 * n + 1
+            }
+            steps = steps + 1
+        }
+        start = start + 1
+    }
+    return steps
+}
+
+print("fib", fib(FIB_N), "pi", leibniz(LOOP_N), "collatz", collatz_steps(COLLATZ_N))
+"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Specialized vs tagged C benchmark")
+    parser.add_argument("--fib", type=int, default=27, help="fib(n) argument")
+    parser.add_argument("--loop", type=int, default=5_000_000, help="Leibniz terms")
+    parser.add_argument("--collatz", type=int, default=100_000, help="Collatz limit")
+    args = parser.parse_args()
+
+    config = LanguageConfig()
+    config.syntax_options.single_line_comment = "#"
+    config.operators["%"] = OperatorConfig("%", 20, "left")
+    config.operators["//"] = OperatorConfig("//", 20, "left")
+    source = (
+        PROGRAM.replace("FIB_N", str(args.fib))
+        .replace("LOOP_N", str(args.loop))
+        .replace("COLLATZ_N", str(args.collatz))
+    )
+
+    timings = {}
+    outputs = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        builder = NativeBuilder(cache_dir=Path(cache_dir))
+        for label, specialize in (("tagged", False), ("specialized", True)):
+            _, ast = ParserGenerator(config).parse(source)
+            c_code = ASTToCGenerator(config, specialize=specialize).translate(ast)
+            try:
+                executable = builder.build(c_code).executable
+            except NativeBuildError as error:
+                print(f"Cannot build: {error}")
+                return 1
+            start = time.perf_counter()
+            completed = builder.run(executable)
+            timings[label] = time.perf_counter() - start
+            outputs[label] = completed.stdout
+
+    print(
+        f"Specialized vs tagged C: fib({args.fib}), {args.loop} Leibniz terms, "
+        f"Collatz below {args.collatz}"
+    )
+    print("=" * 60)
+    print(f"  tagged           {timings['tagged'] * 1000:10.2f}ms")
+    print(f"  specialized      {timings['specialized'] * 1000:10.2f}ms")
+    print(f"  speedup          {timings['tagged'] / timings['specialized']:10.1f}x")
+
+    if outputs["tagged"] != outputs["specialized"]:
+        print("\nOutputs differ:")
+        print(f"  tagged:      {outputs['tagged'].strip()}")
+        print(f"  specialized: {outputs['specialized'].strip()}")
+        return 1
+    print(f"\nOutput: {outputs['specialized'].strip()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
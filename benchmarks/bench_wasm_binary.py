@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Binary .wasm vs. WAT Output
+
+Builds a synthetic ``WasmModule`` (``--functions`` functions with loops,
+branches, calls and memory access, plus imports and data segments) and
+compares:
+
+    wat          WasmModule.to_wat(): text that still needs an assembler
+    wasm         WasmModule.to_wasm(): the binary module, ready to load
+    validate     validate_wasm() on the binary (the self-check)
+    wat2wasm     the external assembler on the WAT text (if installed)
+
+Sizes are reported for both formats. The binary output is validated before
+anything is timed. Function bodies are WAT instruction text, so ``to_wasm``
+still tokenizes and assembles every body; the "assembly cost" line is its
+time as a multiple of ``to_wat``.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_wasm_binary.py
+    PYTHONPATH=src python benchmarks/bench_wasm_binary.py --functions 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from parsercraft.codegen_wasm import (
+    WasmFunction,
+    WasmImport,
+    WasmLocal,
+    WasmModule,
+    WasmType,
+)
+from parsercraft.wasm_binary import validate_wasm
+
+
+def build_module(functions: int) -> WasmModule:
+    module = WasmModule("bench")
+    module.set_memory_size(2)
+    module.add_import(WasmImport("console", "log", [("value", WasmType.I32)]))
+    for index in range(functions):
+        callee = f"$f{index - 1}" if index else "$log_value"
+        module.add_function(WasmFunction(
+            name=f"f{index}",
+            params=[("n", WasmType.I32)],
+            return_type=WasmType.I32,
+            locals=[WasmLocal("i", WasmType.I32), WasmLocal("total", WasmType.I32)],
+            body=[
+                "(local.set $total (i32.const 0))",
+                "(local.set $i (i32.const 0))",
+                "(block $break",
+                "  (loop $continue",
+                "    (br_if $break (i32.ge_s (local.get $i) (local.get $n)))",
+                "    (if (i32.eqz (i32.rem_s (local.get $i) (i32.const 3)))",
+                "      (then (local.set $total (i32.add (local.get $total) (local.get $i))))",
+                f"      (else (local.set $total (i32.sub (local.get $total) (i32.const {index})))))",
+                "    (local.set $i (i32.add (local.get $i) (i32.const 1)))",
+                "    (br $continue)))",
+                f"(i32.store offset={index % 64 * 4} (i32.const 0) (local.get $total))",
+                f"(call {callee} (i32.load offset={index % 64 * 4} (i32.const 0)))",
+            ] + ([] if index else ["drop", "i32.const 0"]),
+            is_export=index % 10 == 0,
+        ))
+    module.add_function(WasmFunction(
+        name="log_value",
+        params=[("value", WasmType.I32)],
+        return_type=WasmType.I32,
+        body=["local.get $value", "call $log", "local.get $value"],
+    ))
+    for index in range(16):
+        module.add_data(1024 + index * 32, f"segment {index}".encode())
+    return module
+
+
+def time_per_call(func: Callable[[], Any], repeat: int) -> float:
+    """Mean seconds per call of ``func()``."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Binary WASM vs WAT benchmark")
+    parser.add_argument("--functions", type=int, default=500, help="Functions in the module")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    module = build_module(args.functions)
+    wat = module.to_wat()
+    binary = module.to_wasm(validate=True)
+
+    wat_seconds = time_per_call(module.to_wat, args.repeat)
+    wasm_seconds = time_per_call(module.to_wasm, args.repeat)
+    validate_seconds = time_per_call(lambda: validate_wasm(binary), args.repeat)
+
+    print(f"Binary WASM vs WAT: {args.functions} functions")
+    print("=" * 60)
+    print(f"  WAT text         {len(wat.encode()):10d} bytes   {wat_seconds * 1000:10.2f}ms")
+    print(f"  .wasm binary     {len(binary):10d} bytes   {wasm_seconds * 1000:10.2f}ms")
+    print(f"  size ratio       {len(wat.encode()) / len(binary):10.1f}x smaller")
+    print(f"  assembly cost    {wasm_seconds / wat_seconds:10.1f}x the time of to_wat")
+    print(f"  validate         {'':16} {validate_seconds * 1000:10.2f}ms")
+
+    assembler = shutil.which("wat2wasm")
+    if assembler:
+        with tempfile.TemporaryDirectory() as work:
+            source = Path(work) / "module.wat"
+            source.write_text(wat, encoding="utf-8")
+            start = time.perf_counter()
+            completed = subprocess.run(
+                [assembler, str(source), "-o", str(Path(work) / "module.wasm")],
+                capture_output=True, text=True, check=False,
+            )
+            assemble_seconds = time.perf_counter() - start
+        status = "ok" if completed.returncode == 0 else "failed"
+        print(
+            f"  WAT + wat2wasm   {'':16} "
+            f"{(wat_seconds + assemble_seconds) * 1000:10.2f}ms ({status})"
+        )
+    else:
+        print("  wat2wasm         not installed (WAT needs it to become .wasm)")
+
+    print("\nSection sizes:")
+    for name, size in validate_wasm(binary).items():
+        print(f"  {name:16} {size:10d} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
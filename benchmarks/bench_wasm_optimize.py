@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: WASM Local Reuse and Peephole Optimization
+
+Builds a module the way a straightforward code generator does: every
+subexpression result goes through a fresh ``WasmGenerator.gen_temp_var()``
+local and loops/ifs come from ``generate_loop``/``generate_if``. Then runs
+``WasmOptimizer`` over it and reports:
+
+    instructions    flat instruction count, before and after
+    locals          declared locals, before and after
+    binary size     WasmModule.to_wasm() bytes, before and after
+    optimize        time spent in the optimizer
+
+Both versions are validated with validate_wasm().
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_wasm_optimize.py
+    PYTHONPATH=src python benchmarks/bench_wasm_optimize.py --functions 1000 --terms 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from parsercraft.codegen_wasm import (
+    WasmFunction,
+    WasmGenerator,
+    WasmImport,
+    WasmLocal,
+    WasmType,
+)
+from parsercraft.wasm_binary import validate_wasm
+from parsercraft.wasm_optimize import WasmOptimizer
+
+
+def build_function(generator: WasmGenerator, index: int, terms: int) -> WasmFunction:
+    """sum over i < n of a polynomial in i, one temporary per operation."""
+    generator.temp_locals = []
+    body = ["(local.set $i (i32.const 0))", "(local.set $acc (i32.const 0))"]
+
+    done = generator.gen_temp_var()
+    condition = f"(local.set {done} (i32.ge_s (local.get $i) (local.get $n))) (local.get {done})"
+
+    loop_body = []
+    term = generator.gen_temp_var()
+    loop_body.append(f"(local.set {term} (i32.const {index}))")
+    for power in range(terms):
+        product = generator.gen_temp_var()
+        scaled = generator.gen_temp_var()
+        loop_body.append(f"(local.set {product} (i32.mul (local.get {term}) (local.get $i)))")
+        loop_body.append(f"(local.set {scaled} (i32.add (local.get {product}) (i32.const {power})))")
+        loop_body.append(f"(local.get {scaled})")
+        loop_body.append(f"(local.set {term})")
+    debug = generator.gen_temp_var()
+    loop_body.append(f"(local.set {debug} (local.get {term}))")
+    loop_body.extend(generator.generate_if(
+        "(i32.const 0)", [f"(call $log (local.get {debug}))"]
+    ))
+    loop_body.append(f"(local.set $acc (i32.xor (local.get $acc) (local.get {term})))")
+    loop_body.append("(local.set $i (i32.add (local.get $i) (i32.const 1)))")
+    body.extend(generator.generate_loop(condition, loop_body))
+
+    result = generator.gen_temp_var()
+    body.extend([f"(local.set {result} (local.get $acc))", f"(local.get {result})"])
+    return WasmFunction(
+        name=f"poly{index}",
+        params=[("n", WasmType.I32)],
+        return_type=WasmType.I32,
+        locals=[WasmLocal("i", WasmType.I32), WasmLocal("acc", WasmType.I32)]
+        + generator.temp_locals,
+        body=body,
+        is_export=index % 10 == 0,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="WASM optimizer benchmark")
+    parser.add_argument("--functions", type=int, default=200, help="Functions in the module")
+    parser.add_argument("--terms", type=int, default=8, help="Polynomial terms per function")
+    args = parser.parse_args()
+
+    generator = WasmGenerator(optimize=False)
+    module = generator.module
+    module.add_import(WasmImport("console", "log", [("value", WasmType.I32)]))
+    for index in range(args.functions):
+        module.add_function(build_function(generator, index, args.terms))
+
+    before = module.to_wasm(validate=True)
+    start = time.perf_counter()
+    report = WasmOptimizer().optimize_module(module)
+    seconds = time.perf_counter() - start
+    after = module.to_wasm()
+    validate_wasm(after)
+
+    print(f"WASM optimizer: {args.functions} functions, {args.terms} terms each")
+    print("=" * 60)
+    print(f"  instructions     {report.instructions_before:10d} -> {report.instructions_after:8d}")
+    print(f"  locals           {report.locals_before:10d} -> {report.locals_after:8d}")
+    print(f"  binary size      {len(before):10d} -> {len(after):8d} bytes")
+    print(f"  optimize         {seconds * 1000:10.2f}ms")
+    if report.skipped:
+        print(f"  skipped          {', '.join(report.skipped)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
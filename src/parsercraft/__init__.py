@@ -2,12 +2,33 @@
 ParserCraft
 
 A comprehensive system for creating custom programming language variants.
+
+Top-level names are resolved on first access so that importing a submodule
+(for example ``parsercraft.cli``) does not load the configuration system.
 """
 
 __version__ = "3.0.0"
 __author__ = "James-HoneyBadger"
 
-from .language_config import LanguageConfig
-from .language_runtime import LanguageRuntime
-
 __all__ = ["LanguageConfig", "LanguageRuntime"]
+
+_LAZY_ATTRIBUTES = {
+    "LanguageConfig": ".language_config",
+    "LanguageRuntime": ".language_runtime",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
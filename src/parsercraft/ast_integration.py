@@ -11,6 +11,8 @@ Features:
     - Type inference from AST nodes
     - Symbol table building from AST
     - Control flow analysis
+    - Optional AST optimization pipeline before code generation
+    - Shared, cached analyses through a PassManager
 
 Usage:
     from parsercraft.ast_integration import ASTToCGenerator, ASTToWasmGenerator
@@ -20,15 +22,47 @@ Usage:
     
     wasm_gen = ASTToWasmGenerator()
     wasm_module = wasm_gen.translate(ast, config)
+
+    # Fold constants and drop dead code first
+    from parsercraft.ast_optimizer import OptimizationPipeline
+    c_gen = ASTToCGenerator(config, optimizer=OptimizationPipeline(config))
 """
 
 from __future__ import annotations
 
+import math
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
-
-from .codegen_c import CCodeGenerator, CType, CVariable, CFunction
-from .codegen_wasm import WasmGenerator, WasmModule, WasmFunction, WasmType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from .codegen_c import CCodeGenerator, CVariable, CFunction
+from .codegen_cache import CodegenCache, CodegenStats, external_references, subtree_fingerprint
+from .codegen_parallel import lower_in_parallel
+from .codegen_wasm import (
+    WasmFunction,
+    WasmGenerator,
+    WasmImport,
+    WasmLocal,
+    WasmModule,
+    WasmType,
+)
+from .ast_optimizer import (
+    UNKNOWN,
+    assign_target,
+    assign_value,
+    function_name,
+    function_params,
+    if_parts,
+    literal_value,
+    name_of,
+    node_attrs,
+    node_kind,
+)
+from .resolver import FrameLayout, Resolution, Resolver, SlotRef
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .ast_optimizer import OptimizationPipeline, OptimizationReport
+    from .pass_manager import PassManager
 
 
 @dataclass
@@ -118,225 +152,2059 @@ class SymbolTable:
         return self.functions.get(name)
 
 
-class ASTToCGenerator(ASTVisitor):
-    """Converts AST to C code."""
+class CodegenError(Exception):
+    """Raised when an AST uses a construct a backend cannot lower."""
+
+
+# Guest types with an unboxed C representation; everything else is a pc_value
+_UNBOXED = ("int", "float", "bool")
+
+_C_RUNTIME = r"""/* ParserCraft runtime: Python-style printing and arithmetic */
+typedef enum { PC_NONE, PC_BOOL, PC_INT, PC_FLOAT, PC_STR } pc_tag;
+
+/* Tagged value, used only where a type could not be inferred */
+typedef struct {
+    pc_tag tag;
+    union { int64_t i; double f; const char* s; } as;
+} pc_value;
+
+typedef enum { PC_ADD, PC_SUB, PC_MUL, PC_DIV, PC_FLOORDIV, PC_MOD, PC_POW } pc_op;
+typedef enum { PC_EQ, PC_NE, PC_LT, PC_GT, PC_LE, PC_GE } pc_cmp;
+
+#ifdef PC_LIBRARY
+/* Inside a host process: unwind to the exported entry point instead */
+static _Thread_local jmp_buf pc_trap;
+static void pc_fail(const char* message) {
+    (void)message;
+    longjmp(pc_trap, 1);
+}
+#else
+static void pc_fail(const char* message) {
+    fflush(stdout);
+    fprintf(stderr, "Runtime error: %s\n", message);
+    exit(1);
+}
+#endif
+
+static pc_value pc_none(void) { pc_value v; v.tag = PC_NONE; v.as.i = 0; return v; }
+static pc_value pc_bool(int b) { pc_value v; v.tag = PC_BOOL; v.as.i = b != 0; return v; }
+static pc_value pc_int(int64_t i) { pc_value v; v.tag = PC_INT; v.as.i = i; return v; }
+static pc_value pc_float(double f) { pc_value v; v.tag = PC_FLOAT; v.as.f = f; return v; }
+static pc_value pc_str(const char* s) { pc_value v; v.tag = PC_STR; v.as.s = s; return v; }
+
+static int pc_is_number(pc_value v) {
+    return v.tag == PC_BOOL || v.tag == PC_INT || v.tag == PC_FLOAT;
+}
+
+static double pc_to_float(pc_value v) {
+    if (v.tag == PC_FLOAT) return v.as.f;
+    if (v.tag != PC_INT && v.tag != PC_BOOL) pc_fail("number expected");
+    return (double)v.as.i;
+}
+
+static int64_t pc_to_int(pc_value v) {
+    if (v.tag == PC_FLOAT) return (int64_t)v.as.f;
+    if (v.tag != PC_INT && v.tag != PC_BOOL) pc_fail("number expected");
+    return v.as.i;
+}
+
+static int pc_truthy(pc_value v) {
+    switch (v.tag) {
+    case PC_NONE: return 0;
+    case PC_FLOAT: return v.as.f != 0;
+    case PC_STR: return v.as.s[0] != '\0';
+    default: return v.as.i != 0;
+    }
+}
+
+/* Guest integers are unbounded; results outside int64_t are runtime errors */
+static int64_t pc_add_i(int64_t a, int64_t b) {
+    int64_t r;
+    if (__builtin_add_overflow(a, b, &r)) pc_fail("integer overflow");
+    return r;
+}
+
+static int64_t pc_sub_i(int64_t a, int64_t b) {
+    int64_t r;
+    if (__builtin_sub_overflow(a, b, &r)) pc_fail("integer overflow");
+    return r;
+}
+
+static int64_t pc_mul_i(int64_t a, int64_t b) {
+    int64_t r;
+    if (__builtin_mul_overflow(a, b, &r)) pc_fail("integer overflow");
+    return r;
+}
+
+static int64_t pc_pow_i(int64_t base, int64_t exponent) {
+    int64_t result = 1;
+    while (exponent) {
+        if (exponent & 1) result = pc_mul_i(result, base);
+        exponent >>= 1;
+        if (exponent) base = pc_mul_i(base, base);
+    }
+    return result;
+}
+
+static int64_t pc_floordiv_i(int64_t a, int64_t b) {
+    int64_t q;
+    if (b == 0) pc_fail("integer division by zero");
+    if (a == INT64_MIN && b == -1) pc_fail("integer overflow");
+    q = a / b;
+    if (a % b != 0 && ((a < 0) != (b < 0))) q--;
+    return q;
+}
+
+static int64_t pc_mod_i(int64_t a, int64_t b) {
+    int64_t r;
+    if (b == 0) pc_fail("integer modulo by zero");
+    if (b == -1) return 0;
+    r = a % b;
+    if (r != 0 && ((r < 0) != (b < 0))) r += b;
+    return r;
+}
+
+static int64_t pc_abs_i(int64_t a) { return a < 0 ? pc_sub_i(0, a) : a; }
+static int64_t pc_min_i(int64_t a, int64_t b) { return a < b ? a : b; }
+static int64_t pc_max_i(int64_t a, int64_t b) { return a > b ? a : b; }
+
+static pc_value pc_abs(pc_value a) {
+    if (a.tag == PC_FLOAT) return pc_float(fabs(a.as.f));
+    return pc_int(pc_abs_i(pc_to_int(a)));
+}
+
+static double pc_div(double a, double b) {
+    if (b == 0) pc_fail("division by zero");
+    return a / b;
+}
+
+static double pc_floordiv(double a, double b) {
+    return floor(pc_div(a, b));
+}
+
+static double pc_mod(double a, double b) {
+    double r;
+    if (b == 0) pc_fail("float modulo by zero");
+    r = fmod(a, b);
+    if (r != 0 && ((r < 0) != (b < 0))) r += b;
+    return r;
+}
+
+static pc_value pc_arith(pc_op op, pc_value a, pc_value b) {
+    double x, y;
+    if (op == PC_ADD && a.tag == PC_STR && b.tag == PC_STR) {
+        /* Concatenations live until the program exits */
+        size_t left = strlen(a.as.s), right = strlen(b.as.s);
+        char* text = malloc(left + right + 1);
+        if (text == NULL) pc_fail("out of memory");
+        memcpy(text, a.as.s, left);
+        memcpy(text + left, b.as.s, right + 1);
+        return pc_str(text);
+    }
+    if (!pc_is_number(a) || !pc_is_number(b)) pc_fail("unsupported operand types");
+    if (a.tag != PC_FLOAT && b.tag != PC_FLOAT) {
+        int64_t i = a.as.i, j = b.as.i;
+        switch (op) {
+        case PC_ADD: return pc_int(pc_add_i(i, j));
+        case PC_SUB: return pc_int(pc_sub_i(i, j));
+        case PC_MUL: return pc_int(pc_mul_i(i, j));
+        case PC_FLOORDIV: return pc_int(pc_floordiv_i(i, j));
+        case PC_MOD: return pc_int(pc_mod_i(i, j));
+        case PC_DIV:
+            if (j != 0 && pc_mod_i(i, j) == 0) return pc_int(pc_floordiv_i(i, j));
+            break;
+        case PC_POW:
+            if (j >= 0) return pc_int(pc_pow_i(i, j));
+            break;
+        default: break;
+        }
+    }
+    x = pc_to_float(a);
+    y = pc_to_float(b);
+    switch (op) {
+    case PC_ADD: return pc_float(x + y);
+    case PC_SUB: return pc_float(x - y);
+    case PC_MUL: return pc_float(x * y);
+    case PC_DIV: return pc_float(pc_div(x, y));
+    case PC_FLOORDIV: return pc_float(pc_floordiv(x, y));
+    case PC_MOD: return pc_float(pc_mod(x, y));
+    default: return pc_float(pow(x, y));
+    }
+}
+
+static int pc_compare(pc_cmp op, pc_value a, pc_value b) {
+    int order;
+    if (pc_is_number(a) && pc_is_number(b)) {
+        if (a.tag != PC_FLOAT && b.tag != PC_FLOAT) {
+            order = (a.as.i > b.as.i) - (a.as.i < b.as.i);
+        } else {
+            double x = pc_to_float(a), y = pc_to_float(b);
+            order = (x > y) - (x < y);
+        }
+    } else if (a.tag == PC_STR && b.tag == PC_STR) {
+        order = strcmp(a.as.s, b.as.s);
+        order = (order > 0) - (order < 0);
+    } else if (op == PC_EQ || op == PC_NE) {
+        int same = a.tag == PC_NONE && b.tag == PC_NONE;
+        return op == PC_EQ ? same : !same;
+    } else {
+        pc_fail("values cannot be ordered");
+        return 0;
+    }
+    switch (op) {
+    case PC_EQ: return order == 0;
+    case PC_NE: return order != 0;
+    case PC_LT: return order < 0;
+    case PC_GT: return order > 0;
+    case PC_LE: return order <= 0;
+    default: return order >= 0;
+    }
+}
+
+static pc_value pc_min(pc_value a, pc_value b) {
+    return pc_compare(PC_LT, b, a) ? b : a;
+}
+
+static pc_value pc_max(pc_value a, pc_value b) {
+    return pc_compare(PC_GT, b, a) ? b : a;
+}
+
+static int pc_print_int(int64_t value, int separate) {
+    if (separate) putchar(' ');
+    return printf("%lld", (long long)value);
+}
+
+static int pc_print_float(double value, int separate) {
+    char text[40];
+    int digits;
+    if (separate) putchar(' ');
+    if (value == floor(value) && fabs(value) < 1e16) {
+        return printf("%.1f", value);
+    }
+    for (digits = 15; digits < 17; digits++) {
+        snprintf(text, sizeof text, "%.*g", digits, value);
+        if (strtod(text, NULL) == value) break;
+    }
+    if (digits == 17) snprintf(text, sizeof text, "%.17g", value);
+    return fputs(text, stdout);
+}
+
+static int pc_print_string(const char* value, int separate) {
+    if (separate) putchar(' ');
+    return fputs(value, stdout);
+}
+
+static int pc_print_bool(int value, int separate) {
+    return pc_print_string(value ? "true" : "false", separate);
+}
+
+static int pc_print_value(pc_value value, int separate) {
+    switch (value.tag) {
+    case PC_NONE: return pc_print_string("null", separate);
+    case PC_BOOL: return pc_print_bool((int)value.as.i, separate);
+    case PC_INT: return pc_print_int(value.as.i, separate);
+    case PC_FLOAT: return pc_print_float(value.as.f, separate);
+    default: return pc_print_string(value.as.s, separate);
+    }
+}
+
+static pc_value pc_print_end(void) {
+    putchar('\n');
+    return pc_none();
+}"""
+
+# Operators on unboxed numbers: guest symbol -> C operator
+_C_OPERATORS = {
+    "+": "+",
+    "-": "-",
+    "*": "*",
+    "==": "==",
+    "!=": "!=",
+    "<": "<",
+    ">": ">",
+    "<=": "<=",
+    ">=": ">=",
+}
+_C_LOGIC = {"and": "and", "&&": "and", "or": "or", "||": "or"}
+
+# Integer arithmetic on unboxed values, checked for int64_t overflow
+_C_CHECKED_INT = {"+": "pc_add_i", "-": "pc_sub_i", "*": "pc_mul_i"}
+
+# Operators on tagged values: guest symbol -> runtime opcode
+_C_VALUE_ARITH = {
+    "+": "PC_ADD",
+    "-": "PC_SUB",
+    "*": "PC_MUL",
+    "/": "PC_DIV",
+    "//": "PC_FLOORDIV",
+    "%": "PC_MOD",
+    "**": "PC_POW",
+}
+_C_VALUE_COMPARE = {
+    "==": "PC_EQ",
+    "!=": "PC_NE",
+    "<": "PC_LT",
+    ">": "PC_GT",
+    "<=": "PC_LE",
+    ">=": "PC_GE",
+}
+
+# Builtins with a C equivalent: implementation name -> C function per representation
+_C_BUILTINS = {
+    "abs": {"int": "pc_abs_i", "float": "fabs", "value": "pc_abs"},
+    "min": {"int": "pc_min_i", "float": "fmin", "value": "pc_min"},
+    "max": {"int": "pc_max_i", "float": "fmax", "value": "pc_max"},
+}
+_C_PRINTERS = {
+    "int": "pc_print_int",
+    "float": "pc_print_float",
+    "bool": "pc_print_bool",
+    "value": "pc_print_value",
+}
+_C_ZERO = {"int": "0", "float": "0.0", "bool": "false", "value": "pc_none()"}
+
+
+def _c_name(name: str) -> str:
+    """C identifier for a guest name (prefixed so it cannot clash with C)."""
+    if name.isascii():
+        return f"g_{name}"
+    return "g_u" + name.encode("utf-8").hex()
+
+
+def _c_number(value: Any) -> Tuple[str, str]:
+    """C literal and representation for a guest number."""
+    if isinstance(value, bool):
+        return ("true" if value else "false"), "bool"
+    if isinstance(value, int):
+        if not -(2**63) < value < 2**63:
+            raise CodegenError(f"Integer literal out of 64-bit range: {value}")
+        return f"INT64_C({value})", "int"
+    number = float(value)
+    if not math.isfinite(number):
+        raise CodegenError(f"Number literal out of range: {value!r}")
+    return repr(number), "float"
+
+
+def _c_string(text: str) -> str:
+    """C string literal for ``text`` (non-ASCII bytes as octal escapes)."""
+    parts = []
+    for byte in text.encode("utf-8"):
+        char = chr(byte)
+        if char in '"\\':
+            parts.append("\\" + char)
+        elif 32 <= byte < 127 and char != "?":
+            parts.append(char)
+        else:
+            parts.append(f"\\{byte:03o}")
+    return '"' + "".join(parts) + '"'
+
+
+def native_symbol(name: str) -> str:
+    """Exported symbol of guest function ``name`` in a native library."""
+    return f"pcx_{_c_name(name)}"
+
+
+def _representation(inferred: Optional[str]) -> str:
+    """C representation of an inferred type: an unboxed kind or ``value``."""
+    return inferred if inferred in _UNBOXED else "value"
+
+
+def _convert(code: str, source: str, target: str) -> str:
+    """Convert C expression ``code`` between representations."""
+    if source == target:
+        return code
+    if target == "value":
+        return {"int": "pc_int", "float": "pc_float", "bool": "pc_bool"}[source] + f"({code})"
+    if source == "value":
+        return {"int": "pc_to_int", "float": "pc_to_float", "bool": "pc_truthy"}[target] + f"({code})"
+    if target == "bool":
+        return f"({code} != 0)"
+    if target == "int" and source == "float":
+        return f"(int64_t)({code})"
+    return code  # C widens bool -> int -> double by itself
+
 
-    def __init__(self, config: Any = None):
+def _truth(code: str, representation: str) -> str:
+    return f"pc_truthy({code})" if representation == "value" else code
+
+
+class ASTToCGenerator(ASTVisitor):
+    """Lowers an AST to a complete, compilable C program.
+
+    Handles both node shapes (see ``ast_optimizer.node_kind``): module-level
+    functions, assignments, if/else, while, break/continue, return, calls,
+    arithmetic, comparisons, ``and``/``or`` and ``not``. Top-level statements
+    become ``main``. ``print`` and the numeric builtins ``abs``/``min``/``max``
+    are supported; anything else (nested functions, for loops, raw expression
+    text) raises ``CodegenError``.
+
+    Variables, parameters and return values take their C type from
+    ``TypeInferencePass``: ``int`` becomes ``int64_t``, ``float`` becomes
+    ``double`` and ``bool`` becomes ``bool``, so monomorphic numeric code
+    runs unboxed. Bindings of any other type (strings, mixed types) use the
+    runtime's tagged ``pc_value``. Guest integers are 64-bit in C; results
+    that overflow ``int64_t`` fail at run time ("integer overflow") on both
+    paths rather than wrapping. With ``specialize=False`` every binding is a
+    ``pc_value``.
+
+    With a ``CodegenCache``, each function's C is reused while its subtree,
+    its inferred types and the signatures of what it references are
+    unchanged; ``codegen_stats`` counts the functions regenerated. With
+    ``jobs`` > 1 the functions that need lowering are lowered in worker
+    processes (see ``codegen_parallel``); the output is the same.
+    """
+
+    def __init__(
+        self,
+        config: Any = None,
+        optimizer: Optional[OptimizationPipeline] = None,
+        pass_manager: Optional[PassManager] = None,
+        type_inference: Optional[TypeInferencePass] = None,
+        specialize: bool = True,
+        cache: Optional[CodegenCache] = None,
+        jobs: int = 1,
+    ):
         self.generator = CCodeGenerator()
         self.symbol_table = SymbolTable()
         self.config = config
         self.current_function: Optional[str] = None
+        self.optimizer = optimizer
+        self.optimization_report: Optional[OptimizationReport] = None
+        self.pass_manager = pass_manager
+        self.resolution: Optional[Resolution] = None
+        self.types: Optional[TypeInferencePass] = type_inference
+        self.specialize = specialize
+        self._module_functions: Dict[str, ASTNode] = {}
+        self._layouts: List[FrameLayout] = []
+        self._return_representation = "int"
+        self._temps: List[Tuple[str, str]] = []
+        self.cache = cache
+        self.codegen_stats = CodegenStats()
+        self.jobs = jobs
+        self._function_keys: Dict[int, str] = {}
+        self._prelowered: Dict[int, CFunction] = {}
+        self._native_calls: Dict[str, Set[str]] = {}
 
     def translate(self, ast: ASTNode, config: Any = None) -> str:
         """Translate AST to C code."""
-        if config:
-            self.config = config
+        self._lower(ast, config)
+        return self.generator.generate(ast, output_file=None)
+
+    def translate_to_file(self, ast: ASTNode, output_file: Any, config: Any = None) -> int:
+        """Translate AST to C, streaming it to ``output_file``; returns characters written."""
+        self._lower(ast, config)
+        return self.generator.write(output_file)
 
-        # First pass: collect symbols
-        self._collect_symbols(ast)
+    def _lower(self, ast: ASTNode, config: Any) -> None:
+        """Run the analyses and fill ``self.generator``."""
+        self._analyze(ast, config)
 
         # Second pass: generate code
         self.visit(ast)
 
-        # Generate final output
-        return self.generator.generate_header() + "\n" + self.generator.generate_implementations()
+    def _analyze(self, ast: ASTNode, config: Any) -> None:
+        """Optimize, then collect symbols, resolve names and infer types."""
+        self.codegen_stats = CodegenStats()
+        if config:
+            self.config = config
+        self.generator.config = self.config
+
+        if self.optimizer is not None:
+            self.optimization_report = self.optimizer.run(ast, self.pass_manager)
+
+        # First pass: collect symbols and types (shared when a pass manager is given)
+        if self.pass_manager is not None:
+            self._use_shared_symbols(ast)
+            self.resolution = self.pass_manager.get(ast, "resolution")
+            if self.types is None:
+                self.types = self.pass_manager.get(ast, "types")
+            elif self.types.resolution is not self.resolution:
+                self.types.infer(ast, self.resolution)
+        else:
+            self._collect_symbols(ast)
+            self.resolution = Resolver().resolve(ast)
+            self.types = self.types or TypeInferencePass()
+            self.types.infer(ast, self.resolution)
 
     def _collect_symbols(self, node: ASTNode) -> None:
         """First pass: collect function and variable declarations."""
-        if node.node_type == "function":
-            func_name = node.attributes.get("name", "unknown")
-            params = node.attributes.get("params", [])
-            return_type = node.attributes.get("return_type", "int")
-            self.symbol_table.declare_function(func_name, params, return_type)
+        if node_kind(node) == "function":
+            return_type = node_attrs(node).get("return_type", "int")
+            self.symbol_table.declare_function(
+                function_name(node), function_params(node), return_type
+            )
 
         for child in node.children:
             self._collect_symbols(child)
 
+    def _use_shared_symbols(self, ast: ASTNode) -> None:
+        """Take function signatures from the pass manager's symbols analysis."""
+        shared = self.pass_manager.get(ast, "symbols")
+        for func_name, (params, return_type) in shared.functions.items():
+            self.symbol_table.declare_function(
+                func_name, list(params), return_type or "int"
+            )
+
+    # === Program Structure ===
+
+    def _c_type(self, representation: str) -> str:
+        return self.generator.translate_type(
+            "any" if representation == "value" else representation
+        )
+
+    def _type_representation(self, inferred: str) -> str:
+        return _representation(inferred) if self.specialize else "value"
+
+    def _binding_representation(self, layout: FrameLayout, name: str) -> str:
+        return self._type_representation(self.types.binding_type(layout, name))
+
     def visit_program(self, node: ASTNode) -> None:
-        """Visit program node (root)."""
-        for child in node.children:
+        """Visit program node (root): globals, functions and ``main``."""
+        generator = self.generator
+        generator.add_include("<math.h>")
+        generator.runtime.append(_C_RUNTIME)
+
+        module = self._enter_module(node)
+        for name in module.names:
+            if name not in self._module_functions:
+                # Static storage starts zeroed: 0, 0.0, false or PC_NONE
+                representation = self._binding_representation(module, name)
+                generator.globals.append(
+                    CVariable(_c_name(name), self._c_type(representation))
+                )
+
+        functions = [child for child in node.children if node_kind(child) == "function"]
+        if self.jobs != 1:
+            self._lower_in_parallel(functions)
+        for child in functions:
             self.visit(child)
 
+        self._temps = []
+        generator.var_counter = 0
+        body: List[str] = []
+        for child in node.children:
+            if node_kind(child) != "function":
+                body.extend(self._statement(child))
+        generator.main_body = self._temp_declarations() + body
+
+    def _enter_module(self, node: ASTNode) -> FrameLayout:
+        """Start lowering at module scope; returns the module layout."""
+        module = self.resolution.module
+        self._layouts = [module]
+        self._module_functions = {
+            function_name(child): child
+            for child in node.children
+            if node_kind(child) == "function"
+        }
+        return module
+
     def visit_function(self, node: ASTNode) -> None:
         """Visit function definition."""
-        func_name = node.attributes.get("name", "unknown_func")
-        # return_type = node.attributes.get("return_type", "int")
-        params = node.attributes.get("params", [])
+        func_name = function_name(node)
+        layout = self.resolution.layout_for(node)
+        if layout.depth > 1:
+            raise CodegenError(
+                f"Nested function '{func_name}' is not supported by the C backend"
+            )
+
+        self.codegen_stats.functions += 1
+        key = None
+        if self.cache is not None:
+            key = self._function_keys.pop(id(node), None) or self._function_key(node, layout)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.generator.functions.append(cached)
+                return
+        self.codegen_stats.regenerated += 1
+
+        func = self._prelowered.pop(id(node), None) or self._lower_function(node)
+        self.generator.functions.append(func)
+        if key is not None:
+            self.cache.put(key, func)
+
+    visit_Program = visit_program
+    visit_FunctionDef = visit_function
+
+    # === Native Libraries ===
+
+    def native_functions(
+        self, ast: ASTNode, config: Any = None
+    ) -> Dict[str, Tuple[Tuple[str, ...], str]]:
+        """Module functions that can run as native code inside a host process.
+
+        Maps each name, in source order, to its parameter and return
+        representations (``int``, ``float`` or ``bool``). A function
+        qualifies when those are all unboxed, it lowers to C, and it calls
+        nothing but ``abs``/``min``/``max`` and other qualifying functions:
+        no ``print``, globals or nested functions, so running it natively
+        cannot lose a side effect.
+        """
+        self._analyze(ast, config)
+        self._enter_module(ast)
+        signatures: Dict[str, Tuple[Tuple[str, ...], str]] = {}
+        calls: Dict[str, Set[str]] = {}
+        for name, node in self._module_functions.items():
+            layout = self.resolution.layout_for(node)
+            params = tuple(self._binding_representation(layout, p) for p in layout.params)
+            result = self._type_representation(self.types.return_type(node))
+            if any(kind not in _UNBOXED for kind in params + (result,)):
+                continue
+            if self._contains_function(node):
+                continue
+            callees = set()
+            for referenced, depth in external_references(node, self.resolution):
+                if depth < 0 and self._builtin_implementation(referenced) in _C_BUILTINS:
+                    continue
+                if depth == 1 and referenced in self._module_functions:
+                    callees.add(referenced)
+                    continue
+                break
+            else:
+                try:
+                    self._lower_function(node)
+                except CodegenError:
+                    continue
+                signatures[name] = (params, result)
+                calls[name] = callees
+
+        # Drop functions that (transitively) call one that does not qualify
+        changed = True
+        while changed:
+            changed = False
+            for name in list(signatures):
+                if not calls[name] <= signatures.keys():
+                    del signatures[name]
+                    changed = True
+        self._native_calls = calls
+        return signatures
+
+    def translate_library(self, ast: ASTNode, names: List[str], config: Any = None) -> str:
+        """C for a shared library exporting the module functions ``names``.
+
+        Every name must be in ``native_functions``; the functions they call
+        are compiled in too. Each export, ``native_symbol(name)``, takes the
+        unboxed parameters plus a pointer for the result, and returns 1, or
+        0 when the runtime failed (``pc_fail`` unwinds to it rather than
+        exiting the host). Use a fresh generator for each library.
+        """
+        native = self.native_functions(ast, config)
+        missing = [name for name in names if name not in native]
+        if missing:
+            raise CodegenError(f"Not natively compilable: {', '.join(missing)}")
+
+        included = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name not in included:
+                included.add(name)
+                pending.extend(self._native_calls[name])
+
+        generator = self.generator
+        generator.library = True
+        generator.add_include("<math.h>")
+        generator.add_include("<setjmp.h>")
+        generator.runtime.extend(["#define PC_LIBRARY", _C_RUNTIME])
+        for name, node in self._module_functions.items():
+            if name in included:
+                self.visit_function(node)
+        for name in names:
+            generator.functions.append(self._native_export(name))
+        return generator.generate(ast, output_file=None)
+
+    def _native_export(self, name: str) -> CFunction:
+        node = self._module_functions[name]
+        layout = self.resolution.layout_for(node)
+        parameters = {
+            _c_name(param): self._c_type(self._binding_representation(layout, param))
+            for param in layout.params
+        }
+        args = ", ".join(parameters)
+        result = self._c_type(self._type_representation(self.types.return_type(node)))
+        parameters["result"] = f"{result}*"
+        return CFunction(
+            name=native_symbol(name),
+            return_type="int",
+            parameters=parameters,
+            body=[
+                "if (setjmp(pc_trap)) return 0;",
+                f"*result = {_c_name(name)}({args});",
+                "return 1;",
+            ],
+        )
 
+    @staticmethod
+    def _contains_function(node: ASTNode) -> bool:
+        stack = list(node.children)
+        while stack:
+            child = stack.pop()
+            if node_kind(child) == "function":
+                return True
+            stack.extend(child.children)
+        return False
+
+    def _lower_in_parallel(self, functions: List[ASTNode]) -> None:
+        """Lower the functions the cache cannot supply across ``jobs`` processes."""
+        pending = []
+        for node in functions:
+            layout = self.resolution.layout_for(node)
+            if layout.depth > 1:
+                continue  # visit_function reports it
+            if self.cache is not None:
+                key = self._function_key(node, layout)
+                self._function_keys[id(node)] = key
+                if key in self.cache:
+                    continue
+            pending.append(node)
+        lowered = lower_in_parallel(self, "_lower_function", pending, self.jobs)
+        for node, func in zip(pending, lowered):
+            self._prelowered[id(node)] = func
+
+    def _lower_function(self, node: ASTNode) -> CFunction:
+        """Generate the C function for a module-level function node."""
+        func_name = function_name(node)
+        layout = self.resolution.layout_for(node)
         self.current_function = func_name
         self.symbol_table.push_scope()
+        self._layouts.append(layout)
+        self._temps = []
+        self.generator.var_counter = 0  # temporaries are per function
+        self._return_representation = self._type_representation(
+            self.types.return_type(node)
+        )
 
-        # Add parameters to symbol table
-        for param_name in params:
-            self.symbol_table.declare(param_name, TypeInfo("int"))
-
-        # Generate function
-        func = CFunction(name=func_name, return_type=CType.INT)
-
-        # Add parameter declarations
-        for param_name in params:
-            func.params.append((param_name, CType.INT))
-
-        # Visit function body
-        for child in node.children:
-            self.visit(child)
+        parameters = {}
+        for param_name in layout.params:
+            c_type = self._c_type(self._binding_representation(layout, param_name))
+            self.symbol_table.declare(param_name, TypeInfo(c_type))
+            parameters[_c_name(param_name)] = c_type
+
+        func = CFunction(
+            name=_c_name(func_name),
+            return_type=self._c_type(self._return_representation),
+            parameters=parameters,
+            is_static=True,
+        )
 
-        self.generator.functions[func_name] = func
+        statements = self._block(node)
+        declarations = []
+        for name in layout.locals:
+            representation = self._binding_representation(layout, name)
+            declarations.append(
+                f"{self._c_type(representation)} {_c_name(name)} = {_C_ZERO[representation]};"
+            )
+        func.body = declarations + self._temp_declarations() + statements + [
+            f"return {_C_ZERO[self._return_representation]};"
+        ]
+
+        self._layouts.pop()
         self.symbol_table.pop_scope()
         self.current_function = None
+        return func
+
+    def _function_key(self, node: ASTNode, layout: FrameLayout) -> str:
+        """Cache key: the subtree, its binding types, and what it references."""
+        module = self.resolution.module
+        references = []
+        for name, depth in external_references(node, self.resolution):
+            if depth < 0:
+                references.append((name, "builtin", self._builtin_implementation(name)))
+            elif depth == 1 and name in self._module_functions:
+                function = self._module_functions[name]
+                callee = self.resolution.layout_for(function)
+                references.append((
+                    name,
+                    "function",
+                    tuple(self._binding_representation(callee, p) for p in callee.params),
+                    self._type_representation(self.types.return_type(function)),
+                ))
+            else:
+                references.append((name, "global", depth, self._binding_representation(module, name)))
+        return CodegenCache.key(
+            "c",
+            self.specialize,
+            subtree_fingerprint(node),
+            tuple((name, self._binding_representation(layout, name)) for name in layout.names),
+            self._type_representation(self.types.return_type(node)),
+            tuple(references),
+        )
 
-    def visit_variable_declaration(self, node: ASTNode) -> None:
-        """Visit variable declaration."""
-        var_name = node.attributes.get("name", "var")
-        var_type = node.attributes.get("type", "int")
-        value = node.attributes.get("value")
-
-        type_info = TypeInfo(var_type)
-        self.symbol_table.declare(var_name, type_info)
-
-        # Add to global variables if at top level, otherwise generate local declaration
-        c_type_str = self.generator.translate_type(var_type)
-        c_var = CVariable(name=var_name, c_type=c_type_str, initial_value=value)
-        self.generator.globals.append(c_var)
-
-    def visit_assignment(self, node: ASTNode) -> None:
-        """Visit assignment statement."""
-        target = node.attributes.get("target", "var")
-        value = node.attributes.get("value", "0")
-
-        # Generate assignment instruction
-        instruction = f"(local.set ${target} {value})"
-        if self.current_function and self.current_function in self.generator.functions:
-            self.generator.functions[self.current_function].body.append(instruction)
+    def _temp(self, representation: str) -> str:
+        c_type = self._c_type(representation)
+        temp = self.generator.gen_temp_var(c_type)
+        self._temps.append((temp, c_type))
+        return temp
 
-    def visit_if(self, node: ASTNode) -> None:
-        """Visit if statement."""
-        # condition = node.attributes.get("condition", "true")
+    def _temp_declarations(self) -> List[str]:
+        return [f"{c_type} {name};" for name, c_type in self._temps]
 
-        # Then branch
-        then_body = []
-        for child in node.children:
-            if child.node_type == "then_block":
-                for stmt in child.children:
-                    then_body.append(f"// {stmt.node_type}")
+    # === Statements ===
 
-        # Else branch
-        else_body = []
+    def _block(self, node: Optional[ASTNode]) -> List[str]:
+        """Lower the statements of a block, function or branch."""
+        lines: List[str] = []
+        if node is None:
+            return lines
         for child in node.children:
-            if child.node_type == "else_block":
-                for stmt in child.children:
-                    else_body.append(f"// {stmt.node_type}")
-
-    def visit_return(self, node: ASTNode) -> None:
-        """Visit return statement."""
-        value = node.attributes.get("value", "0")
-
-        if self.current_function and self.current_function in self.generator.functions:
-            self.generator.functions[self.current_function].body.append(f"return {value};")
+            kind = node_kind(child)
+            if child.node_type == "Parameters":
+                continue
+            if kind == "block":
+                lines.extend(self._block(child))
+            else:
+                lines.extend(self._statement(child))
+        return lines
+
+    def _statement(self, node: ASTNode) -> List[str]:
+        generator = self.generator
+        kind = node_kind(node)
+        if kind == "assign":
+            target, representation = self._variable(node, assign_target(node))
+            code, source = self._value(assign_value(node))
+            return [generator.gen_assignment(target, _convert(code, source, representation))]
+        if kind == "expression":
+            return [f"{generator.indent()}{self._expression(node.children[0])[0]};"]
+        if kind in ("call", "binary", "unary", "name", "literal"):
+            return [f"{generator.indent()}{self._expression(node)[0]};"]
+        if kind == "if":
+            return [self._if(node)]
+        if kind == "loop":
+            return [self._loop(node)]
+        if kind == "return":
+            if node.children:
+                code, source = self._expression(node.children[0])
+            else:
+                code, source = self._value(node_attrs(node).get("value"))
+            if self.current_function is None:
+                return [f"{generator.indent()}{code};", generator.gen_return("0")]
+            return [generator.gen_return(_convert(code, source, self._return_representation))]
+        if kind == "jump":
+            keyword = node_attrs(node).get("original_keyword") or node.node_type
+            return [f"{generator.indent()}{'break' if keyword == 'break' else 'continue'};"]
+        if kind == "block":
+            return self._block(node)
+        if kind == "function":
+            raise CodegenError(
+                f"Nested function '{function_name(node)}' is not supported by the C backend"
+            )
+        if node.node_type == "Comment" or (
+            node.node_type == "KeywordStatement"
+            and node_attrs(node).get("original_keyword") == "pass"
+        ):
+            return []
+        raise CodegenError(f"Unsupported statement for C: {node.node_type}")
+
+    def _nested(self, node: Optional[ASTNode]) -> List[str]:
+        self.generator.indent_level += 1
+        try:
+            return self._block(node)
+        finally:
+            self.generator.indent_level -= 1
+
+    def _if(self, node: ASTNode) -> str:
+        condition, then_block, else_block = if_parts(node)
+        test = self._condition(node, condition)
+        then_lines = self._nested(then_block)
+        else_lines = self._nested(else_block) if else_block is not None else None
+        return self.generator.gen_if(test, then_lines, else_lines)
+
+    def _loop(self, node: ASTNode) -> str:
+        if node.node_type not in ("while", "WhileLoop"):
+            raise CodegenError(f"Unsupported loop for C: {node.node_type}")
+        header = [child for child in node.children if node_kind(child) != "block"]
+        test = self._condition(node, header[0] if header else None)
+        body = ASTNode("block", children=[
+            child for child in node.children if node_kind(child) == "block"
+        ])
+        return self.generator.gen_while(test, self._nested(body))
+
+    def _condition(self, node: ASTNode, condition: Optional[ASTNode]) -> str:
+        if condition is None:
+            raw = node_attrs(node).get("condition")
+            if isinstance(raw, bool):
+                return "1" if raw else "0"
+            raise CodegenError(f"{node.node_type} without a condition expression")
+        return _truth(*self._expression(condition))
+
+    # === Expressions ===
+    # Each returns (C code, representation): "int", "float", "bool" or "value"
+
+    def _value(self, value: Any) -> Tuple[str, str]:
+        """Lower an expression node or a constant attribute value."""
+        if hasattr(value, "node_type"):
+            return self._expression(value)
+        if value is None:
+            return "pc_none()", "value"
+        if isinstance(value, str):
+            raise CodegenError(f"Raw expression text {value!r} cannot be lowered to C")
+        return _c_number(value)
+
+    def _expression(self, node: ASTNode) -> Tuple[str, str]:
+        kind = node_kind(node)
+        if kind == "literal":
+            value = literal_value(node)
+            if value is UNKNOWN:
+                raise CodegenError(f"Unsupported literal for C: {node.value!r}")
+            if isinstance(value, str):
+                return f"pc_str({_c_string(value)})", "value"
+            return _c_number(value)
+        if kind == "name":
+            return self._variable(node, name_of(node))
+        if kind == "binary":
+            return self._binary(node)
+        if kind == "unary":
+            return self._unary(node)
+        if kind == "call":
+            return self._call(node)
+        if kind == "expression" and node.children:
+            return self._expression(node.children[0])
+        raise CodegenError(f"Unsupported expression for C: {node.node_type}")
+
+    def _variable(self, node: ASTNode, name: str) -> Tuple[str, str]:
+        ref = self.resolution.ref_for(node)
+        if ref is None:
+            raise CodegenError(f"Undefined name: '{name}'")
+        if self._is_module_function(name, ref):
+            raise CodegenError(f"Function '{name}' used as a value")
+        layout = self._layouts[-1 - ref.depth]
+        return _c_name(name), self._binding_representation(layout, name)
+
+    def _is_module_function(self, name: str, ref: SlotRef) -> bool:
+        """True if ``ref`` addresses the module binding of function ``name``."""
+        module_depth = 0 if self.current_function is None else 1
+        return ref.depth == module_depth and name in self._module_functions
+
+    def _binary(self, node: ASTNode) -> Tuple[str, str]:
+        symbol = node_attrs(node).get("operator", node.value)
+        if len(node.children) != 2:
+            raise CodegenError(f"Operator '{symbol}' needs two operands")
+        left_node, right_node = node.children
+        if node_attrs(left_node).get("position") == "right":
+            left_node, right_node = right_node, left_node
+        left, left_kind = self._expression(left_node)
+        right, right_kind = self._expression(right_node)
+
+        logic = _C_LOGIC.get(symbol)
+        if logic is not None:
+            # a and b: a if a is falsy, else b; a or b: a if a is truthy, else b
+            result = self._type_representation(self.types.type_of(node))
+            temp = self._temp(left_kind)
+            test = _truth(f"({temp} = {left})", left_kind)
+            kept = _convert(temp, left_kind, result)
+            other = _convert(right, right_kind, result)
+            if logic == "and":
+                return f"({test} ? {other} : {kept})", result
+            return f"({test} ? {kept} : {other})", result
+
+        if left_kind == "value" or right_kind == "value":
+            left = _convert(left, left_kind, "value")
+            right = _convert(right, right_kind, "value")
+            if symbol in _C_VALUE_COMPARE:
+                return f"pc_compare({_C_VALUE_COMPARE[symbol]}, {left}, {right})", "bool"
+            if symbol in _C_VALUE_ARITH:
+                return f"pc_arith({_C_VALUE_ARITH[symbol]}, {left}, {right})", "value"
+            raise CodegenError(f"Unsupported operator for C: {symbol}")
+
+        integral = "float" not in (left_kind, right_kind)
+        if symbol in ("/", "**") and integral:
+            # The quotient or power may be an int or a float at run time
+            left = _convert(left, left_kind, "value")
+            right = _convert(right, right_kind, "value")
+            return f"pc_arith({_C_VALUE_ARITH[symbol]}, {left}, {right})", "value"
+        if symbol == "/":
+            return f"pc_div({left}, {right})", "float"
+        if symbol == "**":
+            return f"pow({left}, {right})", "float"
+        if symbol == "%":
+            return (f"pc_mod_i({left}, {right})", "int") if integral else (
+                f"pc_mod({left}, {right})", "float"
+            )
+        if symbol == "//":
+            return (f"pc_floordiv_i({left}, {right})", "int") if integral else (
+                f"pc_floordiv({left}, {right})", "float"
+            )
+        if integral and symbol in _C_CHECKED_INT:
+            return f"{_C_CHECKED_INT[symbol]}({left}, {right})", "int"
+        c_symbol = _C_OPERATORS.get(symbol)
+        if c_symbol is None:
+            raise CodegenError(f"Unsupported operator for C: {symbol}")
+        code = self.generator.gen_binary_op(left, c_symbol, right)
+        if symbol in _COMPARISONS:
+            return code, "bool"
+        return code, "int" if integral else "float"
+
+    def _unary(self, node: ASTNode) -> Tuple[str, str]:
+        symbol = node_attrs(node).get("operator", node.value)
+        if symbol != "not" or len(node.children) != 1:
+            raise CodegenError(f"Unsupported operator for C: {symbol}")
+        return f"(!{_truth(*self._expression(node.children[0]))})", "bool"
+
+    def _call(self, node: ASTNode) -> Tuple[str, str]:
+        name = node_attrs(node).get("name") or node.value
+        arg_nodes = node.children
+        if len(arg_nodes) == 1 and arg_nodes[0].node_type == "Arguments":
+            arg_nodes = arg_nodes[0].children
+
+        ref = self.resolution.ref_for(node)
+        if ref is None:
+            return self._builtin_call(name, arg_nodes)
+
+        signature = self.symbol_table.lookup_function(name)
+        if signature is None or not self._is_module_function(name, ref):
+            raise CodegenError(f"'{name}' is not a function")
+        if len(signature[0]) != len(arg_nodes):
+            raise CodegenError(
+                f"{name}() takes {len(signature[0])} argument(s), got {len(arg_nodes)}"
+            )
+        function = self._module_functions[name]
+        layout = self.resolution.layout_for(function)
+        args = []
+        for param_name, arg in zip(layout.params, arg_nodes):
+            code, source = self._expression(arg)
+            args.append(
+                _convert(code, source, self._binding_representation(layout, param_name))
+            )
+        result = self._type_representation(self.types.return_type(function))
+        return self.generator.gen_function_call(_c_name(name), args), result
+
+    def _builtin_implementation(self, name: str) -> str:
+        implementation = name
+        if self.config is not None:
+            implementation = self.config.compiled().function_map.get(name, name)
+        return implementation.rsplit(".", 1)[-1]
+
+    def _builtin_call(self, name: str, arg_nodes: List[Any]) -> Tuple[str, str]:
+        implementation = self._builtin_implementation(name)
+
+        if implementation == "print":
+            parts = []
+            for index, arg in enumerate(arg_nodes):
+                value = literal_value(arg)
+                separate = 1 if index else 0
+                if isinstance(value, str):
+                    parts.append(f"pc_print_string({_c_string(value)}, {separate})")
+                else:
+                    code, representation = self._expression(arg)
+                    parts.append(f"{_C_PRINTERS[representation]}({code}, {separate})")
+            parts.append("pc_print_end()")
+            return "(" + ", ".join(parts) + ")", "value"
+
+        builtin = _C_BUILTINS.get(implementation)
+        if builtin is None:
+            raise CodegenError(f"Builtin '{name}' is not supported by the C backend")
+        arity = 1 if implementation == "abs" else 2
+        if len(arg_nodes) != arity:
+            raise CodegenError(f"{name}() takes {arity} argument(s), got {len(arg_nodes)}")
+        args = [self._expression(arg) for arg in arg_nodes]
+        # Like Python, min/max of an int and a float return one of them unchanged
+        kinds = {"int" if kind == "bool" else kind for _, kind in args}
+        target = kinds.pop() if len(kinds) == 1 else "value"
+        return self.generator.gen_function_call(
+            builtin[target], [_convert(code, kind, target) for code, kind in args]
+        ), target
+
+
+# Guest types with a WASM value type; the WASM backend lowers nothing else
+_WASM_TYPES = {"int": WasmType.I64, "float": WasmType.F64, "bool": WasmType.I32}
+_WASM_ZERO = {"int": "(i64.const 0)", "float": "(f64.const 0)", "bool": "(i32.const 0)"}
+_WASM_COMPARE = {"==": "eq", "!=": "ne", "<": "lt", ">": "gt", "<=": "le", ">=": "ge"}
+_WASM_FLOAT_ARITH = {"+": "f64.add", "-": "f64.sub", "*": "f64.mul"}
+_WASM_BUILTINS = ("abs", "min", "max")
+_WASM_ENTRY = "_start"
+
+# Integer arithmetic goes through checked helpers: guest symbol -> helper
+_WASM_INT_ARITH = {
+    "+": "pc_add_i",
+    "-": "pc_sub_i",
+    "*": "pc_mul_i",
+    "//": "pc_floordiv_i",
+    "%": "pc_mod_i",
+}
+
+# Host imports from module "env", each taking one value
+_WASM_PRINTERS = {"int": "pc_print_int", "float": "pc_print_float", "bool": "pc_print_bool"}
+_WASM_PRINT_CHAR = "pc_print_char"  # one Unicode code point
+_WASM_IMPORTS = {
+    "pc_print_int": WasmType.I64,
+    "pc_print_float": WasmType.F64,
+    "pc_print_bool": WasmType.I32,
+    _WASM_PRINT_CHAR: WasmType.I32,
+}
+_WASM_CALL = re.compile(r"\(call \$(pc_\w+)")
+
+
+def _wasm_helper(
+    name: str, params: str, body: List[str], kind: WasmType = WasmType.I64, local_names: str = ""
+) -> WasmFunction:
+    """A helper whose params, locals and result all have type ``kind``."""
+    return WasmFunction(
+        name=name,
+        params=[(param, kind) for param in params.split()],
+        return_type=kind,
+        locals=[WasmLocal(local, kind) for local in local_names.split()],
+        body=body,
+    )
+
+
+def _wasm_helpers() -> Dict[str, WasmFunction]:
+    """Fresh copies of the arithmetic helpers; runtime errors trap."""
+    overflow = "(then unreachable)"
+    helpers = [
+        # Signed overflow: the result's sign differs from both operands' (add)
+        _wasm_helper("pc_add_i", "a b", [
+            "(local.set $r (i64.add (local.get $a) (local.get $b)))",
+            "(if (i64.lt_s (i64.and (i64.xor (local.get $a) (local.get $r))",
+            "                       (i64.xor (local.get $b) (local.get $r)))",
+            f"             (i64.const 0)) {overflow})",
+            "(local.get $r)",
+        ], local_names="r"),
+        _wasm_helper("pc_sub_i", "a b", [
+            "(local.set $r (i64.sub (local.get $a) (local.get $b)))",
+            "(if (i64.lt_s (i64.and (i64.xor (local.get $a) (local.get $b))",
+            "                       (i64.xor (local.get $a) (local.get $r)))",
+            f"             (i64.const 0)) {overflow})",
+            "(local.get $r)",
+        ], local_names="r"),
+        # r / a != b unless a * b fit; i64.div_s itself traps on MIN / -1
+        _wasm_helper("pc_mul_i", "a b", [
+            "(local.set $r (i64.mul (local.get $a) (local.get $b)))",
+            "(if (i64.ne (local.get $a) (i64.const 0))",
+            "  (then",
+            "    (if (i64.ne (i64.div_s (local.get $r) (local.get $a)) (local.get $b))",
+            f"      {overflow})))",
+            "(local.get $r)",
+        ], local_names="r"),
+        # Round toward negative infinity; zero divisors trap in i64.div_s
+        _wasm_helper("pc_floordiv_i", "a b", [
+            "(local.set $q (i64.div_s (local.get $a) (local.get $b)))",
+            "(if (i32.and (i64.ne (i64.rem_s (local.get $a) (local.get $b)) (i64.const 0))",
+            "             (i64.lt_s (i64.xor (local.get $a) (local.get $b)) (i64.const 0)))",
+            "  (then (local.set $q (i64.sub (local.get $q) (i64.const 1)))))",
+            "(local.get $q)",
+        ], local_names="q"),
+        # The remainder takes the divisor's sign
+        _wasm_helper("pc_mod_i", "a b", [
+            "(local.set $r (i64.rem_s (local.get $a) (local.get $b)))",
+            "(if (i32.and (i64.ne (local.get $r) (i64.const 0))",
+            "             (i64.lt_s (i64.xor (local.get $r) (local.get $b)) (i64.const 0)))",
+            "  (then (local.set $r (i64.add (local.get $r) (local.get $b)))))",
+            "(local.get $r)",
+        ], local_names="r"),
+        _wasm_helper("pc_abs_i", "a", [
+            f"(if (i64.eq (local.get $a) (i64.const {-(2**63)})) {overflow})",
+            "(select (i64.sub (i64.const 0) (local.get $a)) (local.get $a)",
+            "        (i64.lt_s (local.get $a) (i64.const 0)))",
+        ]),
+        _wasm_helper("pc_min_i", "a b", [
+            "(select (local.get $a) (local.get $b) (i64.le_s (local.get $a) (local.get $b)))",
+        ]),
+        _wasm_helper("pc_max_i", "a b", [
+            "(select (local.get $a) (local.get $b) (i64.ge_s (local.get $a) (local.get $b)))",
+        ]),
+        _wasm_helper("pc_div_f", "a b", [
+            f"(if (f64.eq (local.get $b) (f64.const 0)) {overflow})",
+            "(f64.div (local.get $a) (local.get $b))",
+        ], kind=WasmType.F64),
+    ]
+    return {helper.name: helper for helper in helpers}
+
+
+def _wasm_number(value: Any) -> Tuple[str, str]:
+    """WAT constant and representation for a guest number."""
+    if isinstance(value, bool):
+        return f"(i32.const {int(value)})", "bool"
+    if isinstance(value, int):
+        if not -(2**63) <= value < 2**63:
+            raise CodegenError(f"Integer literal out of 64-bit range: {value}")
+        return f"(i64.const {value})", "int"
+    number = float(value)
+    if not math.isfinite(number):
+        raise CodegenError(f"Number literal out of range: {value!r}")
+    return f"(f64.const {number!r})", "float"
+
+
+def _wasm_truth(code: str, representation: str) -> str:
+    if representation == "int":
+        return f"(i64.ne {code} (i64.const 0))"
+    if representation == "float":
+        return f"(f64.ne {code} (f64.const 0))"
+    return code
+
+
+def _wasm_convert(code: str, source: str, target: str) -> str:
+    """Convert WAT expression ``code`` between representations."""
+    if source == target:
+        return code
+    if target == "bool":
+        return _wasm_truth(code, source)
+    if (source, target) == ("bool", "int"):
+        return f"(i64.extend_i32_u {code})"
+    if (source, target) == ("bool", "float"):
+        return f"(f64.convert_i32_u {code})"
+    if (source, target) == ("int", "float"):
+        return f"(f64.convert_i64_s {code})"
+    raise CodegenError(f"Cannot convert {source} to {target} in WASM")
 
 
 class ASTToWasmGenerator(ASTVisitor):
-    """Converts AST to WebAssembly."""
-
-    def __init__(self, config: Any = None):
+    """Lowers an AST to a WebAssembly module.
+
+    Covers the subset ``ASTToCGenerator`` does, for both node shapes (see
+    ``ast_optimizer.node_kind``): module-level functions, assignments,
+    if/else, while, break/continue, return, calls, arithmetic, comparisons,
+    ``and``/``or`` and ``not``, plus ``print`` and ``abs``/``min``/``max``.
+    Top-level statements become the exported ``_start`` function; module
+    functions are exported under their own names.
+
+    WASM has no tagged values, so every variable, parameter and return value
+    needs an ``int`` (``i64``), ``float`` (``f64``) or ``bool`` (``i32``)
+    type from ``TypeInferencePass``. Anything else raises ``CodegenError``:
+    other types, strings outside ``print``, nested functions, functions that
+    use module variables (the module has no globals), ``/`` and ``**`` on
+    integers, and float ``%`` and ``**``. Integer overflow and division by
+    zero trap, where the C output fails with a runtime error.
+
+    ``print`` calls host imports from module ``env``: ``pc_print_int(i64)``,
+    ``pc_print_float(f64)``, ``pc_print_bool(i32)`` and
+    ``pc_print_char(i32)``, which takes a Unicode code point and also
+    writes string literals, separators and the newline. Only the imports and
+    helpers the code calls are added.
+
+    With a ``CodegenCache``, unchanged functions (same subtree, same binding
+    types and signatures of what they reference) are reused; see
+    ``codegen_stats``. ``jobs`` > 1 lowers the remaining functions in worker
+    processes.
+    """
+
+    def __init__(
+        self,
+        config: Any = None,
+        optimizer: Optional[OptimizationPipeline] = None,
+        pass_manager: Optional[PassManager] = None,
+        type_inference: Optional[TypeInferencePass] = None,
+        cache: Optional[CodegenCache] = None,
+        jobs: int = 1,
+    ):
         self.generator = WasmGenerator()
         self.module = WasmModule()
+        self.module.set_memory_size(0)  # the lowered code keeps no data in memory
+        self.resolution: Optional[Resolution] = None
+        self.types: Optional[TypeInferencePass] = type_inference
         self.symbol_table = SymbolTable()
         self.config = config
         self.current_function: Optional[str] = None
+        self.optimizer = optimizer
+        self.optimization_report: Optional[OptimizationReport] = None
+        self.pass_manager = pass_manager
+        self.cache = cache
+        self.codegen_stats = CodegenStats()
+        self.jobs = jobs
+        self._module_functions: Dict[str, ASTNode] = {}
+        self._layouts: List[FrameLayout] = []
+        self._return_representation: Optional[str] = None
+        self._temps: List[WasmLocal] = []
+        self._loops = 0
+        self._function_keys: Dict[int, str] = {}
+        self._prelowered: Dict[int, WasmFunction] = {}
 
     def translate(self, ast: ASTNode, config: Any = None) -> WasmModule:
         """Translate AST to WASM module."""
+        self.codegen_stats = CodegenStats()
         if config:
             self.config = config
 
-        # First pass: collect symbols
-        self._collect_symbols(ast)
+        if self.optimizer is not None:
+            self.optimization_report = self.optimizer.run(ast, self.pass_manager)
+
+        # First pass: collect symbols and types (shared when a pass manager is given)
+        if self.pass_manager is not None:
+            self._use_shared_symbols(ast)
+            self.resolution = self.pass_manager.get(ast, "resolution")
+            if self.types is None:
+                self.types = self.pass_manager.get(ast, "types")
+            elif self.types.resolution is not self.resolution:
+                self.types.infer(ast, self.resolution)
+        else:
+            self._collect_symbols(ast)
+            self.resolution = Resolver().resolve(ast)
+            self.types = self.types or TypeInferencePass()
+            self.types.infer(ast, self.resolution)
 
         # Second pass: generate code
+        if node_kind(ast) != "program":
+            raise CodegenError(f"Expected a program, got {ast.node_type}")
         self.visit(ast)
+        self._link()
 
         return self.module
 
     def _collect_symbols(self, node: ASTNode) -> None:
         """First pass: collect declarations."""
-        if node.node_type == "function":
-            func_name = node.attributes.get("name", "unknown")
-            params = node.attributes.get("params", [])
-            return_type = node.attributes.get("return_type", "i32")
-            self.symbol_table.declare_function(func_name, params, return_type)
+        if node_kind(node) == "function":
+            return_type = node_attrs(node).get("return_type", "int")
+            self.symbol_table.declare_function(
+                function_name(node), function_params(node), return_type
+            )
 
         for child in node.children:
             self._collect_symbols(child)
 
+    def _use_shared_symbols(self, ast: ASTNode) -> None:
+        """Take function signatures from the pass manager's symbols analysis."""
+        shared = self.pass_manager.get(ast, "symbols")
+        for func_name, (params, return_type) in shared.functions.items():
+            self.symbol_table.declare_function(
+                func_name, list(params), return_type or "int"
+            )
+
+    # === Program Structure ===
+
+    def _representation(self, inferred: str, what: str) -> str:
+        """``inferred`` if it has a WASM value type, else a ``CodegenError``."""
+        if inferred not in _WASM_TYPES:
+            raise CodegenError(
+                f"The WASM backend needs an int, float or bool type for {what}, not '{inferred}'"
+            )
+        return inferred
+
+    def _binding_representation(self, layout: FrameLayout, name: str) -> str:
+        return self._representation(self.types.binding_type(layout, name), f"'{name}'")
+
+    def _result_representation(self, function: ASTNode) -> Optional[str]:
+        """Representation of a function's return value (None: it returns none)."""
+        inferred = self.types.return_type(function)
+        if inferred == "none" or not self._returns_value(function):
+            return None
+        return self._representation(inferred, f"the result of '{function_name(function)}'")
+
+    @staticmethod
+    def _returns_value(function: ASTNode) -> bool:
+        """True if a ``return`` in ``function`` (not in nested ones) has a value."""
+        stack = list(function.children)
+        while stack:
+            node = stack.pop()
+            kind = node_kind(node)
+            if kind == "return" and (node.children or node_attrs(node).get("value") is not None):
+                return True
+            if kind != "function":
+                stack.extend(node.children)
+        return False
+
     def visit_program(self, node: ASTNode) -> None:
-        """Visit program node."""
-        for child in node.children:
+        """Visit program node (root): functions, then ``_start``."""
+        module = self.resolution.module
+        self._layouts = [module]
+        self._module_functions = {
+            function_name(child): child
+            for child in node.children
+            if node_kind(child) == "function"
+        }
+        if _WASM_ENTRY in self._module_functions:
+            raise CodegenError(f"Function name '{_WASM_ENTRY}' is reserved by the WASM backend")
+
+        functions = [child for child in node.children if node_kind(child) == "function"]
+        if self.jobs != 1:
+            self._lower_in_parallel(functions)
+        for child in functions:
             self.visit(child)
 
+        self.current_function = None
+        self._temps = []
+        body: List[str] = []
+        for child in node.children:
+            if node_kind(child) != "function":
+                body.extend(self._statement(child))
+        variables = [
+            WasmLocal(name, _WASM_TYPES[self._binding_representation(module, name)])
+            for name in module.names
+            if name not in self._module_functions
+        ]
+        self.module.add_function(WasmFunction(
+            name=_WASM_ENTRY, locals=variables + self._temps, body=body, is_export=True,
+        ))
+
     def visit_function(self, node: ASTNode) -> None:
         """Visit function definition."""
-        func_name = node.attributes.get("name", "unknown")
-        return_type = node.attributes.get("return_type", "i32")
-        params = node.attributes.get("params", [])
-
+        layout = self.resolution.layout_for(node)
+        if layout.depth > 1:
+            raise CodegenError(
+                f"Nested function '{function_name(node)}' is not supported by the WASM backend"
+            )
+
+        self.codegen_stats.functions += 1
+        key = None
+        if self.cache is not None:
+            key = self._function_keys.pop(id(node), None) or self._function_key(node, layout)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.module.add_function(cached)
+                return
+        self.codegen_stats.regenerated += 1
+
+        lowered = self._prelowered.pop(id(node), None) or self._lower_function(node)
+        self.module.add_function(lowered)
+        if key is not None:
+            self.cache.put(key, lowered)
+
+    visit_Program = visit_program
+    visit_FunctionDef = visit_function
+
+    def _lower_in_parallel(self, functions: List[ASTNode]) -> None:
+        """Lower the functions the cache cannot supply across ``jobs`` processes."""
+        pending = []
+        for node in functions:
+            layout = self.resolution.layout_for(node)
+            if layout.depth > 1:
+                continue  # visit_function reports it
+            if self.cache is not None:
+                key = self._function_key(node, layout)
+                self._function_keys[id(node)] = key
+                if key in self.cache:
+                    continue
+            pending.append(node)
+        lowered = lower_in_parallel(self, "_lower_function", pending, self.jobs)
+        for node, wasm_func in zip(pending, lowered):
+            self._prelowered[id(node)] = wasm_func
+
+    def _lower_function(self, node: ASTNode) -> WasmFunction:
+        """Generate the WASM function for a module-level function node."""
+        func_name = function_name(node)
+        layout = self.resolution.layout_for(node)
         self.current_function = func_name
-        self.symbol_table.push_scope()
-
-        # Map return type
-        wasm_return = self._translate_type(return_type)
-
-        # Create WASM function
-        wasm_func = WasmFunction(
+        self._layouts.append(layout)
+        self._temps = []
+        self._return_representation = self._result_representation(node)
+
+        params = [
+            (name, _WASM_TYPES[self._binding_representation(layout, name)])
+            for name in layout.params
+        ]
+        body = self._block(node)
+        variables = [
+            WasmLocal(name, _WASM_TYPES[self._binding_representation(layout, name)])
+            for name in layout.locals
+        ]
+        if self._return_representation is not None:
+            # Falling off the end returns zero, as in the C output
+            body.append(_WASM_ZERO[self._return_representation])
+
+        self._layouts.pop()
+        self.current_function = None
+        return WasmFunction(
             name=func_name,
-            return_type=wasm_return,
-            params=[(p, WasmType.I32) for p in params],
+            params=params,
+            return_type=(
+                _WASM_TYPES[self._return_representation]
+                if self._return_representation is not None
+                else None
+            ),
+            locals=variables + self._temps,
+            body=body,
+            is_export=True,
         )
 
-        # Add to module
-        self.module.add_function(wasm_func)
+    def _function_key(self, node: ASTNode, layout: FrameLayout) -> str:
+        """Cache key: the subtree, its binding types, and what it references."""
+        references = []
+        for name, depth in external_references(node, self.resolution):
+            if depth < 0:
+                references.append((name, "builtin", self._builtin_implementation(name)))
+            elif depth == 1 and name in self._module_functions:
+                function = self._module_functions[name]
+                callee = self.resolution.layout_for(function)
+                references.append((
+                    name,
+                    "function",
+                    tuple(self.types.binding_type(callee, p) for p in callee.params),
+                    self.types.return_type(function),
+                ))
+            else:
+                references.append((name, "global", depth))
+        return CodegenCache.key(
+            "wasm",
+            subtree_fingerprint(node),
+            tuple((name, self.types.binding_type(layout, name)) for name in layout.names),
+            self.types.return_type(node),
+            tuple(references),
+        )
 
-        # Visit function body
+    def _link(self) -> None:
+        """Add the helpers and host imports that the generated code calls."""
+        called = set()
+        for func in self.module.functions.values():
+            for instruction in func.body:
+                called.update(_WASM_CALL.findall(instruction))
+        for name, helper in _wasm_helpers().items():
+            if name in called:
+                self._reserve(name)
+                self.module.add_function(helper)
+        for name, value_type in _WASM_IMPORTS.items():
+            if name in called:
+                self._reserve(name)
+                self.module.add_import(WasmImport("env", name, [("value", value_type)]))
+
+    def _reserve(self, name: str) -> None:
+        if name in self._module_functions:
+            raise CodegenError(f"Function name '{name}' is reserved by the WASM backend")
+
+    def _temp(self, representation: str) -> str:
+        name = f"tmp.{len(self._temps)}"  # "." keeps it apart from guest names
+        self._temps.append(WasmLocal(name, _WASM_TYPES[representation]))
+        return f"${name}"
+
+    # === Statements ===
+
+    def _block(self, node: Optional[ASTNode]) -> List[str]:
+        """Lower the statements of a block, function or branch."""
+        lines: List[str] = []
+        if node is None:
+            return lines
         for child in node.children:
-            self.visit(child)
-
-        self.symbol_table.pop_scope()
-        self.current_function = None
+            if child.node_type == "Parameters":
+                continue
+            lines.extend(self._statement(child))
+        return lines
+
+    def _statement(self, node: ASTNode) -> List[str]:
+        kind = node_kind(node)
+        if kind == "assign":
+            name = assign_target(node)
+            code, source = self._value(assign_value(node))
+            representation = self._variable(node, name)
+            return [f"(local.set ${name} {_wasm_convert(code, source, representation)})"]
+        if kind == "expression":
+            return self._discard(self._expression(node.children[0]))
+        if kind in ("call", "binary", "unary", "name", "literal"):
+            return self._discard(self._expression(node))
+        if kind == "if":
+            condition, then_block, else_block = if_parts(node)
+            return self.generator.generate_if(
+                self._condition(node, condition),
+                self._block(then_block),
+                self._block(else_block) if else_block is not None else None,
+            )
+        if kind == "loop":
+            return self._loop(node)
+        if kind == "return":
+            return self._return(node)
+        if kind == "jump":
+            keyword = node_attrs(node).get("original_keyword") or node.node_type
+            if not self._loops:
+                raise CodegenError(f"'{keyword}' outside a loop")
+            return ["(br $break)" if keyword == "break" else "(br $continue)"]
+        if kind == "block":
+            return self._block(node)
+        if kind == "function":
+            raise CodegenError(
+                f"Nested function '{function_name(node)}' is not supported by the WASM backend"
+            )
+        if node.node_type == "Comment" or (
+            node.node_type == "KeywordStatement"
+            and node_attrs(node).get("original_keyword") == "pass"
+        ):
+            return []
+        raise CodegenError(f"Unsupported statement for WASM: {node.node_type}")
+
+    def _loop(self, node: ASTNode) -> List[str]:
+        if node.node_type not in ("while", "WhileLoop"):
+            raise CodegenError(f"Unsupported loop for WASM: {node.node_type}")
+        header = [child for child in node.children if node_kind(child) != "block"]
+        test = self._condition(node, header[0] if header else None)
+        body = ASTNode("block", children=[
+            child for child in node.children if node_kind(child) == "block"
+        ])
+        # generate_loop leaves the loop when its condition holds
+        self._loops += 1
+        try:
+            return self.generator.generate_loop(f"(i32.eqz {test})", self._block(body))
+        finally:
+            self._loops -= 1
+
+    def _return(self, node: ASTNode) -> List[str]:
+        if node.children:
+            value = self._expression(node.children[0])
+        else:
+            raw = node_attrs(node).get("value")
+            value = self._value(raw) if raw is not None else None
+        if self.current_function is None or self._return_representation is None:
+            # _start, or a function that returns none: just stop
+            return (self._discard(value) if value is not None else []) + ["return"]
+        code, source = self._operand(value)
+        return [f"(return {_wasm_convert(code, source, self._return_representation)})"]
+
+    def _discard(self, value: Tuple[str, Optional[str]]) -> List[str]:
+        """Instructions that evaluate ``value`` for its side effects only."""
+        code, representation = value
+        return [code] if representation is None else [f"(drop {code})"]
+
+    def _condition(self, node: ASTNode, condition: Optional[ASTNode]) -> str:
+        if condition is None:
+            raw = node_attrs(node).get("condition")
+            if isinstance(raw, bool):
+                return f"(i32.const {int(raw)})"
+            raise CodegenError(f"{node.node_type} without a condition expression")
+        return _wasm_truth(*self._operand(self._expression(condition)))
+
+    # === Expressions ===
+    # Each returns (WAT code, representation): "int", "float", "bool", or
+    # None for code that leaves no value (print, functions returning none)
+
+    @staticmethod
+    def _operand(value: Tuple[str, Optional[str]]) -> Tuple[str, str]:
+        code, representation = value
+        if representation is None:
+            raise CodegenError("An expression without a value is used as a value")
+        return code, representation
+
+    def _value(self, value: Any) -> Tuple[str, str]:
+        """Lower an expression node or a constant attribute value."""
+        if hasattr(value, "node_type"):
+            return self._operand(self._expression(value))
+        if value is None:
+            raise CodegenError("None values are not supported by the WASM backend")
+        if isinstance(value, str):
+            raise CodegenError(f"Raw expression text {value!r} cannot be lowered to WASM")
+        return _wasm_number(value)
+
+    def _expression(self, node: ASTNode) -> Tuple[str, Optional[str]]:
+        kind = node_kind(node)
+        if kind == "literal":
+            value = literal_value(node)
+            if value is UNKNOWN:
+                raise CodegenError(f"Unsupported literal for WASM: {node.value!r}")
+            if isinstance(value, str):
+                raise CodegenError("Strings are supported by the WASM backend only as print arguments")
+            return _wasm_number(value)
+        if kind == "name":
+            name = name_of(node)
+            return f"(local.get ${name})", self._variable(node, name)
+        if kind == "binary":
+            return self._binary(node)
+        if kind == "unary":
+            return self._unary(node)
+        if kind == "call":
+            return self._call(node)
+        if kind == "expression" and node.children:
+            return self._expression(node.children[0])
+        raise CodegenError(f"Unsupported expression for WASM: {node.node_type}")
+
+    def _variable(self, node: ASTNode, name: str) -> str:
+        """Representation of the local that ``node`` reads or assigns."""
+        ref = self.resolution.ref_for(node)
+        if ref is None:
+            raise CodegenError(f"Undefined name: '{name}'")
+        if self._is_module_function(name, ref):
+            raise CodegenError(f"Function '{name}' used as a value")
+        if self.current_function is not None and ref.depth > 0:
+            raise CodegenError(
+                f"Function '{self.current_function}' uses module variable '{name}',"
+                " which the WASM backend does not support"
+            )
+        return self._binding_representation(self._layouts[-1 - ref.depth], name)
+
+    def _is_module_function(self, name: str, ref: SlotRef) -> bool:
+        """True if ``ref`` addresses the module binding of function ``name``."""
+        module_depth = 0 if self.current_function is None else 1
+        return ref.depth == module_depth and name in self._module_functions
+
+    def _binary(self, node: ASTNode) -> Tuple[str, str]:
+        symbol = node_attrs(node).get("operator", node.value)
+        if len(node.children) != 2:
+            raise CodegenError(f"Operator '{symbol}' needs two operands")
+        left_node, right_node = node.children
+        if node_attrs(left_node).get("position") == "right":
+            left_node, right_node = right_node, left_node
+        left, left_kind = self._operand(self._expression(left_node))
+        right, right_kind = self._operand(self._expression(right_node))
+
+        logic = _C_LOGIC.get(symbol)
+        if logic is not None:
+            # a and b: a if a is falsy, else b; a or b: a if a is truthy, else b
+            result = self._representation(self.types.type_of(node), f"the result of '{symbol}'")
+            temp = self._temp(left_kind)
+            test = _wasm_truth(f"(local.tee {temp} {left})", left_kind)
+            kept = _wasm_convert(f"(local.get {temp})", left_kind, result)
+            other = _wasm_convert(right, right_kind, result)
+            then, otherwise = (other, kept) if logic == "and" else (kept, other)
+            return (
+                f"(if (result {_WASM_TYPES[result].value}) {test}"
+                f" (then {then}) (else {otherwise}))"
+            ), result
+
+        if "float" in (left_kind, right_kind):
+            operands = "float"
+        elif left_kind == right_kind == "bool" and symbol in _COMPARISONS:
+            operands = "bool"
+        else:
+            operands = "int"
+        left = _wasm_convert(left, left_kind, operands)
+        right = _wasm_convert(right, right_kind, operands)
+
+        if symbol in _WASM_COMPARE:
+            instruction = _WASM_COMPARE[symbol]
+            if operands != "float" and instruction not in ("eq", "ne"):
+                instruction += "_s"
+            return f"({_WASM_TYPES[operands].value}.{instruction} {left} {right})", "bool"
+        if operands == "int" and symbol in _WASM_INT_ARITH:
+            return f"(call ${_WASM_INT_ARITH[symbol]} {left} {right})", "int"
+        if operands == "float":
+            if symbol in _WASM_FLOAT_ARITH:
+                return f"({_WASM_FLOAT_ARITH[symbol]} {left} {right})", "float"
+            if symbol == "/":
+                return f"(call $pc_div_f {left} {right})", "float"
+            if symbol == "//":
+                return f"(f64.floor (call $pc_div_f {left} {right}))", "float"
+        raise CodegenError(
+            f"Operator '{symbol}' on {left_kind} and {right_kind} is not supported by the WASM backend"
+        )
 
-    def visit_return(self, node: ASTNode) -> None:
-        """Visit return statement."""
-        # value = node.attributes.get("value", "0")
-
-        if self.current_function and self.current_function in {f.name for f in self.module.functions.values()}:
-            func = self.module.functions[self.current_function]
-            func.body.append("return")
-
-    def _translate_type(self, lang_type: str) -> WasmType:
-        """Translate language type to WASM type."""
-        type_map = {
-            "int": WasmType.I32,
-            "i32": WasmType.I32,
-            "i64": WasmType.I64,
-            "float": WasmType.F32,
-            "f32": WasmType.F32,
-            "f64": WasmType.F64,
-            "bool": WasmType.I32,
-        }
-        return type_map.get(lang_type, WasmType.I32)
+    def _unary(self, node: ASTNode) -> Tuple[str, str]:
+        symbol = node_attrs(node).get("operator", node.value)
+        if symbol != "not" or len(node.children) != 1:
+            raise CodegenError(f"Unsupported operator for WASM: {symbol}")
+        operand = self._operand(self._expression(node.children[0]))
+        return f"(i32.eqz {_wasm_truth(*operand)})", "bool"
+
+    def _call(self, node: ASTNode) -> Tuple[str, Optional[str]]:
+        name = node_attrs(node).get("name") or node.value
+        arg_nodes = node.children
+        if len(arg_nodes) == 1 and arg_nodes[0].node_type == "Arguments":
+            arg_nodes = arg_nodes[0].children
+
+        ref = self.resolution.ref_for(node)
+        if ref is None:
+            return self._builtin_call(name, arg_nodes)
+
+        signature = self.symbol_table.lookup_function(name)
+        if signature is None or not self._is_module_function(name, ref):
+            raise CodegenError(f"'{name}' is not a function")
+        if len(signature[0]) != len(arg_nodes):
+            raise CodegenError(
+                f"{name}() takes {len(signature[0])} argument(s), got {len(arg_nodes)}"
+            )
+        function = self._module_functions[name]
+        layout = self.resolution.layout_for(function)
+        args = []
+        for param_name, arg in zip(layout.params, arg_nodes):
+            code, source = self._operand(self._expression(arg))
+            args.append(
+                " " + _wasm_convert(code, source, self._binding_representation(layout, param_name))
+            )
+        return f"(call ${name}{''.join(args)})", self._result_representation(function)
+
+    def _builtin_implementation(self, name: str) -> str:
+        implementation = name
+        if self.config is not None:
+            implementation = self.config.compiled().function_map.get(name, name)
+        return implementation.rsplit(".", 1)[-1]
+
+    def _builtin_call(self, name: str, arg_nodes: List[Any]) -> Tuple[str, Optional[str]]:
+        implementation = self._builtin_implementation(name)
+
+        if implementation == "print":
+            calls = []
+            for index, arg in enumerate(arg_nodes):
+                if index:
+                    calls.append(self._print_char(" "))
+                value = literal_value(arg)
+                if isinstance(value, str):
+                    calls.extend(self._print_char(char) for char in value)
+                else:
+                    code, representation = self._operand(self._expression(arg))
+                    calls.append(f"(call ${_WASM_PRINTERS[representation]} {code})")
+            calls.append(self._print_char("\n"))
+            return " ".join(calls), None
+
+        if implementation not in _WASM_BUILTINS:
+            raise CodegenError(f"Builtin '{name}' is not supported by the WASM backend")
+        arity = 1 if implementation == "abs" else 2
+        if len(arg_nodes) != arity:
+            raise CodegenError(f"{name}() takes {arity} argument(s), got {len(arg_nodes)}")
+        args = [self._operand(self._expression(arg)) for arg in arg_nodes]
+        kinds = {"int" if kind == "bool" else kind for _, kind in args}
+        if len(kinds) != 1:
+            raise CodegenError(f"{name}() of an int and a float is not supported by the WASM backend")
+        target = kinds.pop()
+        codes = " ".join(_wasm_convert(code, kind, target) for code, kind in args)
+        if target == "float":
+            return f"(f64.{implementation} {codes})", "float"
+        return f"(call $pc_{implementation}_i {codes})", "int"
+
+    @staticmethod
+    def _print_char(char: str) -> str:
+        return f"(call ${_WASM_PRINT_CHAR} (i32.const {ord(char)}))"
+
+
+_NUMERIC_TYPES = frozenset({"bool", "int", "float"})
+_COMPARISONS = frozenset({"==", "!=", "<", ">", "<=", ">="})
+
+
+def join_types(left: Optional[str], right: Optional[str]) -> Optional[str]:
+    """Least upper bound of two inferred types (None: nothing known yet).
+
+    Different types join to ``any``, even ``int`` and ``float``: a binding
+    holding ``2`` and ``2.0`` must keep them apart to print them apart.
+    """
+    if left is None:
+        return right
+    if right is None or left == right:
+        return left
+    return "any"
+
+
+def _value_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "string"
+    return "any"
 
 
 class TypeInferencePass(ASTVisitor):
-    """Infers types from AST nodes."""
+    """Infers types from AST nodes.
+
+    ``infer`` runs a whole-program fixpoint over both node shapes using the
+    resolver's slot layout. Every binding (variable or parameter) gets the
+    join of the types stored into it, parameters take the join over all call
+    sites, and functions the join of their ``return`` values. Types are
+    ``bool``, ``int``, ``float``, ``string``, ``none`` and ``any``; a
+    binding that sees two different types, or nothing at all, is ``any``.
+    Arithmetic on numbers gives the wider operand type (``bool < int <
+    float``), except that ``/`` and ``**`` on integers are ``any`` because
+    exact results stay integers.
+    """
 
     def __init__(self):
         self.type_map: Dict[str, TypeInfo] = {}
         self.constraints: List[Tuple[str, str]] = []
-
-    def infer(self, node: ASTNode) -> Dict[str, TypeInfo]:
-        """Infer types from AST."""
-        self.visit(node)
+        self.resolution: Optional[Resolution] = None
+        self.node_types: Dict[int, str] = {}
+        self.binding_types: Dict[Tuple[int, int], Optional[str]] = {}
+        self.return_types: Dict[int, Optional[str]] = {}
+        self.rounds = 0
+        self._functions: Dict[Tuple[int, int], ASTNode] = {}
+        self._changed = False
+
+    def infer(
+        self, node: ASTNode, resolution: Optional[Resolution] = None
+    ) -> Dict[str, TypeInfo]:
+        """Infer types from AST; returns ``type_map`` (see ``type_of`` too)."""
+        self.resolution = resolution or Resolver().resolve(node)
+        self.node_types = {}
+        self.binding_types = {}
+        self.return_types = {}
+        self._functions = {}
+        chain = [self.resolution.layout_for(node)]
+        self._index_functions(node, chain)
+
+        # Types only widen and the lattice is shallow, so this terminates
+        self.rounds = 0
+        self._changed = True
+        while self._changed:
+            self._changed = False
+            self.rounds += 1
+            self._scope(node, chain, None)
+
+        for key, inferred in self.binding_types.items():
+            if inferred is None:
+                self.binding_types[key] = "any"
+        for key, inferred in self.return_types.items():
+            if inferred is None:
+                self.return_types[key] = "any"
+        self._fill_type_map(node, chain, "")
         return self.type_map
 
+    # === Queries ===
+
+    def type_of(self, node: ASTNode) -> str:
+        """Inferred type of an expression node."""
+        return self.node_types.get(id(node)) or "any"
+
+    def binding_type(self, layout: FrameLayout, name: str) -> str:
+        """Inferred type of variable or parameter ``name`` of ``layout``."""
+        slot = layout.slot(name)
+        if slot is None:
+            return "any"
+        return self.binding_types.get((id(layout), slot)) or "any"
+
+    def return_type(self, function: ASTNode) -> str:
+        """Inferred return type of a function node (``none`` if it never returns a value)."""
+        return self.return_types.get(id(function)) or "none"
+
+    # === Fixpoint ===
+
+    def _binding(self, ref: SlotRef, chain: List[FrameLayout]) -> Tuple[int, int]:
+        return id(chain[-1 - ref.depth]), ref.slot
+
+    def _index_functions(self, node: ASTNode, chain: List[FrameLayout]) -> None:
+        for child in node.children:
+            if node_kind(child) == "function":
+                ref = self.resolution.ref_for(child)
+                if ref is not None:
+                    self._functions[self._binding(ref, chain)] = child
+                self.return_types[id(child)] = None
+                inner = chain + [self.resolution.layout_for(child)]
+                self._index_functions(child, inner)
+            else:
+                self._index_functions(child, chain)
+
+    def _bind(self, key: Tuple[int, int], inferred: Optional[str]) -> None:
+        old = self.binding_types.get(key)
+        new = join_types(old, inferred)
+        if new != old:
+            self.binding_types[key] = new
+            self._changed = True
+
+    def _scope(
+        self, node: ASTNode, chain: List[FrameLayout], function: Optional[ASTNode]
+    ) -> None:
+        for child in node.children:
+            if child.node_type != "Parameters":
+                self._statement(child, chain, function)
+
+    def _statement(
+        self, node: ASTNode, chain: List[FrameLayout], function: Optional[ASTNode]
+    ) -> None:
+        kind = node_kind(node)
+        if kind == "function":
+            self._scope(node, chain + [self.resolution.layout_for(node)], node)
+        elif kind == "assign":
+            value = assign_value(node)
+            if hasattr(value, "node_type"):
+                inferred = self._expression(value, chain)
+            else:
+                inferred = "none" if value is None else _value_type(value)
+            ref = self.resolution.ref_for(node)
+            if ref is not None:
+                self._bind(self._binding(ref, chain), inferred)
+        elif kind == "return":
+            if node.children:
+                inferred = self._expression(node.children[0], chain)
+            else:
+                value = node_attrs(node).get("value")
+                inferred = "none" if value is None else _value_type(value)
+            if function is not None:
+                old = self.return_types[id(function)]
+                new = join_types(old, inferred)
+                if new != old:
+                    self.return_types[id(function)] = new
+                    self._changed = True
+        elif kind in ("literal", "name", "binary", "unary", "call"):
+            self._expression(node, chain)
+        else:
+            self._scope(node, chain, function)
+
+    def _expression(self, node: ASTNode, chain: List[FrameLayout]) -> Optional[str]:
+        kind = node_kind(node)
+        if kind == "literal":
+            value = literal_value(node)
+            inferred = "any" if value is UNKNOWN else _value_type(value)
+        elif kind == "name":
+            inferred = self._name_type(node, chain)
+        elif kind == "binary":
+            inferred = self._binary_type(node, chain)
+        elif kind == "unary":
+            for child in node.children:
+                self._expression(child, chain)
+            inferred = "bool"
+        elif kind == "call":
+            inferred = self._call_type(node, chain)
+        elif kind == "expression" and node.children:
+            inferred = self._expression(node.children[0], chain)
+        else:
+            for child in node.children:
+                self._expression(child, chain)
+            inferred = "any"
+        self.node_types[id(node)] = inferred
+        return inferred
+
+    def _name_type(self, node: ASTNode, chain: List[FrameLayout]) -> Optional[str]:
+        ref = self.resolution.ref_for(node)
+        if ref is None:
+            return "any"
+        key = self._binding(ref, chain)
+        if key in self._functions:
+            return "any"
+        return self.binding_types.get(key)
+
+    def _binary_type(self, node: ASTNode, chain: List[FrameLayout]) -> Optional[str]:
+        symbol = node_attrs(node).get("operator", node.value)
+        operands = [self._expression(child, chain) for child in node.children]
+        if len(operands) != 2:
+            return "any"
+        left, right = operands
+        if symbol in _C_LOGIC:
+            return join_types(left, right)
+        if symbol in _COMPARISONS:
+            return "bool"
+        if left is None or right is None:
+            return None
+        if symbol == "+" and left == right == "string":
+            return "string"
+        if left not in _NUMERIC_TYPES or right not in _NUMERIC_TYPES:
+            return "any"
+        if symbol in ("/", "**"):
+            # Exact integer quotients and powers stay integers at run time
+            return "float" if "float" in (left, right) else "any"
+        if "float" in (left, right):
+            return "float"
+        return "int"
+
+    def _call_type(self, node: ASTNode, chain: List[FrameLayout]) -> Optional[str]:
+        arg_nodes = node.children
+        if len(arg_nodes) == 1 and arg_nodes[0].node_type == "Arguments":
+            arg_nodes = arg_nodes[0].children
+        args = [self._expression(arg, chain) for arg in arg_nodes]
+
+        ref = self.resolution.ref_for(node)
+        if ref is None:
+            name = (node_attrs(node).get("name") or node.value or "").rsplit(".", 1)[-1]
+            if name == "print":
+                return "none"
+            if name == "abs" and len(args) == 1:
+                return args[0] if args[0] in (None, "int", "float") else "any"
+            if name in ("min", "max") and args:
+                if None in args:
+                    return None
+                kinds = {"int" if inferred == "bool" else inferred for inferred in args}
+                return kinds.pop() if len(kinds) == 1 else "any"
+            return "any"
+
+        function = self._functions.get(self._binding(ref, chain))
+        if function is None:
+            return "any"
+        layout = self.resolution.layout_for(function)
+        if len(args) == len(layout.params):
+            for slot, inferred in enumerate(args):
+                self._bind((id(layout), slot), inferred)
+        return self.return_types[id(function)]
+
+    def _fill_type_map(self, node: ASTNode, chain: List[FrameLayout], prefix: str) -> None:
+        """Record bindings as ``name`` (module) or ``function.name`` (locals)."""
+        layout = chain[-1]
+        for slot, name in enumerate(layout.names):
+            inferred = self.binding_types.get((id(layout), slot))
+            if inferred is not None:
+                self.type_map[prefix + name] = TypeInfo(inferred)
+        self._fill_nested(node, chain, prefix)
+
+    def _fill_nested(self, node: ASTNode, chain: List[FrameLayout], prefix: str) -> None:
+        for child in node.children:
+            if node_kind(child) == "function":
+                self._fill_type_map(
+                    child,
+                    chain + [self.resolution.layout_for(child)],
+                    f"{prefix}{function_name(child)}.",
+                )
+            else:
+                self._fill_nested(child, chain, prefix)
+
+    # === Single-node typing ===
+
     def visit_literal(self, node: ASTNode) -> TypeInfo:
         """Infer type from literal."""
         value = node.attributes.get("value")
@@ -379,12 +2247,20 @@ class TypeInferencePass(ASTVisitor):
 
 
 class ControlFlowAnalyzer(ASTVisitor):
-    """Analyzes control flow in AST."""
+    """Analyzes control flow in AST.
+
+    Besides counting branches, loops and returns, it records *tail calls*:
+    calls that are the whole value of a ``return`` inside a function. An
+    executor can run those without growing the stack. Parser-generator
+    node types (``IfStatement``, ``ReturnStatement``, ...) are handled too.
+    """
 
     def __init__(self):
         self.branches: List[str] = []
         self.loops: List[str] = []
         self.returns: List[str] = []
+        self.tail_calls: List[ASTNode] = []
+        self._functions: List[str] = []
 
     def analyze(self, node: ASTNode) -> Dict[str, Any]:
         """Analyze control flow."""
@@ -393,8 +2269,16 @@ class ControlFlowAnalyzer(ASTVisitor):
             "branches": self.branches,
             "loops": self.loops,
             "returns": self.returns,
+            "tail_calls": self.tail_calls,
         }
 
+    def visit_function(self, node: ASTNode) -> None:
+        """Visit function definition."""
+        self._functions.append(function_name(node))
+        for child in node.children:
+            self.visit(child)
+        self._functions.pop()
+
     def visit_if(self, node: ASTNode) -> None:
         """Visit if statement."""
         self.branches.append("if")
@@ -416,3 +2300,14 @@ class ControlFlowAnalyzer(ASTVisitor):
     def visit_return(self, node: ASTNode) -> None:
         """Visit return statement."""
         self.returns.append("return")
+        if self._functions and node.children:
+            value = node.children[0]
+            if node_kind(value) == "call":
+                self.tail_calls.append(value)
+
+    # parser_generator node types
+    visit_FunctionDef = visit_function
+    visit_IfStatement = visit_if
+    visit_WhileLoop = visit_while
+    visit_ForLoop = visit_for
+    visit_ReturnStatement = visit_return
@@ -0,0 +1,991 @@
+#!/usr/bin/env python3
+"""
+AST Optimization Pipeline
+
+Rewrites an AST in place before it reaches a code generator, so backends no
+longer emit exactly what the user wrote.
+
+Features:
+    - Constant folding, restricted to operators enabled in the configuration
+    - Constant propagation through straight-line code
+    - Unreachable-code removal (after return/break/continue, constant branches)
+    - Dead store elimination for function locals
+    - Passes can be toggled individually; each reports timing and rewrites
+    - Works on both ``ast_integration.ASTNode`` and ``parser_generator.ASTNode``
+
+Usage:
+    from parsercraft.ast_optimizer import OptimizationPipeline
+
+    pipeline = OptimizationPipeline(config)
+    pipeline.disable("dead_store_elimination")
+    report = pipeline.run(ast)
+    print(report.format())
+
+    # Or hand it to a backend
+    ASTToCGenerator(config, optimizer=pipeline).translate(ast)
+
+    # Keep a PassManager's cached analyses in sync
+    pipeline.run(ast, pass_manager=manager)
+
+Semantics:
+    Folding never changes observable results: integer division folds only
+    when exact, ``%`` only for non-negative integers, and integer results
+    must fit in 64 bits. Propagation forgets facts about globals, and
+    about locals that nested functions assign, across calls, and about
+    anything assigned inside branches or loops.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+import re
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .pass_manager import PassManager
+
+# === Node Shapes ===
+#
+# ast_integration nodes use lowercase types and an ``attributes`` dict;
+# parser_generator nodes use CamelCase types and ``metadata``. Passes work on
+# normalized kinds so one implementation serves both.
+
+_KIND_ALIASES = {
+    # ast_integration
+    "program": "program",
+    "function": "function",
+    "block": "block",
+    "then_block": "block",
+    "else_block": "block",
+    "if": "if",
+    "while": "loop",
+    "for": "loop",
+    "return": "return",
+    "break": "jump",
+    "continue": "jump",
+    "assignment": "assign",
+    "variable_declaration": "assign",
+    "literal": "literal",
+    "identifier": "name",
+    "variable": "name",
+    "binary_op": "binary",
+    "call": "call",
+    "function_call": "call",
+    # parser_generator
+    "Program": "program",
+    "FunctionDef": "function",
+    "Block": "block",
+    "IfStatement": "if",
+    "WhileLoop": "loop",
+    "ForLoop": "loop",
+    "ReturnStatement": "return",
+    "Assignment": "assign",
+    "Number": "literal",
+    "String": "literal",
+    "Identifier": "name",
+    "BinaryOp": "binary",
+    "UnaryOp": "unary",
+    "FunctionCall": "call",
+    "ExpressionStatement": "expression",
+}
+
+# What a transform can change; analyses declare which of these they read
+AST_ASPECTS = frozenset({"expressions", "control_flow", "declarations"})
+
+_STATEMENT_LISTS = frozenset({"program", "function", "block"})
+_WHILE_TYPES = frozenset({"while", "WhileLoop"})
+_DECLARATION_TYPES = frozenset({"variable_declaration"})
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+
+# Sentinel for "not a compile-time constant"
+_UNKNOWN = object()
+UNKNOWN = _UNKNOWN
+
+
+def node_kind(node: Any) -> str:
+    """Normalized kind of an AST node ("other" when unrecognized)."""
+    kind = _KIND_ALIASES.get(node.node_type)
+    if kind is not None:
+        return kind
+    if node.node_type == "KeywordStatement" and node_attrs(node).get(
+        "original_keyword"
+    ) in ("break", "continue"):
+        return "jump"
+    return "other"
+
+
+def node_attrs(node: Any) -> Dict[str, Any]:
+    """Attribute dict of a node (``attributes`` or ``metadata``)."""
+    attrs = getattr(node, "attributes", None)
+    if attrs is None:
+        attrs = getattr(node, "metadata", None)
+    return attrs if attrs is not None else {}
+
+
+def literal_value(node: Any) -> Any:
+    """Python value of a literal node, or ``_UNKNOWN``."""
+    if node_kind(node) != "literal":
+        return _UNKNOWN
+    if node.node_type == "Number":
+        text = str(node.value)
+        try:
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            return float(text)
+        except ValueError:
+            return _UNKNOWN
+    if node.node_type == "String":
+        text = str(node.value)
+        if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+            return text[1:-1]
+        return _UNKNOWN
+    attrs = node_attrs(node)
+    return attrs["value"] if "value" in attrs else node.value
+
+
+def make_literal(like: Any, value: Any) -> Optional[Any]:
+    """Build a literal node of the same shape as ``like``, if representable."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if hasattr(like, "attributes"):
+        attrs: Dict[str, Any] = {"value": value}
+        if "position" in like.attributes:
+            attrs["position"] = like.attributes["position"]
+        return type(like)("literal", value, attributes=attrs)
+
+    token = getattr(like, "token", None)
+    if isinstance(value, bool):
+        return None  # parser ASTs have no boolean literal
+    if isinstance(value, (int, float)):
+        return type(like)("Number", repr(value), token=token)
+    if isinstance(value, str) and '"' not in value and "\\" not in value:
+        return type(like)("String", f'"{value}"', token=token)
+    return None
+
+
+def name_of(node: Any) -> str:
+    """Name referenced by an identifier node."""
+    return node_attrs(node).get("name", node.value)
+
+
+def assign_target(node: Any) -> Optional[str]:
+    """Variable written by an assignment or declaration node."""
+    attrs = node_attrs(node)
+    return attrs.get("target") or attrs.get("name") or node.value
+
+
+def assign_value(node: Any) -> Any:
+    """Value expression node of an assignment, else its raw attribute value."""
+    if node.children:
+        return node.children[0]
+    return node_attrs(node).get("value")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _raw_names(value: Any) -> Set[str]:
+    """Identifiers mentioned by a raw (string) expression attribute."""
+    if isinstance(value, str):
+        return set(_IDENTIFIER.findall(value))
+    return set()
+
+
+def read_names(node: Any) -> Set[str]:
+    """Every name read anywhere under ``node`` (including nested functions)."""
+    names: Set[str] = set()
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        kind = node_kind(current)
+        if kind == "name":
+            names.add(name_of(current))
+        elif kind != "literal":
+            attrs = node_attrs(current)
+            names |= _raw_names(attrs.get("value"))
+            names |= _raw_names(attrs.get("condition"))
+        stack.extend(current.children)
+    return names
+
+
+def assigned_names(node: Any) -> Set[str]:
+    """Names assigned under ``node``, not descending into nested functions."""
+    names: Set[str] = set()
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        kind = node_kind(current)
+        if kind == "assign":
+            target = assign_target(current)
+            if target:
+                names.add(target)
+        if kind == "function" and current is not node:
+            continue
+        stack.extend(current.children)
+    return names
+
+
+def contains_call(node: Any) -> bool:
+    """True if evaluating ``node`` may call a function."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        kind = node_kind(current)
+        if kind == "call":
+            return True
+        if kind == "function" and current is not node:
+            continue
+        if kind != "literal":
+            raw = node_attrs(current).get("value")
+            if isinstance(raw, str) and "(" in raw:
+                return True
+        stack.extend(current.children)
+    return False
+
+
+def nested_function_names(node: Any) -> Tuple[Set[str], Set[str]]:
+    """Names read and names assigned by functions nested under ``node``.
+
+    A nested function may read or write the enclosing function's locals, so
+    a call can observe or change them. Nested locals are included too; that
+    only makes callers more conservative.
+    """
+    reads: Set[str] = set()
+    writes: Set[str] = set()
+    stack = list(node.children)
+    while stack:
+        current = stack.pop()
+        if node_kind(current) == "function":
+            reads |= read_names(current)
+            writes |= assigned_names(current)
+        stack.extend(current.children)
+    return reads, writes
+
+
+def function_name(node: Any) -> str:
+    """Name bound by a function definition node."""
+    return node_attrs(node).get("name") or node.value or "unknown"
+
+
+def function_params(node: Any) -> List[str]:
+    """Parameter names of a function node."""
+    params = node_attrs(node).get("params")
+    if params:
+        return [p if isinstance(p, str) else getattr(p, "name", str(p)) for p in params]
+    for child in node.children:
+        if child.node_type == "Parameters":
+            return [param.value for param in child.children]
+    return []
+
+
+def nested_functions(node: Any) -> List[Any]:
+    """Functions defined directly in ``node``'s scope (not inside another)."""
+    found = []
+    stack = list(node.children)
+    while stack:
+        current = stack.pop()
+        if node_kind(current) == "function":
+            found.append(current)
+        else:
+            stack.extend(current.children)
+    return found
+
+
+def frame_locals(node: Any, enclosing: Set[str]) -> Set[str]:
+    """Names bound in ``node``'s own frame, following the resolver's rules.
+
+    Parameters, declarations and nested function names are local; other
+    assignments are local unless ``enclosing`` (names bound by enclosing
+    scopes, module included) already binds the name.
+    """
+    names = set(function_params(node)) if node_kind(node) == "function" else set()
+    stack = list(node.children)
+    while stack:
+        current = stack.pop()
+        kind = node_kind(current)
+        if kind == "function":
+            names.add(function_name(current))
+            continue
+        if kind == "assign":
+            target = assign_target(current)
+            if target and (
+                target not in enclosing
+                or current.node_type in _DECLARATION_TYPES
+                or node_attrs(current).get("declaration")
+            ):
+                names.add(target)
+        stack.extend(current.children)
+    return names
+
+
+def if_parts(node: Any) -> Tuple[Optional[Any], Optional[Any], Optional[Any]]:
+    """(condition, then block, else block) of an if node."""
+    condition = None
+    blocks = []
+    else_block = None
+    for child in node.children:
+        if node_kind(child) == "block":
+            if child.node_type == "else_block":
+                else_block = child
+            else:
+                blocks.append(child)
+        elif condition is None:
+            condition = child
+    then_block = blocks[0] if blocks else None
+    if else_block is None and len(blocks) > 1:
+        else_block = blocks[1]
+    return condition, then_block, else_block
+
+
+def _condition_value(node: Any) -> Any:
+    """Constant truth value of an if/while condition, or ``_UNKNOWN``."""
+    condition = if_parts(node)[0]
+    if condition is not None:
+        value = literal_value(condition)
+    else:
+        value = node_attrs(node).get("condition", _UNKNOWN)
+    # Only booleans and numbers have language-independent truthiness
+    if isinstance(value, bool) or _is_number(value):
+        return bool(value)
+    return _UNKNOWN
+
+
+# === Operator Semantics ===
+
+
+class _NotFoldable(Exception):
+    """Raised by an evaluator when folding would change semantics."""
+
+
+_INT_LIMIT = 2**63
+
+
+def _divide(left: Any, right: Any) -> Any:
+    if isinstance(left, int) and isinstance(right, int):
+        if right == 0 or left % right:
+            raise _NotFoldable
+        return left // right
+    if right == 0:
+        raise _NotFoldable
+    return left / right
+
+
+def _natural_int_op(func: Callable[[int, int], int]) -> Callable[[Any, Any], Any]:
+    # C and Python disagree on negative operands for % and //
+    def evaluate(left: Any, right: Any) -> Any:
+        if not (isinstance(left, int) and isinstance(right, int)):
+            raise _NotFoldable
+        if left < 0 or right <= 0:
+            raise _NotFoldable
+        return func(left, right)
+
+    return evaluate
+
+
+_ARITHMETIC: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _divide,
+    "%": _natural_int_op(operator.mod),
+    "//": _natural_int_op(operator.floordiv),
+}
+
+_COMPARISON: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+_LOGICAL: Dict[str, Callable[[bool, bool], bool]] = {
+    "and": lambda left, right: left and right,
+    "&&": lambda left, right: left and right,
+    "or": lambda left, right: left or right,
+    "||": lambda left, right: left or right,
+}
+
+FOLDABLE_OPERATORS = frozenset(_ARITHMETIC) | frozenset(_COMPARISON) | frozenset(_LOGICAL)
+
+
+def evaluate_operator(symbol: str, left: Any, right: Any) -> Any:
+    """Evaluate a binary operator on constants; ``_UNKNOWN`` if not foldable."""
+    try:
+        if symbol in _ARITHMETIC:
+            if _is_number(left) and _is_number(right):
+                result = _ARITHMETIC[symbol](left, right)
+                if isinstance(result, int) and not -_INT_LIMIT <= result < _INT_LIMIT:
+                    return _UNKNOWN
+                return result
+            if symbol == "+" and isinstance(left, str) and isinstance(right, str):
+                return left + right
+            return _UNKNOWN
+        if symbol in _COMPARISON:
+            comparable = (_is_number(left) and _is_number(right)) or (
+                isinstance(left, str) and isinstance(right, str)
+            )
+            if comparable or (
+                symbol in ("==", "!=") and isinstance(left, bool) and isinstance(right, bool)
+            ):
+                return _COMPARISON[symbol](left, right)
+            return _UNKNOWN
+        if symbol in _LOGICAL:
+            if isinstance(left, bool) and isinstance(right, bool):
+                return _LOGICAL[symbol](left, right)
+            return _UNKNOWN
+    except (_NotFoldable, ArithmeticError):
+        return _UNKNOWN
+    return _UNKNOWN
+
+
+# === Passes ===
+
+
+class OptimizationPass:
+    """Base class for AST rewriting passes.
+
+    Subclasses set ``name`` and implement ``run``, which rewrites the tree in
+    place and returns the number of rewrites made. ``changes`` lists the
+    ``AST_ASPECTS`` a rewrite may affect, so a ``PassManager`` invalidates
+    only the analyses that read them.
+    """
+
+    name = "pass"
+    changes: FrozenSet[str] = AST_ASPECTS
+
+    def __init__(self, config: Any = None):
+        self.config = config
+
+    def run(self, ast: Any) -> int:
+        raise NotImplementedError
+
+
+class ConstantFoldingPass(OptimizationPass):
+    """Replace operators applied to literals with their result."""
+
+    name = "constant_folding"
+    changes = frozenset({"expressions"})
+
+    def __init__(self, config: Any = None):
+        super().__init__(config)
+        operators = getattr(config, "operators", None)
+        if operators is None:
+            self.operators = FOLDABLE_OPERATORS
+        else:
+            enabled = {op.symbol for op in operators.values() if op.enabled}
+            self.operators = FOLDABLE_OPERATORS & enabled
+
+    def run(self, ast: Any) -> int:
+        self.rewrites = 0
+        self._fold(ast)
+        return self.rewrites
+
+    def _fold(self, node: Any) -> Any:
+        children = node.children
+        for index, child in enumerate(children):
+            folded = self._fold(child)
+            if folded is not child:
+                children[index] = folded
+
+        if node_kind(node) != "binary" or len(children) != 2:
+            return node
+
+        symbol = node_attrs(node).get("operator", node.value)
+        if symbol not in self.operators:
+            return node
+
+        left, right = children
+        if [node_attrs(c).get("position") for c in children] == ["right", "left"]:
+            left, right = right, left
+        left_value = literal_value(left)
+        right_value = literal_value(right)
+        if left_value is _UNKNOWN or right_value is _UNKNOWN:
+            return node
+
+        result = evaluate_operator(symbol, left_value, right_value)
+        if result is _UNKNOWN:
+            return node
+        replacement = make_literal(node, result)
+        if replacement is None:
+            return node
+        self.rewrites += 1
+        return replacement
+
+
+class ConstantPropagationPass(OptimizationPass):
+    """Substitute variables whose value is a known constant."""
+
+    name = "constant_propagation"
+    changes = frozenset({"expressions"})
+
+    def run(self, ast: Any) -> int:
+        self.rewrites = 0
+        kind = node_kind(ast)
+        if kind == "function":
+            self._function(ast, set())
+        elif kind in _STATEMENT_LISTS:
+            self._statements(ast.children, {}, None)
+            for function in nested_functions(ast):
+                self._function(function, frame_locals(ast, set()))
+        return self.rewrites
+
+    def _function(self, node: Any, enclosing: Set[str]) -> None:
+        # Names bound by an enclosing scope behave like globals here
+        own = frame_locals(node, enclosing)
+        _, nested_writes = nested_function_names(node)
+        self._statements(node.children, {}, own - nested_writes)
+        for function in nested_functions(node):
+            self._function(function, enclosing | own)
+
+    def _forget_calls(self, env: Dict[str, Any], local_names: Optional[Set[str]]) -> None:
+        # A call may write any global, and any local a nested function assigns
+        if local_names is None:
+            env.clear()
+        else:
+            for name in [name for name in env if name not in local_names]:
+                del env[name]
+
+    def _forget(self, env: Dict[str, Any], names: Iterable[str]) -> None:
+        for name in names:
+            env.pop(name, None)
+
+    def _statements(
+        self, statements: List[Any], env: Dict[str, Any], local_names: Optional[Set[str]]
+    ) -> None:
+        for statement in statements:
+            kind = node_kind(statement)
+            if kind == "function":
+                continue  # handled by _function, with its enclosing names
+            elif kind == "block":
+                self._statements(statement.children, env, local_names)
+            elif kind == "if":
+                self._if(statement, env, local_names)
+            elif kind == "loop":
+                self._loop(statement, env, local_names)
+            else:
+                if contains_call(statement):
+                    self._forget_calls(env, local_names)
+                self._substitute_children(statement, env)
+                if kind == "assign":
+                    self._record(statement, env)
+
+    def _record(self, statement: Any, env: Dict[str, Any]) -> None:
+        target = assign_target(statement)
+        if not target:
+            return
+        value = assign_value(statement)
+        if statement.children:
+            value = literal_value(value)
+        elif not (isinstance(value, bool) or _is_number(value)):
+            value = _UNKNOWN  # raw attribute strings are code, not constants
+        if value is _UNKNOWN:
+            env.pop(target, None)
+        else:
+            env[target] = value
+
+    def _if(self, statement: Any, env: Dict[str, Any], local_names: Optional[Set[str]]) -> None:
+        condition, then_block, else_block = if_parts(statement)
+        if condition is not None:
+            if contains_call(condition):
+                self._forget_calls(env, local_names)
+            self._substitute_in(statement, condition, env)
+        for block in (then_block, else_block):
+            if block is not None:
+                self._statements(block.children, dict(env), local_names)
+        self._forget(env, assigned_names(statement))
+        if contains_call(statement):
+            self._forget_calls(env, local_names)
+
+    def _loop(self, statement: Any, env: Dict[str, Any], local_names: Optional[Set[str]]) -> None:
+        # Facts must hold on every iteration, not just the first
+        self._forget(env, assigned_names(statement))
+        if contains_call(statement):
+            self._forget_calls(env, local_names)
+        for child in statement.children:
+            if node_kind(child) == "block":
+                self._statements(child.children, dict(env), local_names)
+            else:
+                self._substitute_in(statement, child, env)
+
+    def _substitute_in(self, parent: Any, child: Any, env: Dict[str, Any]) -> None:
+        replacement = self._substitute(child, env)
+        if replacement is not child:
+            parent.children[parent.children.index(child)] = replacement
+
+    def _substitute_children(self, node: Any, env: Dict[str, Any]) -> None:
+        for index, child in enumerate(node.children):
+            replacement = self._substitute(child, env)
+            if replacement is not child:
+                node.children[index] = replacement
+
+    def _substitute(self, node: Any, env: Dict[str, Any]) -> Any:
+        kind = node_kind(node)
+        if kind == "name":
+            name = name_of(node)
+            if name in env:
+                replacement = make_literal(node, env[name])
+                if replacement is not None:
+                    self.rewrites += 1
+                    return replacement
+            return node
+        if kind == "function":
+            return node
+        if env:
+            self._substitute_children(node, env)
+        return node
+
+
+def _terminates(statement: Any) -> bool:
+    """True if control never falls through ``statement``."""
+    kind = node_kind(statement)
+    if kind in ("return", "jump"):
+        return True
+    if kind == "if":
+        _, then_block, else_block = if_parts(statement)
+        return (
+            then_block is not None
+            and else_block is not None
+            and bool(then_block.children)
+            and bool(else_block.children)
+            and _terminates(then_block.children[-1])
+            and _terminates(else_block.children[-1])
+        )
+    return False
+
+
+class UnreachableCodePass(OptimizationPass):
+    """Drop statements that can never execute."""
+
+    name = "unreachable_code"
+
+    def run(self, ast: Any) -> int:
+        self.rewrites = 0
+        self._visit(ast)
+        return self.rewrites
+
+    def _visit(self, node: Any) -> None:
+        if node_kind(node) in _STATEMENT_LISTS:
+            node.children[:] = self._prune(node.children)
+        for child in node.children:
+            self._visit(child)
+
+    def _prune(self, statements: List[Any]) -> List[Any]:
+        result: List[Any] = []
+        for index, statement in enumerate(statements):
+            kind = node_kind(statement)
+            if kind == "if":
+                taken = _condition_value(statement)
+                if taken is not _UNKNOWN:
+                    _, then_block, else_block = if_parts(statement)
+                    block = then_block if taken else else_block
+                    self.rewrites += 1
+                    if block is not None:
+                        result.extend(self._prune(block.children))
+                    if result and _terminates(result[-1]):
+                        self.rewrites += len(statements) - index - 1
+                        break
+                    continue
+            elif kind == "loop" and statement.node_type in _WHILE_TYPES:
+                if _condition_value(statement) is False:
+                    self.rewrites += 1
+                    continue
+
+            result.append(statement)
+            if _terminates(statement):
+                self.rewrites += len(statements) - index - 1
+                break
+        return result
+
+
+class DeadStoreEliminationPass(OptimizationPass):
+    """Remove side-effect-free stores to locals that are never read."""
+
+    name = "dead_store_elimination"
+    changes = frozenset({"expressions", "declarations"})
+
+    def run(self, ast: Any) -> int:
+        self.rewrites = 0
+        stack = [(ast, self._global_names(ast))]
+        while stack:
+            node, enclosing = stack.pop()
+            if node_kind(node) == "function":
+                self._function(node, enclosing)
+                enclosing = enclosing | frame_locals(node, enclosing)
+            stack.extend((child, enclosing) for child in node.children)
+        return self.rewrites
+
+    @staticmethod
+    def _global_names(ast: Any) -> Set[str]:
+        if node_kind(ast) != "program":
+            return set()
+        names: Set[str] = set()
+        stack = list(ast.children)
+        while stack:
+            node = stack.pop()
+            kind = node_kind(node)
+            if kind == "function":
+                continue
+            if kind == "assign":
+                names.add(assign_target(node))
+            stack.extend(node.children)
+        return names
+
+    @staticmethod
+    def _is_pure(statement: Any) -> bool:
+        value = assign_value(statement)
+        if value is None or not hasattr(value, "node_type"):
+            return not (isinstance(value, str) and "(" in value)
+        return not contains_call(value)
+
+    def _function(self, node: Any, enclosing: Set[str]) -> None:
+        # Locals a nested function reads or writes live past their last use here
+        nested_reads, nested_writes = nested_function_names(node)
+        local_names = frame_locals(node, enclosing) - nested_reads - nested_writes
+        reads = read_names(node)
+
+        # Locals never read: drop every store, but only if all are pure
+        stores: Dict[str, List[Any]] = {}
+        for statement in self._statements(node):
+            if node_kind(statement) == "assign":
+                stores.setdefault(assign_target(statement), []).append(statement)
+        unused = {
+            name
+            for name, statements in stores.items()
+            if name in local_names
+            and name not in reads
+            and all(self._is_pure(s) for s in statements)
+        }
+        if unused:
+            self._remove(node, lambda s: node_kind(s) == "assign" and assign_target(s) in unused)
+
+        # Stores overwritten (or followed by return) before any read
+        self._overwritten(node.children, local_names, function_body=True)
+
+    def _statements(self, node: Any) -> Iterable[Any]:
+        for child in node.children:
+            kind = node_kind(child)
+            if kind == "function":
+                continue
+            yield child
+            if kind not in ("call", "name", "literal", "binary", "unary"):
+                yield from self._statements(child)
+
+    def _remove(self, node: Any, dead: Callable[[Any], bool]) -> None:
+        kept = [child for child in node.children if not dead(child)]
+        self.rewrites += len(node.children) - len(kept)
+        node.children[:] = kept
+        for child in kept:
+            if node_kind(child) != "function":
+                self._remove(child, dead)
+
+    def _overwritten(
+        self, statements: List[Any], local_names: Set[str], function_body: bool
+    ) -> None:
+        dead_indexes = []
+        for index, statement in enumerate(statements):
+            kind = node_kind(statement)
+            if kind in ("if", "loop", "block"):
+                for child in statement.children:
+                    if node_kind(child) == "block":
+                        self._overwritten(child.children, local_names, False)
+                if kind == "block":
+                    self._overwritten(statement.children, local_names, False)
+                continue
+            if (
+                kind != "assign"
+                or statement.node_type in _DECLARATION_TYPES
+                or assign_target(statement) not in local_names
+                or not self._is_pure(statement)
+            ):
+                continue
+            if self._is_dead_after(
+                assign_target(statement), statements[index + 1:], function_body
+            ):
+                dead_indexes.append(index)
+
+        for index in reversed(dead_indexes):
+            del statements[index]
+        self.rewrites += len(dead_indexes)
+
+    @staticmethod
+    def _is_dead_after(name: str, following: List[Any], function_body: bool) -> bool:
+        for statement in following:
+            kind = node_kind(statement)
+            if name in read_names(statement):
+                return False
+            if kind == "assign" and assign_target(statement) == name:
+                return True
+            if kind == "return":
+                return True
+            if kind == "jump":
+                return False  # the next iteration may read it
+        return function_body
+
+
+# === Pipeline ===
+
+PASS_REGISTRY: Dict[str, Type[OptimizationPass]] = {
+    pass_class.name: pass_class
+    for pass_class in (
+        ConstantFoldingPass,
+        ConstantPropagationPass,
+        UnreachableCodePass,
+        DeadStoreEliminationPass,
+    )
+}
+
+DEFAULT_PASSES = tuple(PASS_REGISTRY)
+
+
+@dataclass
+class PassStats:
+    """Cumulative statistics for one pass over a pipeline run."""
+
+    name: str
+    enabled: bool = True
+    runs: int = 0
+    rewrites: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class OptimizationReport:
+    """Per-pass timings and rewrite counts of one pipeline run."""
+
+    passes: Dict[str, PassStats] = field(default_factory=dict)
+    iterations: int = 0
+    seconds: float = 0.0
+
+    @property
+    def total_rewrites(self) -> int:
+        return sum(stats.rewrites for stats in self.passes.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "iterations": self.iterations,
+            "seconds": self.seconds,
+            "total_rewrites": self.total_rewrites,
+            "passes": {
+                name: {
+                    "enabled": stats.enabled,
+                    "runs": stats.runs,
+                    "rewrites": stats.rewrites,
+                    "seconds": stats.seconds,
+                }
+                for name, stats in self.passes.items()
+            },
+        }
+
+    def format(self) -> str:
+        """Human-readable table of the run."""
+        lines = [f"{'pass':28} {'runs':>5} {'rewrites':>9} {'time':>10}"]
+        for stats in self.passes.values():
+            if not stats.enabled:
+                lines.append(f"{stats.name:28} {'(disabled)':>26}")
+                continue
+            lines.append(
+                f"{stats.name:28} {stats.runs:5d} {stats.rewrites:9d} "
+                f"{stats.seconds * 1000:8.3f}ms"
+            )
+        lines.append(
+            f"{'total':28} {self.iterations:5d} {self.total_rewrites:9d} "
+            f"{self.seconds * 1000:8.3f}ms"
+        )
+        return "\n".join(lines)
+
+
+class OptimizationPipeline:
+    """Runs optimization passes over an AST until nothing changes."""
+
+    def __init__(
+        self,
+        config: Any = None,
+        passes: Optional[Iterable[str]] = None,
+        max_iterations: int = 4,
+    ):
+        self.config = config
+        self.max_iterations = max_iterations
+        self.passes: List[OptimizationPass] = []
+        self.enabled: Dict[str, bool] = {}
+        for name in passes if passes is not None else DEFAULT_PASSES:
+            self.add_pass(name)
+
+    def add_pass(self, name: str) -> None:
+        """Append a registered pass to the pipeline."""
+        if name not in PASS_REGISTRY:
+            raise ValueError(
+                f"Unknown optimization pass: {name} "
+                f"(available: {', '.join(PASS_REGISTRY)})"
+            )
+        self.passes.append(PASS_REGISTRY[name](self.config))
+        self.enabled[name] = True
+
+    def enable(self, name: str, enabled: bool = True) -> None:
+        """Turn a pass on or off."""
+        if name not in self.enabled:
+            raise ValueError(f"Pass not in pipeline: {name}")
+        self.enabled[name] = enabled
+
+    def disable(self, name: str) -> None:
+        """Turn a pass off."""
+        self.enable(name, False)
+
+    def run(
+        self, ast: Any, pass_manager: Optional[PassManager] = None
+    ) -> OptimizationReport:
+        """Optimize ``ast`` in place and report what each pass did.
+
+        With a ``pass_manager``, analyses cached for ``ast`` are invalidated
+        according to what each rewriting pass declares it changes.
+        """
+        report = OptimizationReport(
+            passes={
+                opt_pass.name: PassStats(opt_pass.name, self.enabled[opt_pass.name])
+                for opt_pass in self.passes
+            }
+        )
+        started = time.perf_counter()
+        for _ in range(self.max_iterations):
+            report.iterations += 1
+            changed = 0
+            for opt_pass in self.passes:
+                stats = report.passes[opt_pass.name]
+                if not stats.enabled:
+                    continue
+                pass_started = time.perf_counter()
+                rewrites = opt_pass.run(ast)
+                stats.seconds += time.perf_counter() - pass_started
+                stats.runs += 1
+                stats.rewrites += rewrites
+                changed += rewrites
+                if rewrites and pass_manager is not None:
+                    pass_manager.invalidate(ast, opt_pass.changes)
+            if not changed:
+                break
+        report.seconds = time.perf_counter() - started
+        return report
+
+
+def optimize(ast: Any, config: Any = None, **kwargs: Any) -> OptimizationReport:
+    """Run the default pipeline over ``ast`` in place."""
+    return OptimizationPipeline(config, **kwargs).run(ast)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Shared Helpers for the On-Disk Caches
+
+The config, codegen, native build and type check caches share one
+directory layout and one way of writing entries.
+
+Features:
+    - Cache directories under one root: the cache's override variable,
+      else $XDG_CACHE_HOME/parsercraft/<name>, else
+      ~/.cache/parsercraft/<name>
+    - Atomic pickle writes (temp file in the same directory + os.replace),
+      with the directory created as mode 0700 because entries are pickles
+
+Usage:
+    from parsercraft.cache_store import cache_dir, write_pickle
+
+    directory = cache_dir("PARSERCRAFT_CACHE_DIR", "configs")
+    write_pickle(directory / "entry.pickle", {"format": 1, "value": value})
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def cache_dir(override_env: str, name: str) -> Path:
+    """Directory of the cache called ``name``; ``$override_env`` wins if set."""
+    override = os.environ.get(override_env)
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "parsercraft" / name
+
+
+def write_pickle(path: Path, value: Any) -> None:
+    """Pickle ``value`` to ``path`` atomically.
+
+    Readers see the old entry or the new one, never a partial file.
+    Raises ``OSError`` or ``pickle.PicklingError``; the caches count these
+    and carry on, since caching is best-effort.
+    """
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
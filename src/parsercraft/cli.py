@@ -18,7 +18,10 @@ Usage:
     parsercraft update FILE [--set KEY VALUE] [--merge FILE]
     parsercraft delete FILE [--keyword KW] [--function FN]
     parsercraft repl [FILE] [--debug]
-    parsercraft batch FILE [--script SCRIPT]
+    parsercraft batch FILE [--script SCRIPT] [--watch]
+    parsercraft test --config FILE --tests FILE [--watch]
+    parsercraft translate --config FILE --input FILE [--watch]
+    parsercraft daemon start|stop|status
 
 Presets:
     - python_like    : Python-style syntax
@@ -41,50 +44,44 @@ See Also:
     - ParserCraft IDE: Interactive GUI for language design
     - CodeEx IDE: Develop applications in your languages
     - Documentation: docs/guides/CODEX_QUICKSTART.md
+
+Startup:
+    Only the standard library modules needed to parse arguments are imported
+    at module load. Configuration, runtime, YAML and every subsystem used by
+    a subcommand are imported inside the handler that needs them, so
+    ``parsercraft --help`` and light commands stay fast. Keep it that way:
+    benchmarks/bench_cli_import.py fails when the import budget is exceeded.
 """
 
+from __future__ import annotations
+
 import argparse
-import ast
 import contextlib
 import io
 import json
 import os
 import re
-import subprocess
 import sys
 import traceback
 from math import e, pi
 from pathlib import Path
-from typing import Any, Optional, Sequence
-
-try:
-    import readline  # noqa: F401
-except ImportError:  # pragma: no cover - platform dependent
-    readline = None
-
-from parsercraft.language_config import (
-    LanguageConfig,
-    create_custom_config_interactive,
-    list_presets,
-)
-from parsercraft.language_runtime import LanguageRuntime
-
-# YAML support (optional)
-try:
-    from yaml import YAMLError, safe_load  # type: ignore[assignment]
-except ImportError:  # pragma: no cover - optional dependency
-    YAMLError = None  # type: ignore[assignment,misc]
-    safe_load = None  # type: ignore[assignment]
-
-if YAMLError is not None:
-    CONFIG_LOAD_ERRORS: tuple[type[Exception], ...] = (
-        OSError,
-        ValueError,
-        json.JSONDecodeError,
-        YAMLError,
-    )
-else:
-    CONFIG_LOAD_ERRORS = (OSError, ValueError, json.JSONDecodeError)
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    from parsercraft.language_config import LanguageConfig
+
+
+def _config_load_errors() -> tuple[type[Exception], ...]:
+    """Exceptions raised by ``LanguageConfig.load`` for bad input files.
+
+    Evaluated only when an ``except`` clause is reached, so YAML is not
+    imported unless a config actually failed to load.
+    """
+    try:
+        from yaml import YAMLError
+    except ImportError:  # pragma: no cover - optional dependency
+        return (OSError, ValueError, json.JSONDecodeError)
+    return (OSError, ValueError, json.JSONDecodeError, YAMLError)
 
 
 SAFE_BUILTINS: dict[str, Any] = {
@@ -115,38 +112,73 @@ SAFE_BUILTINS: dict[str, Any] = {
 }
 
 
+# Set by the daemon so handlers reuse configs and module graphs across calls
+_WARM_STATE: Any = None
+
+
+def _load_config(path: Path) -> LanguageConfig:
+    """Load a configuration file, via the daemon's cache when available."""
+    from .language_config import LanguageConfig
+
+    if _WARM_STATE is not None:
+        return _WARM_STATE.load_config(path)
+    return LanguageConfig.load(path)
+
+
 def _load_config_from_path(
     path: Path,
     error_prefix: str,
 ) -> Optional[LanguageConfig]:
     """Load a configuration file, reporting user-friendly errors."""
     try:
-        return LanguageConfig.load(path)
-    except CONFIG_LOAD_ERRORS as error:
+        return _load_config(path)
+    except _config_load_errors() as error:
         print(f"{error_prefix}{error}")
         return None
 
 
-def _translate_with_keywords(
-    source: str,
+def _compile_translation_rules(
     custom_keywords: Sequence[str],
-) -> str:
-    """Translate custom keywords in source code back to their originals."""
-    translated = source
+) -> list[tuple[re.Pattern[str], str]]:
+    """Precompile the substitution rules for the loaded configuration."""
+    from .language_runtime import LanguageRuntime
+
+    rules = []
     for custom_kw in custom_keywords:
         original_kw = LanguageRuntime.translate_keyword(custom_kw)
         pattern = r"\b" + re.escape(custom_kw) + r"\b"
-        translated = re.sub(pattern, original_kw, translated)
+        rules.append((re.compile(pattern), original_kw))
 
     # Also translate custom function names if present
     for custom_func in LanguageRuntime.get_custom_functions():
         original_func = LanguageRuntime.translate_function(custom_func)
         pattern = r"\b" + re.escape(custom_func) + r"\b"
-        translated = re.sub(pattern, original_func, translated)
+        rules.append((re.compile(pattern), original_func))
+
+    return rules
 
+
+def _apply_translation_rules(
+    source: str,
+    rules: Sequence[tuple[re.Pattern[str], str]],
+) -> str:
+    """Apply precompiled substitution rules to source code."""
+    translated = source
+    for pattern, replacement in rules:
+        translated = pattern.sub(replacement, translated)
     return translated
 
 
+def _translate_with_keywords(
+    source: str,
+    custom_keywords: Sequence[str],
+) -> str:
+    """Translate custom keywords in source code back to their originals."""
+    return _apply_translation_rules(
+        source, _compile_translation_rules(custom_keywords)
+    )
+
+
 def _load_test_cases(path: Path) -> Optional[list[dict[str, Any]]]:
     """Load test cases from a YAML or JSON file."""
     if not path.exists():
@@ -159,8 +191,15 @@ def _load_test_cases(path: Path) -> Optional[list[dict[str, Any]]]:
         print(f"Error reading test file: {error}")
         return None
 
+    safe_load = None
+    if path.suffix.lower() in {".yaml", ".yml"}:
+        try:
+            from yaml import safe_load
+        except ImportError:  # pragma: no cover - optional dependency
+            pass
+
     try:
-        if path.suffix.lower() in {".yaml", ".yml"} and safe_load is not None:
+        if safe_load is not None:
             cases = safe_load(content)
         else:
             cases = json.loads(content)
@@ -178,7 +217,7 @@ def _load_test_cases(path: Path) -> Optional[list[dict[str, Any]]]:
 def _run_test_case(
     case: dict[str, Any],
     base_dir: Path,
-    custom_keywords: Sequence[str],
+    translation_rules: Sequence[tuple[re.Pattern[str], str]],
     show_translation: bool,
     debug: bool,
 ) -> tuple[bool, list[str]]:
@@ -200,7 +239,7 @@ def _run_test_case(
     if not source:
         return False, ["Missing 'file' or 'source' in test case"]
 
-    translated = _translate_with_keywords(source, custom_keywords)
+    translated = _apply_translation_rules(source, translation_rules)
 
     if show_translation:
         details.append("Translated code:\n" + translated)
@@ -354,6 +393,8 @@ def _execute_repl_line(
         starts_with_keyword = stripped_line.startswith(tuple(keyword_prefixes))
 
         if not has_assignment and not starts_with_keyword:
+            import ast
+
             try:
                 result = ast.literal_eval(translated)
             except (ValueError, SyntaxError):
@@ -372,6 +413,8 @@ def _execute_repl_line(
 
 def _run_repl_session(config: LanguageConfig, debug: bool) -> int:
     """Run the interactive REPL session."""
+    from .language_runtime import LanguageRuntime
+
     LanguageRuntime.load_config(config=config)
     custom_keywords = tuple(LanguageRuntime.get_custom_keywords())
     keyword_prefixes = custom_keywords
@@ -424,6 +467,8 @@ def _run_repl_session(config: LanguageConfig, debug: bool) -> int:
 
 def _resolve_repl_config(file_arg: Optional[str]) -> Optional[LanguageConfig]:
     """Resolve the configuration to use for the REPL."""
+    from .language_config import LanguageConfig
+
     if not file_arg:
         print("Using default configuration")
         return LanguageConfig()
@@ -441,7 +486,7 @@ def _resolve_repl_config(file_arg: Optional[str]) -> Optional[LanguageConfig]:
 
 def _run_batch_script(
     script_path: Path,
-    custom_keywords: Sequence[str],
+    translation_rules: Sequence[tuple[re.Pattern[str], str]],
     show_translation: bool,
     show_vars: bool,
     debug: bool,
@@ -460,7 +505,7 @@ def _run_batch_script(
         print(f"Error reading script: {error}")
         return 1
 
-    translated = _translate_with_keywords(code, custom_keywords)
+    translated = _apply_translation_rules(code, translation_rules)
 
     if show_translation:
         print("\nTranslated Python code:")
@@ -494,9 +539,34 @@ def _run_batch_script(
     return 0
 
 
+def _translate_batch_files(
+    files: Sequence[Path],
+    translation_rules: Sequence[tuple[re.Pattern[str], str]],
+    target_dir: Path,
+) -> tuple[int, int]:
+    """Translate each file into ``target_dir``; return (successes, errors)."""
+    success_count = 0
+    error_count = 0
+
+    for file_path in files:
+        print(f"\nProcessing: {file_path.name}")
+        try:
+            code = file_path.read_text(encoding="utf-8")
+            translated = _apply_translation_rules(code, translation_rules)
+            output_file = target_dir / f"{file_path.stem}.py"
+            output_file.write_text(translated, encoding="utf-8")
+            print(f"  -> Saved to: {output_file}")
+            success_count += 1
+        except OSError as error:
+            print(f"  -> Error: {error}")
+            error_count += 1
+
+    return success_count, error_count
+
+
 def _process_batch_directory(
     input_dir: Path,
-    custom_keywords: Sequence[str],
+    translation_rules: Sequence[tuple[re.Pattern[str], str]],
     output_dir: Optional[str],
     pattern: Optional[str],
 ) -> int:
@@ -514,21 +584,9 @@ def _process_batch_directory(
         print(f"No files found matching pattern: {glob_pattern}")
         return 1
 
-    success_count = 0
-    error_count = 0
-
-    for file_path in files:
-        print(f"\nProcessing: {file_path.name}")
-        try:
-            code = file_path.read_text(encoding="utf-8")
-            translated = _translate_with_keywords(code, custom_keywords)
-            output_file = target_dir / f"{file_path.stem}.py"
-            output_file.write_text(translated, encoding="utf-8")
-            print(f"  -> Saved to: {output_file}")
-            success_count += 1
-        except OSError as error:
-            print(f"  -> Error: {error}")
-            error_count += 1
+    success_count, error_count = _translate_batch_files(
+        files, translation_rules, target_dir
+    )
 
     print("\n" + "=" * 70)
     print("Batch processing complete:")
@@ -540,6 +598,12 @@ def _process_batch_directory(
 
 def cmd_create(args):
     """Create a new language configuration."""
+    from .language_config import (
+        LanguageConfig,
+        create_custom_config_interactive,
+        list_presets,
+    )
+
     if args.preset:
         try:
             config = LanguageConfig.from_preset(args.preset)
@@ -563,6 +627,7 @@ def cmd_create(args):
 
 def cmd_edit(args):
     """Edit an existing configuration (opens in text editor)."""
+    from .language_config import LanguageConfig
 
     filepath = Path(args.file)
     if not filepath.exists():
@@ -574,6 +639,8 @@ def cmd_edit(args):
 
     # Open in editor
     try:
+        import subprocess
+
         subprocess.run([editor, str(filepath)], check=False)
         print(f"Edited: {filepath}")
 
@@ -588,7 +655,7 @@ def cmd_edit(args):
                 return 1
             else:
                 print("\n✓ Configuration is valid")
-        except CONFIG_LOAD_ERRORS as error:
+        except _config_load_errors() as error:
             print(f"\n❌ Error loading config: {error}")
             return 1
     except FileNotFoundError:
@@ -607,7 +674,7 @@ def cmd_validate(args):
         return 1
 
     try:
-        config = LanguageConfig.load(filepath)
+        config = _load_config(filepath)
         errors = config.validate()
 
         if errors:
@@ -625,13 +692,16 @@ def cmd_validate(args):
             print(f"  Functions: {len(config.builtin_functions)}")
             print(f"  Operators: {len(config.operators)}")
             return 0
-    except CONFIG_LOAD_ERRORS as error:
+    except _config_load_errors() as error:
         print(f"❌ Error loading config: {error}")
         return 1
 
 
 def cmd_info(args):
     """Show information about a configuration."""
+    from .language_config import LanguageConfig
+    from .language_runtime import LanguageRuntime
+
     if args.file:
         filepath = Path(args.file)
         if not filepath.exists():
@@ -640,7 +710,7 @@ def cmd_info(args):
 
         try:
             config = LanguageConfig.load(filepath)
-        except CONFIG_LOAD_ERRORS as error:
+        except _config_load_errors() as error:
             print(f"Error loading config: {error}")
             return 1
     else:
@@ -722,6 +792,8 @@ def cmd_info(args):
 
 def cmd_export(args):
     """Export configuration in different formats."""
+    from .language_config import LanguageConfig
+
     filepath = Path(args.file)
     if not filepath.exists():
         print(f"Error: File not found: {filepath}")
@@ -729,7 +801,7 @@ def cmd_export(args):
 
     try:
         config = LanguageConfig.load(filepath)
-    except CONFIG_LOAD_ERRORS as error:
+    except _config_load_errors() as error:
         print(f"Error loading config: {error}")
         return 1
 
@@ -765,6 +837,8 @@ def cmd_import(args):
     Loads the configuration into the runtime and optionally persists
     a reference in `.langconfig` (project) or `~/.langconfig` (user).
     """
+    from .language_runtime import LanguageRuntime
+
     filepath = Path(args.file)
     if not filepath.exists():
         print(f"Error: File not found: {filepath}")
@@ -796,25 +870,22 @@ def cmd_import(args):
         except OSError as error:
             print(f"Warning: Failed to persist reference: {error}")
         return 0
-    except CONFIG_LOAD_ERRORS as error:
+    except _config_load_errors() as error:
         print(f"Error importing config: {error}")
         return 1
 
 
 def cmd_list_presets(_args):
     """List available presets."""
-    presets = list_presets()
+    from .language_config import get_preset_info, list_presets
 
     print("Available Presets:")
     print("=" * 70)
 
-    for preset in presets:
-        try:
-            config = LanguageConfig.from_preset(preset)
-            print(f"\n{preset}:")
-            print(f"  {config.description}")
-        except CONFIG_LOAD_ERRORS as error:
-            print(f"\n{preset}: (error loading: {error})")
+    # Descriptions come from the registry; no preset is built
+    for preset in list_presets():
+        print(f"\n{preset}:")
+        print(f"  {get_preset_info(preset).description}")
 
     print("\nUsage:")
     print("  langconfig create --preset PRESET_NAME")
@@ -824,6 +895,8 @@ def cmd_list_presets(_args):
 
 def cmd_convert(args):
     """Convert configuration between formats."""
+    from .language_config import LanguageConfig
+
     filepath = Path(args.file)
     if not filepath.exists():
         print(f"Error: File not found: {filepath}")
@@ -831,7 +904,7 @@ def cmd_convert(args):
 
     try:
         config = LanguageConfig.load(filepath)
-    except CONFIG_LOAD_ERRORS as error:
+    except _config_load_errors() as error:
         print(f"Error loading config: {error}")
         return 1
 
@@ -850,6 +923,8 @@ def cmd_convert(args):
 
 def cmd_diff(args):
     """Show differences between two configurations."""
+    from .language_config import LanguageConfig
+
     file1 = Path(args.file1)
     file2 = Path(args.file2)
 
@@ -863,7 +938,7 @@ def cmd_diff(args):
     try:
         config1 = LanguageConfig.load(file1)
         config2 = LanguageConfig.load(file2)
-    except CONFIG_LOAD_ERRORS as error:
+    except _config_load_errors() as error:
         print(f"Error loading configs: {error}")
         return 1
 
@@ -954,6 +1029,8 @@ def cmd_diff(args):
 
 def cmd_update(args):
     """Update a configuration file."""
+    from .language_config import LanguageConfig
+
     filepath = Path(args.file)
     if not filepath.exists():
         print(f"Error: File not found: {filepath}")
@@ -961,7 +1038,7 @@ def cmd_update(args):
 
     try:
         config = LanguageConfig.load(filepath)
-    except CONFIG_LOAD_ERRORS as error:
+    except _config_load_errors() as error:
         print(f"Error loading config: {error}")
         return 1
 
@@ -993,7 +1070,7 @@ def cmd_update(args):
 
         try:
             merge_config = LanguageConfig.load(merge_path)
-        except CONFIG_LOAD_ERRORS as error:
+        except _config_load_errors() as error:
             print(f"Error loading merge config: {error}")
             return 1
 
@@ -1013,6 +1090,11 @@ def cmd_update(args):
 
 def cmd_repl(args):
     """Interactive REPL mode for testing language features."""
+    try:
+        import readline  # noqa: F401  # pylint: disable=unused-import
+    except ImportError:  # pragma: no cover - platform dependent
+        readline = None
+
     if readline is None:
         print("Warning: readline support unavailable; history disabled")
 
@@ -1023,6 +1105,39 @@ def cmd_repl(args):
     return _run_repl_session(config, args.debug)
 
 
+def _activate_config(
+    config: LanguageConfig,
+) -> list[tuple[re.Pattern[str], str]]:
+    """Load ``config`` into the runtime and compile its translation rules."""
+    from .language_runtime import LanguageRuntime
+
+    LanguageRuntime.load_config(config=config)
+
+    if _WARM_STATE is not None:
+        rules = _WARM_STATE.translation_rules(config)
+        if rules is not None:
+            return rules
+
+    rules = _compile_translation_rules(
+        tuple(LanguageRuntime.get_custom_keywords())
+    )
+    if _WARM_STATE is not None:
+        _WARM_STATE.store_translation_rules(config, rules)
+    return rules
+
+
+def _reload_watched_config(
+    config_path: Path,
+) -> Optional[list[tuple[re.Pattern[str], str]]]:
+    """Reload a watched configuration; None keeps the previous one."""
+    config = _load_config_from_path(
+        config_path, "Error reloading config (keeping previous): "
+    )
+    if config is None:
+        return None
+    return _activate_config(config)
+
+
 def cmd_batch(args):
     """Execute batch processing of language files."""
     filepath = Path(args.file)
@@ -1034,58 +1149,116 @@ def cmd_batch(args):
     if config is None:
         return 1
 
-    LanguageRuntime.load_config(config=config)
-    custom_keywords = tuple(LanguageRuntime.get_custom_keywords())
+    translation_rules = _activate_config(config)
 
     if args.script:
-        return _run_batch_script(
-            Path(args.script),
-            custom_keywords,
+        script_path = Path(args.script)
+        status = _run_batch_script(
+            script_path,
+            translation_rules,
             args.show_translation,
             args.show_vars,
             args.debug,
         )
+        if not args.watch:
+            return status
+
+        from .watch import StatScanner, watch_loop
+
+        def rerun_script(changes):
+            nonlocal translation_rules
+            if filepath in changes.changed:
+                translation_rules = (
+                    _reload_watched_config(filepath) or translation_rules
+                )
+            _run_batch_script(
+                script_path,
+                translation_rules,
+                args.show_translation,
+                args.show_vars,
+                args.debug,
+            )
+
+        scanner = StatScanner(files=[filepath, script_path])
+        return watch_loop(scanner, rerun_script, interval=args.interval)
 
     if args.input_dir:
-        return _process_batch_directory(
-            Path(args.input_dir),
-            custom_keywords,
+        input_dir = Path(args.input_dir)
+        status = _process_batch_directory(
+            input_dir,
+            translation_rules,
             args.output_dir,
             args.pattern,
         )
+        if not args.watch or not input_dir.is_dir():
+            return status
 
-    print("Error: Specify --script FILE or --input-dir DIR")
-    return 1
+        from .watch import DependencyGraph, StatScanner, watch_loop
 
+        target_dir = Path(args.output_dir) if args.output_dir else input_dir
+        scanner = StatScanner(
+            files=[filepath],
+            directories=[(input_dir, args.pattern or "*.txt")],
+        )
+        sources = [path for path in scanner.files() if path != filepath]
+        graph = DependencyGraph(config)
+        graph.update_many(sources)
+
+        def retranslate(changes):
+            nonlocal translation_rules
+            if filepath in changes.changed:
+                translation_rules = (
+                    _reload_watched_config(filepath) or translation_rules
+                )
+                affected = set(scanner.files()) - {filepath}
+            else:
+                graph.apply(changes)
+                affected = graph.dependents(changes.touched) - changes.removed
 
-def cmd_test(args):
-    """Translate, run, and verify test cases."""
-    tests_path = Path(args.tests)
-    cases = _load_test_cases(tests_path)
-    if cases is None:
-        return 1
+            files = sorted(path for path in affected if path.exists())
+            _, errors = _translate_batch_files(
+                files, translation_rules, target_dir
+            )
+            print(
+                f"Re-translated {len(files)} file(s)"
+                + (f", {errors} error(s)" if errors else "")
+            )
 
-    config_path = Path(args.config)
-    if not config_path.exists():
-        print(f"Error: Configuration file not found: {config_path}")
-        return 1
+        return watch_loop(scanner, retranslate, interval=args.interval)
 
-    config = _load_config_from_path(config_path, "Error loading config: ")
-    if config is None:
-        return 1
+    print("Error: Specify --script FILE or --input-dir DIR")
+    return 1
 
-    LanguageRuntime.load_config(config=config)
-    custom_keywords = tuple(LanguageRuntime.get_custom_keywords())
 
-    base_dir = tests_path.parent
+def _case_source_path(case: dict[str, Any], base_dir: Path) -> Optional[Path]:
+    """Return the resolved source file of a test case, if it has one."""
+    file_path = case.get("file")
+    if not file_path:
+        return None
+    return (base_dir / file_path).resolve()
+
+
+def _run_test_cases(
+    cases: Sequence[dict[str, Any]],
+    base_dir: Path,
+    translation_rules: Sequence[tuple[re.Pattern[str], str]],
+    args: argparse.Namespace,
+    selected: Optional[set[int]] = None,
+) -> int:
+    """Run test cases (optionally only ``selected`` indexes); return failures."""
     failures = 0
+    total = 0
 
     for index, case in enumerate(cases, start=1):
+        if selected is not None and index not in selected:
+            continue
+
+        total += 1
         name = case.get("name") or f"case {index}"
         passed, details = _run_test_case(
             case,
             base_dir,
-            custom_keywords,
+            translation_rules,
             args.show_translation,
             args.debug,
         )
@@ -1100,16 +1273,20 @@ def cmd_test(args):
             if args.stop_on_fail:
                 break
 
-    total = len(cases)
     print(
         f"\nSummary: {total - failures}/{total} passed, {failures} failed"
     )
 
-    return 0 if failures == 0 else 1
+    return failures
 
 
-def cmd_translate(args):
-    """Translate a source file using a language configuration."""
+def cmd_test(args):
+    """Translate, run, and verify test cases."""
+    tests_path = Path(args.tests)
+    cases = _load_test_cases(tests_path)
+    if cases is None:
+        return 1
+
     config_path = Path(args.config)
     if not config_path.exists():
         print(f"Error: Configuration file not found: {config_path}")
@@ -1119,24 +1296,82 @@ def cmd_translate(args):
     if config is None:
         return 1
 
-    LanguageRuntime.load_config(config=config)
-    custom_keywords = tuple(LanguageRuntime.get_custom_keywords())
+    translation_rules = _activate_config(config)
+    base_dir = tests_path.parent
 
-    input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"Error: Input file not found: {input_path}")
-        return 1
+    failures = _run_test_cases(cases, base_dir, translation_rules, args)
+    if not args.watch:
+        return 0 if failures == 0 else 1
+
+    from .watch import DependencyGraph, StatScanner, watch_loop
 
+    def case_sources() -> dict[Path, set[int]]:
+        sources: dict[Path, set[int]] = {}
+        for index, case in enumerate(cases, start=1):
+            path = _case_source_path(case, base_dir)
+            if path is not None:
+                sources.setdefault(path, set()).add(index)
+        return sources
+
+    # Watch sibling modules too, so edits to imported files re-run importers
+    def module_directories() -> set[tuple[Path, str]]:
+        return {(path.parent, f"*{path.suffix}") for path in case_sources()}
+
+    scanner = StatScanner(
+        files=[tests_path, config_path],
+        directories=module_directories(),
+    )
+    graph = DependencyGraph(config)
+    graph.update_many(
+        path for path in scanner.files() if path not in (tests_path, config_path)
+    )
+
+    def rerun_cases(changes):
+        nonlocal cases, translation_rules
+
+        selected: Optional[set[int]] = None
+        if config_path in changes.changed:
+            translation_rules = (
+                _reload_watched_config(config_path) or translation_rules
+            )
+        elif tests_path in changes.changed:
+            cases = _load_test_cases(tests_path) or cases
+            for directory, pattern in module_directories():
+                graph.update_many(scanner.add_directory(directory, pattern))
+        else:
+            graph.apply(changes)
+            affected = {
+                path.resolve() for path in graph.dependents(changes.touched)
+            }
+            selected = set()
+            for path, indexes in case_sources().items():
+                if path in affected:
+                    selected.update(indexes)
+            if not selected:
+                print("No test cases depend on the changed files")
+                return
+
+        _run_test_cases(cases, base_dir, translation_rules, args, selected)
+
+    return watch_loop(scanner, rerun_cases, interval=args.interval)
+
+
+def _translate_file(
+    input_path: Path,
+    output: Optional[str],
+    translation_rules: Sequence[tuple[re.Pattern[str], str]],
+) -> int:
+    """Translate one source file to ``output`` (or stdout)."""
     try:
         source = input_path.read_text(encoding="utf-8")
     except OSError as error:
         print(f"Error reading input file: {error}")
         return 1
 
-    translated = _translate_with_keywords(source, custom_keywords)
+    translated = _apply_translation_rules(source, translation_rules)
 
-    if args.output:
-        output_path = Path(args.output)
+    if output:
+        output_path = Path(output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         try:
             output_path.write_text(translated, encoding="utf-8")
@@ -1150,8 +1385,47 @@ def cmd_translate(args):
     return 0
 
 
+def cmd_translate(args):
+    """Translate a source file using a language configuration."""
+    config_path = Path(args.config)
+    if not config_path.exists():
+        print(f"Error: Configuration file not found: {config_path}")
+        return 1
+
+    config = _load_config_from_path(config_path, "Error loading config: ")
+    if config is None:
+        return 1
+
+    translation_rules = _activate_config(config)
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"Error: Input file not found: {input_path}")
+        return 1
+
+    status = _translate_file(input_path, args.output, translation_rules)
+    if not args.watch:
+        return status
+
+    from .watch import StatScanner, watch_loop
+
+    def retranslate(changes):
+        nonlocal translation_rules
+        if config_path in changes.changed:
+            translation_rules = (
+                _reload_watched_config(config_path) or translation_rules
+            )
+        if input_path in changes.changed or config_path in changes.changed:
+            _translate_file(input_path, args.output, translation_rules)
+
+    scanner = StatScanner(files=[config_path, input_path])
+    return watch_loop(scanner, retranslate, interval=args.interval)
+
+
 def cmd_delete(args):
     """Delete elements from configuration."""
+    from .language_config import LanguageConfig
+
     filepath = Path(args.file)
     if not filepath.exists():
         print(f"Error: File not found: {filepath}")
@@ -1159,7 +1433,7 @@ def cmd_delete(args):
 
     try:
         config = LanguageConfig.load(filepath)
-    except CONFIG_LOAD_ERRORS as error:
+    except _config_load_errors() as error:
         print(f"Error loading config: {error}")
         return 1
 
@@ -1240,13 +1514,14 @@ def cmd_lsp(args):
             return 1
 
         return 0
-    except CONFIG_LOAD_ERRORS as error:
+    except _config_load_errors() as error:
         print(f"Error loading config: {error}", file=sys.stderr)
         return 1
 
 
 def cmd_extension(args):
     """Generate VS Code extension."""
+    from .language_config import LanguageConfig
     from .vscode_integration import generate_vscode_extension
 
     config_path = Path(args.config)
@@ -1269,94 +1544,99 @@ def cmd_extension(args):
         print("  3. npm run compile")
         print("  4. code --install-extension .vscode-ext")
         return 0
-    except CONFIG_LOAD_ERRORS as error:
+    except _config_load_errors() as error:
         print(f"Error loading config: {error}")
         return 1
 
 
 def cmd_type_check(args):
-    """Perform static type analysis on source file."""
-    from .type_system import TypeChecker, AnalysisLevel
+    """Perform static type analysis on source files and their imports."""
+    from .type_system import AnalysisLevel
+    from .typecheck_cache import ProjectTypeChecker, TypeCheckCache, collect_sources
 
     config_path = Path(args.config)
     if not config_path.exists():
         print(f"Error: Configuration file not found: {config_path}")
         return 1
 
-    source_path = Path(args.input)
-    if not source_path.exists():
-        print(f"Error: Source file not found: {source_path}")
+    inputs = [args.project] if args.project else args.input
+    missing = [path for path in inputs if not Path(path).exists()]
+    if missing:
+        print(f"Error: Source file not found: {missing[0]}")
         return 1
 
     try:
-        config = LanguageConfig.load(config_path)
-    except CONFIG_LOAD_ERRORS as error:
+        config = _load_config(config_path)
+    except _config_load_errors() as error:
         print(f"Error loading config: {error}")
         return 1
 
-    try:
-        source = source_path.read_text(encoding="utf-8")
-    except OSError as error:
-        print(f"Error reading source file: {error}")
-        return 1
-
-    # Parse analysis level
     level_map = {
-        "lenient": AnalysisLevel.Lenient,
-        "moderate": AnalysisLevel.Moderate,
-        "strict": AnalysisLevel.Strict,
-        "very-strict": AnalysisLevel.VeryStrict,
+        "lenient": AnalysisLevel.LENIENT,
+        "moderate": AnalysisLevel.MODERATE,
+        "strict": AnalysisLevel.STRICT,
+        "very-strict": AnalysisLevel.VERY_STRICT,
     }
-    analysis_level = level_map.get(args.level, AnalysisLevel.Moderate)
+    analysis_level = level_map.get(args.level, AnalysisLevel.MODERATE)
 
-    # Create type checker
-    checker = TypeChecker(config=config, analysis_level=analysis_level)
+    sources = collect_sources(Path(path) for path in inputs)
+    search_paths = None
+    if args.project:
+        # Project mode: modules also resolve from the project's root, modules/ and lib/
+        root = Path(args.project)
+        search_paths = [str(root), str(root / "modules"), str(root / "lib")]
+    cache = None if args.no_cache else TypeCheckCache.default()
+    project = ProjectTypeChecker(
+        config, level=analysis_level, cache=cache, search_paths=search_paths
+    )
 
-    # Check the file
-    print(f"Type checking: {source_path}")
+    print(f"Type checking: {len(sources)} file(s)")
     print(f"Analysis level: {args.level}")
     print("=" * 70)
 
     try:
-        errors = checker.check_file(
-            source_path=str(source_path), source=source
-        )
-
-        if not errors:
-            print("✓ No type errors found")
-            return 0
-
-        # Display errors
-        print(f"Found {len(errors)} error(s):\n")
-        for error in errors:
-            print(f"[{error.kind.name}] {error.message}")
-            if error.location:
-                loc = error.location
-                print(
-                    f"  Location: {loc.path}:{loc.line}:{loc.column}"
-                )
-            if error.suggestion:
-                print(f"  Suggestion: {error.suggestion}")
-            print()
-
-        return 1 if not args.warnings_as_errors else 1
-
+        run = project.check(sources, jobs=args.jobs)
     except Exception as error:  # pylint: disable=broad-exception-caught
         print(f"Error during type checking: {error}")
         if args.debug:
             traceback.print_exc()
         return 1
 
+    print(run.format())
+    print("-" * 70)
+    print(run.get_type_error_summary())
+    if run.error_count or (args.warnings_as_errors and run.warning_count):
+        return 1
+    return 0
 
-def cmd_module_info(args):
-    """Show information about a module."""
+
+def _module_manager(module_dir: Path):
+    """Create (or reuse, under the daemon) a module manager for a directory."""
+    from .language_config import LanguageConfig
     from .module_system import ModuleManager
 
+    def factory(base_dir: Path) -> ModuleManager:
+        return ModuleManager(
+            LanguageConfig(),
+            search_paths=[
+                str(base_dir),
+                str(base_dir / "modules"),
+                str(base_dir / "lib"),
+            ],
+        )
+
+    if _WARM_STATE is not None:
+        return _WARM_STATE.module_manager(module_dir, factory)
+    return factory(module_dir)
+
+
+def cmd_module_info(args):
+    """Show information about a module."""
     module_name = args.module
     module_dir = Path(args.module_dir) if args.module_dir else Path.cwd()
 
     try:
-        manager = ModuleManager(base_dir=module_dir)
+        manager = _module_manager(module_dir)
         module = manager.load_module(module_name)
 
         print(f"Module: {module.name}")
@@ -1387,13 +1667,11 @@ def cmd_module_info(args):
 
 def cmd_module_deps(args):
     """Show module dependencies."""
-    from .module_system import ModuleManager
-
     module_name = args.module
     module_dir = Path(args.module_dir) if args.module_dir else Path.cwd()
 
     try:
-        manager = ModuleManager(base_dir=module_dir)
+        manager = _module_manager(module_dir)
         deps = manager.resolve_dependencies(module_name)
 
         print(f"Dependencies for {module_name}:")
@@ -1404,8 +1682,8 @@ def cmd_module_deps(args):
             return 0
 
         module = manager.load_module(module_name)
-        print(f"Direct dependencies ({len(module.imports)}):")
-        for imp in module.imports:
+        print(f"Direct dependencies ({len(module.dependencies)}):")
+        for imp in module.dependencies:
             print(f"  • {imp.module_name}")
 
         all_deps = set(deps) - {module_name}
@@ -1425,12 +1703,12 @@ def cmd_module_deps(args):
 
 def cmd_module_cycles(args):
     """Detect circular dependencies."""
-    from .module_system import ModuleManager, CircularDependencyError
+    from .module_system import CircularDependencyError
 
     module_dir = Path(args.module_dir) if args.module_dir else Path.cwd()
 
     try:
-        manager = ModuleManager(base_dir=module_dir)
+        manager = _module_manager(module_dir)
 
         # Try to load all modules and detect cycles
         cycles = []
@@ -1515,57 +1793,134 @@ def cmd_check_protocol(args):
 
 
 def cmd_codegen_c(args):
-    """Generate C code from source."""
-    from .codegen_c import CCodeGenerator
+    """Generate C code from source (and optionally build it)."""
+    from .ast_integration import ASTToCGenerator
+    from .ast_optimizer import OptimizationPipeline
+    from .codegen_cache import CodegenCache
+    from .language_config import LanguageConfig
+    from .parser_generator import ParserGenerator
+
+    source_path = Path(args.file)
+    if not source_path.exists():
+        print(f"Error: Source file not found: {source_path}")
+        return 1
 
-    try:
-        with open(args.file) as f:
-            pass
-            # source = f.read()
+    if args.config:
+        config = _load_config_from_path(Path(args.config), "Error loading config: ")
+        if config is None:
+            return 1
+    else:
+        config = LanguageConfig()
 
-        generator = CCodeGenerator()
-        c_code = (
-            generator.generate_header()
-            + "\n"
-            + generator.generate_implementations()
-        )
+    try:
+        source = source_path.read_text(encoding="utf-8")
+        _, ast = ParserGenerator(config).parse(source)
 
-        output_file = args.output or args.file.replace(".lang", ".c")
+        output_file = Path(args.output) if args.output else source_path.with_suffix(".c")
+        if output_file.resolve() == source_path.resolve():
+            print(f"Error: Output would overwrite the source file: {output_file}")
+            return 1
 
-        with open(output_file, "w") as f:
-            f.write(c_code)
+        optimizer = OptimizationPipeline(config) if args.optimize else None
+        cache = None if args.no_cache else CodegenCache.for_source(source_path)
+        generator = ASTToCGenerator(
+            config, optimizer=optimizer, cache=cache, jobs=args.jobs
+        )
+        if args.build:
+            c_code = generator.translate(ast)
+            output_file.write_text(c_code, encoding="utf-8")
+            size = len(c_code)
+        else:
+            size = generator.translate_to_file(ast, output_file)
+        if cache is not None:
+            cache.save()
 
+        stats = generator.codegen_stats
         print(f"✓ Generated C code: {output_file}")
-        print(f"  Lines: {len(c_code.split(chr(10)))}")
-
-        return 0
+        print(f"  Size: {size} characters")
+        print(f"  Functions: {stats.functions} ({stats.regenerated} regenerated)")
+        if generator.optimization_report is not None:
+            print(f"  Optimizer rewrites: {generator.optimization_report.total_rewrites}")
 
     except Exception as error:  # pylint: disable=broad-exception-caught
         print(f"Error: {error}")
         return 1
 
+    if args.build:
+        import shutil
+
+        from .native_build import NativeBuilder, NativeBuildError
+
+        try:
+            result = NativeBuilder().build(c_code)
+        except NativeBuildError as error:
+            print(f"Error: {error}")
+            return 1
+        executable = output_file.with_suffix(result.executable.suffix)
+        shutil.copy2(result.executable, executable)
+        status = "cached" if result.cached else f"compiled in {result.seconds:.2f}s"
+        print(f"✓ Built executable: {executable} ({status})")
+
+    return 0
+
+
+def _print_wasm_optimization(report) -> None:
+    """Before/after counts of a WasmOptimizer run, if there was one."""
+    if report is not None:
+        print(
+            f"  Optimized: {report.instructions_before} -> {report.instructions_after} "
+            f"instructions, {report.locals_before} -> {report.locals_after} locals"
+        )
+
 
 def cmd_codegen_wasm(args):
     """Generate WebAssembly from source."""
-    from .codegen_wasm import WasmGenerator
+    from .ast_integration import ASTToWasmGenerator
+    from .codegen_cache import CodegenCache
+    from .language_config import LanguageConfig
+    from .parser_generator import ParserGenerator
+    from .wasm_optimize import WasmOptimizer
 
-    try:
-        with open(args.file) as f:
-            pass
-            # source = f.read()
+    source_path = Path(args.file)
+    if not source_path.exists():
+        print(f"Error: Source file not found: {source_path}")
+        return 1
 
-        generator = WasmGenerator()
-        module = generator.generate_from_ast(None)
+    if args.config:
+        config = _load_config_from_path(Path(args.config), "Error loading config: ")
+        if config is None:
+            return 1
+    else:
+        config = LanguageConfig()
 
-        output_file = args.output or args.file.replace(".lang", ".wat")
+    try:
+        suffix = ".wasm" if args.format == "wasm" else ".wat"
+        output_file = Path(args.output) if args.output else source_path.with_suffix(suffix)
+        if output_file.resolve() == source_path.resolve():
+            print(f"Error: Output would overwrite the source file: {output_file}")
+            return 1
 
-        wat_text = module.to_wat()
-        with open(output_file, "w") as f:
-            f.write(wat_text)
+        source = source_path.read_text(encoding="utf-8")
+        _, ast = ParserGenerator(config).parse(source)
+        cache = None if args.no_cache else CodegenCache.for_source(source_path, "wasm")
+        generator = ASTToWasmGenerator(config, cache=cache, jobs=args.jobs)
+        # Raises CodegenError for anything the backend cannot lower
+        module = generator.translate(ast)
+        if cache is not None:
+            cache.save()
+        report = WasmOptimizer().optimize_module(module) if args.optimize else None
+
+        if args.format == "wasm":
+            output_file.write_bytes(module.to_wasm(validate=True))
+        else:
+            module.save(str(output_file), binary=False)
 
+        stats = generator.codegen_stats
         print(f"✓ Generated WebAssembly: {output_file}")
         print(f"  Format: {args.format}")
-        print(f"  Lines: {len(wat_text.split(chr(10)))}")
+        print(f"  Size: {output_file.stat().st_size} bytes")
+        print(f"  Functions: {stats.functions} ({stats.regenerated} regenerated)")
+        _print_wasm_optimization(report)
 
         return 0
 
@@ -1752,9 +2107,81 @@ def cmd_debug_launch(args):
         return 1
 
 
-def main():
-    """Main entry point for the CLI application."""
+def cmd_daemon(args):
+    """Start, stop, or query the background daemon."""
+    from . import daemon
+
+    socket_path = Path(args.socket) if args.socket else None
+    actions = {
+        "start": daemon.start,
+        "stop": daemon.stop,
+        "status": daemon.status,
+        "run": daemon.serve,
+    }
+    return actions[args.action](socket_path)
+
+
+# Subcommand name -> handler. Handlers import the subsystems they need when
+# they run, so registering a command here costs nothing at startup.
+COMMANDS: dict[str, Callable[[argparse.Namespace], int]] = {
+    "create": cmd_create,
+    "edit": cmd_edit,
+    "validate": cmd_validate,
+    "info": cmd_info,
+    "export": cmd_export,
+    "list-presets": cmd_list_presets,
+    "convert": cmd_convert,
+    "diff": cmd_diff,
+    "update": cmd_update,
+    "delete": cmd_delete,
+    "import": cmd_import,
+    "repl": cmd_repl,
+    "batch": cmd_batch,
+    "test": cmd_test,
+    "translate": cmd_translate,
+    "lsp": cmd_lsp,
+    "extension": cmd_extension,
+    "type-check": cmd_type_check,
+    "module-info": cmd_module_info,
+    "module-deps": cmd_module_deps,
+    "module-cycles": cmd_module_cycles,
+    "generics": cmd_generics,
+    "check-protocol": cmd_check_protocol,
+    "codegen-c": cmd_codegen_c,
+    "codegen-wasm": cmd_codegen_wasm,
+    "package-search": cmd_package_search,
+    "package-install": cmd_package_install,
+    "refactor-rename": cmd_refactor_rename,
+    "format": cmd_format,
+    "test-run": cmd_test_run,
+    "debug-launch": cmd_debug_launch,
+    "daemon": cmd_daemon,
+}
+
+def main(argv: Optional[Sequence[str]] = None, warm_state: Any = None):
+    """Main entry point for the CLI application.
+
+    Args:
+        argv: Command-line arguments (default: ``sys.argv[1:]``)
+        warm_state: Shared caches supplied by the daemon when it runs a
+            forwarded command
+    """
+    global _WARM_STATE  # pylint: disable=global-statement
+
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if warm_state is None:
+        from .daemon import forward
+
+        forwarded = forward(argv)
+        if forwarded is not None:
+            return forwarded
+
+    _WARM_STATE = warm_state
+
     parser = argparse.ArgumentParser(
+        prog="parsercraft",
         description="Language Configuration Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -1966,6 +2393,18 @@ Examples:
     batch_parser.add_argument(
         "--debug", "-d", action="store_true", help="Enable debug mode"
     )
+    batch_parser.add_argument(
+        "--watch",
+        "-w",
+        action="store_true",
+        help="Re-run when the config or input files change",
+    )
+    batch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Polling interval in seconds for --watch (default: 0.5)",
+    )
 
     # Test command
     test_parser = subparsers.add_parser(
@@ -1989,6 +2428,18 @@ Examples:
     test_parser.add_argument(
         "--debug", "-d", action="store_true", help="Enable debug mode"
     )
+    test_parser.add_argument(
+        "--watch",
+        "-w",
+        action="store_true",
+        help="Re-run affected cases when sources change",
+    )
+    test_parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Polling interval in seconds for --watch (default: 0.5)",
+    )
 
     # Translate command
     translate_parser = subparsers.add_parser(
@@ -2004,6 +2455,18 @@ Examples:
     translate_parser.add_argument(
         "--output", "-o", help="Output file (default: stdout)"
     )
+    translate_parser.add_argument(
+        "--watch",
+        "-w",
+        action="store_true",
+        help="Re-translate when the config or input changes",
+    )
+    translate_parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Polling interval in seconds for --watch (default: 0.5)",
+    )
 
     # LSP server command
     lsp_parser = subparsers.add_parser(
@@ -2053,8 +2516,18 @@ Examples:
     typecheck_parser.add_argument(
         "--config", "-c", required=True, help="Language configuration file"
     )
-    typecheck_parser.add_argument(
-        "--input", "-i", required=True, help="Source file to analyze"
+    typecheck_inputs = typecheck_parser.add_mutually_exclusive_group(required=True)
+    typecheck_inputs.add_argument(
+        "--input",
+        "-i",
+        nargs="+",
+        help="Source files or directories to analyze (imports are checked too)",
+    )
+    typecheck_inputs.add_argument(
+        "--project",
+        "-p",
+        help="Project directory: check every source in it, resolving imports "
+        "from it and its modules/ and lib/ directories",
     )
     typecheck_parser.add_argument(
         "--level",
@@ -2067,6 +2540,15 @@ Examples:
         action="store_true",
         help="Treat warnings as errors",
     )
+    typecheck_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-check every file instead of reusing cached results",
+    )
+    typecheck_parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Worker processes for independent modules (0 = one per CPU)"
+    )
     typecheck_parser.add_argument(
         "--debug", "-d", action="store_true", help="Enable debug mode"
     )
@@ -2153,6 +2635,21 @@ Examples:
     codegen_c_parser.add_argument(
         "--optimize", action="store_true", help="Enable optimizations"
     )
+    codegen_c_parser.add_argument(
+        "--config", "-c", help="Language configuration file (default: built-in)"
+    )
+    codegen_c_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Regenerate every function instead of reusing unchanged ones"
+    )
+    codegen_c_parser.add_argument(
+        "--build", action="store_true",
+        help="Compile with the local C compiler (binaries cached by content hash)",
+    )
+    codegen_c_parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Worker processes for lowering functions (0 = one per CPU)"
+    )
 
     # WASM code generation
     codegen_wasm_parser = subparsers.add_parser(
@@ -2167,6 +2664,21 @@ Examples:
         "--format", choices=["wat", "wasm"], default="wat",
         help="Output format"
     )
+    codegen_wasm_parser.add_argument(
+        "--optimize", action="store_true",
+        help="Reuse locals and apply peephole optimizations"
+    )
+    codegen_wasm_parser.add_argument(
+        "--config", "-c", help="Language configuration file (default: built-in)"
+    )
+    codegen_wasm_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Regenerate every function instead of reusing unchanged ones"
+    )
+    codegen_wasm_parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Worker processes for lowering functions (0 = one per CPU)"
+    )
 
     # Package management commands
     package_search_parser = subparsers.add_parser(
@@ -2246,48 +2758,28 @@ Examples:
         "--breakpoint", "-b", action="append", help="Set breakpoint at line"
     )
 
-    args = parser.parse_args()
+    # Daemon
+    daemon_parser = subparsers.add_parser(
+        "daemon",
+        help="Manage the background daemon",
+    )
+    daemon_parser.add_argument(
+        "action",
+        choices=["start", "stop", "status", "run"],
+        help="start/stop in the background, show status, or run in foreground",
+    )
+    daemon_parser.add_argument(
+        "--socket", help="Socket path (default: $PARSERCRAFT_DAEMON_SOCKET)"
+    )
+
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return 0
 
     # Dispatch to command handler
-    commands = {
-        "create": cmd_create,
-        "edit": cmd_edit,
-        "validate": cmd_validate,
-        "info": cmd_info,
-        "export": cmd_export,
-        "list-presets": cmd_list_presets,
-        "convert": cmd_convert,
-        "diff": cmd_diff,
-        "update": cmd_update,
-        "delete": cmd_delete,
-        "import": cmd_import,
-        "repl": cmd_repl,
-        "batch": cmd_batch,
-        "test": cmd_test,
-        "translate": cmd_translate,
-        "lsp": cmd_lsp,
-        "extension": cmd_extension,
-        "type-check": cmd_type_check,
-        "module-info": cmd_module_info,
-        "module-deps": cmd_module_deps,
-        "module-cycles": cmd_module_cycles,
-        "generics": cmd_generics,
-        "check-protocol": cmd_check_protocol,
-        "codegen-c": cmd_codegen_c,
-        "codegen-wasm": cmd_codegen_wasm,
-        "package-search": cmd_package_search,
-        "package-install": cmd_package_install,
-        "refactor-rename": cmd_refactor_rename,
-        "format": cmd_format,
-        "test-run": cmd_test_run,
-        "debug-launch": cmd_debug_launch,
-    }
-
-    handler = commands.get(args.command)
+    handler = COMMANDS.get(args.command)
     if handler:
         return handler(args)
     else:
@@ -17,27 +17,34 @@ Usage:
     
     generator = CCodeGenerator(config)
     c_code = generator.generate(ast, "output.c")
+    generator.write("output.c")          # streamed, function by function
     
     # Compile with:
-    # gcc output.c -o program
+    # gcc output.c -o program -lm
+
+    # Lower a parsed program (see ast_integration.ASTToCGenerator)
+    from parsercraft.ast_integration import ASTToCGenerator
+    c_code = ASTToCGenerator(config).translate(ast)
 """
 
 from __future__ import annotations
 
+import textwrap
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 
 class CType(Enum):
     """C type mappings."""
 
     BOOL = "bool"
-    INT = "int"
+    INT = "int64_t"
     FLOAT = "double"
     STR = "const char*"
     VOID = "void"
     ANY = "void*"
+    VALUE = "pc_value"  # tagged value from the ASTToCGenerator runtime
     LIST = "vector_t*"
     DICT = "map_t*"
 
@@ -80,10 +87,13 @@ class CFunction:
         return f"{prefix}{inline}{self.return_type} {self.name}({params})"
 
     def definition(self) -> str:
-        """Generate complete function definition."""
+        """Generate complete function definition.
+
+        Body entries may span several lines; each line is indented one level.
+        """
         sig = self.signature()
-        body = "\n    ".join(self.body) if self.body else "return;"
-        return f"{sig} {{\n    {body}\n}}"
+        body = "\n".join(self.body) if self.body else "return;"
+        return f"{sig} {{\n{textwrap.indent(body, '    ')}\n}}"
 
 
 class CCodeGenerator:
@@ -93,7 +103,12 @@ class CCodeGenerator:
         self.config = config
         self.functions: List[CFunction] = []
         self.globals: List[CVariable] = []
-        self.includes: Set[str] = {"<stdio.h>", "<stdlib.h>", "<string.h>"}
+        self.includes: Set[str] = {
+            "<stdbool.h>", "<stdint.h>", "<stdio.h>", "<stdlib.h>", "<string.h>"
+        }
+        self.runtime: List[str] = []  # support code emitted before declarations
+        self.main_body: List[str] = []
+        self.library = False  # shared library: no main
         self.indent_level = 0
         self.var_counter = 0
 
@@ -121,6 +136,10 @@ class CCodeGenerator:
         for include in sorted(self.includes):
             lines.append(f"#include {include}")
 
+        for block in self.runtime:
+            lines.append("")
+            lines.append(block)
+
         lines.append("")
         lines.append("// Forward declarations")
         for func in self.functions:
@@ -142,29 +161,20 @@ class CCodeGenerator:
         return "\n".join(implementations)
 
     def generate_main(self) -> str:
-        """Generate main function."""
-        return """int main(int argc, char** argv) {
-    // Program entry point
-    return 0;
-}
-"""
+        """Generate main function running ``main_body``."""
+        body = "\n".join(self.main_body + ["return 0;"])
+        return (
+            "int main(int argc, char** argv) {\n"
+            "    // Program entry point\n"
+            f"{textwrap.indent(body, '    ')}\n"
+            "}\n"
+        )
 
     def generate(
         self, ast: Dict[str, Any], output_file: str = "output.c"
     ) -> str:
         """Generate complete C program."""
-        code_parts = [
-            "// Auto-generated C code from ParserCraft",
-            f"// Original language: {self.config.name if self.config else 'Unknown'}",
-            "",
-            self.generate_header(),
-            "",
-            self.generate_implementations(),
-            "",
-            self.generate_main(),
-        ]
-
-        full_code = "\n".join(code_parts)
+        full_code = "".join(self.iter_code())
 
         # Write to file if specified
         if output_file:
@@ -173,6 +183,50 @@ class CCodeGenerator:
 
         return full_code
 
+    def iter_code(self) -> Iterator[str]:
+        """The program as consecutive pieces: header, each function, ``main``.
+
+        A ``library`` has no ``main``; it ends after the last function.
+        """
+        yield "// Auto-generated C code from ParserCraft\n"
+        yield f"// Original language: {self.config.name if self.config else 'Unknown'}\n"
+        yield "\n"
+        yield self.generate_header()
+        yield "\n\n"
+        for index, func in enumerate(self.functions):
+            yield func.definition()
+            yield "\n\n" if index + 1 < len(self.functions) else "\n"
+        if not self.library:
+            yield "\n\n"
+            yield self.generate_main()
+
+    def write(self, output_file: Any, chunk_size: int = 1 << 16) -> int:
+        """Stream the program to a path or text file; returns characters written.
+
+        Functions are rendered one at a time and written in chunks of about
+        ``chunk_size`` characters, so the whole program is never one string.
+        """
+        if hasattr(output_file, "write"):
+            return self._write_chunks(output_file, chunk_size)
+        with open(output_file, "w", encoding="utf-8") as handle:
+            return self._write_chunks(handle, chunk_size)
+
+    def _write_chunks(self, handle: Any, chunk_size: int) -> int:
+        written = 0
+        pending: List[str] = []
+        pending_size = 0
+        for piece in self.iter_code():
+            pending.append(piece)
+            pending_size += len(piece)
+            if pending_size >= chunk_size:
+                handle.write("".join(pending))
+                written += pending_size
+                pending, pending_size = [], 0
+        if pending:
+            handle.write("".join(pending))
+            written += pending_size
+        return written
+
     def translate_type(self, lang_type: str) -> str:
         """Translate language type to C type."""
         type_map = {
@@ -184,6 +238,8 @@ class CCodeGenerator:
             "list": CType.LIST.value,
             "dict": CType.DICT.value,
             "void": CType.VOID.value,
+            "any": CType.VALUE.value,
+            "none": CType.VALUE.value,
         }
         return type_map.get(lang_type, CType.ANY.value)
 
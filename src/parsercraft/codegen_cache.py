@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Per-Function Code Generation Cache
+
+Backends lower one function at a time; when neither a function's AST nor
+anything it depends on has changed, its generated output can be reused. This
+module provides the cache and the fingerprints the keys are built from.
+
+Features:
+    - Structural SHA-256 of an AST subtree (node kinds, values, attributes;
+      source positions are ignored, so moving a function does not change it)
+    - External references of a function: names bound outside it, resolved
+      through the ``Resolution`` (backends add the callee/global types)
+    - In-memory entries, optionally persisted to one pickle file per source
+    - Per-run statistics: functions reused vs. regenerated
+
+Usage:
+    from parsercraft.codegen_cache import CodegenCache
+
+    cache = CodegenCache.for_source("program.lang")   # or CodegenCache()
+    generator = ASTToCGenerator(config, cache=cache)
+    generator.translate_to_file(ast, "program.c")      # streamed
+    print(generator.codegen_stats.regenerated, "regenerated")
+    cache.save()
+
+Cache location:
+    $PARSERCRAFT_CODEGEN_CACHE_DIR, else $XDG_CACHE_HOME/parsercraft/codegen,
+    else ~/.cache/parsercraft/codegen (created with mode 0700). Entries are
+    pickles, so only the owning user should be able to write the directory.
+    ``PARSERCRAFT_NO_CODEGEN_CACHE=1`` disables persistence.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ast_optimizer import name_of, node_attrs, node_kind
+from .cache_store import cache_dir, write_pickle
+
+CACHE_DIR_ENV = "PARSERCRAFT_CODEGEN_CACHE_DIR"
+DISABLE_ENV = "PARSERCRAFT_NO_CODEGEN_CACHE"
+
+# Bump when any backend changes what it generates for the same input
+CACHE_FORMAT = 2
+
+_CLOSE = object()
+
+
+def default_cache_dir() -> Path:
+    """Directory holding persisted codegen caches."""
+    return cache_dir(CACHE_DIR_ENV, "codegen")
+
+
+def subtree_fingerprint(node: Any) -> str:
+    """SHA-256 of an AST subtree's structure and values."""
+    parts: List[str] = []
+    stack: List[Any] = [node]
+    while stack:
+        item = stack.pop()
+        if item is _CLOSE:
+            parts.append(")")
+        elif hasattr(item, "node_type"):
+            attrs = node_attrs(item)
+            parts.append(f"({item.node_type}|{len(attrs)}|{len(item.children)}|")
+            stack.append(_CLOSE)
+            stack.extend(reversed(item.children))
+            if attrs:
+                stack.append(attrs)
+            stack.append(item.value)
+        elif isinstance(item, (str, int, float, bool)) or item is None:
+            text = repr(item)
+            parts.append(f"{len(text)}:{text}")
+        elif isinstance(item, (list, tuple)):
+            parts.append(f"[{len(item)}|")
+            stack.extend(reversed(item))
+        elif isinstance(item, dict):
+            keys = sorted(item, key=repr)
+            parts.append(f"{{{len(keys)}|")
+            for key in reversed(keys):
+                stack.append(item[key])
+                stack.append(key)
+        else:
+            text = repr(item)
+            parts.append(f"{len(text)}:{text}")
+    return hashlib.sha256("".join(parts).encode("utf-8")).hexdigest()
+
+
+def external_references(function: Any, resolution: Any) -> List[Tuple[str, int]]:
+    """Sorted ``(name, depth)`` of names a function uses but does not bind.
+
+    ``depth`` counts frames outward from the function (1 is the enclosing
+    scope); free names (builtins) have depth -1.
+    """
+    found = set()
+    stack = list(function.children)
+    while stack:
+        node = stack.pop()
+        stack.extend(node.children)
+        kind = node_kind(node)
+        if kind == "name":
+            name = name_of(node)
+        elif kind == "call":
+            name = node_attrs(node).get("name") or node.value
+        else:
+            continue
+        ref = resolution.ref_for(node)
+        if ref is None:
+            found.add((str(name), -1))
+        elif ref.depth > 0:
+            found.add((str(name), ref.depth))
+    return sorted(found)
+
+
+@dataclass
+class CodegenStats:
+    """Functions reused from the cache vs. regenerated in one run."""
+
+    functions: int = 0
+    regenerated: int = 0
+
+    @property
+    def reused(self) -> int:
+        return self.functions - self.regenerated
+
+
+class CodegenCache:
+    """Generated per-function output, keyed by content hashes."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self.entries: Dict[str, Any] = {}
+        self.used: set = set()  # keys read or written since loading
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        if self.path is not None:
+            self.load()
+
+    @classmethod
+    def for_source(cls, source: Path, backend: str = "c") -> CodegenCache:
+        """Persistent cache for one source file and backend (in-memory when disabled).
+
+        Each backend gets its own file, so pruning on ``save()`` after a
+        C build does not drop the entries of the WASM build, or vice versa.
+        """
+        if os.environ.get(DISABLE_ENV):
+            return cls()
+        key = hashlib.sha256(str(Path(source).resolve()).encode("utf-8"))
+        return cls(default_cache_dir() / f"{key.hexdigest()[:32]}-{backend}.pickle")
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Hash of ``parts`` (strings, numbers, tuples, None)."""
+        return hashlib.sha256(repr((CACHE_FORMAT,) + parts).encode("utf-8")).hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        """Whether ``key`` has an entry (does not count as a hit or miss)."""
+        return key in self.entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """A copy of the entry for ``key``, or None."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.used.add(key)
+        return copy.deepcopy(entry)
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a copy of ``value`` (callers may keep mutating theirs)."""
+        self.entries[key] = copy.deepcopy(value)
+        self.used.add(key)
+
+    def load(self) -> None:
+        """Read persisted entries; a missing or unreadable file means empty."""
+        try:
+            with open(self.path, "rb") as handle:
+                stored = pickle.load(handle)
+        except FileNotFoundError:
+            return
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.errors += 1
+            return
+        if isinstance(stored, dict) and stored.get("format") == CACHE_FORMAT:
+            self.entries.update(stored.get("entries", {}))
+
+    def save(self, prune: bool = True) -> None:
+        """Persist the entries (only those used since loading, if ``prune``)."""
+        if self.path is None:
+            return
+        if prune:
+            self.entries = {key: self.entries[key] for key in self.used if key in self.entries}
+        try:
+            write_pickle(self.path, {"format": CACHE_FORMAT, "entries": self.entries})
+        except (OSError, pickle.PicklingError):
+            # Best-effort, like the config cache
+            self.errors += 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.used.clear()
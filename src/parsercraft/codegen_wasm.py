@@ -6,19 +6,24 @@ Compiles custom language code to WebAssembly for web deployment.
 
 Features:
     - WAT (WebAssembly Text) generation
+    - Binary .wasm encoding (see wasm_binary)
     - Memory management
     - Function imports/exports
     - Type system mapping to WASM types
     - Optimized instruction selection
+    - Local reuse and peephole cleanup (see wasm_optimize)
+    - Allocator, string and array runtime (see wasm_runtime)
     - WASM module builder
 
 Usage:
     from parsercraft.codegen_wasm import WasmGenerator, WasmModule
     
-    gen = WasmGenerator()
+    gen = WasmGenerator()                 # optimize=True: see wasm_optimize
     module = gen.generate_from_ast(ast, config)
+    print(gen.optimization_report.format())
     wat_text = module.to_wat()
-    module.save("output.wasm")
+    wasm_bytes = module.to_wasm()
+    module.save("output.wasm")      # binary; "output.wat" saves text
 
 WASM Types:
     - i32: 32-bit integer
@@ -31,7 +36,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 class WasmType(Enum):
@@ -166,6 +171,14 @@ class WasmImport:
         return f'(import "{self.module}" "{self.name}" {sig})'
 
 
+def _wat_string(data: bytes) -> str:
+    """WAT string literal body: printable ASCII as is, other bytes as \\hh."""
+    return "".join(
+        chr(byte) if 0x20 <= byte < 0x7F and byte not in (0x22, 0x5C) else f"\\{byte:02x}"
+        for byte in data
+    )
+
+
 class WasmModule:
     """WebAssembly module builder."""
 
@@ -194,38 +207,56 @@ class WasmModule:
 
     def to_wat(self) -> str:
         """Convert module to WAT format."""
-        lines = [f"(module ${self.name}"]
+        return "\n".join(self.iter_wat())
 
-        # Memory
-        lines.append(f"  (memory {self.memory_size})")
+    def iter_wat(self) -> Iterator[str]:
+        """WAT lines of the module, produced one function at a time."""
+        yield f"(module ${self.name}"
 
-        # Imports
+        # Imports (they must precede every definition)
         for imp in self.imports.values():
-            lines.append(f"  {imp.to_wat()}")
+            yield f"  {imp.to_wat()}"
+
+        # Memory
+        yield f"  (memory {self.memory_size})"
 
         # Functions
         for func in self.functions.values():
             for line in func.to_wat().split("\n"):
-                lines.append(f"  {line}" if line and not line.startswith("(export") else line)
+                yield f"  {line}" if line and not line.startswith("(export") else line
 
         # Data segments
         for address, data in self.data_segment.items():
-            lines.append(f'  (data (i32.const {address}) "{data.decode()}")')
+            yield f'  (data (i32.const {address}) "{_wat_string(data)}")'
 
-        lines.append(")")
+        yield ")"
 
-        return "\n".join(lines)
+    def to_wasm(self, validate: bool = False, names: bool = True) -> bytes:
+        """Convert module to the binary format (``validate`` runs the self-check)."""
+        from .wasm_binary import encode_module
+
+        return encode_module(self, names=names, validate=validate)
 
-    def save(self, filename: str) -> None:
-        """Save module as WAT file."""
-        with open(filename, "w") as f:
-            f.write(self.to_wat())
+    def save(self, filename: str, binary: Optional[bool] = None) -> None:
+        """Save module as binary ``.wasm`` or WAT text (by default, by suffix)."""
+        if binary is None:
+            binary = str(filename).endswith(".wasm")
+        if binary:
+            with open(filename, "wb") as f:
+                f.write(self.to_wasm())
+        else:
+            # Streamed line by line; the whole text is never built
+            with open(filename, "w") as f:
+                f.writelines(
+                    line if index == 0 else "\n" + line
+                    for index, line in enumerate(self.iter_wat())
+                )
 
 
 class WasmGenerator:
     """Generates WebAssembly from custom language AST."""
 
-    def __init__(self):
+    def __init__(self, optimize: bool = True):
         self.module = WasmModule()
         self.type_mapping = {
             "int": WasmType.I32,
@@ -233,14 +264,20 @@ class WasmGenerator:
             "bool": WasmType.I32,
         }
         self.var_count = 0
+        self.optimize = optimize
+        self.optimization_report = None
+        self.runtime = None  # WasmRuntime, created by the first runtime use
+        # Temporaries of the function being generated (become its locals)
+        self.temp_locals: List[WasmLocal] = []
 
     def translate_type(self, lang_type: str) -> WasmType:
         """Translate language type to WASM type."""
         return self.type_mapping.get(lang_type, WasmType.I32)
 
-    def gen_temp_var(self) -> str:
-        """Generate unique temporary variable name."""
+    def gen_temp_var(self, wasm_type: WasmType = WasmType.I32) -> str:
+        """Generate unique temporary variable name, declared as a local."""
         self.var_count += 1
+        self.temp_locals.append(WasmLocal(f"temp{self.var_count}", wasm_type))
         return f"$temp{self.var_count}"
 
     def generate_from_ast(self, ast: Any, config: Any = None) -> WasmModule:
@@ -261,6 +298,16 @@ class WasmGenerator:
         # Add standard library imports
         self._add_stdlib_imports()
 
+        # Allocator/string/array runtime, if generated code used it
+        if self.runtime is not None:
+            self.runtime.install()
+
+        # Share temporaries' locals and clean up the instruction lists
+        if self.optimize:
+            from .wasm_optimize import WasmOptimizer
+
+            self.optimization_report = WasmOptimizer().optimize_module(self.module)
+
         return self.module
 
     def _generate_function(self, func_def: Any) -> Optional[WasmFunction]:
@@ -282,6 +329,7 @@ class WasmGenerator:
 
         # Generate body
         body = []
+        self.temp_locals = []
         if hasattr(func_def, "body"):
             body = self._generate_body(func_def.body)
 
@@ -289,6 +337,7 @@ class WasmGenerator:
             name=func_def.name,
             params=params,
             return_type=return_type,
+            locals=self.temp_locals,
             body=body,
             is_export=getattr(func_def, "is_export", False),
         )
@@ -334,6 +383,23 @@ class WasmGenerator:
             )
         )
 
+    def use_runtime(self):
+        """The module's WasmRuntime (installed by generate_from_ast())."""
+        if self.runtime is None:
+            from .wasm_runtime import WasmRuntime
+
+            self.runtime = WasmRuntime(self.module)
+        return self.runtime
+
+    def generate_string_literal(self, text: str) -> str:
+        """Pointer to an interned, length-prefixed copy of ``text``."""
+        return f"(i32.const {self.use_runtime().intern(text)})"
+
+    def generate_runtime_call(self, name: str, *args: str) -> str:
+        """Call a runtime function, e.g. ("str_concat", a, b) -> $rt_str_concat."""
+        self.use_runtime()
+        return f"(call $rt_{name}{''.join(' ' + arg for arg in args)})"
+
     def generate_binary_op(self, op: str, left_type: WasmType, right_type: WasmType) -> str:
         """Generate WASM for binary operation."""
         # Map operator to WASM instruction
@@ -351,9 +417,12 @@ class WasmGenerator:
             return f"(unreachable) ;; unknown op: {op}"
 
         wasm_op = op_map[op]
-        type_suffix = ".i32" if left_type == WasmType.I32 else ".f32"
+        name = wasm_op.value
+        if left_type in (WasmType.F32, WasmType.F64):
+            # Float instructions have no signedness suffix
+            name = name.replace("_s", "")
 
-        return f"({wasm_op.value}{type_suffix})"
+        return f"({left_type.value}.{name})"
 
     def generate_memory_load(
         self, address: int, wasm_type: WasmType, offset: int = 0
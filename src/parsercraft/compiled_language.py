@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Compiled Language View
+
+A read-only snapshot of a ``LanguageConfig`` with every lookup table the
+lexer, parser, runtime, validator and LSP need, built once per config
+revision instead of being re-derived by each consumer.
+
+Features:
+    - Interned keyword tuple and frozenset for O(1) keyword tests
+    - custom <-> original keyword dictionaries
+    - Operator trie for longest-match scanning, plus symbols sorted by length
+    - Operator precedence and associativity tables
+    - Function map (custom name -> implementation) matching runtime rules
+    - Stable SHA-256 content fingerprint
+
+Usage:
+    from parsercraft.language_config import LanguageConfig
+
+    config = LanguageConfig.from_preset("python_like")
+    compiled = config.compiled()      # cached until the config is mutated
+
+    compiled.is_keyword("def")                   # True
+    compiled.custom_to_original.get("def")       # "def"
+    compiled.operator_trie.match("a >= b", 2)    # ">="
+    compiled.fingerprint                         # "3f5a..."
+
+Invalidation:
+    Every assignment to a config dataclass field and every change to its
+    keyword/function/operator dictionaries bumps a mutation counter, so
+    ``LanguageConfig.compiled()`` notices edits made anywhere. In-place
+    edits of nested lists (e.g. ``parsing_config.string_delimiters``) are
+    not tracked; call ``config.invalidate_compiled()`` after those.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .language_config import LanguageConfig
+
+# Key marking "an operator ends here" inside trie nodes; never a real character
+_TERMINAL = ""
+
+
+class OperatorTrie:
+    """Character trie over operator symbols for longest-match lookup."""
+
+    __slots__ = ("_root", "max_length")
+
+    def __init__(self, symbols: Tuple[str, ...] = ()):
+        self._root: Dict[str, Any] = {}
+        self.max_length = 0
+        for symbol in symbols:
+            self.add(symbol)
+
+    def add(self, symbol: str) -> None:
+        """Insert an operator symbol."""
+        if not symbol:
+            return
+        node = self._root
+        for char in symbol:
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = symbol
+        self.max_length = max(self.max_length, len(symbol))
+
+    def match(self, text: str, pos: int = 0) -> Optional[str]:
+        """Return the longest operator starting at ``text[pos]``, if any."""
+        node = self._root
+        longest = None
+        end = len(text)
+        while pos < end:
+            node = node.get(text[pos])
+            if node is None:
+                break
+            symbol = node.get(_TERMINAL)
+            if symbol is not None:
+                longest = symbol
+            pos += 1
+        return longest
+
+    def __contains__(self, symbol: object) -> bool:
+        if not isinstance(symbol, str) or not symbol:
+            return False
+        node = self._root
+        for char in symbol:
+            node = node.get(char)
+            if node is None:
+                return False
+        return _TERMINAL in node
+
+
+@dataclass(frozen=True)
+class CompiledLanguage:
+    """Precomputed lookup tables for one revision of a ``LanguageConfig``.
+
+    Build with ``LanguageConfig.compiled()`` rather than directly, so the
+    result is cached and refreshed automatically after mutations.
+    """
+
+    name: str
+    fingerprint: str
+
+    # Keywords (custom names are interned; ``keywords`` keeps config order)
+    keywords: Tuple[str, ...]
+    keyword_set: FrozenSet[str]
+    original_keywords: FrozenSet[str]
+    custom_to_original: Dict[str, str]
+    original_to_custom: Dict[str, str]
+    duplicate_keywords: FrozenSet[str]
+    keyword_descriptions: Dict[str, str]
+
+    # Operators
+    operators: Tuple[str, ...]  # longest first
+    operator_set: FrozenSet[str]
+    operator_trie: OperatorTrie
+    precedence: Dict[str, int]
+    associativity: Dict[str, str]
+
+    # Functions
+    function_names: Tuple[str, ...]
+    function_set: FrozenSet[str]
+    function_map: Dict[str, str]  # enabled functions: name -> implementation
+    function_arity: Dict[str, int]
+
+    # Syntax
+    single_line_comment: str
+
+    def is_keyword(self, word: str) -> bool:
+        """True if ``word`` is a (custom) keyword of this language."""
+        return word in self.keyword_set
+
+    def original_keyword(self, word: str) -> Optional[str]:
+        """Original keyword for a custom keyword, or None."""
+        return self.custom_to_original.get(word)
+
+    @classmethod
+    def from_config(cls, config: LanguageConfig) -> CompiledLanguage:
+        """Build the view from a configuration."""
+        intern = sys.intern
+
+        keywords = tuple(
+            intern(mapping.custom) for mapping in config.keyword_mappings.values()
+        )
+        custom_to_original: Dict[str, str] = {}
+        original_to_custom: Dict[str, str] = {}
+        descriptions: Dict[str, str] = {}
+        seen: set[str] = set()
+        duplicates: set[str] = set()
+        for mapping in config.keyword_mappings.values():
+            custom = intern(mapping.custom)
+            if custom in seen:
+                duplicates.add(custom)
+            seen.add(custom)
+            # First mapping wins, matching the parser's historical lookup
+            custom_to_original.setdefault(custom, intern(mapping.original))
+            original_to_custom[intern(mapping.original)] = custom
+            descriptions.setdefault(custom, mapping.description)
+
+        operator_configs = list((config.operators or {}).values())
+        operators = tuple(
+            sorted(
+                {intern(op.symbol) for op in operator_configs},
+                key=lambda symbol: (-len(symbol), symbol),
+            )
+        )
+        precedence = {op.symbol: op.precedence for op in operator_configs}
+        associativity = {op.symbol: op.associativity for op in operator_configs}
+
+        function_names = tuple(
+            intern(func.name) for func in config.builtin_functions.values()
+        )
+        function_map: Dict[str, str] = {}
+        function_arity: Dict[str, int] = {}
+        for func in config.builtin_functions.values():
+            function_arity[func.name] = func.arity
+            if not func.enabled:
+                continue
+            impl = func.implementation or func.name
+            if impl == func.name and impl.isupper():
+                impl = impl.lower()
+            function_map[func.name] = impl
+
+        return cls(
+            name=config.name,
+            fingerprint=config_fingerprint(config),
+            keywords=keywords,
+            keyword_set=frozenset(keywords),
+            original_keywords=frozenset(custom_to_original.values())
+            | frozenset(original_to_custom),
+            custom_to_original=custom_to_original,
+            original_to_custom=original_to_custom,
+            duplicate_keywords=frozenset(duplicates),
+            keyword_descriptions=descriptions,
+            operators=operators,
+            operator_set=frozenset(operators),
+            operator_trie=OperatorTrie(operators),
+            precedence=precedence,
+            associativity=associativity,
+            function_names=function_names,
+            function_set=frozenset(function_names),
+            function_map=function_map,
+            function_arity=function_arity,
+            single_line_comment=config.syntax_options.single_line_comment or "",
+        )
+
+
+def config_fingerprint(config: LanguageConfig) -> str:
+    """Stable SHA-256 of a config's canonical JSON serialization."""
+    canonical = json.dumps(
+        config.to_dict(), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Binary Sidecar Cache for Language Configurations
+
+Parsing YAML and rebuilding every config dataclass dominates the cost of
+``LanguageConfig.load``. This module keeps a pickled copy of each loaded
+configuration in a per-user cache directory and returns it when the source
+file is unchanged.
+
+Features:
+    - Entries keyed by source path; validated by mtime, size and SHA-256
+    - Atomic writes (temp file + rename); corrupt entries are ignored
+    - Entries tagged with a format version so class changes invalidate them
+    - Opt out with ``PARSERCRAFT_NO_CONFIG_CACHE=1``
+
+Usage:
+    from parsercraft.config_cache import ConfigCache
+
+    cache = ConfigCache.default()
+    config = cache.get(path, raw_bytes)
+    if config is None:
+        config = parse(raw_bytes)
+        cache.put(path, raw_bytes, config)
+
+Cache location:
+    $PARSERCRAFT_CACHE_DIR, else $XDG_CACHE_HOME/parsercraft/configs, else
+    ~/.cache/parsercraft/configs. The directory is created with mode 0700;
+    entries are pickles, so only the owning user should be able to write it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .cache_store import cache_dir, write_pickle
+
+CACHE_DIR_ENV = "PARSERCRAFT_CACHE_DIR"
+DISABLE_ENV = "PARSERCRAFT_NO_CONFIG_CACHE"
+
+# Bump when LanguageConfig (or its nested dataclasses) change shape
+CACHE_FORMAT = 1
+
+
+def default_cache_dir() -> Path:
+    """Directory holding cached configs."""
+    return cache_dir(CACHE_DIR_ENV, "configs")
+
+
+class ConfigCache:
+    """Pickle cache of loaded configurations, one file per source path."""
+
+    _default: Optional[ConfigCache] = None
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @classmethod
+    def default(cls) -> Optional[ConfigCache]:
+        """Shared cache instance, or None when caching is disabled."""
+        if os.environ.get(DISABLE_ENV):
+            return None
+        if cls._default is None or cls._default.cache_dir != default_cache_dir():
+            cls._default = cls()
+        return cls._default
+
+    def entry_path(self, source: Path) -> Path:
+        """Cache file used for ``source``."""
+        key = hashlib.sha256(str(Path(source).resolve()).encode("utf-8"))
+        return self.cache_dir / f"{key.hexdigest()[:32]}.pickle"
+
+    def get(self, source: Path, content: bytes) -> Optional[Any]:
+        """Return the cached config for ``source`` if ``content`` matches."""
+        try:
+            stat = os.stat(source)
+            with open(self.entry_path(source), "rb") as handle:
+                entry = pickle.load(handle)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Unreadable, truncated or from an incompatible version
+            self.errors += 1
+            return None
+
+        if (
+            not isinstance(entry, dict)
+            or entry.get("format") != CACHE_FORMAT
+            or entry.get("mtime_ns") != stat.st_mtime_ns
+            or entry.get("size") != stat.st_size
+            or entry.get("sha256") != hashlib.sha256(content).hexdigest()
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry["config"]
+
+    def put(self, source: Path, content: bytes, config: Any) -> None:
+        """Store ``config`` as the parsed form of ``source``."""
+        try:
+            stat = os.stat(source)
+            entry = {
+                "format": CACHE_FORMAT,
+                "source": str(Path(source).resolve()),
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": hashlib.sha256(content).hexdigest(),
+                "config": config,
+            }
+            write_pickle(self.entry_path(source), entry)
+        except (OSError, pickle.PicklingError):
+            # Caching is best-effort; a read-only home must not break loading
+            self.errors += 1
+
+    def invalidate(self, source: Path) -> None:
+        """Remove the entry for ``source``."""
+        try:
+            self.entry_path(source).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> int:
+        """Remove every cached entry; return how many were deleted."""
+        removed = 0
+        if not self.cache_dir.is_dir():
+            return removed
+        for path in self.cache_dir.glob("*.pickle"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process."""
+        total = self.hits + self.misses
+        return {
+            "cache_dir": str(self.cache_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+ParserCraft Daemon
+
+Long-lived local server that keeps language configurations, compiled
+translation rules and module graphs warm between CLI invocations. When the
+daemon is running, ``parsercraft validate``, ``translate``, ``type-check``,
+``codegen-c`` and ``module-deps`` forward their arguments to it over a Unix
+domain socket instead of re-importing the package and re-reading configs.
+
+Features:
+    - JSON-lines protocol over an AF_UNIX socket
+    - Config cache keyed by path and file stamp (reloads on edit)
+    - Cached keyword translation rules per loaded config
+    - Per-directory module managers, invalidated by stat polling
+    - Transparent fallback to in-process execution when no daemon is running
+
+Usage:
+    parsercraft daemon start      # spawn in the background
+    parsercraft daemon status
+    parsercraft daemon stop
+    parsercraft daemon run        # run in the foreground
+
+    # Bypass a running daemon for a single command
+    PARSERCRAFT_NO_DAEMON=1 parsercraft validate my_lang.yaml
+
+Protocol:
+    Each request is one JSON object per line; the daemon replies with one
+    JSON object per line and closes the connection.
+
+    {"op": "run", "argv": [...], "cwd": "/path"}
+        -> {"exit_code": 0, "stdout": "...", "stderr": "..."}
+    {"op": "ping"}      -> {"ok": true, "pid": 1234}
+    {"op": "status"}    -> {"ok": true, "pid": ..., "uptime": ..., ...}
+    {"op": "shutdown"}  -> {"ok": true}
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - server-side only, imported lazily
+    from .watch import FileStamp, StatScanner
+
+# The client half of this module runs on every forwarded CLI call, so it
+# sticks to cheap standard library imports; the warm state pulls in the
+# rest of the package inside the daemon process only.
+
+SOCKET_ENV = "PARSERCRAFT_DAEMON_SOCKET"
+DISABLE_ENV = "PARSERCRAFT_NO_DAEMON"
+
+# Subcommands that may be served by a running daemon
+FORWARDED_COMMANDS = frozenset(
+    {"validate", "translate", "type-check", "codegen-c", "module-deps"}
+)
+
+CONNECT_TIMEOUT = 0.5
+START_TIMEOUT = 5.0
+
+
+def default_socket_path() -> Path:
+    """Return the socket path, honouring ``PARSERCRAFT_DAEMON_SOCKET``."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return Path(runtime_dir) / "parsercraft.sock"
+
+    import tempfile
+
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return Path(tempfile.gettempdir()) / f"parsercraft-{uid}.sock"
+
+
+# ============================================================================
+# Warm state
+# ============================================================================
+
+
+@dataclass
+class _CachedConfig:
+    stamp: FileStamp
+    config: Any  # LanguageConfig
+    translation_rules: Optional[List[Tuple[Any, str]]] = None
+
+
+@dataclass
+class _CachedModules:
+    scanner: StatScanner
+    manager: Any  # ModuleManager
+
+
+@dataclass
+class WarmState:
+    """Caches shared by every request served by the daemon."""
+
+    configs: Dict[Path, _CachedConfig] = field(default_factory=dict)
+    modules: Dict[Path, _CachedModules] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+
+    def load_config(self, path: Path) -> Any:
+        """Return the config at ``path``, reloading only if it changed."""
+        from .language_config import LanguageConfig
+        from .watch import FileStamp
+
+        resolved = Path(path).resolve()
+        stamp = FileStamp.from_stat(os.stat(resolved))
+
+        cached = self.configs.get(resolved)
+        if cached is not None and cached.stamp == stamp:
+            self.hits += 1
+            return cached.config
+
+        self.misses += 1
+        config = LanguageConfig.load(resolved)
+        self.configs[resolved] = _CachedConfig(stamp, config)
+        return config
+
+    def translation_rules(self, config: Any) -> Optional[List[Tuple[Any, str]]]:
+        """Return cached translation rules for a config loaded via the cache."""
+        for cached in self.configs.values():
+            if cached.config is config:
+                return cached.translation_rules
+        return None
+
+    def store_translation_rules(
+        self, config: Any, rules: List[Tuple[Any, str]]
+    ) -> None:
+        """Remember compiled translation rules for a cached config."""
+        for cached in self.configs.values():
+            if cached.config is config:
+                cached.translation_rules = rules
+                return
+
+    def module_manager(self, module_dir: Path, factory: Any) -> Any:
+        """Return a module manager for ``module_dir``, dropping stale modules."""
+        from .watch import StatScanner
+
+        resolved = Path(module_dir).resolve()
+        cached = self.modules.get(resolved)
+
+        if cached is None:
+            manager = factory(resolved)
+            scanner = StatScanner(
+                directories=[(Path(p), "*") for p in manager.search_paths]
+            )
+            self.modules[resolved] = _CachedModules(scanner, manager)
+            self.misses += 1
+            return manager
+
+        changes = cached.scanner.poll()
+        if changes:
+            manager = cached.manager
+            for changed in changes.touched:
+                manager.loaded_modules.pop(changed.stem, None)
+                manager.loader.cache.pop(changed.stem, None)
+            manager.dependency_graph.clear()
+        else:
+            self.hits += 1
+        return cached.manager
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for ``daemon status``."""
+        return {
+            "configs": len(self.configs),
+            "module_dirs": len(self.modules),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# ============================================================================
+# Server
+# ============================================================================
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as error:
+            response: Dict[str, Any] = {"ok": False, "error": str(error)}
+        else:
+            response = self.server.dispatch(request)
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server running CLI commands against warm state.
+
+    Requests are handled one at a time: commands change the working
+    directory and redirect stdout, both of which are process-wide.
+    """
+
+    def __init__(self, socket_path: Path):
+        self.socket_path = Path(socket_path)
+        self.state = WarmState()
+        self.started = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        super().__init__(str(self.socket_path), _RequestHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle one decoded request."""
+        op = request.get("op", "run")
+
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "status":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "socket": str(self.socket_path),
+                "uptime": time.time() - self.started,
+                "requests": self.requests,
+                **self.state.stats(),
+            }
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        if op == "run":
+            return self.run_command(request.get("argv", []), request.get("cwd"))
+
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    def run_command(
+        self, argv: Sequence[str], cwd: Optional[str]
+    ) -> Dict[str, Any]:
+        """Run a CLI command in-process, capturing its output."""
+        from . import cli
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+
+        with self._lock:
+            self.requests += 1
+            previous_cwd = os.getcwd()
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(
+                    stderr
+                ):
+                    try:
+                        exit_code = cli.main(list(argv), warm_state=self.state)
+                    except SystemExit as exit_:
+                        exit_code = exit_.code if isinstance(exit_.code, int) else 1
+                    except Exception as error:  # pylint: disable=broad-exception-caught
+                        print(f"Error: {error}", file=sys.stderr)
+                        exit_code = 1
+            finally:
+                os.chdir(previous_cwd)
+
+        return {
+            "exit_code": exit_code or 0,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(OSError):
+            self.socket_path.unlink()
+
+
+def serve(socket_path: Optional[Path] = None) -> int:
+    """Run the daemon in the foreground until shut down."""
+    path = Path(socket_path) if socket_path else default_socket_path()
+
+    if ping(path) is not None:
+        print(f"Error: Daemon already running on {path}", file=sys.stderr)
+        return 1
+
+    server = DaemonServer(path)
+    print(f"ParserCraft daemon listening on {path} (pid {os.getpid()})")
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+# ============================================================================
+# Client
+# ============================================================================
+
+
+def request(
+    message: Dict[str, Any],
+    socket_path: Optional[Path] = None,
+    timeout: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """Send one request; return the response, or None if unreachable."""
+    path = Path(socket_path) if socket_path else default_socket_path()
+    if not path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(path))
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+
+    try:
+        return json.loads(b"".join(chunks))
+    except json.JSONDecodeError:
+        return None
+
+
+def ping(socket_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Return the daemon's ping reply, or None if it is not running."""
+    return request({"op": "ping"}, socket_path, timeout=CONNECT_TIMEOUT)
+
+
+def forward(argv: Sequence[str]) -> Optional[int]:
+    """Run ``argv`` on the daemon if possible.
+
+    Returns the command's exit code after replaying its output, or None
+    when the command should run in-process instead.
+    """
+    if not argv or argv[0] not in FORWARDED_COMMANDS:
+        return None
+    if os.environ.get(DISABLE_ENV):
+        return None
+    if "--watch" in argv or "-w" in argv:
+        return None
+
+    response = request({"op": "run", "argv": list(argv), "cwd": os.getcwd()})
+    if response is None or "exit_code" not in response:
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response["exit_code"])
+
+
+def start(socket_path: Optional[Path] = None) -> int:
+    """Spawn a background daemon and wait until it answers."""
+    path = Path(socket_path) if socket_path else default_socket_path()
+
+    reply = ping(path)
+    if reply is not None:
+        print(f"Daemon already running (pid {reply.get('pid')}) on {path}")
+        return 0
+
+    import subprocess
+
+    env = dict(os.environ)
+    env.pop(DISABLE_ENV, None)
+    subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, "-m", "parsercraft.daemon", "run", "--socket", str(path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        env=env,
+    )
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        reply = ping(path)
+        if reply is not None:
+            print(f"✓ Daemon started (pid {reply.get('pid')}) on {path}")
+            return 0
+        time.sleep(0.05)
+
+    print(f"Error: Daemon did not start within {START_TIMEOUT:g}s")
+    return 1
+
+
+def stop(socket_path: Optional[Path] = None) -> int:
+    """Ask a running daemon to shut down."""
+    path = Path(socket_path) if socket_path else default_socket_path()
+    if request({"op": "shutdown"}, path, timeout=CONNECT_TIMEOUT) is None:
+        print("Daemon is not running")
+        return 1
+    print("✓ Daemon stopped")
+    return 0
+
+
+def status(socket_path: Optional[Path] = None) -> int:
+    """Print daemon status and cache statistics."""
+    path = Path(socket_path) if socket_path else default_socket_path()
+    reply = request({"op": "status"}, path, timeout=CONNECT_TIMEOUT)
+    if reply is None:
+        print(f"Daemon is not running ({path})")
+        return 1
+
+    print(f"Daemon running (pid {reply['pid']})")
+    print(f"  Socket: {reply['socket']}")
+    print(f"  Uptime: {reply['uptime']:.1f}s")
+    print(f"  Requests served: {reply['requests']}")
+    print(f"  Cached configs: {reply['configs']}")
+    print(f"  Cached module directories: {reply['module_dirs']}")
+    print(f"  Cache hits/misses: {reply['hits']}/{reply['misses']}")
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point for ``python -m parsercraft.daemon``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ParserCraft daemon")
+    parser.add_argument("action", choices=["start", "stop", "status", "run"])
+    parser.add_argument("--socket", help="Socket path (default: per-user)")
+    args = parser.parse_args(argv)
+
+    socket_path = Path(args.socket) if args.socket else None
+    actions = {"start": start, "stop": stop, "status": status, "run": serve}
+    return actions[args.action](socket_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,8 +9,9 @@ Features:
     - Type constraints: T extends Number
     - Type bounds: Covariance and contravariance
     - Generic function signatures
-    - Type parameter inference
+    - Type parameter inference (unification, see parsercraft.unification)
     - Generic class definitions
+    - Memoized instantiation (``instantiation_cache().stats()``)
 
 Usage:
     from parsercraft.generics import GenericType, TypeParameter, GenericChecker
@@ -31,7 +32,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .type_system import Type, TypeKind, parse_type
 
 
 class Variance(Enum):
@@ -87,15 +90,21 @@ class GenericType:
         return len(self.parameters) > 0 and len(self.arguments) == 0
 
     def bind(self, type_args: Dict[str, str]) -> GenericType:
-        """Bind type parameters to concrete types."""
+        """Bind type parameters to concrete types.
+
+        Memoized (see ``InstantiationCache``); treat the result as read-only.
+        """
         bound_args = [
             type_args.get(param.name, param.default or "Any")
             for param in self.parameters
         ]
-        return GenericType(
-            name=self.name,
-            parameters=self.parameters,
-            arguments=bound_args,
+        return _INSTANTIATIONS.get_or_build(
+            self,
+            tuple(map(parse_type, bound_args)),
+            GenericType,
+            self.name,
+            self.parameters,
+            bound_args,
         )
 
 
@@ -115,7 +124,15 @@ class GenericFunction:
         return f"function {self.name}<{params}>({sig}) -> {self.return_type}"
 
     def instantiate(self, type_args: Dict[str, str]) -> "GenericFunction":
-        """Create concrete function instance with bound types."""
+        """Create concrete function instance with bound types.
+
+        Memoized (see ``InstantiationCache``); treat the result as read-only.
+        """
+        return _INSTANTIATIONS.get_or_build(
+            self, _type_arguments_key(type_args), self._instantiate, type_args
+        )
+
+    def _instantiate(self, type_args: Dict[str, str]) -> "GenericFunction":
         new_params = {
             k: type_args.get(v, v) for k, v in self.parameter_types.items()
         }
@@ -143,7 +160,15 @@ class GenericClass:
         return f"class {self.name}<{params}>"
 
     def instantiate(self, type_args: Dict[str, str]) -> "GenericClass":
-        """Create concrete class instance with bound types."""
+        """Create concrete class instance with bound types.
+
+        Memoized (see ``InstantiationCache``); treat the result as read-only.
+        """
+        return _INSTANTIATIONS.get_or_build(
+            self, _type_arguments_key(type_args), self._instantiate, type_args
+        )
+
+    def _instantiate(self, type_args: Dict[str, str]) -> "GenericClass":
         new_fields = {k: type_args.get(v, v) for k, v in self.fields.items()}
         new_methods = {
             k: v.instantiate(type_args) for k, v in self.methods.items()
@@ -156,6 +181,71 @@ class GenericClass:
         )
 
 
+class InstantiationCache:
+    """Bounded memo of generic instantiations.
+
+    Entries are keyed by the identity of the generic (a ``GenericType``,
+    ``GenericFunction`` or ``GenericClass``) and its type arguments as
+    interned types, so ``List[int]`` and ``list[int]`` share an entry. An
+    entry keeps its generic alive, so the identity cannot be reused while
+    the entry exists. Generics are assumed not to change after they are
+    first instantiated. At most ``limit`` entries are kept; the oldest is
+    evicted first.
+    """
+
+    def __init__(self, limit: int = 4096):
+        self.limit = limit
+        self.entries: Dict[Tuple[int, Tuple[Any, ...]], Tuple[Any, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+        self, generic: Any, type_args: Tuple[Any, ...], build: Callable[..., Any], *args: Any
+    ) -> Any:
+        """The cached value for ``generic`` and ``type_args``; ``build(*args)``
+        on a miss."""
+        key = (id(generic), type_args)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = build(*args)
+        if len(self.entries) >= self.limit:
+            del self.entries[next(iter(self.entries))]
+        self.entries[key] = (generic, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Forget every entry and reset the counters."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_INSTANTIATIONS = InstantiationCache()
+
+
+def instantiation_cache() -> InstantiationCache:
+    """The process-wide cache used by ``bind`` and ``instantiate``."""
+    return _INSTANTIATIONS
+
+
+def _type_arguments_key(type_args: Dict[str, str]) -> Tuple[Tuple[str, ...], Tuple[Type, ...]]:
+    names = sorted(type_args)
+    return tuple(names), tuple([parse_type(type_args[name]) for name in names])
+
+
 class GenericChecker:
     """Validates generic type compatibility and constraints."""
 
@@ -175,7 +265,9 @@ class GenericChecker:
             return True
 
         allowed = self.constraints_map.get(type_param.constraint, set())
-        return concrete_type in allowed or concrete_type == "Any"
+        # Interned, so "List[int]" and "list[int]" are the same type (a list)
+        concrete = parse_type(concrete_type)
+        return concrete.kind == TypeKind.ANY or concrete.name in allowed
 
     def check_generic_assignment(
         self, source: GenericType, target: GenericType
@@ -194,15 +286,22 @@ class GenericChecker:
             if param and not self.check_constraint(param, src_arg):
                 return False
 
+            # Interned types: equal spellings are one object
+            src_type = parse_type(src_arg)
+            tgt_type = parse_type(tgt_arg)
+            same = src_type is tgt_type
+            src_any = src_type.kind == TypeKind.ANY
+            tgt_any = tgt_type.kind == TypeKind.ANY
+
             # Check variance
             if param and param.variance == Variance.COVARIANT:
-                if src_arg != tgt_arg and src_arg != "Any":
+                if not same and not src_any:
                     return False
             elif param and param.variance == Variance.CONTRAVARIANT:
-                if src_arg != tgt_arg and tgt_arg != "Any":
+                if not same and not tgt_any:
                     return False
             elif param and param.variance == Variance.INVARIANT:
-                if src_arg != tgt_arg and src_arg != "Any" and tgt_arg != "Any":
+                if not same and not src_any and not tgt_any:
                     return False
 
         return True
@@ -210,34 +309,25 @@ class GenericChecker:
     def infer_type_arguments(
         self, generic_func: GenericFunction, actual_args: Dict[str, str]
     ) -> Optional[Dict[str, str]]:
-        """Infer type arguments from actual argument types."""
-        inferred: Dict[str, str] = {}
+        """Infer type arguments from actual argument types.
+
+        Unifies each declared parameter type with its argument type (see
+        ``parsercraft.unification``), so type parameters nested inside
+        generics are inferred too. Returns None if the types conflict or a
+        parameter cannot be inferred and has no default.
+        """
+        from .unification import Unifier
 
+        unifier = Unifier(generic_func.type_parameters, self.check_constraint)
         for param_name, expected_type in generic_func.parameter_types.items():
             if param_name not in actual_args:
                 continue
+            if not unifier.unify(expected_type, actual_args[param_name]):
+                return None  # Conflicting inference
 
-            actual_type = actual_args[param_name]
-
-            # Simple inference: if expected is T and actual is int, infer T=int
-            for type_param in generic_func.type_parameters:
-                if expected_type == type_param.name:
-                    if type_param.name in inferred:
-                        if inferred[type_param.name] != actual_type:
-                            return None  # Conflicting inference
-                    if not self.check_constraint(type_param, actual_type):
-                        return None
-
-                    inferred[type_param.name] = actual_type
-
-        # Check all type parameters are bound
-        for type_param in generic_func.type_parameters:
-            if type_param.name not in inferred:
-                if type_param.default:
-                    inferred[type_param.name] = type_param.default
-                else:
-                    return None
-
+        inferred = unifier.solve()
+        if unifier.errors:
+            return None
         return inferred
 
     def validate_generic_class(self, generic_class: GenericClass) -> List[str]:
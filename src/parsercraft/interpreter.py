@@ -0,0 +1,616 @@
+#!/usr/bin/env python3
+"""
+AST Interpreter for Guest Languages
+
+Executes programs parsed from a language configuration. The AST is compiled
+once into nested Python closures; variables live in fixed-size frame slots
+assigned by ``resolver.Resolver``, so every read and write is an indexed
+list access instead of a walk through dict scopes.
+
+Features:
+    - Closure compilation (no per-node dispatch at run time)
+    - Slot-resolved locals, closures via lexical parent frames
+    - Functions, calls, recursion, if/else, while, break/continue, return
+    - Tail calls (found by ``ControlFlowAnalyzer``) run on a trampoline in
+      constant stack, so tail-recursive loops never hit the recursion limit
+    - Operators with the configuration's enabled/disabled flags honoured
+    - Built-in functions from the configuration (``builtin.print`` etc.)
+    - Works with both ``ast_integration`` and ``parser_generator`` nodes
+    - ``function_hook`` sees each function as it is defined and may replace
+      it (call profiling, native dispatch in ``native_accel``)
+
+Usage:
+    from parsercraft.interpreter import ASTInterpreter
+
+    interpreter = ASTInterpreter(config)
+    globals_ = interpreter.run(ast)          # {"x": 42, "fact": <function>}
+    interpreter.call("fact", 10)             # call a guest function
+
+Errors:
+    ``InterpreterError`` is raised for programs that cannot be compiled
+    (unsupported nodes, disabled operators); ``GuestRuntimeError`` for
+    failures while running (undefined names, bad arity, division by zero).
+"""
+
+from __future__ import annotations
+
+import operator
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, TextIO, Tuple
+
+from .ast_optimizer import (
+    UNKNOWN,
+    assign_target,
+    assign_value,
+    function_name,
+    if_parts,
+    literal_value,
+    node_attrs,
+    node_kind,
+)
+from .resolver import UNSET, Frame, FrameLayout, Resolution, Resolver, SlotRef
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .pass_manager import PassManager
+
+Evaluator = Callable[[Frame], Any]
+
+
+class InterpreterError(Exception):
+    """A program cannot be compiled for execution."""
+
+
+class GuestRuntimeError(InterpreterError):
+    """A guest program failed while running."""
+
+
+# === Control Signals ===
+#
+# Compiled statements return None to fall through, or one of these.
+
+
+class _Return:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+class _TailCall:
+    """Call to make in place of the returning function's frame."""
+
+    __slots__ = ("function", "args")
+
+    def __init__(self, function: Any, args: tuple):
+        self.function = function
+        self.args = args
+
+
+_BREAK = object()
+_CONTINUE = object()
+
+
+# === Guest Values ===
+
+
+class GuestFunction:
+    """A guest-language function closed over its defining frame."""
+
+    __slots__ = ("name", "arity", "template", "body", "closure")
+
+    def __init__(self, name: str, layout: FrameLayout, body: Evaluator, closure: Frame):
+        self.name = name
+        self.arity = len(layout.params)
+        self.template = layout.new_slots()
+        self.body = body
+        self.closure = closure
+
+    def __call__(self, *args: Any) -> Any:
+        function = self
+        while True:
+            if len(args) != function.arity:
+                raise GuestRuntimeError(
+                    f"{function.name}() takes {function.arity} argument(s), "
+                    f"got {len(args)}"
+                )
+            slots = function.template.copy()
+            slots[: function.arity] = args
+            result = function.body(Frame(slots, function.closure))
+
+            # Trampoline: a tail call replaces this frame instead of nesting
+            if result.__class__ is _TailCall:
+                function, args = result.function, result.args
+                if function.__class__ is not GuestFunction:
+                    return function(*args)
+                continue
+            return result.value if result.__class__ is _Return else None
+
+    def __repr__(self) -> str:
+        return f"<function {self.name}/{self.arity}>"
+
+
+def _divide(left: Any, right: Any) -> Any:
+    # Exact integer quotients stay integers; everything else is true division
+    if type(left) is int and type(right) is int and right and not left % right:
+        return left // right
+    return left / right
+
+
+_BINARY: Dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _divide,
+    "%": operator.mod,
+    "//": operator.floordiv,
+    "**": operator.pow,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+_SHORT_CIRCUIT = {"and": "and", "&&": "and", "or": "or", "||": "or"}
+
+
+def _to_number(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    text = str(value).strip()
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _to_string(value: Any) -> str:
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return "null"
+    return str(value)
+
+
+_PYTHON_BUILTINS: Dict[str, Callable[..., Any]] = {
+    "len": len,
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "range": range,
+    "round": round,
+    "sum": sum,
+    "sorted": sorted,
+}
+
+
+class ASTInterpreter:
+    """Compiles an AST to closures and runs it."""
+
+    def __init__(
+        self,
+        config: Any = None,
+        output: Optional[TextIO] = None,
+        pass_manager: Optional[PassManager] = None,
+        tail_calls: bool = True,
+        function_hook: Optional[Callable[[GuestFunction], Any]] = None,
+    ):
+        self.config = config
+        self.output = output
+        self.pass_manager = pass_manager
+        self.tail_calls = tail_calls
+        self.function_hook = function_hook
+        self.builtins = self._default_builtins()
+        self.module_frame: Optional[Frame] = None
+        self.module_layout: Optional[FrameLayout] = None
+        self._resolution: Optional[Resolution] = None
+        self._tail_call_nodes: Set[int] = set()
+
+    # === Builtins ===
+
+    def _print(self, *args: Any) -> None:
+        stream = self.output if self.output is not None else sys.stdout
+        stream.write(" ".join(_to_string(arg) for arg in args) + "\n")
+
+    def _default_builtins(self) -> Dict[str, Callable[..., Any]]:
+        implementations: Dict[str, Callable[..., Any]] = {
+            "builtin.print": self._print,
+            "builtin.to_number": _to_number,
+            "builtin.to_string": _to_string,
+            "builtin.to_boolean": bool,
+            "builtin.list": lambda *items: list(items),
+        }
+        table = dict(_PYTHON_BUILTINS)
+        if self.config is None:
+            table.update(
+                print=self._print,
+                Number=_to_number,
+                String=_to_string,
+                Boolean=bool,
+                List=implementations["builtin.list"],
+            )
+            return table
+
+        for name, impl in self.config.compiled().function_map.items():
+            function = implementations.get(impl) or _PYTHON_BUILTINS.get(impl)
+            if function is None and impl == "print":
+                function = self._print
+            if function is not None:
+                table[name] = function
+        return table
+
+    # === Running ===
+
+    def run(self, ast: Any) -> Dict[str, Any]:
+        """Execute a program; return its module-level variables."""
+        program = self.compile(ast)
+        layout = self.module_layout
+        frame = Frame(layout.new_slots())
+        self.module_frame = frame
+        self._guarded(program, frame)
+        return {
+            name: value
+            for name, value in zip(layout.names, frame.slots)
+            if value is not UNSET
+        }
+
+    def call(self, name: str, *args: Any) -> Any:
+        """Call a module-level guest function after ``run``."""
+        if self.module_frame is None:
+            raise InterpreterError("No program has been run")
+        slot = self.module_layout.slot(name)
+        function = self.module_frame.slots[slot] if slot is not None else UNSET
+        if function is UNSET:
+            function = self.builtins.get(name, UNSET)
+        if not callable(function):
+            raise GuestRuntimeError(f"'{name}' is not a function")
+        return self._guarded(lambda _frame: function(*args), self.module_frame)
+
+    @staticmethod
+    def _guarded(code: Evaluator, frame: Frame) -> Any:
+        try:
+            return code(frame)
+        except InterpreterError:
+            raise
+        except RecursionError as error:
+            raise GuestRuntimeError("Maximum recursion depth exceeded") from error
+        except (ArithmeticError, TypeError, ValueError, IndexError, KeyError) as error:
+            raise GuestRuntimeError(f"{type(error).__name__}: {error}") from error
+
+    # === Compilation ===
+
+    def compile(self, ast: Any) -> Evaluator:
+        """Compile a program; the result runs it against a module frame."""
+        if self.pass_manager is not None:
+            self._resolution = self.pass_manager.get(ast, "resolution")
+        else:
+            self._resolution = Resolver().resolve(ast)
+        self.module_layout = self._resolution.module
+
+        self._tail_call_nodes = set()
+        if self.tail_calls:
+            if self.pass_manager is not None:
+                control_flow = self.pass_manager.get(ast, "cfg")
+            else:
+                from .ast_integration import ControlFlowAnalyzer
+
+                control_flow = ControlFlowAnalyzer().analyze(ast)
+            self._tail_call_nodes = {id(call) for call in control_flow["tail_calls"]}
+        return self._block(self._body(ast))
+
+    @staticmethod
+    def _body(node: Any) -> List[Any]:
+        """Statements of a program/function/block, with blocks flattened."""
+        statements: List[Any] = []
+        for child in node.children:
+            if child.node_type == "Parameters":
+                continue
+            if node_kind(child) == "block":
+                statements.extend(ASTInterpreter._body(child))
+            else:
+                statements.append(child)
+        return statements
+
+    def _block(self, statements: List[Any]) -> Evaluator:
+        compiled = tuple(
+            code
+            for code in (self._statement(statement) for statement in statements)
+            if code is not None
+        )
+        if not compiled:
+            return lambda frame: None
+        if len(compiled) == 1:
+            return compiled[0]
+
+        def run_block(frame: Frame) -> Any:
+            for statement in compiled:
+                signal = statement(frame)
+                if signal is not None:
+                    return signal
+            return None
+
+        return run_block
+
+    def _statement(self, node: Any) -> Optional[Evaluator]:
+        kind = node_kind(node)
+        if kind == "assign":
+            return self._assign(node)
+        if kind == "expression" or kind in ("call", "binary", "unary", "name", "literal"):
+            expression = self._expression(node.children[0] if kind == "expression" else node)
+
+            def run_expression(frame: Frame) -> None:
+                expression(frame)
+
+            return run_expression
+        if kind == "if":
+            return self._if(node)
+        if kind == "loop":
+            return self._loop(node)
+        if kind == "return":
+            return self._return(node)
+        if kind == "jump":
+            signal = _BREAK if self._jump_keyword(node) == "break" else _CONTINUE
+            return lambda frame: signal
+        if kind == "function":
+            return self._function(node)
+        if kind == "block":
+            return self._block(self._body(node))
+        if node.node_type == "Comment" or (
+            node.node_type == "KeywordStatement"
+            and node_attrs(node).get("original_keyword") == "pass"
+        ):
+            return None
+        raise InterpreterError(f"Unsupported statement: {node.node_type}")
+
+    @staticmethod
+    def _jump_keyword(node: Any) -> str:
+        return node_attrs(node).get("original_keyword") or node.node_type
+
+    def _store(self, node: Any, name: str) -> Callable[[Frame, Any], None]:
+        ref = self._resolution.ref_for(node)
+        if ref is None:
+            raise InterpreterError(f"Cannot assign to '{name}'")
+        slot = ref.slot
+        if ref.depth == 0:
+
+            def store_local(frame: Frame, value: Any) -> None:
+                frame.slots[slot] = value
+
+            return store_local
+        return lambda frame, value: frame.store(ref, value)
+
+    def _assign(self, node: Any) -> Evaluator:
+        name = assign_target(node)
+        if node.children:
+            value = self._expression(node.children[0])
+        else:
+            value = self._constant(assign_value(node), node)
+
+        ref = self._resolution.ref_for(node)
+        if ref is not None and ref.depth == 0:
+            slot = ref.slot
+
+            def assign_local(frame: Frame) -> None:
+                frame.slots[slot] = value(frame)
+
+            return assign_local
+
+        store = self._store(node, name)
+
+        def assign(frame: Frame) -> None:
+            store(frame, value(frame))
+
+        return assign
+
+    def _if(self, node: Any) -> Evaluator:
+        condition_node, then_block, else_block = if_parts(node)
+        if condition_node is not None:
+            condition = self._expression(condition_node)
+        else:
+            condition = self._constant(node_attrs(node).get("condition"), node)
+        then_code = self._block(self._body(then_block) if then_block else [])
+        else_code = self._block(self._body(else_block)) if else_block else None
+
+        if else_code is None:
+
+            def run_if(frame: Frame) -> Any:
+                if condition(frame):
+                    return then_code(frame)
+                return None
+
+            return run_if
+
+        def run_if_else(frame: Frame) -> Any:
+            if condition(frame):
+                return then_code(frame)
+            return else_code(frame)
+
+        return run_if_else
+
+    def _loop(self, node: Any) -> Evaluator:
+        if node.node_type not in ("while", "WhileLoop"):
+            raise InterpreterError(f"Unsupported loop: {node.node_type}")
+        header = [child for child in node.children if node_kind(child) != "block"]
+        if not header:
+            raise InterpreterError("while loop without a condition")
+        condition = self._expression(header[0])
+        body = self._block(self._body(node))
+
+        def run_while(frame: Frame) -> Any:
+            while condition(frame):
+                signal = body(frame)
+                if signal is not None:
+                    if signal is _BREAK:
+                        break
+                    if signal is _CONTINUE:
+                        continue
+                    return signal
+            return None
+
+        return run_while
+
+    def _return(self, node: Any) -> Evaluator:
+        if node.children and id(node.children[0]) in self._tail_call_nodes:
+            return self._tail_call(node.children[0])
+        if node.children:
+            value = self._expression(node.children[0])
+        else:
+            value = self._constant(node_attrs(node).get("value"), node)
+
+        def run_return(frame: Frame) -> _Return:
+            return _Return(value(frame))
+
+        return run_return
+
+    def _tail_call(self, node: Any) -> Evaluator:
+        callee, args = self._call_parts(node)
+
+        def run_tail_call(frame: Frame) -> _TailCall:
+            return _TailCall(callee(frame), tuple([arg(frame) for arg in args]))
+
+        return run_tail_call
+
+    def _function(self, node: Any) -> Evaluator:
+        name = function_name(node)
+        layout = self._resolution.layout_for(node)
+        body = self._block(self._body(node))
+        store = self._store(node, name)
+        hook = self.function_hook
+
+        if hook is not None:
+
+            def define_hooked(frame: Frame) -> None:
+                store(frame, hook(GuestFunction(name, layout, body, frame)))
+
+            return define_hooked
+
+        def define(frame: Frame) -> None:
+            store(frame, GuestFunction(name, layout, body, frame))
+
+        return define
+
+    # === Expressions ===
+
+    def _constant(self, value: Any, node: Any) -> Evaluator:
+        if isinstance(value, str):
+            raise InterpreterError(
+                f"{node.node_type}: raw expression text {value!r} is not executable"
+            )
+        return lambda frame: value
+
+    def _expression(self, node: Any) -> Evaluator:
+        kind = node_kind(node)
+        if kind == "literal":
+            value = literal_value(node)
+            if value is UNKNOWN:
+                raise InterpreterError(f"Invalid literal: {node.value!r}")
+            return lambda frame: value
+        if kind == "name":
+            return self._load(node, node_attrs(node).get("name", node.value))
+        if kind == "binary":
+            return self._binary(node)
+        if kind == "unary":
+            return self._unary(node)
+        if kind == "call":
+            return self._call(node)
+        if kind == "expression" and node.children:
+            return self._expression(node.children[0])
+        raise InterpreterError(f"Unsupported expression: {node.node_type}")
+
+    def _load(self, node: Any, name: str) -> Evaluator:
+        ref: Optional[SlotRef] = self._resolution.ref_for(node)
+        if ref is None:
+            if name in self.builtins:
+                builtin = self.builtins[name]
+                return lambda frame: builtin
+
+            def undefined(frame: Frame) -> Any:
+                raise GuestRuntimeError(f"Undefined name: '{name}'")
+
+            return undefined
+
+        slot = ref.slot
+        if ref.depth == 0:
+
+            def load_local(frame: Frame) -> Any:
+                value = frame.slots[slot]
+                if value is UNSET:
+                    raise GuestRuntimeError(f"'{name}' used before assignment")
+                return value
+
+            return load_local
+
+        def load_outer(frame: Frame) -> Any:
+            value = frame.load(ref)
+            if value is UNSET:
+                raise GuestRuntimeError(f"'{name}' used before assignment")
+            return value
+
+        return load_outer
+
+    def _binary(self, node: Any) -> Evaluator:
+        symbol = node_attrs(node).get("operator", node.value)
+        operators = getattr(self.config, "operators", None) or {}
+        if symbol in operators and not operators[symbol].enabled:
+            raise InterpreterError(f"Operator '{symbol}' is disabled")
+        if len(node.children) != 2:
+            raise InterpreterError(f"Operator '{symbol}' needs two operands")
+
+        left_node, right_node = node.children
+        if node_attrs(left_node).get("position") == "right":
+            left_node, right_node = right_node, left_node
+        left = self._expression(left_node)
+        right = self._expression(right_node)
+
+        logic = _SHORT_CIRCUIT.get(symbol)
+        if logic == "and":
+            return lambda frame: left(frame) and right(frame)
+        if logic == "or":
+            return lambda frame: left(frame) or right(frame)
+
+        op = _BINARY.get(symbol)
+        if op is None:
+            raise InterpreterError(f"Unsupported operator: {symbol}")
+
+        constant = literal_value(right_node)
+        if constant is not UNKNOWN:
+            return lambda frame: op(left(frame), constant)
+        return lambda frame: op(left(frame), right(frame))
+
+    def _unary(self, node: Any) -> Evaluator:
+        symbol = node_attrs(node).get("operator", node.value)
+        if symbol != "not":
+            raise InterpreterError(f"Unsupported operator: {symbol}")
+        if len(node.children) != 1:
+            raise InterpreterError(f"Operator '{symbol}' needs one operand")
+        operand = self._expression(node.children[0])
+        return lambda frame: not operand(frame)
+
+    def _call_parts(self, node: Any) -> Tuple[Evaluator, Tuple[Evaluator, ...]]:
+        name = node_attrs(node).get("name") or node.value
+        arg_nodes = node.children
+        if len(arg_nodes) == 1 and arg_nodes[0].node_type == "Arguments":
+            arg_nodes = arg_nodes[0].children
+        args = tuple(self._expression(arg) for arg in arg_nodes)
+        return self._load(node, name), args
+
+    def _call(self, node: Any) -> Evaluator:
+        callee, args = self._call_parts(node)
+
+        if not args:
+            return lambda frame: callee(frame)()
+        if len(args) == 1:
+            (first,) = args
+            return lambda frame: callee(frame)(first(frame))
+        if len(args) == 2:
+            first, second = args
+            return lambda frame: callee(frame)(first(frame), second(frame))
+        return lambda frame: callee(frame)(*[arg(frame) for arg in args])
+
+
+def run_program(ast: Any, config: Any = None, **kwargs: Any) -> Dict[str, Any]:
+    """Run ``ast`` with a fresh interpreter; return its module variables."""
+    return ASTInterpreter(config, **kwargs).run(ast)
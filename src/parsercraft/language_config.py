@@ -28,21 +28,139 @@ from __future__ import annotations
 import json
 from copy import deepcopy
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .compiled_language import CompiledLanguage
 
 # Optional YAML support
 try:
     import yaml
 
     YAML_AVAILABLE = True
+    # libyaml-backed loader is several times faster when compiled in
+    _YAMLSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     YAML_AVAILABLE = False
     yaml = None  # type: ignore[assignment]
+    _YAMLSafeLoader = None
+
+
+# === Mutation Tracking ===
+#
+# LanguageConfig.compiled() caches a CompiledLanguage view. Each config
+# keeps a version counter. Its nested option objects, table entries and
+# mapping dictionaries point back to the config that owns them, and a
+# write to any of them bumps only that config's version. Objects with no
+# owner (not yet added to a config) are not tracked. Objects shared by
+# several configs bump a process-wide epoch instead, and every config
+# also watches that epoch. A cached view whose version or epoch changed
+# is re-verified by fingerprint.
+
+# Owner of objects reachable from more than one config
+_SHARED = object()
+
+_shared_epoch = 0
+
+
+def _mark_changed(owner: Any) -> None:
+    global _shared_epoch  # pylint: disable=global-statement
+    if owner is None:
+        return
+    if owner is _SHARED:
+        _shared_epoch += 1
+    else:
+        state = owner.__dict__
+        state["_version"] = state.get("_version", 0) + 1
+
+
+def _adopt(value: Any, owner: Any) -> None:
+    """Record ``owner`` as the config that ``value`` belongs to."""
+    if isinstance(value, _TrackedDict):
+        current = value._owner
+        value._owner = owner if current is None or current is owner else _SHARED
+        for entry in value.values():
+            _adopt(entry, owner)
+    elif isinstance(value, _Tracked):
+        state = value.__dict__
+        current = state.get("_owner")
+        state["_owner"] = owner if current is None or current is owner else _SHARED
+
+
+class _Tracked:
+    """Mixin for config dataclasses: attribute writes mark the owner changed."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _mark_changed(self.__dict__.get("_owner"))
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Pickles and copies start without an owner
+        state = dict(self.__dict__)
+        state.pop("_owner", None)
+        return state
+
+
+class _TrackedDict(dict):
+    """Dictionary whose mutations mark its owner changed."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._owner = None
+
+    def _changed(self, *values):
+        _mark_changed(self._owner)
+        if self._owner is not None:
+            for value in values:
+                _adopt(value, self._owner)
+
+    def __setitem__(self, key, value):
+        self._changed(value)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._changed()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._changed(*dict(other).values())
+        return super().__ior__(other)
+
+    def clear(self):
+        self._changed()
+        super().clear()
+
+    def pop(self, *args):
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._changed()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._changed(default)
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        added = dict(*args, **kwargs)
+        self._changed(*added.values())
+        super().update(added)
+
+    def __reduce__(self):
+        # Pickle/copy as a plain dict; LanguageConfig re-wraps on assignment
+        return (dict, (dict(self),))
 
 
 @dataclass
-class KeywordMapping:
+class KeywordMapping(_Tracked):
     """Maps original keyword to custom name."""
 
     original: str
@@ -52,7 +170,7 @@ class KeywordMapping:
 
 
 @dataclass
-class FunctionConfig:
+class FunctionConfig(_Tracked):
     """Configuration for a built-in function."""
 
     name: str
@@ -66,7 +184,7 @@ class FunctionConfig:
 
 
 @dataclass
-class OperatorConfig:
+class OperatorConfig(_Tracked):
     """Configuration for operators."""
 
     symbol: str
@@ -76,7 +194,7 @@ class OperatorConfig:
 
 
 @dataclass
-class ParsingConfig:
+class ParsingConfig(_Tracked):
     """Deep parsing and syntax customization.
 
     This allows creating entirely new language syntaxes.
@@ -137,7 +255,7 @@ class ParsingConfig:
 
 
 @dataclass
-class SyntaxOptions:
+class SyntaxOptions(_Tracked):
     """General syntax configuration options."""
 
     # Array indexing
@@ -170,8 +288,126 @@ class SyntaxOptions:
     enable_gaslighting: bool = True
 
 
+# Fields holding mapping dictionaries that LanguageConfig keeps tracked
+_TRACKED_DICT_FIELDS = frozenset({"keyword_mappings", "builtin_functions", "operators"})
+
+
+# === Default Tables ===
+#
+# Every LanguageConfig starts from the same default keywords, functions and
+# operators. The templates below are built once; instances receive shallow
+# per-entry copies, which skip dataclass __init__ and mutation tracking.
+
+
+@lru_cache(maxsize=None)
+def _default_keyword_table() -> dict[str, KeywordMapping]:
+    return {
+        # Control flow
+        "if": KeywordMapping("if", "if", "control", "Conditional statement"),
+        "else": KeywordMapping("else", "else", "control", "Else clause"),
+        "elif": KeywordMapping("elif", "elif", "control", "Else-if clause"),
+        "while": KeywordMapping("while", "while", "control", "While loop"),
+        "for": KeywordMapping("for", "for", "control", "For loop"),
+        "break": KeywordMapping("break", "break", "control", "Break statement"),
+        "continue": KeywordMapping(
+            "continue", "continue", "control", "Continue statement"
+        ),
+        "pass": KeywordMapping("pass", "pass", "control", "Pass statement"),
+        "when": KeywordMapping("when", "when", "control", "Reactive programming"),
+        # Functions and definitions
+        "def": KeywordMapping("def", "def", "function", "Function definition"),
+        "function": KeywordMapping(
+            "function", "function", "function", "Function definition"
+        ),
+        "return": KeywordMapping("return", "return", "function", "Return value"),
+        "lambda": KeywordMapping(
+            "lambda", "lambda", "function", "Lambda expression"
+        ),
+        "yield": KeywordMapping("yield", "yield", "function", "Yield statement"),
+        # Exception handling
+        "try": KeywordMapping("try", "try", "exception", "Try block"),
+        "except": KeywordMapping(
+            "except", "except", "exception", "Exception handler"
+        ),
+        "finally": KeywordMapping(
+            "finally", "finally", "exception", "Finally block"
+        ),
+        # Imports and modules
+        "import": KeywordMapping("import", "import", "import", "Import module"),
+        "from": KeywordMapping("from", "from", "import", "From import"),
+        "as": KeywordMapping("as", "as", "import", "Import alias"),
+        # Context management
+        "with": KeywordMapping("with", "with", "context", "Context manager"),
+        # Variables and constants
+        "const": KeywordMapping(
+            "const", "const", "variable", "Constant declaration"
+        ),
+        "var": KeywordMapping("var", "var", "variable", "Variable declaration"),
+        # Object-oriented
+        "class": KeywordMapping("class", "class", "oop", "Class definition"),
+        # Logical operators (often used as keywords)
+        "and": KeywordMapping("and", "and", "logic", "Logical AND"),
+        "or": KeywordMapping("or", "or", "logic", "Logical OR"),
+        "not": KeywordMapping("not", "not", "logic", "Logical NOT"),
+        # Common keywords in other languages
+        "let": KeywordMapping("let", "let", "variable", "Variable declaration"),
+        "then": KeywordMapping("then", "then", "control", "Then clause"),
+    }
+
+
+@lru_cache(maxsize=None)
+def _default_function_table() -> dict[str, FunctionConfig]:
+    return {
+        "print": FunctionConfig("print", -1, "builtin.print", "Print to stdout"),
+        "Number": FunctionConfig(
+            "Number", 1, "builtin.to_number", "Convert to number"
+        ),
+        "String": FunctionConfig(
+            "String", 1, "builtin.to_string", "Convert to string"
+        ),
+        "Boolean": FunctionConfig(
+            "Boolean", 1, "builtin.to_boolean", "Convert to boolean"
+        ),
+        "List": FunctionConfig("List", -1, "builtin.list", "Create list"),
+    }
+
+
+@lru_cache(maxsize=None)
+def _default_operator_table() -> dict[str, OperatorConfig]:
+    return {
+        "+": OperatorConfig("+", 10, "left"),
+        "-": OperatorConfig("-", 10, "left"),
+        "*": OperatorConfig("*", 20, "left"),
+        "/": OperatorConfig("/", 20, "left"),
+        "==": OperatorConfig("==", 5, "none"),
+        "!=": OperatorConfig("!=", 5, "none"),
+        ">": OperatorConfig(">", 5, "none"),
+        "<": OperatorConfig("<", 5, "none"),
+        ">=": OperatorConfig(">=", 5, "none"),
+        "<=": OperatorConfig("<=", 5, "none"),
+        "=": OperatorConfig("=", 1, "right"),
+    }
+
+
+def _copy_entry(entry: Any) -> Any:
+    """Copy a config dataclass without running __init__ or mutation tracking."""
+    duplicate = object.__new__(type(entry))
+    state = duplicate.__dict__
+    state.update(entry.__dict__)
+    state.pop("_owner", None)
+    for name, value in state.items():
+        if type(value) is list:
+            state[name] = list(value)
+    return duplicate
+
+
+def _copy_table(table: dict[str, Any]) -> _TrackedDict:
+    """Copy a mapping table, duplicating each entry."""
+    return _TrackedDict({key: _copy_entry(value) for key, value in table.items()})
+
+
 @dataclass
-class LanguageConfig:
+class LanguageConfig(_Tracked):
     """Complete language configuration.
 
     This class provides a comprehensive way to customize a language's
@@ -197,6 +433,28 @@ class LanguageConfig:
     strict_mode: bool = False
     compatibility_mode: str = "standard"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _TRACKED_DICT_FIELDS and type(value) is dict:
+            value = _TrackedDict(value)
+        _mark_changed(self)
+        object.__setattr__(self, name, value)
+        _adopt(value, self)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The compiled view and its version are derived data; never pickle or copy them
+        state = dict(self.__dict__)
+        state.pop("_compiled", None)
+        state.pop("_version", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name in _TRACKED_DICT_FIELDS:
+            if type(state.get(name)) is dict:
+                state[name] = _TrackedDict(state[name])
+        self.__dict__.update(state)
+        for value in state.values():
+            _adopt(value, self)
+
     def __post_init__(self):
         """Initialize with default configuration if empty."""
         if not self.keyword_mappings:
@@ -208,93 +466,15 @@ class LanguageConfig:
 
     def _load_default_keywords(self):
         """Load default keywords."""
-        default_keywords = {
-            # Control flow
-            "if": KeywordMapping("if", "if", "control", "Conditional statement"),
-            "else": KeywordMapping("else", "else", "control", "Else clause"),
-            "elif": KeywordMapping("elif", "elif", "control", "Else-if clause"),
-            "while": KeywordMapping("while", "while", "control", "While loop"),
-            "for": KeywordMapping("for", "for", "control", "For loop"),
-            "break": KeywordMapping("break", "break", "control", "Break statement"),
-            "continue": KeywordMapping(
-                "continue", "continue", "control", "Continue statement"
-            ),
-            "pass": KeywordMapping("pass", "pass", "control", "Pass statement"),
-            "when": KeywordMapping("when", "when", "control", "Reactive programming"),
-            # Functions and definitions
-            "def": KeywordMapping("def", "def", "function", "Function definition"),
-            "function": KeywordMapping(
-                "function", "function", "function", "Function definition"
-            ),
-            "return": KeywordMapping("return", "return", "function", "Return value"),
-            "lambda": KeywordMapping(
-                "lambda", "lambda", "function", "Lambda expression"
-            ),
-            "yield": KeywordMapping("yield", "yield", "function", "Yield statement"),
-            # Exception handling
-            "try": KeywordMapping("try", "try", "exception", "Try block"),
-            "except": KeywordMapping(
-                "except", "except", "exception", "Exception handler"
-            ),
-            "finally": KeywordMapping(
-                "finally", "finally", "exception", "Finally block"
-            ),
-            # Imports and modules
-            "import": KeywordMapping("import", "import", "import", "Import module"),
-            "from": KeywordMapping("from", "from", "import", "From import"),
-            "as": KeywordMapping("as", "as", "import", "Import alias"),
-            # Context management
-            "with": KeywordMapping("with", "with", "context", "Context manager"),
-            # Variables and constants
-            "const": KeywordMapping(
-                "const", "const", "variable", "Constant declaration"
-            ),
-            "var": KeywordMapping("var", "var", "variable", "Variable declaration"),
-            # Object-oriented
-            "class": KeywordMapping("class", "class", "oop", "Class definition"),
-            # Logical operators (often used as keywords)
-            "and": KeywordMapping("and", "and", "logic", "Logical AND"),
-            "or": KeywordMapping("or", "or", "logic", "Logical OR"),
-            "not": KeywordMapping("not", "not", "logic", "Logical NOT"),
-            # Common keywords in other languages
-            "let": KeywordMapping("let", "let", "variable", "Variable declaration"),
-            "then": KeywordMapping("then", "then", "control", "Then clause"),
-        }
-        self.keyword_mappings = default_keywords
+        self.keyword_mappings = _copy_table(_default_keyword_table())
 
     def _load_default_functions(self):
         """Load default built-in functions."""
-        default_functions = {
-            "print": FunctionConfig("print", -1, "builtin.print", "Print to stdout"),
-            "Number": FunctionConfig(
-                "Number", 1, "builtin.to_number", "Convert to number"
-            ),
-            "String": FunctionConfig(
-                "String", 1, "builtin.to_string", "Convert to string"
-            ),
-            "Boolean": FunctionConfig(
-                "Boolean", 1, "builtin.to_boolean", "Convert to boolean"
-            ),
-            "List": FunctionConfig("List", -1, "builtin.list", "Create list"),
-        }
-        self.builtin_functions = default_functions
+        self.builtin_functions = _copy_table(_default_function_table())
 
     def _load_default_operators(self):
         """Load default operators with precedence."""
-        default_operators = {
-            "+": OperatorConfig("+", 10, "left"),
-            "-": OperatorConfig("-", 10, "left"),
-            "*": OperatorConfig("*", 20, "left"),
-            "/": OperatorConfig("/", 20, "left"),
-            "==": OperatorConfig("==", 5, "none"),
-            "!=": OperatorConfig("!=", 5, "none"),
-            ">": OperatorConfig(">", 5, "none"),
-            "<": OperatorConfig("<", 5, "none"),
-            ">=": OperatorConfig(">=", 5, "none"),
-            "<=": OperatorConfig("<=", 5, "none"),
-            "=": OperatorConfig("=", 1, "right"),
-        }
-        self.operators = default_operators
+        self.operators = _copy_table(_default_operator_table())
 
     # === Keyword Management ===
 
@@ -449,125 +629,54 @@ class LanguageConfig:
 
     @classmethod
     def from_preset(cls, preset_name: str) -> LanguageConfig:
-        """Load a preset language configuration."""
-        config = cls()
-
-        if preset_name == "python_like":
-            config.name = "Python-like"
-            # Remove 'function' since 'def' is the Python standard
-            config.remove_keyword("function")
-            config.set_array_indexing(0, False)
-            config.syntax_options.statement_terminator = ""
-            config.syntax_options.require_semicolons = False
-            config.disable_satirical_keywords()
-
-        elif preset_name == "js_like":
-            config.name = "JavaScript-like"
-            config.set_array_indexing(0, False)
-            config.syntax_options.statement_terminator = ";"
-            config.syntax_options.require_semicolons = True
-            config.disable_satirical_keywords()
-
-        elif preset_name == "minimal":
-            config.name = "Minimal"
-            config.description = "Minimal feature set"
-            config.disable_satirical_keywords()
-            essential = {"print", "Number", "String", "Boolean", "List"}
-            for func_name in list(config.builtin_functions.keys()):
-                if func_name not in essential:
-                    config.remove_function(func_name)
-
-        elif preset_name == "ruby_like":
-            config.name = "Ruby-like"
-            config.description = "Ruby-inspired syntax for educational purposes"
-            config.remove_keyword("function")
-            config.rename_keyword("def", "define")
-            config.rename_keyword("class", "blueprint")
-            config.rename_keyword("if", "when")
-            config.rename_keyword("else", "otherwise")
-            config.rename_keyword("while", "loop_while")
-            config.set_array_indexing(0, False)
-            config.disable_satirical_keywords()
-
-        elif preset_name == "golang_like":
-            config.name = "Go-like"
-            config.description = "Go/Golang-inspired syntax"
-            config.remove_keyword("function")
-            config.rename_keyword("def", "func")
-            config.rename_keyword("class", "type")
-            config.rename_keyword("return", "return")
-            config.set_array_indexing(0, False)
-            config.syntax_options.statement_terminator = ""
-            config.disable_satirical_keywords()
-
-        elif preset_name == "rust_like":
-            config.name = "Rust-like"
-            config.description = "Rust-inspired syntax for systems programming"
-            config.remove_keyword("function")
-            config.rename_keyword("def", "fn")
-            config.rename_keyword("const", "const")
-            config.rename_keyword("var", "let")
-            config.rename_keyword("class", "struct")
-            config.set_array_indexing(0, False)
-            config.disable_satirical_keywords()
-
-        elif preset_name == "clike":
-            config.name = "C-like"
-            config.description = "C/C++-inspired syntax"
-            config.remove_keyword("function")
-            config.rename_keyword("def", "void")
-            config.rename_keyword("class", "struct")
-            config.rename_keyword("if", "if")
-            config.set_array_indexing(0, False)
-            config.syntax_options.statement_terminator = ";"
-            config.syntax_options.require_semicolons = True
-            config.disable_satirical_keywords()
-
-        elif preset_name == "functional":
-            config.name = "Functional Lambda"
-            config.description = "A functional language based on lambda calculus"
-            config.rename_keyword("if", "cond")
-            config.rename_keyword("def", "define")
-            config.rename_keyword("lambda", "lambda")
-            config.rename_keyword("let", "let")
-            config.set_array_indexing(0, False)
-            config.syntax_options.statement_terminator = ""
-            config.disable_satirical_keywords()
-            # Add functional-specific operators if needed, or rely on functions
-
-        elif preset_name == "lisp_like":
-            config.name = "Lisp-like"
-            config.description = "Lisp-inspired parenthesized syntax"
-            config.rename_keyword("if", "if")
-            config.rename_keyword("def", "def")
-            config.rename_keyword("lambda", "lambda")
-            config.set_array_indexing(0, False)
-            config.syntax_options.statement_terminator = ""
-            config.syntax_options.function_call_start = "("
-            config.syntax_options.function_call_end = ")"
-            config.syntax_options.block_start = "("
-            config.syntax_options.block_end = ")"
-            config.disable_satirical_keywords()
-
-        elif preset_name == "basic_like":
-            config.name = "BASIC-like"
-            config.description = "BASIC-inspired syntax"
-            config.rename_keyword("if", "IF")
-            config.rename_keyword("else", "ELSE")
-            config.rename_keyword("for", "FOR")
-            config.rename_keyword("while", "WHILE")
-            # print is a function, not a keyword
-            config.rename_function("print", "PRINT")
-            config.rename_keyword("def", "DEF")
-            config.rename_keyword("return", "RETURN")
-            config.set_array_indexing(1, False)
-            config.syntax_options.statement_terminator = ""
-            config.disable_satirical_keywords()
+        """Load a preset language configuration.
 
-        else:
+        Each preset is built once per class on first use; callers receive a
+        cheap clone, so the shared template is never mutated.
+        """
+        info = _PRESETS.get(preset_name)
+        if info is None:
             raise ValueError(f"Unknown preset: {preset_name}")
 
-        return config
+        key = (cls, preset_name)
+        template = _PRESET_TEMPLATES.get(key)
+        if template is None:
+            template = cls()
+            info.builder(template)
+            _PRESET_TEMPLATES[key] = template
+
+        return template.clone()
+
+    # === Compiled View ===
+
+    def compiled(self) -> CompiledLanguage:
+        """Return the precomputed lookup tables for this configuration.
+
+        The view is cached on the instance and rebuilt only when the
+        configuration's content has changed since it was built.
+        """
+        from .compiled_language import CompiledLanguage, config_fingerprint
+
+        state = self.__dict__
+        stamp = (state.get("_version", 0), _shared_epoch)
+        cached = state.get("_compiled")
+        if cached is not None:
+            cached_stamp, view = cached
+            if cached_stamp == stamp:
+                return view
+            # Written to, or a shared object changed: keep the view if the
+            # content is still the same
+            if config_fingerprint(self) == view.fingerprint:
+                state["_compiled"] = (stamp, view)
+                return view
+
+        view = CompiledLanguage.from_config(self)
+        state["_compiled"] = (stamp, view)
+        return view
+
+    def invalidate_compiled(self) -> None:
+        """Drop the cached compiled view (after untracked in-place edits)."""
+        self.__dict__.pop("_compiled", None)
 
     # === Validation ===
 
@@ -576,8 +685,7 @@ class LanguageConfig:
         errors = []
 
         # Check for duplicate custom names
-        custom_names = [m.custom for m in self.keyword_mappings.values()]
-        duplicates = [name for name in custom_names if custom_names.count(name) > 1]
+        duplicates = self.compiled().duplicate_keywords
         if duplicates:
             errors.append(f"Duplicate keyword names: {set(duplicates)}")
 
@@ -626,42 +734,55 @@ class LanguageConfig:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> LanguageConfig:
         """Create configuration from dictionary."""
-        config = cls()
+        # Sections go straight to the constructor so default tables are only
+        # materialized for the sections the data leaves out.
+        kwargs: dict[str, Any] = {}
 
         if "metadata" in data:
-            config.name = data["metadata"].get("name", config.name)
-            config.version = data["metadata"].get("version", config.version)
-            config.description = data["metadata"].get("description", config.description)
-            config.author = data["metadata"].get("author", config.author)
+            metadata = data["metadata"]
+            for key in ("name", "version", "description", "author"):
+                if key in metadata:
+                    kwargs[key] = metadata[key]
 
         if "keywords" in data:
-            config.keyword_mappings = {
+            kwargs["keyword_mappings"] = {
                 k: KeywordMapping(**v) for k, v in data["keywords"].items()
             }
 
         if "functions" in data:
-            config.builtin_functions = {
+            kwargs["builtin_functions"] = {
                 k: FunctionConfig(**v) for k, v in data["functions"].items()
             }
 
         if "operators" in data:
-            config.operators = {
+            kwargs["operators"] = {
                 k: OperatorConfig(**v) for k, v in data["operators"].items()
             }
 
         if "syntax_options" in data:
-            config.syntax_options = SyntaxOptions(**data["syntax_options"])
+            kwargs["syntax_options"] = SyntaxOptions(**data["syntax_options"])
 
         if "parsing_config" in data:
-            config.parsing_config = ParsingConfig(**data["parsing_config"])
+            kwargs["parsing_config"] = ParsingConfig(**data["parsing_config"])
 
         if "runtime" in data:
-            config.debug_mode = data["runtime"].get("debug_mode", False)
-            config.strict_mode = data["runtime"].get("strict_mode", False)
-            config.compatibility_mode = data["runtime"].get(
+            kwargs["debug_mode"] = data["runtime"].get("debug_mode", False)
+            kwargs["strict_mode"] = data["runtime"].get("strict_mode", False)
+            kwargs["compatibility_mode"] = data["runtime"].get(
                 "compatibility_mode", "standard"
             )
 
+        config = cls(**kwargs)
+
+        # An explicitly empty section means "none", not "use the defaults"
+        for section, attribute in (
+            ("keywords", "keyword_mappings"),
+            ("functions", "builtin_functions"),
+            ("operators", "operators"),
+        ):
+            if section in data and not kwargs[attribute]:
+                setattr(config, attribute, {})
+
         return config
 
     def save(self, filepath: Union[str, Path], format: str = "auto") -> None:
@@ -686,21 +807,6 @@ class LanguageConfig:
 
         print(f"Configuration saved to {filepath}")
 
-    @classmethod
-    def load(cls, filepath: Union[str, Path]) -> "LanguageConfig":
-        """Load configuration from file."""
-        filepath = Path(filepath)
-        if not filepath.exists():
-            raise FileNotFoundError(f"Config file not found: {filepath}")
-
-        with open(filepath, "r") as f:
-            if filepath.suffix in [".yaml", ".yml"] and YAML_AVAILABLE:
-                data = yaml.safe_load(f)
-            else:
-                data = json.load(f)
-
-        return cls.from_dict(data)
-    
     @classmethod
     def from_json(cls, json_str: str) -> "LanguageConfig":
         """Create configuration from JSON string."""
@@ -718,9 +824,18 @@ class LanguageConfig:
         raise ImportError("PyYAML is not installed")
 
     @classmethod
-    def load(cls, filepath: Union[str, Path]) -> LanguageConfig:
-        """Load configuration from file."""
+    def load(
+        cls, filepath: Union[str, Path], use_cache: bool = True
+    ) -> LanguageConfig:
+        """Load configuration from file.
+
+        Parsed configs are kept in a binary sidecar cache (see
+        ``config_cache``) and reused while the file's mtime, size and
+        content hash are unchanged.
+        """
         filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"Config file not found: {filepath}")
 
         is_yaml = filepath.suffix in [".yaml", ".yml"]
         if is_yaml and not YAML_AVAILABLE:
@@ -728,13 +843,28 @@ class LanguageConfig:
                 "YAML support not available. Install with: pip install pyyaml"
             )
 
-        with open(filepath, "r") as f:
-            if is_yaml:
-                data = yaml.safe_load(f)
-            else:
-                data = json.load(f)
+        content = filepath.read_bytes()
 
-        return cls.from_dict(data)
+        cache = None
+        if use_cache:
+            from .config_cache import ConfigCache
+
+            cache = ConfigCache.default()
+            if cache is not None:
+                cached = cache.get(filepath, content)
+                if isinstance(cached, cls):
+                    return cached
+
+        text = content.decode("utf-8")
+        if is_yaml:
+            data = yaml.load(text, Loader=_YAMLSafeLoader)  # nosec B506 - safe loader
+        else:
+            data = json.loads(text)
+
+        config = cls.from_dict(data)
+        if cache is not None:
+            cache.put(filepath, content, config)
+        return config
 
     @classmethod
     def load_preset(cls, preset_name: str) -> "LanguageConfig":
@@ -795,8 +925,24 @@ class LanguageConfig:
         return False
 
     def clone(self) -> "LanguageConfig":
-        """Create a deep copy of this configuration."""
-        return deepcopy(self)
+        """Create an independent copy of this configuration.
+
+        Tables and option objects are copied entry by entry, which is much
+        cheaper than ``deepcopy``; the compiled view is immutable and shared.
+        """
+        duplicate = object.__new__(type(self))
+        state = duplicate.__dict__
+        for name, value in self.__dict__.items():
+            if name in _TRACKED_DICT_FIELDS:
+                value = _copy_table(value)
+            elif name in ("syntax_options", "parsing_config"):
+                value = _copy_entry(value)
+            elif name not in ("_compiled", "_version"):
+                value = deepcopy(value)
+            state[name] = value
+        for value in state.values():
+            _adopt(value, duplicate)
+        return duplicate
 
     @property
     def keywords(self) -> dict[str, KeywordMapping]:
@@ -873,20 +1019,189 @@ class LanguageConfig:
         )
 
 
+# === Preset Registry ===
+
+
+@dataclass(frozen=True)
+class PresetInfo:
+    """A registered preset: its name, a one-line summary and its builder."""
+
+    name: str
+    description: str
+    builder: Callable[[LanguageConfig], None]
+
+
+# Presets by name, in registration order; templates are built on demand
+_PRESETS: dict[str, PresetInfo] = {}
+_PRESET_TEMPLATES: dict[tuple[type, str], LanguageConfig] = {}
+
+
+def register_preset(
+    name: str, description: str = ""
+) -> Callable[[Callable[[LanguageConfig], None]], Callable[[LanguageConfig], None]]:
+    """Decorator registering a preset builder under ``name``.
+
+    The builder receives a default ``LanguageConfig`` and customizes it in
+    place. It runs the first time the preset is requested.
+    """
+
+    def decorator(
+        builder: Callable[[LanguageConfig], None]
+    ) -> Callable[[LanguageConfig], None]:
+        _PRESETS[name] = PresetInfo(name, description, builder)
+        for key in [key for key in _PRESET_TEMPLATES if key[1] == name]:
+            del _PRESET_TEMPLATES[key]
+        return builder
+
+    return decorator
+
+
+@register_preset("python_like", "Python-style syntax (0-based arrays, no terminators)")
+def _preset_python_like(config: LanguageConfig) -> None:
+    config.name = "Python-like"
+    # Remove 'function' since 'def' is the Python standard
+    config.remove_keyword("function")
+    config.set_array_indexing(0, False)
+    config.syntax_options.statement_terminator = ""
+    config.syntax_options.require_semicolons = False
+    config.disable_satirical_keywords()
+
+
+@register_preset("js_like", "JavaScript-style syntax with semicolons")
+def _preset_js_like(config: LanguageConfig) -> None:
+    config.name = "JavaScript-like"
+    config.set_array_indexing(0, False)
+    config.syntax_options.statement_terminator = ";"
+    config.syntax_options.require_semicolons = True
+    config.disable_satirical_keywords()
+
+
+@register_preset("minimal", "Minimal feature set")
+def _preset_minimal(config: LanguageConfig) -> None:
+    config.name = "Minimal"
+    config.description = "Minimal feature set"
+    config.disable_satirical_keywords()
+    essential = {"print", "Number", "String", "Boolean", "List"}
+    for func_name in list(config.builtin_functions.keys()):
+        if func_name not in essential:
+            config.remove_function(func_name)
+
+
+@register_preset("ruby_like", "Ruby-inspired syntax for educational purposes")
+def _preset_ruby_like(config: LanguageConfig) -> None:
+    config.name = "Ruby-like"
+    config.description = "Ruby-inspired syntax for educational purposes"
+    config.remove_keyword("function")
+    config.rename_keyword("def", "define")
+    config.rename_keyword("class", "blueprint")
+    config.rename_keyword("if", "when")
+    config.rename_keyword("else", "otherwise")
+    config.rename_keyword("while", "loop_while")
+    config.set_array_indexing(0, False)
+    config.disable_satirical_keywords()
+
+
+@register_preset("golang_like", "Go/Golang-inspired syntax")
+def _preset_golang_like(config: LanguageConfig) -> None:
+    config.name = "Go-like"
+    config.description = "Go/Golang-inspired syntax"
+    config.remove_keyword("function")
+    config.rename_keyword("def", "func")
+    config.rename_keyword("class", "type")
+    config.rename_keyword("return", "return")
+    config.set_array_indexing(0, False)
+    config.syntax_options.statement_terminator = ""
+    config.disable_satirical_keywords()
+
+
+@register_preset("rust_like", "Rust-inspired syntax for systems programming")
+def _preset_rust_like(config: LanguageConfig) -> None:
+    config.name = "Rust-like"
+    config.description = "Rust-inspired syntax for systems programming"
+    config.remove_keyword("function")
+    config.rename_keyword("def", "fn")
+    config.rename_keyword("const", "const")
+    config.rename_keyword("var", "let")
+    config.rename_keyword("class", "struct")
+    config.set_array_indexing(0, False)
+    config.disable_satirical_keywords()
+
+
+@register_preset("clike", "C/C++-inspired syntax")
+def _preset_clike(config: LanguageConfig) -> None:
+    config.name = "C-like"
+    config.description = "C/C++-inspired syntax"
+    config.remove_keyword("function")
+    config.rename_keyword("def", "void")
+    config.rename_keyword("class", "struct")
+    config.rename_keyword("if", "if")
+    config.set_array_indexing(0, False)
+    config.syntax_options.statement_terminator = ";"
+    config.syntax_options.require_semicolons = True
+    config.disable_satirical_keywords()
+
+
+@register_preset("functional", "A functional language based on lambda calculus")
+def _preset_functional(config: LanguageConfig) -> None:
+    config.name = "Functional Lambda"
+    config.description = "A functional language based on lambda calculus"
+    config.rename_keyword("if", "cond")
+    config.rename_keyword("def", "define")
+    config.rename_keyword("lambda", "lambda")
+    config.rename_keyword("let", "let")
+    config.set_array_indexing(0, False)
+    config.syntax_options.statement_terminator = ""
+    config.disable_satirical_keywords()
+    # Add functional-specific operators if needed, or rely on functions
+
+
+@register_preset("lisp_like", "Lisp-inspired parenthesized syntax")
+def _preset_lisp_like(config: LanguageConfig) -> None:
+    config.name = "Lisp-like"
+    config.description = "Lisp-inspired parenthesized syntax"
+    config.rename_keyword("if", "if")
+    config.rename_keyword("def", "def")
+    config.rename_keyword("lambda", "lambda")
+    config.set_array_indexing(0, False)
+    config.syntax_options.statement_terminator = ""
+    config.syntax_options.function_call_start = "("
+    config.syntax_options.function_call_end = ")"
+    config.syntax_options.block_start = "("
+    config.syntax_options.block_end = ")"
+    config.disable_satirical_keywords()
+
+
+@register_preset("basic_like", "BASIC-inspired syntax")
+def _preset_basic_like(config: LanguageConfig) -> None:
+    config.name = "BASIC-like"
+    config.description = "BASIC-inspired syntax"
+    config.rename_keyword("if", "IF")
+    config.rename_keyword("else", "ELSE")
+    config.rename_keyword("for", "FOR")
+    config.rename_keyword("while", "WHILE")
+    # print is a function, not a keyword
+    config.rename_function("print", "PRINT")
+    config.rename_keyword("def", "DEF")
+    config.rename_keyword("return", "RETURN")
+    config.set_array_indexing(1, False)
+    config.syntax_options.statement_terminator = ""
+    config.disable_satirical_keywords()
+
+
+def get_preset_info(name: str) -> PresetInfo:
+    """Registry entry for a preset, without building it."""
+    try:
+        return _PRESETS[name]
+    except KeyError:
+        raise ValueError(f"Unknown preset: {name}") from None
+
+
 # === Helper Functions ===
 
 
 def list_presets() -> list[str]:
     """Get list of available presets."""
-    return [
-        "python_like",
-        "js_like",
-        "minimal",
-        "ruby_like",
-        "golang_like",
-        "rust_like",
-        "clike",
-    ]
+    return list(_PRESETS)
 
 
 def create_custom_config_interactive() -> LanguageConfig:
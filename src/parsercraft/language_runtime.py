@@ -16,9 +16,10 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from .language_config import LanguageConfig
+from .offset_array import OffsetArray
 
 
 class LanguageRuntime:
@@ -95,29 +96,18 @@ class LanguageRuntime:
         if not self._config:
             return
 
-        # Build keyword reverse map: custom name -> original name
-        self._keyword_reverse_map = {
-            mapping.custom: mapping.original
-            for mapping in self._config.keyword_mappings.values()
-        }
-
-        # Build function map
-        self._function_map = {}
-        for func in self._config.builtin_functions.values():
-            if not func.enabled:
-                continue
-
-            impl = func.implementation or func.name
-            if impl == func.name and impl.isupper():
-                impl = impl.lower()
-
-            self._function_map[func.name] = impl
+        # Both maps come from the config's cached compiled view
+        compiled = self._config.compiled()
+        self._keyword_reverse_map = compiled.custom_to_original
+        self._function_map = compiled.function_map
 
     @classmethod
     def get_custom_keywords(cls) -> list[str]:
         """Return the list of custom keywords currently configured."""
         runtime = cls.get_instance()
-        return list(runtime._keyword_reverse_map.keys())
+        if not runtime._config:
+            return []
+        return list(runtime._config.compiled().custom_to_original)
 
     @classmethod
     def translate_keyword(cls, keyword_text: str) -> str:
@@ -133,7 +123,8 @@ class LanguageRuntime:
         if not runtime._config:
             return keyword_text
 
-        return runtime._keyword_reverse_map.get(keyword_text, keyword_text)
+        compiled = runtime._config.compiled()
+        return compiled.custom_to_original.get(keyword_text, keyword_text)
 
     @classmethod
     def translate_function(cls, function_name: str) -> str:
@@ -142,13 +133,17 @@ class LanguageRuntime:
         if not runtime._config:
             return function_name
 
-        return runtime._function_map.get(function_name, function_name)
+        return runtime._config.compiled().function_map.get(
+            function_name, function_name
+        )
 
     @classmethod
     def get_custom_functions(cls) -> list[str]:
         """Return the list of custom functions currently configured."""
         runtime = cls.get_instance()
-        return list(runtime._function_map.keys())
+        if not runtime._config:
+            return []
+        return list(runtime._config.compiled().function_map)
 
     @classmethod
     def is_keyword_enabled(cls, original_keyword: str) -> bool:
@@ -193,6 +188,22 @@ class LanguageRuntime:
 
         return runtime._config.syntax_options.allow_fractional_indexing
 
+    @classmethod
+    def new_array(cls, values: Iterable[Any] = ()) -> OffsetArray:
+        """Create a guest array using the configured indexing rules.
+
+        Args:
+            values: Initial elements
+
+        Returns:
+            OffsetArray starting at ``get_array_start_index()``
+        """
+        return OffsetArray(
+            values,
+            cls.get_array_start_index(),
+            cls.is_fractional_indexing_enabled(),
+        )
+
     @classmethod
     def is_feature_enabled(cls, feature: str) -> bool:
         """Check if a language feature is enabled.
@@ -66,19 +66,11 @@ class LanguageValidator:
 
     def check_keyword_conflicts(self) -> None:
         """Check for keyword conflicts and ambiguities."""
-        custom_keywords = [
-            kw.custom for kw in self.config.keyword_mappings.values()
-        ]  # noqa: E501 pylint: disable=line-too-long
+        compiled = self.config.compiled()
+        custom_keywords = compiled.keywords
 
         # Check for duplicate custom keywords
-        seen = set()
-        duplicates = set()
-        for keyword in custom_keywords:
-            if keyword in seen:
-                duplicates.add(keyword)
-            seen.add(keyword)
-
-        for dup in duplicates:
+        for dup in compiled.duplicate_keywords:
             self.issues.append(
                 ValidationIssue(
                     severity="error",
@@ -153,9 +145,8 @@ class LanguageValidator:
 
     def check_function_conflicts(self) -> None:
         """Check for function naming conflicts."""
-        function_names = [
-            f.name for f in self.config.builtin_functions.values()
-        ]  # noqa: E501
+        compiled = self.config.compiled()
+        function_names = compiled.function_names
 
         # Check for duplicate function names
         seen = set()
@@ -173,11 +164,8 @@ class LanguageValidator:
             seen.add(name)
 
         # Check if function names conflict with keywords
-        custom_keywords = set(
-            kw.custom for kw in self.config.keyword_mappings.values()
-        )  # noqa: E501
         for name in function_names:
-            if name in custom_keywords:
+            if compiled.is_keyword(name):
                 self.issues.append(
                     ValidationIssue(
                         severity="error",
@@ -313,10 +301,7 @@ class LanguageValidator:
             "super",
         }
 
-        custom_keywords = set(
-            kw.custom for kw in self.config.keyword_mappings.values()
-        )  # noqa: E501
-        conflicts = custom_keywords & common_reserved
+        conflicts = self.config.compiled().keyword_set & common_reserved
 
         if conflicts:
             self.issues.append(
@@ -371,11 +356,8 @@ class LanguageValidator:
         """Check if the language configuration is complete."""
         # Check for essential keywords
         essential_originals = {"if", "while", "for", "function", "return"}
-        defined_originals = set(
-            kw.original for kw in self.config.keyword_mappings.values()
-        )
-
-        missing = essential_originals - defined_originals
+        compiled = self.config.compiled()
+        missing = essential_originals - compiled.original_keywords
         if missing:
             self.issues.append(
                 ValidationIssue(
@@ -389,11 +371,7 @@ class LanguageValidator:
 
         # Check for essential functions
         essential_functions = {"print", "input", "len"}
-        defined_functions = set(
-            f.name for f in self.config.builtin_functions.values()
-        )  # noqa: E501
-
-        missing_funcs = essential_functions - defined_functions
+        missing_funcs = essential_functions - compiled.function_set
         if missing_funcs:
             self.issues.append(
                 ValidationIssue(
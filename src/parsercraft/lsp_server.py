@@ -8,7 +8,8 @@ Features:
     - Real-time syntax highlighting
     - Code completion
     - Hover documentation
-    - Diagnostic/error reporting
+    - Diagnostic/error reporting, including type checker errors
+    - Document symbols from the parsed AST (shared PassManager analyses)
     - Go to definition
     - Symbol renaming
     - Document formatting
@@ -37,8 +38,11 @@ from pathlib import Path
 from typing import Any, Optional, Union
 
 from .language_config import LanguageConfig
-from .parser_generator import Lexer, ASTNode, Token
+from .module_system import ModuleImport
+from .parser_generator import Lexer, ASTNode, ParseError, Token
 from .language_validator import LanguageValidator
+from .pass_manager import PassManager
+from .type_system import TypeChecker, parse_module
 
 
 # Configure logging
@@ -212,12 +216,40 @@ class DocumentManager:
 
 
 class LanguageServerAnalyzer:
-    """Analyzes code for LSP features."""
+    """Analyzes code for LSP features.
+
+    Parsed documents go through one ``PassManager``, so the type checker and
+    the symbol outline share its cached analyses for each document version.
+    """
 
     def __init__(self, config: LanguageConfig):
         self.config = config
         self.lexer = Lexer(config)
         self.validator = LanguageValidator(config)
+        self.pass_manager = PassManager(config)
+        self.type_checker = TypeChecker(config, pass_manager=self.pass_manager)
+        self._parsed: Optional[tuple[str, ASTNode, list[tuple[int, ModuleImport]]]] = None
+        self.parse_error: Optional[ParseError] = None  # of the last parse
+
+    def parse(self, content: str) -> Optional[tuple[ASTNode, list[tuple[int, ModuleImport]]]]:
+        """AST and import statements of ``content`` (None if it cannot be parsed).
+
+        The last document parsed is kept, so the analyses cached for its AST
+        are reused until the content changes.
+        """
+        if self._parsed is not None and self._parsed[0] == content:
+            return self._parsed[1], self._parsed[2]
+        self.parse_error = None
+        try:
+            ast, import_statements = parse_module(self.config, content)
+        except ParseError as e:
+            self.parse_error = e
+            return None
+        except Exception as e:
+            logger.error(f"Parse error: {e}")
+            return None
+        self._parsed = (content, ast, import_statements)
+        return ast, import_statements
 
     def tokenize(self, content: str) -> list[Token]:
         """Tokenize content and return tokens."""
@@ -282,6 +314,57 @@ class LanguageServerAnalyzer:
         except Exception as e:
             logger.error(f"Diagnostic analysis error: {e}")
 
+        diagnostics.extend(self.get_type_diagnostics(content))
+        return diagnostics
+
+    def get_type_diagnostics(self, content: str) -> list[Diagnostic]:
+        """Type checker errors and warnings for ``content``.
+
+        If ``content`` does not parse, this is the syntax error alone (E004).
+        """
+        parsed = self.parse(content)
+        if parsed is None:
+            if self.parse_error is None:
+                return []
+            line = max(self.parse_error.line - 1, 0)
+            column = max(self.parse_error.column - 1, 0)
+            return [
+                Diagnostic(
+                    range=Range(
+                        start=Position(line=line, character=column),
+                        end=Position(line=line, character=column + 1),
+                    ),
+                    message=f"Syntax error: {self.parse_error.message}",
+                    severity=DiagnosticSeverity.ERROR,
+                    code="E004",
+                )
+            ]
+        ast, import_statements = parsed
+        try:
+            errors = self.type_checker.check_ast(ast, import_statements=import_statements)
+        except Exception as e:
+            logger.error(f"Type check error: {e}")
+            return []
+
+        diagnostics = []
+        for error in errors:
+            line = max(error.line - 1, 0)
+            column = max(error.column - 1, 0)
+            diagnostics.append(
+                Diagnostic(
+                    range=Range(
+                        start=Position(line=line, character=column),
+                        end=Position(line=line, character=column + 1),
+                    ),
+                    message=error.message,
+                    severity=(
+                        DiagnosticSeverity.ERROR
+                        if error.kind == "error"
+                        else DiagnosticSeverity.WARNING
+                    ),
+                    code=error.code,
+                )
+            )
         return diagnostics
 
     def get_completions(self, content: str, position: Position) -> list[CompletionItem]:
@@ -343,16 +426,18 @@ class LanguageServerAnalyzer:
 
         word = word_match.group()
 
+        compiled = self.config.compiled()
+
         # Check if it's a keyword
-        for keyword_map in self.config.keyword_mappings.values():
-            if keyword_map.custom == word:
-                return Hover(
-                    contents=f"**{word}** (keyword)\n\n{keyword_map.description or 'Language keyword'}",
-                    range=Range(
-                        start=Position(line=position.line, character=position.character - len(word)),
-                        end=Position(line=position.line, character=position.character),
-                    ),
-                )
+        if compiled.is_keyword(word):
+            description = compiled.keyword_descriptions.get(word)
+            return Hover(
+                contents=f"**{word}** (keyword)\n\n{description or 'Language keyword'}",
+                range=Range(
+                    start=Position(line=position.line, character=position.character - len(word)),
+                    end=Position(line=position.line, character=position.character),
+                ),
+            )
 
         # Check if it's a built-in function
         for func_config in self.config.builtin_functions.values():
@@ -408,29 +493,29 @@ class LanguageServerAnalyzer:
 
     def get_symbols(self, content: str) -> list[dict]:
         """Get document symbols (functions, variables, etc.)."""
-        symbols = []
-        lines = content.split("\n")
+        parsed = self.parse(content)
+        if parsed is None:
+            return []
 
-        for i, line in enumerate(lines):
-            # Find function definitions
-            for kw_map in self.config.keyword_mappings.values():
-                if kw_map.original == "def":  # Function definition keyword
-                    pattern = rf"\b{re.escape(kw_map.custom)}\s+(\w+)"
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        symbols.append(
-                            {
-                                "name": match.group(1),
-                                "kind": 12,  # Function
-                                "location": {
-                                    "uri": "",
-                                    "range": {
-                                        "start": {"line": i, "character": match.start()},
-                                        "end": {"line": i, "character": match.end()},
-                                    },
-                                },
-                            }
-                        )
+        symbols = []
+        for definition in self.pass_manager.get(parsed[0], "definitions"):
+            token = definition.node.token
+            if token is None:
+                continue
+            line, column = token.line - 1, token.column - 1
+            symbols.append(
+                {
+                    "name": definition.name,
+                    "kind": 12 if definition.kind == "function" else 13,  # Function / Variable
+                    "location": {
+                        "uri": "",
+                        "range": {
+                            "start": {"line": line, "character": column},
+                            "end": {"line": line, "character": column + len(token.value)},
+                        },
+                    },
+                }
+            )
 
         return symbols
 
@@ -292,6 +292,17 @@ class ModuleLoader:
 
         module.parsed = True
 
+    def parse_imports(self, content: str) -> List[Tuple[int, ModuleImport]]:
+        """``(line number, import)`` for each import statement in ``content``."""
+        imports = []
+        for i, line in enumerate(content.split("\n"), 1):
+            stripped = line.strip()
+            if stripped.startswith("import "):
+                import_stmt = self._parse_import_statement(stripped)
+                if import_stmt:
+                    imports.append((i, import_stmt))
+        return imports
+
     def _parse_import_statement(self, line: str) -> Optional[ModuleImport]:
         """Parse import statement.
 
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Native Acceleration of Hot Guest Functions
+
+A middle ground between interpreting a program and compiling all of it:
+profile an interpreted run, pick the hottest functions that are purely
+numeric, compile just those through the C backend into a shared library,
+and let the interpreter call them through ``ctypes``.
+
+Features:
+    - Call profiler for guest functions (calls, self time, sample arguments)
+    - Candidates from ``ASTToCGenerator.native_functions``: int/float/bool
+      parameters and result, no output, globals or nested functions
+    - Shared library built and cached by ``NativeBuilder.build_library``
+    - Transparent dispatch through the interpreter's ``function_hook``;
+      calls with other argument types or integers beyond 64 bits, and
+      runtime errors (integer overflow, division by zero, ...), fall back
+      to the interpreter
+    - Native results checked against the interpreter on the profiled
+      arguments before a function is accelerated
+    - Per-function speedups measured on those arguments
+
+Usage:
+    from parsercraft.native_accel import HotFunctionAccelerator
+
+    accelerator = HotFunctionAccelerator(config, top=3)
+    accelerator.profile(ast)                  # interpreted run
+    accelerator.accelerate(ast)               # ["fib", "mandel"]
+    accelerator.interpreter().run(ast)        # hot functions run natively
+    print(accelerator.measure().format())
+
+Semantics:
+    Native integers are 64-bit. The C backend checks integer arithmetic
+    for overflow, and an overflowing call is rerun by the interpreter,
+    whose integers grow without bound, so results match. Deep non-tail
+    recursion uses the C stack instead of the interpreter's recursion
+    limit. While profiling, tail calls through a profiled function nest
+    instead of running on the trampoline.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+from .ast_integration import ASTToCGenerator, native_symbol
+from .interpreter import ASTInterpreter, GuestFunction
+from .native_build import BuildResult, NativeBuilder
+
+_C_TYPES = {"int": ctypes.c_int64, "float": ctypes.c_double, "bool": ctypes.c_bool}
+_PY_TYPES = {"int": int, "float": float, "bool": bool}
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+# === Profiling ===
+
+
+@dataclass
+class FunctionProfile:
+    """Calls and self time of one guest function."""
+
+    name: str
+    calls: int = 0
+    seconds: float = 0.0  # excluding time in profiled callees
+    samples: List[Tuple[Any, ...]] = field(default_factory=list)  # distinct argument tuples
+
+
+class _ProfiledCall:
+    """Stands in for a module-level guest function while profiling."""
+
+    __slots__ = ("function", "profile", "profiler")
+
+    def __init__(self, function: GuestFunction, profile: FunctionProfile, profiler: CallProfiler):
+        self.function = function
+        self.profile = profile
+        self.profiler = profiler
+
+    def __call__(self, *args: Any) -> Any:
+        profile = self.profile
+        profile.calls += 1
+        if len(profile.samples) < self.profiler.sample_limit and args not in profile.samples:
+            profile.samples.append(args)
+        children = self.profiler.child_seconds
+        children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self.function(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            profile.seconds += elapsed - children.pop()
+            if children:
+                children[-1] += elapsed
+
+
+class CallProfiler:
+    """Profiles module-level guest functions; use as an interpreter ``function_hook``."""
+
+    def __init__(self, sample_limit: int = 8):
+        self.sample_limit = sample_limit
+        self.functions: Dict[str, FunctionProfile] = {}
+        self.child_seconds: List[float] = []
+
+    def __call__(self, function: GuestFunction) -> Any:
+        if function.closure.parent is not None:
+            return function  # nested functions are never compiled
+        profile = self.functions.setdefault(function.name, FunctionProfile(function.name))
+        return _ProfiledCall(function, profile, self)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(profile.seconds for profile in self.functions.values())
+
+    def hottest(self) -> List[FunctionProfile]:
+        """Profiles by self time, hottest first."""
+        return sorted(self.functions.values(), key=lambda profile: -profile.seconds)
+
+
+# === Native Dispatch ===
+
+
+class NativeFunction:
+    """Calls a native entry point, falling back to the interpreted function."""
+
+    __slots__ = ("name", "entry", "arg_types", "result_type", "fallback", "calls", "fallbacks")
+
+    def __init__(
+        self,
+        name: str,
+        entry: Any,
+        params: Tuple[str, ...],
+        result: str,
+        fallback: Callable[..., Any],
+    ):
+        entry.argtypes = [_C_TYPES[kind] for kind in params] + [ctypes.POINTER(_C_TYPES[result])]
+        entry.restype = ctypes.c_int
+        self.name = name
+        self.entry = entry
+        self.arg_types = tuple(_PY_TYPES[kind] for kind in params)
+        self.result_type = _C_TYPES[result]
+        self.fallback = fallback
+        self.calls = 0
+        self.fallbacks = 0
+
+    def __call__(self, *args: Any) -> Any:
+        self.calls += 1
+        if len(args) == len(self.arg_types):
+            for value, expected in zip(args, self.arg_types):
+                # Exact types: an int passed for a float parameter stays an int
+                # in the interpreter, and bool is a subclass of int
+                if value.__class__ is not expected:
+                    break
+                if expected is int and not _INT64_MIN <= value <= _INT64_MAX:
+                    break
+            else:
+                result = self.result_type()
+                if self.entry(*args, ctypes.byref(result)):
+                    return result.value
+        # Wrong types, or the runtime failed (integer overflow included): the
+        # interpreter decides (and raises the guest error, if any); native
+        # functions have no side effects
+        self.fallbacks += 1
+        return self.fallback(*args)
+
+    def __repr__(self) -> str:
+        return f"<native function {self.name}>"
+
+
+# === Reports ===
+
+
+@dataclass
+class FunctionSpeedup:
+    """Interpreted vs native time per call of one accelerated function."""
+
+    name: str
+    calls: int  # during profiling
+    interpreted_seconds: float  # per call, on the profiled arguments
+    native_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        return self.interpreted_seconds / self.native_seconds if self.native_seconds else 0.0
+
+
+@dataclass
+class AccelerationReport:
+    """What ``HotFunctionAccelerator`` compiled and how much faster it runs."""
+
+    functions: List[FunctionSpeedup] = field(default_factory=list)
+    rejected: Dict[str, str] = field(default_factory=dict)  # name -> reason
+    build: Optional[BuildResult] = None
+
+    def format(self) -> str:
+        lines = []
+        if self.build is not None:
+            status = "cached" if self.build.cached else f"compiled in {self.build.seconds:.2f}s"
+            lines.append(f"Native library: {self.build.executable.name} ({status})")
+        for entry in self.functions:
+            lines.append(
+                f"  {entry.name:20} {entry.calls:8d} calls  "
+                f"{entry.interpreted_seconds * 1e6:10.2f}us -> {entry.native_seconds * 1e6:8.2f}us  "
+                f"{entry.speedup:7.1f}x"
+            )
+        for name, reason in self.rejected.items():
+            lines.append(f"  {name:20} not accelerated: {reason}")
+        return "\n".join(lines)
+
+
+# === Accelerator ===
+
+
+class HotFunctionAccelerator:
+    """Profile, pick hot numeric functions, compile them, dispatch natively."""
+
+    def __init__(
+        self,
+        config: Any = None,
+        top: int = 3,
+        min_share: float = 0.01,
+        builder: Optional[NativeBuilder] = None,
+    ):
+        self.config = config
+        self.top = top
+        self.min_share = min_share  # of profiled self time
+        self.builder = builder or NativeBuilder()
+        self.profiler = CallProfiler()
+        self.report = AccelerationReport()
+        self.library: Optional[ctypes.CDLL] = None
+        self.signatures: Dict[str, Tuple[Tuple[str, ...], str]] = {}
+        self._profiled: Optional[ASTInterpreter] = None
+
+    def profile(self, ast: Any, output: Optional[TextIO] = None) -> List[FunctionProfile]:
+        """Run ``ast`` interpreted with the call profiler; returns the hottest first."""
+        interpreter = ASTInterpreter(self.config, output=output, function_hook=self.profiler)
+        interpreter.run(ast)
+        # Unwrap, so later calls through this interpreter are plain interpreted calls
+        slots = interpreter.module_frame.slots
+        for index, value in enumerate(slots):
+            if value.__class__ is _ProfiledCall:
+                slots[index] = value.function
+        self._profiled = interpreter
+        return self.profiler.hottest()
+
+    def select(self, ast: Any) -> List[str]:
+        """Hottest profiled functions that can be compiled, at most ``top``."""
+        candidates = ASTToCGenerator(self.config).native_functions(ast)
+        total = self.profiler.total_seconds
+        selected = []
+        for profile in self.profiler.hottest():
+            if len(selected) == self.top:
+                break
+            if not profile.calls or profile.seconds < total * self.min_share:
+                continue
+            if profile.name in candidates:
+                selected.append(profile.name)
+                self.signatures[profile.name] = candidates[profile.name]
+        return selected
+
+    def accelerate(self, ast: Any, verify: bool = True) -> List[str]:
+        """Compile and load the selected functions; returns the accelerated names.
+
+        With ``verify``, each function's native results are compared with
+        the interpreter's on the profiled arguments (which re-runs those
+        calls interpreted) and mismatches are left interpreted.
+        """
+        if self._profiled is None:
+            self.profile(ast)
+        names = self.select(ast)
+        self.report = AccelerationReport()
+        if not names:
+            return []
+        source = ASTToCGenerator(self.config).translate_library(ast, names)
+        self.report.build = self.builder.build_library(source)
+        self.library = ctypes.CDLL(str(self.report.build.executable))
+
+        for name in list(names) if verify else []:
+            reason = self._verify(name)
+            if reason is not None:
+                self.report.rejected[name] = reason
+                names.remove(name)
+                del self.signatures[name]
+        return names
+
+    def _native(self, name: str, fallback: Callable[..., Any]) -> NativeFunction:
+        params, result = self.signatures[name]
+        entry = getattr(self.library, native_symbol(name))
+        return NativeFunction(name, entry, params, result, fallback)
+
+    def _interpreted(self, name: str) -> GuestFunction:
+        interpreter = self._profiled
+        return interpreter.module_frame.slots[interpreter.module_layout.slot(name)]
+
+    def _verify(self, name: str) -> Optional[str]:
+        """None if native results match the interpreter's on the profiled arguments."""
+        interpreted = self._interpreted(name)
+        native = self._native(name, interpreted)
+        for args in self.profiler.functions[name].samples:
+            expected = interpreted(*args)
+            actual = native(*args)
+            if actual.__class__ is not expected.__class__ or actual != expected:
+                return f"{name}{args} gives {actual!r} natively, {expected!r} interpreted"
+        return None
+
+    def dispatch(self, function: GuestFunction) -> Any:
+        """Interpreter ``function_hook``: native code for accelerated functions."""
+        if function.closure.parent is not None or function.name not in self.signatures:
+            return function
+        return self._native(function.name, function)
+
+    def interpreter(self, output: Optional[TextIO] = None, **kwargs: Any) -> ASTInterpreter:
+        """An interpreter that dispatches accelerated functions to native code."""
+        return ASTInterpreter(self.config, output=output, function_hook=self.dispatch, **kwargs)
+
+    def measure(self, min_seconds: float = 0.05) -> AccelerationReport:
+        """Time each accelerated function interpreted and native, per call.
+
+        Both run on the arguments seen while profiling, each side repeated
+        until it takes at least ``min_seconds``.
+        """
+        self.report.functions = []
+        for name in self.signatures:
+            profile = self.profiler.functions[name]
+            interpreted = self._interpreted(name)
+            native = self._native(name, interpreted)
+            self.report.functions.append(FunctionSpeedup(
+                name,
+                profile.calls,
+                _time_per_call(interpreted, profile.samples, min_seconds),
+                _time_per_call(native, profile.samples, min_seconds),
+            ))
+        return self.report
+
+
+def _time_per_call(function: Callable[..., Any], samples: List[Tuple[Any, ...]], min_seconds: float) -> float:
+    if not samples:
+        return 0.0
+    rounds = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for args in samples:
+                function(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / (rounds * len(samples))
+        rounds *= 2
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Native Builds of Generated C
+
+Compiles C produced by ``ASTToCGenerator`` with the local C compiler and
+caches the executables (and shared libraries). The cache key is a hash of
+the C source, the compiler identity and the flags, so rebuilding an
+unchanged program costs one hash and one ``stat``.
+
+Features:
+    - Compiler discovery: $CC, then cc, gcc, clang
+    - Content-addressed executable cache with atomic installs
+    - Shared libraries for ``ctypes`` (``build_library``), cached the same way
+    - Compiler diagnostics surfaced as ``NativeBuildError``
+    - Hit/miss statistics
+
+Usage:
+    from parsercraft.native_build import NativeBuilder
+
+    builder = NativeBuilder()
+    result = builder.build(c_code)
+    print(result.executable, "cached" if result.cached else "compiled")
+    output = builder.run(result.executable).stdout
+
+    library = builder.build_library(library_code).executable   # .so/.dylib/.dll
+
+Cache location:
+    $PARSERCRAFT_NATIVE_CACHE_DIR, else $XDG_CACHE_HOME/parsercraft/native,
+    else ~/.cache/parsercraft/native (created with mode 0700).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+from .cache_store import cache_dir
+
+NATIVE_CACHE_DIR_ENV = "PARSERCRAFT_NATIVE_CACHE_DIR"
+
+DEFAULT_FLAGS = ("-O2",)
+_LINK_FLAGS = ("-lm",)
+_SHARED_FLAGS = ("-shared", "-fPIC")
+_COMPILER_CANDIDATES = ("cc", "gcc", "clang")
+
+
+class NativeBuildError(Exception):
+    """Raised when no compiler is available or compilation fails."""
+
+
+def default_cache_dir() -> Path:
+    """Directory holding cached executables."""
+    return cache_dir(NATIVE_CACHE_DIR_ENV, "native")
+
+
+def find_c_compiler() -> Optional[str]:
+    """Path of the C compiler to use, or None if there is none."""
+    configured = os.environ.get("CC")
+    if configured:
+        return shutil.which(configured) or configured
+    for candidate in _COMPILER_CANDIDATES:
+        found = shutil.which(candidate)
+        if found:
+            return found
+    return None
+
+
+@dataclass
+class BuildResult:
+    """Outcome of ``NativeBuilder.build`` or ``build_library``."""
+
+    executable: Path  # the built file; a shared library for build_library
+    key: str
+    cached: bool
+    seconds: float
+
+
+class NativeBuilder:
+    """Compiles C source to executables, cached by content hash."""
+
+    def __init__(
+        self,
+        compiler: Optional[str] = None,
+        flags: Sequence[str] = DEFAULT_FLAGS,
+        cache_dir: Optional[Path] = None,
+    ):
+        self.compiler = compiler or find_c_compiler()
+        self.flags = tuple(flags)
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self._compiler_identity: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+
+    def compiler_identity(self) -> str:
+        """Compiler path and version banner (part of every cache key)."""
+        if self._compiler_identity is None:
+            if self.compiler is None:
+                raise NativeBuildError(
+                    "No C compiler found (set $CC or install cc, gcc or clang)"
+                )
+            try:
+                banner = subprocess.run(
+                    [self.compiler, "--version"],
+                    capture_output=True, text=True, check=False,
+                ).stdout.splitlines()
+            except OSError as error:
+                raise NativeBuildError(f"Cannot run {self.compiler}: {error}") from error
+            self._compiler_identity = f"{self.compiler}\n{banner[0] if banner else ''}"
+        return self._compiler_identity
+
+    def cache_key(self, source: str, flags: Optional[Sequence[str]] = None) -> str:
+        """Content hash identifying the file built from ``source`` with ``flags``."""
+        flags = self.flags if flags is None else flags
+        digest = hashlib.sha256()
+        for part in (self.compiler_identity(), " ".join(flags), source):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def executable_path(self, key: str) -> Path:
+        suffix = ".exe" if sys.platform == "win32" else ""
+        return self.cache_dir / f"{key[:32]}{suffix}"
+
+    def library_path(self, key: str) -> Path:
+        suffix = {"win32": ".dll", "darwin": ".dylib"}.get(sys.platform, ".so")
+        return self.cache_dir / f"{key[:32]}{suffix}"
+
+    def build(self, source: str) -> BuildResult:
+        """Return an executable for ``source``, compiling only on a miss."""
+        start = time.perf_counter()
+        key = self.cache_key(source)
+        executable = self.executable_path(key)
+        if os.access(executable, os.X_OK):
+            self.hits += 1
+            return BuildResult(executable, key, True, time.perf_counter() - start)
+        self._compile(source, self.flags, executable)
+        return BuildResult(executable, key, False, time.perf_counter() - start)
+
+    def build_library(self, source: str) -> BuildResult:
+        """Return a shared library for ``source``, compiling only on a miss."""
+        start = time.perf_counter()
+        flags = self.flags + _SHARED_FLAGS
+        key = self.cache_key(source, flags)
+        library = self.library_path(key)
+        if library.is_file():
+            self.hits += 1
+            return BuildResult(library, key, True, time.perf_counter() - start)
+        self._compile(source, flags, library)
+        return BuildResult(library, key, False, time.perf_counter() - start)
+
+    def _compile(self, source: str, flags: Sequence[str], target: Path) -> None:
+        """Compile ``source`` and install the result at ``target`` atomically."""
+        self.misses += 1
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.cache_dir) as work:
+            c_file = Path(work) / "program.c"
+            c_file.write_text(source, encoding="utf-8")
+            output = Path(work) / target.name
+            command = [
+                self.compiler, *flags, "-o", str(output), str(c_file), *_LINK_FLAGS
+            ]
+            try:
+                completed = subprocess.run(
+                    command, capture_output=True, text=True, check=False
+                )
+            except OSError as error:
+                raise NativeBuildError(f"Cannot run {self.compiler}: {error}") from error
+            if completed.returncode != 0:
+                raise NativeBuildError(
+                    f"C compilation failed ({' '.join(command)}):\n"
+                    f"{completed.stderr.strip()}"
+                )
+            os.replace(output, target)
+
+    def run(
+        self, executable: Path, args: Sequence[str] = (), timeout: Optional[float] = None
+    ) -> subprocess.CompletedProcess:
+        """Run a built executable, capturing its output."""
+        return subprocess.run(
+            [str(executable), *args],
+            capture_output=True, text=True, timeout=timeout, check=False,
+        )
+
+    def clear(self) -> int:
+        """Delete cached executables and libraries; return how many were removed."""
+        removed = 0
+        if self.cache_dir.is_dir():
+            for entry in self.cache_dir.iterdir():
+                if entry.is_file():
+                    entry.unlink()
+                    removed += 1
+        return removed
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Cache counters for this builder."""
+        total = self.hits + self.misses
+        return {
+            "cache_dir": str(self.cache_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Offset-Aware Arrays for Guest Programs
+
+``SyntaxOptions.array_start_index`` lets a language number its first element
+-1, 0 or 1, and ``allow_fractional_indexing`` allows indices such as ``0.5``.
+``OffsetArray`` builds both into a ``list`` subclass. An index is translated
+once inside ``__getitem__``/``__setitem__``, and iteration, ``len``, ``in``
+and comparisons are the plain list operations, running at C speed.
+
+Features:
+    - Integer indexing relative to a configurable start index
+    - Slices use guest indices and return ``OffsetArray`` with the same start
+    - No Python-style wrap-around: indices before the start raise IndexError
+    - Fractional reads interpolate linearly between neighbouring elements
+    - Fractional writes insert between neighbouring elements
+    - ``items()`` yields ``(guest_index, value)`` pairs
+
+Usage:
+    from parsercraft.offset_array import OffsetArray
+
+    scores = OffsetArray([3, 2, 5], start=-1, fractional=True)
+    scores[-1]          # 3
+    scores[0.5]         # 3.5, halfway between scores[0] and scores[1]
+    scores[0.5] = 4     # [3, 2, 4, 5]
+    scores[0:]          # OffsetArray([2, 4, 5], start=-1, fractional=True)
+
+    # Using the active language configuration
+    from parsercraft.language_runtime import LanguageRuntime
+    array = LanguageRuntime.new_array([1, 2, 3])
+
+Fractional index semantics:
+    Reading ``a[i + f]`` (0 < f < 1) returns ``a[i] + (a[i + 1] - a[i]) * f``
+    when both neighbours are numbers. Otherwise it returns ``a[i]``. Both
+    neighbours must exist. Writing ``a[i + f] = v`` inserts ``v`` between
+    ``a[i]`` and ``a[i + 1]``, so every later element moves up by one index.
+    A float with no fractional part is treated as the matching integer.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable, Iterator, Optional, SupportsIndex, Tuple
+
+_get = list.__getitem__
+_set = list.__setitem__
+_delete = list.__delitem__
+_floor = math.floor
+_INF = math.inf
+_NUMBERS = frozenset({int, float})
+
+
+class OffsetArray(list):
+    """A list whose first element has guest index ``start``."""
+
+    __slots__ = ("start", "fractional")
+
+    def __init__(self, iterable: Iterable[Any] = (), start: int = 0, fractional: bool = False):
+        super().__init__(iterable)
+        self.start = start
+        self.fractional = fractional
+
+    # === Index Translation ===
+
+    def _position(self, index: Any) -> int:
+        """List position of integer-like guest ``index`` (not range-checked)."""
+        if index.__class__ is float:
+            if not index.is_integer():
+                raise TypeError("fractional index used as a position")
+            return int(index) - self.start
+        try:
+            return index.__index__() - self.start
+        except AttributeError:
+            raise TypeError(
+                f"array indices must be integers or slices, not {type(index).__name__}"
+            ) from None
+
+    def _checked(self, index: Any) -> int:
+        position = self._position(index)
+        if 0 <= position < len(self):
+            return position
+        raise IndexError(f"array index {index} out of range")
+
+    def _fraction(self, index: Any) -> Optional[Tuple[int, float]]:
+        """``(floor, fraction)`` for a fractional float index, else None."""
+        if index.__class__ is not float or index.is_integer():
+            return None
+        if not self.fractional:
+            raise TypeError("fractional indexing is disabled for this array")
+        if not math.isfinite(index):
+            raise IndexError(f"array index {index} out of range")
+        floor = math.floor(index)
+        return floor, index - floor
+
+    def _slice(self, index: slice) -> slice:
+        """Translate a slice of guest indices into list positions."""
+        step = index.step
+        backwards = step is not None and step < 0
+        return slice(
+            self._bound(index.start, backwards),
+            self._bound(index.stop, backwards),
+            step,
+        )
+
+    def _bound(self, bound: Any, backwards: bool) -> Optional[int]:
+        if bound is None:
+            return None
+        position = self._position(bound)
+        if position >= 0:
+            return position
+        # Before the first element: an empty edge going forwards; going
+        # backwards it means "through the first element"
+        return None if backwards else 0
+
+    # === Element Access ===
+
+    def __getitem__(self, index: Any) -> Any:
+        if index.__class__ is int:
+            position = index - self.start
+            if position >= 0:
+                return _get(self, position)
+            raise IndexError(f"array index {index} out of range")
+        if index.__class__ is slice:
+            return self.__class__(_get(self, self._slice(index)), self.start, self.fractional)
+
+        if index.__class__ is float and self.fractional and -_INF < index < _INF:
+            floor = _floor(index)
+            position = floor - self.start
+            if 0 <= position < len(self) - 1:
+                weight = index - floor
+                lower = _get(self, position)
+                if not weight:
+                    return lower
+                upper = _get(self, position + 1)
+                if lower.__class__ in _NUMBERS and upper.__class__ in _NUMBERS:
+                    return lower + (upper - lower) * weight
+                return lower
+
+        fraction = self._fraction(index)
+        if fraction is None:
+            return _get(self, self._checked(index))
+        raise IndexError(f"array index {index} out of range")
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if index.__class__ is int:
+            position = index - self.start
+            if position >= 0:
+                _set(self, position, value)
+                return
+            raise IndexError(f"array index {index} out of range")
+        if index.__class__ is slice:
+            _set(self, self._slice(index), value)
+            return
+
+        fraction = self._fraction(index)
+        if fraction is None:
+            _set(self, self._checked(index), value)
+            return
+        position = fraction[0] - self.start + 1
+        if not 0 <= position <= len(self):
+            raise IndexError(f"array index {index} out of range")
+        list.insert(self, position, value)
+
+    def __delitem__(self, index: Any) -> None:
+        if index.__class__ is slice:
+            _delete(self, self._slice(index))
+        else:
+            _delete(self, self._checked(index))
+
+    # === List Methods Using Guest Indices ===
+
+    def insert(self, index: SupportsIndex, value: Any) -> None:
+        list.insert(self, max(self._position(index), 0), value)
+
+    def pop(self, index: Optional[SupportsIndex] = None) -> Any:
+        if index is None:
+            return list.pop(self)
+        return list.pop(self, self._checked(index))
+
+    def index(self, value: Any, *bounds: Any) -> int:  # type: ignore[override]
+        positions = [max(self._position(bound), 0) for bound in bounds]
+        return list.index(self, value, *positions) + self.start
+
+    @property
+    def stop(self) -> int:
+        """Guest index one past the last element."""
+        return self.start + len(self)
+
+    def items(self) -> Iterator[Tuple[int, Any]]:
+        """``(guest_index, value)`` pairs in order."""
+        return zip(range(self.start, self.start + len(self)), self)
+
+    # === Copies ===
+
+    def copy(self) -> OffsetArray:
+        return self.__class__(self, self.start, self.fractional)
+
+    def __copy__(self) -> OffsetArray:
+        return self.copy()
+
+    def __add__(self, other: Iterable[Any]) -> OffsetArray:  # type: ignore[override]
+        result = self.copy()
+        result.extend(other)
+        return result
+
+    def __mul__(self, count: SupportsIndex) -> OffsetArray:
+        return self.__class__(list.__mul__(self, count), self.start, self.fractional)
+
+    __rmul__ = __mul__
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self.__class__, (list(self), self.start, self.fractional))
+
+    def __repr__(self) -> str:
+        flag = ", fractional=True" if self.fractional else ""
+        return f"OffsetArray({list.__repr__(self)}, start={self.start}{flag})"
+
+
+def array_from_config(config: Any, iterable: Iterable[Any] = ()) -> OffsetArray:
+    """An ``OffsetArray`` using ``config.syntax_options`` indexing rules."""
+    options = config.syntax_options
+    return OffsetArray(
+        iterable, options.array_start_index, options.allow_fractional_indexing
+    )
@@ -12,7 +12,7 @@ Generates parsers from language configurations with support for:
 import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from .language_config import LanguageConfig
 
@@ -71,18 +71,40 @@ class ASTNode:
         return self.node_type
 
 
+class ParseError(Exception):
+    """Syntax error at a token; ``line`` and ``column`` are 1-based."""
+
+    def __init__(self, message: str, token: Token):
+        super().__init__(f"line {token.line}, column {token.column}: {message}")
+        self.message = message
+        self.token = token
+        self.line = token.line
+        self.column = token.column
+
+
 class Lexer:
     """Tokenizes source code based on language configuration."""
 
     def __init__(self, config: LanguageConfig):
         self.config = config
-        self.keywords = set(kw.custom for kw in config.keyword_mappings.values())
-        self.operators = set()
-        if config.operators:
-            self.operators = set(op.symbol for op in config.operators.values())
+
+    @property
+    def keywords(self) -> FrozenSet[str]:
+        """Custom keywords of the current config revision."""
+        return self.config.compiled().keyword_set
+
+    @property
+    def operators(self) -> FrozenSet[str]:
+        """Operator symbols of the current config revision."""
+        return self.config.compiled().operator_set
 
     def tokenize(self, source: str) -> List[Token]:
         """Tokenize source code into a list of tokens."""
+        compiled = self.config.compiled()
+        keywords = compiled.keyword_set
+        match_operator = compiled.operator_trie.match
+        comment_style = compiled.single_line_comment
+
         tokens = []
         lines = source.split("\n")
 
@@ -98,8 +120,7 @@ class Lexer:
                     continue
 
                 # Check for comments
-                comment_style = self.config.syntax_options.single_line_comment
-                if comment_style and line[i:].startswith(comment_style):
+                if comment_style and line.startswith(comment_style, i):
                     tokens.append(Token(TokenType.COMMENT, line[i:], line_num, column))
                     break
 
@@ -138,17 +159,12 @@ class Lexer:
                     i = j
                     continue
 
-                # Check for operators
-                matched_op = False
-                for op in sorted(self.operators, key=len, reverse=True):
-                    if line[i:].startswith(op):
-                        tokens.append(Token(TokenType.OPERATOR, op, line_num, column))
-                        column += len(op)
-                        i += len(op)
-                        matched_op = True
-                        break
-
-                if matched_op:
+                # Check for operators (longest match)
+                op = match_operator(line, i)
+                if op is not None:
+                    tokens.append(Token(TokenType.OPERATOR, op, line_num, column))
+                    column += len(op)
+                    i += len(op)
                     continue
 
                 # Check for identifiers and keywords
@@ -160,7 +176,7 @@ class Lexer:
                     word = line[i:j]
                     token_type = (
                         TokenType.KEYWORD
-                        if word in self.keywords
+                        if word in keywords
                         else TokenType.IDENTIFIER
                     )
 
@@ -187,13 +203,36 @@ class Lexer:
         return tokens
 
 
+# Original keywords that close an "end"-delimited block
+_BLOCK_END = frozenset({"end", "endif", "endwhile", "endfunction", "next"})
+
+# Original keywords that may follow a block header ("if x then", "while x do")
+_HEADER_WORDS = frozenset({"then", "do"})
+
+# Logical operators spelled as keywords, by original name
+_KEYWORD_OPERATORS = {"or": 2, "and": 3}
+_NOT_PRECEDENCE = 4
+
+_DECLARATION_KEYWORDS = frozenset({"let", "var", "const"})
+
+
 class Parser:
-    """Parses tokens into an Abstract Syntax Tree."""
+    """Parses tokens into an Abstract Syntax Tree.
+
+    Expressions are parsed by precedence climbing over the configured
+    operator precedences; ``and``/``or``/``not`` bind looser than any
+    comparison. Blocks may be delimited by braces, by an "end"-style
+    keyword, or (after a trailing ``:``) by indentation.
+
+    Tokens that cannot start or continue a statement raise ``ParseError``
+    instead of being skipped.
+    """
 
     def __init__(self, config: LanguageConfig, tokens: List[Token]):
         self.config = config
         self.tokens = tokens
         self.current = 0
+        self.compiled = config.compiled()
 
     def parse(self) -> ASTNode:
         """Parse tokens into an AST."""
@@ -217,12 +256,21 @@ class Parser:
             self.advance()
             return ASTNode("Comment", token.value, token=token)
 
+        if token.type == TokenType.PUNCTUATION and token.value == ";":
+            self.advance()
+            return None
+
         if token.type == TokenType.KEYWORD:
             return self.parse_keyword_statement()
 
+        if token.type == TokenType.IDENTIFIER and self.is_assignment_ahead():
+            return self.parse_assignment()
+
         # Expression statement
         expr = self.parse_expression()
-        return ASTNode("ExpressionStatement", children=[expr]) if expr else None
+        if expr is None:
+            raise self.error(f"Unexpected {self.describe(token)}", token)
+        return ASTNode("ExpressionStatement", children=[expr])
 
     def parse_keyword_statement(self) -> Optional[ASTNode]:
         """Parse keyword-based statements."""
@@ -230,11 +278,7 @@ class Parser:
         keyword = keyword_token.value
 
         # Find original keyword for semantic understanding
-        original = None
-        for mapping in self.config.keyword_mappings.values():
-            if mapping.custom == keyword:
-                original = mapping.original
-                break
+        original = self.compiled.original_keyword(keyword)
 
         if original in ["if", "when"]:
             return self.parse_if_statement(keyword_token)
@@ -244,33 +288,54 @@ class Parser:
             return self.parse_function_def(keyword_token)
         elif original == "return":
             return self.parse_return_statement(keyword_token)
+        elif original in _DECLARATION_KEYWORDS and self.is_assignment_ahead():
+            return self.parse_assignment(declaration=True)
         else:
             # Generic keyword statement
             node = ASTNode("KeywordStatement", keyword, token=keyword_token)
             node.metadata["original_keyword"] = original
             return node
 
-    def parse_if_statement(self, keyword_token: Token) -> ASTNode:
-        """Parse if/conditional statement."""
+    def parse_assignment(self, declaration: bool = False) -> ASTNode:
+        """Parse ``name = expression``."""
+        name_token = self.advance()
+        self.advance()  # consume '='
+        node = ASTNode("Assignment", name_token.value, token=name_token)
+        if declaration:
+            node.metadata["declaration"] = True
+
+        node.children.append(self.expect_expression("after '='"))
+        return node
+
+    def parse_if_statement(self, keyword_token: Token, chained: bool = False) -> ASTNode:
+        """Parse if/conditional statement.
+
+        ``elif``/``else if`` chains become nested IfStatements in the else
+        block and share the outer statement's closing keyword.
+        """
         node = ASTNode("IfStatement", token=keyword_token)
 
-        # Parse condition
-        condition = self.parse_expression()
-        if condition:
-            node.children.append(condition)
-
-        # Parse body (simplified - just collect tokens until we hit else/end)
-        body = ASTNode("Block")
-        while not self.is_at_end() and self.peek().value not in [
-            "else",
-            "end",
-            "endif",
-        ]:
-            stmt = self.parse_statement()
-            if stmt:
-                body.children.append(stmt)
+        node.children.append(self.expect_expression(f"after '{keyword_token.value}'"))
 
+        body = self.parse_block(keyword_token, _BLOCK_END | {"else", "elif"})
         node.children.append(body)
+
+        word = self.original(self.peek())
+        if word == "elif":
+            nested = self.parse_if_statement(self.advance(), chained=True)
+            body = ASTNode("Block", children=[nested])
+            node.children.append(body)
+        elif word == "else":
+            else_token = self.advance()
+            if self.original(self.peek()) in ("if", "when"):
+                nested = self.parse_if_statement(self.advance(), chained=True)
+                body = ASTNode("Block", children=[nested])
+            else:
+                body = self.parse_block(else_token)
+            node.children.append(body)
+
+        if not chained:
+            self.close_block(body)
         return node
 
     def parse_loop_statement(self, keyword_token: Token, loop_type: str) -> ASTNode:
@@ -282,17 +347,8 @@ class Parser:
         if header:
             node.children.append(header)
 
-        # Parse body
-        body = ASTNode("Block")
-        while not self.is_at_end() and self.peek().value not in [
-            "end",
-            "endwhile",
-            "next",
-        ]:
-            stmt = self.parse_statement()
-            if stmt:
-                body.children.append(stmt)
-
+        body = self.parse_block(keyword_token)
+        self.close_block(body)
         node.children.append(body)
         return node
 
@@ -320,21 +376,172 @@ class Parser:
                 self.advance()
             node.children.append(params)
 
+        body = self.parse_block(keyword_token)
+        self.close_block(body)
+        node.children.append(body)
         return node
 
     def parse_return_statement(self, keyword_token: Token) -> ASTNode:
         """Parse return statement."""
         node = ASTNode("ReturnStatement", token=keyword_token)
 
-        # Parse return value
-        expr = self.parse_expression()
-        if expr:
-            node.children.append(expr)
+        # A value must start on the same line and not close the block
+        token = self.peek()
+        if (
+            token.line == keyword_token.line
+            and token.value not in ("}", ";")
+            and self.original(token) not in _BLOCK_END
+        ):
+            expr = self.parse_expression()
+            if expr:
+                node.children.append(expr)
 
         return node
 
-    def parse_expression(self) -> Optional[ASTNode]:
-        """Parse expression (simplified)."""
+    # === Blocks ===
+
+    def parse_block(
+        self, opener: Token, stop: FrozenSet[str] = _BLOCK_END
+    ) -> ASTNode:
+        """Parse the body of the statement introduced by ``opener``.
+
+        ``{ ... }`` ends at the closing brace. After a trailing ``:`` that
+        ends the line, the block ends at the first token indented no deeper
+        than ``opener``. Otherwise it ends before a word in ``stop``; call
+        ``close_block`` to consume that keyword.
+        """
+        block = ASTNode("Block")
+        if self.peek().value == "{":
+            self.advance()
+            block.metadata["delimiter"] = "braces"
+            while not self.is_at_end() and self.peek().value != "}":
+                stmt = self.parse_statement()
+                if stmt:
+                    block.children.append(stmt)
+            self.expect("}")
+            return block
+
+        colon = False
+        while self.peek().value == ":" or (
+            self.peek().type == TokenType.KEYWORD
+            and self.original(self.peek()) in _HEADER_WORDS
+        ):
+            colon = colon or self.peek().value == ":"
+            self.advance()
+
+        indented = colon and self.peek().line > opener.line
+        block.metadata["delimiter"] = "indent" if indented else "keyword"
+        while not self.is_at_end():
+            token = self.peek()
+            if indented:
+                if token.column <= opener.column and token.line > opener.line:
+                    break
+            elif self.original(token) in stop:
+                break
+            stmt = self.parse_statement()
+            if stmt:
+                block.children.append(stmt)
+        return block
+
+    def close_block(self, block: ASTNode) -> None:
+        """Consume the ``end``-style keyword closing a keyword block."""
+        if (
+            block.metadata.get("delimiter") == "keyword"
+            and self.original(self.peek()) in _BLOCK_END
+        ):
+            self.advance()
+
+    # === Expressions ===
+
+    def parse_expression(self, min_precedence: int = 0) -> Optional[ASTNode]:
+        """Parse an expression by precedence climbing.
+
+        Operators bind by their configured precedence; only operators at
+        ``min_precedence`` or above are consumed at this level.
+        """
+        left = self.parse_unary()
+        if left is None:
+            return None
+
+        while True:
+            token = self.peek()
+            symbol = self.binary_operator(token)
+            if symbol is None:
+                break
+            precedence = self.precedence(symbol)
+            if precedence < min_precedence:
+                break
+
+            self.advance()
+            if self.compiled.associativity.get(symbol) == "right":
+                right = self.parse_expression(precedence)
+            else:
+                right = self.parse_expression(precedence + 1)
+            if right is None:
+                raise self.error(
+                    f"Expected an expression after '{token.value}', "
+                    f"found {self.describe(self.peek())}"
+                )
+            left = ASTNode("BinaryOp", symbol, [left, right], token=token)
+
+        return left
+
+    def binary_operator(self, token: Token) -> Optional[str]:
+        """Binary operator ``token`` stands for, if any.
+
+        Keyword operators are returned by their original name. ``=`` is
+        assignment, handled at statement level.
+        """
+        if token.type == TokenType.OPERATOR:
+            return token.value if token.value != "=" else None
+        if token.type == TokenType.KEYWORD:
+            original = self.original(token)
+            if original in _KEYWORD_OPERATORS:
+                return original
+        return None
+
+    def precedence(self, symbol: str) -> int:
+        """Binding strength of a binary operator."""
+        if symbol in _KEYWORD_OPERATORS:
+            return _KEYWORD_OPERATORS[symbol]
+        return self.compiled.precedence.get(symbol, 0)
+
+    def parse_unary(self) -> Optional[ASTNode]:
+        """Parse prefix ``-`` and ``not``, then a primary expression.
+
+        Negation of a number literal folds into the literal; otherwise
+        ``-x`` becomes ``0 - x``. ``not x`` becomes a ``UnaryOp`` node,
+        which tests the operand's truthiness at run time.
+        """
+        token = self.peek()
+        if token.type == TokenType.OPERATOR and token.value == "-":
+            self.advance()
+            operand = self.parse_unary()
+            if operand is None:
+                raise self.error(
+                    f"Expected an expression after '-', found {self.describe(self.peek())}"
+                )
+            if operand.node_type == "Number":
+                text = str(operand.value)
+                operand.value = text[1:] if text.startswith("-") else f"-{text}"
+                return operand
+            zero = ASTNode("Number", "0", token=token)
+            return ASTNode("BinaryOp", "-", [zero, operand], token=token)
+
+        if token.type == TokenType.KEYWORD and self.original(token) == "not":
+            self.advance()
+            operand = self.parse_expression(_NOT_PRECEDENCE)
+            if operand is None:
+                raise self.error(
+                    f"Expected an expression after '{token.value}', "
+                    f"found {self.describe(self.peek())}"
+                )
+            return ASTNode("UnaryOp", "not", [operand], token=token)
+
+        return self.parse_primary()
+
+    def parse_primary(self) -> Optional[ASTNode]:
+        """Parse a literal, name, call or parenthesized expression."""
         token = self.peek()
 
         if token.type == TokenType.NUMBER:
@@ -354,33 +561,78 @@ class Parser:
             return node
         elif token.value == "(":
             self.advance()
-            expr = self.parse_expression()
-            if self.peek().value == ")":
-                self.advance()
+            expr = self.expect_expression("after '('")
+            self.expect(")")
             return expr
 
         return None
 
     def parse_function_call(self, func_node: ASTNode) -> ASTNode:
         """Parse function call."""
-        call_node = ASTNode("FunctionCall", func_node.value)
+        call_node = ASTNode("FunctionCall", func_node.value, token=func_node.token)
         self.advance()  # consume '('
 
         # Parse arguments
         args = ASTNode("Arguments")
         while self.peek().value != ")" and not self.is_at_end():
-            arg = self.parse_expression()
-            if arg:
-                args.children.append(arg)
+            args.children.append(self.expect_expression("as an argument"))
             if self.peek().value == ",":
                 self.advance()
-
-        if self.peek().value == ")":
-            self.advance()
+            elif self.peek().value != ")":
+                raise self.error(
+                    f"Expected ',' or ')' in call to '{func_node.value}', "
+                    f"found {self.describe(self.peek())}"
+                )
+        self.expect(")")
 
         call_node.children.append(args)
         return call_node
 
+    # === Errors ===
+
+    def error(self, message: str, token: Optional[Token] = None) -> ParseError:
+        """A ``ParseError`` at ``token`` (default: the current token)."""
+        return ParseError(message, token or self.peek())
+
+    @staticmethod
+    def describe(token: Token) -> str:
+        """How a token is named in error messages."""
+        if token.type == TokenType.EOF:
+            return "end of input"
+        return f"'{token.value}'"
+
+    def expect(self, value: str) -> Token:
+        """Consume the token ``value`` or raise ``ParseError``."""
+        if self.peek().value != value:
+            raise self.error(f"Expected '{value}', found {self.describe(self.peek())}")
+        return self.advance()
+
+    def expect_expression(self, where: str) -> ASTNode:
+        """Parse an expression that must be present, or raise ``ParseError``."""
+        expr = self.parse_expression()
+        if expr is None:
+            raise self.error(f"Expected an expression {where}, found {self.describe(self.peek())}")
+        return expr
+
+    # === Tokens ===
+
+    def original(self, token: Token) -> str:
+        """Original keyword for a keyword token, else the token text."""
+        if token.type == TokenType.KEYWORD:
+            return self.compiled.original_keyword(token.value) or token.value
+        return token.value
+
+    def is_assignment_ahead(self) -> bool:
+        """True if the next tokens are ``identifier =``."""
+        if self.peek().type != TokenType.IDENTIFIER:
+            return False
+        following = self.tokens[self.current + 1] if self.current + 1 < len(self.tokens) else None
+        return (
+            following is not None
+            and following.type == TokenType.OPERATOR
+            and following.value == "="
+        )
+
     def peek(self) -> Token:
         """Look at current token without consuming it."""
         if self.current < len(self.tokens):
@@ -496,14 +748,12 @@ class ParserGenerator:
     @property
     def keywords(self) -> List[str]:
         """Get list of custom keywords."""
-        return [kw.custom for kw in self.config.keyword_mappings.values()]
+        return list(self.config.compiled().keywords)
 
     @property
     def operators(self) -> List[str]:
-        """Get list of operators."""
-        if self.config.operators:
-            return [op.symbol for op in self.config.operators.values()]
-        return []
+        """Get list of operators (longest first)."""
+        return list(self.config.compiled().operators)
 
 
 def generate_parser(config: LanguageConfig) -> ParserGenerator:
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Pass Manager with Cached Analyses
+
+Code generators, the type checker and the LSP all need the same facts about
+an AST (symbols, definitions, inferred types, control flow, variable slots). A ``PassManager`` computes
+each analysis once per AST version, in dependency order, and shares it
+between consumers. Transform passes declare which aspects of the tree they
+change, and only analyses that read those aspects are recomputed.
+
+Features:
+    - Named analyses with declared prerequisites (resolved topologically)
+    - Results cached per AST until invalidated
+    - Aspect-based invalidation: "expressions", "control_flow", "declarations"
+    - Runs ``ast_optimizer`` transforms and keeps the cache in sync
+    - Works with both ``ast_integration`` and ``parser_generator`` nodes
+    - Hit/miss statistics
+
+Usage:
+    from parsercraft.pass_manager import PassManager
+
+    manager = PassManager(config)
+    symbols = manager.get(ast, "symbols")       # computed
+    symbols = manager.get(ast, "symbols")       # cached
+
+    manager.run(ast, ["constant_folding", "cfg"])  # transforms + analyses
+    manager.invalidate(ast)                     # after editing ast by hand
+
+    # Share it with backends
+    ASTToCGenerator(config, pass_manager=manager).translate(ast)
+
+Custom analyses:
+    manager.register_analysis(
+        "call_graph", build_call_graph,
+        requires=("symbols",), depends_on={"expressions", "declarations"},
+    )
+"""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .ast_optimizer import (
+    AST_ASPECTS,
+    PASS_REGISTRY,
+    OptimizationPass,
+    assign_target,
+    function_name,
+    function_params,
+    node_attrs,
+    node_kind,
+)
+
+
+@dataclass(frozen=True)
+class AnalysisInfo:
+    """A registered analysis.
+
+    ``compute(ast, manager)`` returns the result; it may call
+    ``manager.get`` for the analyses listed in ``requires``. ``depends_on``
+    names the AST aspects whose change makes the result stale.
+    """
+
+    name: str
+    compute: Callable[[Any, "PassManager"], Any]
+    requires: Tuple[str, ...] = ()
+    depends_on: FrozenSet[str] = AST_ASPECTS
+
+
+class _ASTState:
+    """Cached results for one AST object."""
+
+    __slots__ = ("version", "results")
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.results: Dict[str, Any] = {}
+
+
+# === Built-in Analyses ===
+
+
+def _symbols_analysis(ast: Any, _manager: PassManager) -> Any:
+    """Functions and global declarations, as an ``ast_integration.SymbolTable``.
+
+    Function return types are recorded as written (None when absent) so each
+    backend can apply its own default.
+    """
+    from .ast_integration import SymbolTable, TypeInfo
+
+    table = SymbolTable()
+    stack = [(ast, True)]
+    while stack:
+        node, top_level = stack.pop()
+        kind = node_kind(node)
+        if kind == "function":
+            table.declare_function(
+                function_name(node),
+                function_params(node),
+                node_attrs(node).get("return_type"),
+            )
+            top_level = False
+        elif kind == "assign" and top_level:
+            name = assign_target(node)
+            if name:
+                table.declare(name, TypeInfo(node_attrs(node).get("type", "any")))
+        for child in reversed(node.children):
+            stack.append((child, top_level))
+    return table
+
+
+class Definition(NamedTuple):
+    """A function (at any depth) or module-level variable and its defining node."""
+
+    name: str
+    kind: str  # "function" or "variable"
+    node: Any
+
+
+def _definitions_analysis(ast: Any, _manager: PassManager) -> List[Definition]:
+    """Definitions in source order; the first assignment defines a variable."""
+    definitions: List[Definition] = []
+    seen = set()
+    stack = [(ast, True)]
+    while stack:
+        node, top_level = stack.pop()
+        kind = node_kind(node)
+        if kind == "function":
+            definitions.append(Definition(function_name(node), "function", node))
+            top_level = False
+        elif kind == "assign" and top_level:
+            name = assign_target(node)
+            if name and name not in seen:
+                seen.add(name)
+                definitions.append(Definition(name, "variable", node))
+        for child in reversed(node.children):
+            stack.append((child, top_level))
+    return definitions
+
+
+def _types_analysis(ast: Any, manager: PassManager) -> Any:
+    """The ``ast_integration.TypeInferencePass`` after inferring ``ast``.
+
+    Query it with ``type_of(node)``, ``binding_type(layout, name)`` and
+    ``return_type(function)``; ``type_map`` has the per-name summary.
+    """
+    from .ast_integration import TypeInferencePass
+
+    inference = TypeInferencePass()
+    inference.infer(ast, manager.get(ast, "resolution"))
+    return inference
+
+
+def _cfg_analysis(ast: Any, _manager: PassManager) -> Any:
+    from .ast_integration import ControlFlowAnalyzer
+
+    return ControlFlowAnalyzer().analyze(ast)
+
+
+def _resolution_analysis(ast: Any, _manager: PassManager) -> Any:
+    from .resolver import Resolver
+
+    return Resolver().resolve(ast)
+
+
+DEFAULT_ANALYSES: Tuple[AnalysisInfo, ...] = (
+    AnalysisInfo("symbols", _symbols_analysis, depends_on=frozenset({"declarations"})),
+    AnalysisInfo(
+        "definitions", _definitions_analysis, depends_on=frozenset({"declarations"})
+    ),
+    # Keyed by node identity through the resolution it is built on
+    AnalysisInfo("types", _types_analysis, requires=("resolution",)),
+    # Tail calls are recorded by node identity, so expression rewrites count
+    AnalysisInfo(
+        "cfg", _cfg_analysis, depends_on=frozenset({"control_flow", "expressions"})
+    ),
+    # Refers to nodes by identity, so any rewrite makes it stale
+    AnalysisInfo("resolution", _resolution_analysis),
+)
+
+
+class PassManager:
+    """Runs analyses and transforms over ASTs, caching analysis results."""
+
+    def __init__(self, config: Any = None):
+        self.config = config
+        self.analyses: Dict[str, AnalysisInfo] = {
+            info.name: info for info in DEFAULT_ANALYSES
+        }
+        self._states: Dict[int, Tuple[weakref.ref, _ASTState]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # === Registration ===
+
+    def register_analysis(
+        self,
+        name: str,
+        compute: Callable[[Any, PassManager], Any],
+        requires: Iterable[str] = (),
+        depends_on: Iterable[str] = AST_ASPECTS,
+    ) -> None:
+        """Add (or replace) an analysis."""
+        depends_on = frozenset(depends_on)
+        unknown = depends_on - AST_ASPECTS
+        if unknown:
+            raise ValueError(f"Unknown AST aspects: {', '.join(sorted(unknown))}")
+        self.analyses[name] = AnalysisInfo(name, compute, tuple(requires), depends_on)
+        for _, state in self._states.values():
+            self._drop(state, {name})
+
+    # === Per-AST State ===
+
+    def _state(self, ast: Any) -> _ASTState:
+        key = id(ast)
+        entry = self._states.get(key)
+        if entry is not None and entry[0]() is ast:
+            return entry[1]
+
+        state = _ASTState()
+        states = self._states
+
+        def forget(_ref: weakref.ref, key: int = key) -> None:
+            current = states.get(key)
+            if current is not None and current[0] is _ref:
+                del states[key]
+
+        self._states[key] = (weakref.ref(ast, forget), state)
+        return state
+
+    def version(self, ast: Any) -> int:
+        """Number of recorded changes to ``ast``."""
+        return self._state(ast).version
+
+    def cached(self, ast: Any) -> List[str]:
+        """Names of analyses currently cached for ``ast``."""
+        return list(self._state(ast).results)
+
+    # === Analyses ===
+
+    def get(self, ast: Any, name: str) -> Any:
+        """Result of analysis ``name`` for ``ast``, computing it if needed."""
+        return self._get(ast, self._state(ast), name, ())
+
+    def _get(self, ast: Any, state: _ASTState, name: str, active: Tuple[str, ...]) -> Any:
+        if name in state.results:
+            self.hits += 1
+            return state.results[name]
+
+        info = self.analyses.get(name)
+        if info is None:
+            raise ValueError(f"Unknown analysis: {name}")
+        if name in active:
+            cycle = " -> ".join(active + (name,))
+            raise ValueError(f"Cyclic analysis dependency: {cycle}")
+
+        for required in info.requires:
+            self._get(ast, state, required, active + (name,))
+
+        self.misses += 1
+        result = info.compute(ast, self)
+        state.results[name] = result
+        return result
+
+    def invalidate(self, ast: Any, changes: Optional[Iterable[str]] = None) -> None:
+        """Record a change to ``ast`` and drop analyses that read it.
+
+        ``changes`` lists the affected aspects; None means everything.
+        """
+        state = self._state(ast)
+        state.version += 1
+        changed = AST_ASPECTS if changes is None else frozenset(changes)
+        stale = {
+            name
+            for name in state.results
+            if name not in self.analyses or self.analyses[name].depends_on & changed
+        }
+        self._drop(state, stale)
+
+    def _drop(self, state: _ASTState, stale: Iterable[str]) -> None:
+        # Anything computed from a stale analysis is stale too
+        pending = [name for name in stale if name in state.results]
+        while pending:
+            name = pending.pop()
+            if name not in state.results:
+                continue
+            del state.results[name]
+            self.invalidations += 1
+            for dependent in list(state.results):
+                info = self.analyses.get(dependent)
+                if info is None or name in info.requires:
+                    pending.append(dependent)
+
+    def clear(self, ast: Any = None) -> None:
+        """Forget cached results for ``ast`` (or for every AST)."""
+        if ast is None:
+            self._states.clear()
+        else:
+            self._states.pop(id(ast), None)
+
+    # === Running Passes ===
+
+    def run(
+        self, ast: Any, passes: Iterable[Union[str, OptimizationPass]]
+    ) -> Dict[str, Any]:
+        """Run analyses and transforms in order.
+
+        Names of analyses return their (possibly cached) result; transforms
+        (``ast_optimizer`` pass names or instances) return their rewrite
+        count and invalidate what they declare they change.
+        """
+        results: Dict[str, Any] = {}
+        for item in passes:
+            if isinstance(item, OptimizationPass):
+                results[item.name] = self._transform(ast, item)
+            elif item in self.analyses:
+                results[item] = self.get(ast, item)
+            elif item in PASS_REGISTRY:
+                results[item] = self._transform(ast, PASS_REGISTRY[item](self.config))
+            else:
+                raise ValueError(f"Unknown pass or analysis: {item}")
+        return results
+
+    def _transform(self, ast: Any, opt_pass: OptimizationPass) -> int:
+        for required in getattr(opt_pass, "requires", ()):
+            self.get(ast, required)
+        rewrites = opt_pass.run(ast)
+        if rewrites:
+            self.invalidate(ast, opt_pass.changes)
+        return rewrites
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Cache counters for this manager."""
+        total = self.hits + self.misses
+        return {
+            "asts": len(self._states),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
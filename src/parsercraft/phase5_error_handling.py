@@ -18,6 +18,7 @@ from parsercraft.ast_integration import (
     TypeInferencePass,
     ControlFlowAnalyzer,
 )
+from parsercraft.pass_manager import PassManager
 from parsercraft.protocol_type_integration import ProtocolTypeIntegration
 from parsercraft.lsp_integration import LSPFeaturesIntegration
 from parsercraft.registry_backend import RemotePackageRegistry
@@ -115,6 +116,15 @@ class ASTIntegrationErrorHandler:
             )
             raise
 
+    def run_analysis(self, pass_manager: PassManager, ast: Any, name: str) -> Any:
+        """Fetch a shared analysis from ``pass_manager`` with error handling.
+
+        Results are cached by the pass manager, so wrapped consumers no
+        longer re-walk the AST with their own visitors.
+        """
+        with self.handle_type_inference_error():
+            return pass_manager.get(ast, name)
+
 
 class ProtocolTypeErrorHandler:
     """Error handling for protocol type integration."""
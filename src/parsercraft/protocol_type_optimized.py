@@ -5,12 +5,12 @@ Performance improvements:
 - Memoization cache for protocol conformance checks
 - Lazy evaluation of structural compatibility
 - Index-based protocol lookup
-- Pre-computed method signature hashes
+- Requirement bitmasks: conformance decided by a bitwise AND when
+  the protocol has no properties or optional methods
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -19,28 +19,16 @@ from parsercraft.protocol_type_integration import (
     ProtocolBinding,
     TypeCompatibilityResult,
 )
-from parsercraft.protocols import MethodSignature, Protocol
+from parsercraft.protocols import MethodSignature, Protocol, ProtocolIndex
 from parsercraft.type_system import Type, TypeKind
 
 
-@dataclass
-class _MethodHash:
-    """Pre-computed hash for method signatures."""
-
-    name: str
-    return_type: str
-    param_types: Tuple[str, ...] = field(default_factory=tuple)
-
-    def __hash__(self) -> int:
-        return hash((self.name, self.return_type, self.param_types))
-
-
 class OptimizedProtocolTypeIntegration(BaseProtocolTypeIntegration):
     """
     Performance-optimized protocol type integration.
 
     Optimizations:
-    1. Method signature hashing for O(1) lookup
+    1. Requirement bitmasks (ProtocolIndex) for conformance by bitwise AND
     2. Protocol conformance memoization
     3. Early termination on incompatibility
     4. Lazy structural type evaluation
@@ -48,20 +36,36 @@ class OptimizedProtocolTypeIntegration(BaseProtocolTypeIntegration):
 
     def __init__(self, type_checker=None):
         super().__init__(type_checker)
-        self._protocol_method_cache: Dict[str, Set[_MethodHash]] = {}
+        # Optional methods may be missing, as in check_protocol_conformance
+        self._protocol_index = ProtocolIndex(optional_methods=True)
         self._conformance_cache: Dict[Tuple[str, str], bool] = {}
         self._incompatibility_cache: Dict[Tuple[str, str], Set[str]] = {}
 
     def register_protocol(self, protocol: Protocol) -> None:
-        """Register protocol with method caching."""
+        """Register protocol and index its requirements."""
         super().register_protocol(protocol)
+        self._protocol_index.add(protocol)
+        # Results for this name may have been for an older definition
+        self.clear_caches()
 
-        # Pre-compute method hashes for O(1) lookup
-        method_hashes = set()
-        for name, sig in protocol.methods.items():
-            method_hashes.add(_MethodHash(name=name, return_type=sig.return_type))
-
-        self._protocol_method_cache[protocol.name] = method_hashes
+    def check_protocol_conformance(
+        self,
+        type_: Type,
+        protocol: Protocol,
+        environment=None,
+    ) -> TypeCompatibilityResult:
+        """Check conformance, by bitmask when the index decides it alone."""
+        index = self._protocol_index
+        if protocol.name in index.exact and index.protocols[protocol.name] is protocol:
+            struct_type = self.extract_type_structure(type_, environment)
+            if struct_type is not None and index.meets(struct_type, protocol.name):
+                return TypeCompatibilityResult(
+                    compatible=True,
+                    reason=f"Type conforms to protocol {protocol.name}",
+                )
+        # Non-conforming (or not decidable by mask): the full check lists
+        # what is missing
+        return super().check_protocol_conformance(type_, protocol, environment)
 
     def check_type_compatibility(
         self,
@@ -100,7 +104,8 @@ class OptimizedProtocolTypeIntegration(BaseProtocolTypeIntegration):
     def get_cache_stats(self) -> Dict[str, int]:
         """Return cache statistics for monitoring."""
         return {
-            "protocol_methods": len(self._protocol_method_cache),
+            "protocol_methods": len(self._protocol_index.bits),
+            "indexed_protocols": len(self._protocol_index),
             "conformance_cached": len(self._conformance_cache),
             "incompatibilities_cached": len(self._incompatibility_cache),
         }
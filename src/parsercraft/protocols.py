@@ -11,6 +11,8 @@ Features:
     - Protocol composition
     - Method signature compatibility
     - Runtime protocol checking
+    - Bitset protocol index: matching against many protocols is a
+      bitwise AND per protocol, with detailed checks only for candidates
 
 Usage:
     from parsercraft.protocols import Protocol, ProtocolChecker
@@ -141,15 +143,142 @@ class StructuralType:
         )
 
 
+def _method_key(name: str, method: MethodSignature) -> Tuple[Any, ...]:
+    return (
+        "method",
+        name,
+        tuple(param_type for _, param_type in method.parameter_types),
+        method.return_type,
+    )
+
+
+class ProtocolIndex:
+    """Bitset index of protocol requirements.
+
+    Every distinct requirement gets one bit. A requirement is either a
+    method (name, parameter types, return type) or a required property
+    name. A protocol is stored as the mask of its requirements. A
+    structural type maps to the mask of the requirements it meets. One of
+    its methods meets every indexed signature with the same name that it
+    matches (``signature_matches``, so ``Any`` still matches anything).
+    A protocol is a candidate for a type when ``protocol & type == protocol``.
+
+    Method bits are exact, but properties are only checked for presence.
+    A protocol is in ``exact`` when its mask decides conformance on its
+    own, which is when it has no properties or skipped optional methods.
+    If ``optional_methods`` is set, optional methods are not required
+    (as in ``ProtocolTypeIntegration``). Otherwise every method is
+    required (as in ``ProtocolChecker``). Protocols are assumed not to
+    change after they are added.
+    """
+
+    def __init__(self, optional_methods: bool = False):
+        self.optional_methods = optional_methods
+        self.bits: Dict[Tuple[Any, ...], int] = {}
+        self.protocols: Dict[str, Protocol] = {}
+        self.masks: Dict[str, int] = {}
+        self.exact: Set[str] = set()
+        # method name -> indexed signatures of that name and their bits
+        self._signatures: Dict[str, List[Tuple[MethodSignature, int]]] = {}
+        # method key of an implementation -> bits it meets
+        self._met: Dict[Tuple[Any, ...], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def add(self, protocol: Protocol) -> None:
+        """Index ``protocol``, replacing one of the same name."""
+        mask = 0
+        exact = not protocol.properties
+        for name, method in protocol.methods.items():
+            if self.optional_methods and method.is_optional:
+                exact = False
+                continue
+            mask |= self._method_bit(name, method)
+        for name, prop in protocol.properties.items():
+            if not prop.is_optional:
+                mask |= self._bit(("property", name))
+
+        self.protocols[protocol.name] = protocol
+        self.masks[protocol.name] = mask
+        if exact:
+            self.exact.add(protocol.name)
+        else:
+            self.exact.discard(protocol.name)
+
+    def remove(self, name: str) -> None:
+        """Drop a protocol; its bits stay allocated."""
+        self.protocols.pop(name, None)
+        self.masks.pop(name, None)
+        self.exact.discard(name)
+
+    def type_mask(self, struct_type: StructuralType) -> int:
+        """Mask of the indexed requirements ``struct_type`` meets."""
+        mask = 0
+        for name, method in struct_type.methods.items():
+            key = _method_key(name, method)
+            met = self._met.get(key)
+            if met is None:
+                met = 0
+                for required, bit in self._signatures.get(name, ()):
+                    if required.signature_matches(method):
+                        met |= bit
+                if len(self._met) >= 65536:
+                    self._met.clear()
+                self._met[key] = met
+            mask |= met
+        for name in struct_type.properties:
+            mask |= self.bits.get(("property", name), 0)
+        return mask
+
+    def candidates(self, struct_type: StructuralType) -> List[str]:
+        """Protocols (in registration order) whose requirements are all met."""
+        met = self.type_mask(struct_type)
+        return [name for name, mask in self.masks.items() if mask & met == mask]
+
+    def meets(self, struct_type: StructuralType, name: str) -> bool:
+        """Whether ``struct_type`` meets every indexed requirement of ``name``."""
+        mask = self.masks.get(name)
+        return mask is not None and mask & self.type_mask(struct_type) == mask
+
+    def stats(self) -> Dict[str, int]:
+        """Index sizes."""
+        return {
+            "protocols": len(self.masks),
+            "exact": len(self.exact),
+            "bits": len(self.bits),
+            "memoized_methods": len(self._met),
+        }
+
+    def _bit(self, key: Tuple[Any, ...]) -> int:
+        bit = self.bits.get(key)
+        if bit is None:
+            bit = 1 << len(self.bits)
+            self.bits[key] = bit
+        return bit
+
+    def _method_bit(self, name: str, method: MethodSignature) -> int:
+        key = _method_key(name, method)
+        bit = self.bits.get(key)
+        if bit is None:
+            bit = self._bit(key)
+            self._signatures.setdefault(name, []).append((method, bit))
+            # Implementations seen so far may meet the new signature
+            self._met.clear()
+        return bit
+
+
 class ProtocolChecker:
     """Validates structural type compatibility with protocols."""
 
     def __init__(self):
         self.protocol_cache: Dict[str, Protocol] = {}
+        self.index = ProtocolIndex()
 
     def register_protocol(self, protocol: Protocol) -> None:
         """Register a protocol."""
         self.protocol_cache[protocol.name] = protocol
+        self.index.add(protocol)
 
     def conforms_to_protocol(
         self,
@@ -237,10 +366,26 @@ class ProtocolChecker:
     def find_matching_protocols(
         self, struct_type: StructuralType
     ) -> List[str]:
-        """Find which protocols a type conforms to."""
+        """Find which protocols a type conforms to.
+
+        The index rules out protocols with a requirement the type does not
+        meet. The remaining candidates get the full check unless their
+        mask alone decides conformance.
+        """
+        index = self.index
+        if len(index) != len(self.protocol_cache):
+            # Protocols were put in protocol_cache directly; reindex
+            index = self.index = ProtocolIndex()
+            for protocol in self.protocol_cache.values():
+                index.add(protocol)
+
         matching = []
-        for protocol_name, protocol in self.protocol_cache.items():
-            if self.conforms_to_protocol(struct_type, protocol):
+        for protocol_name in index.candidates(struct_type):
+            protocol = self.protocol_cache.get(protocol_name)
+            if protocol is None:
+                continue
+            exact = protocol_name in index.exact and index.protocols[protocol_name] is protocol
+            if exact or self.conforms_to_protocol(struct_type, protocol):
                 matching.append(protocol_name)
         return matching
 
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Slot Resolver for Guest-Language Variables
+
+Assigns every variable a ``(depth, slot)`` address at compile time so an
+executor can store locals in fixed-size lists instead of walking a chain of
+dict scopes on each access. ``depth`` counts lexical function boundaries
+between a use and its binding (0 = the current frame); ``slot`` indexes the
+binding frame's list.
+
+Features:
+    - One ``FrameLayout`` per function (parameters first) and for the module
+    - ``SlotRef`` for every identifier, assignment, call and function binding
+    - Names bound nowhere are reported as free (builtins or errors)
+    - Function locals used by nested functions are listed per layout
+    - Works with both ``ast_integration`` and ``parser_generator`` nodes
+
+Usage:
+    from parsercraft.resolver import Frame, Resolver
+
+    resolution = Resolver().resolve(ast)
+    layout = resolution.layout_for(function_node)   # slots: ["n", "acc"]
+    ref = resolution.ref_for(identifier_node)       # SlotRef(depth=0, slot=1)
+
+    frame = Frame(layout.new_slots(), parent=closure_frame)
+
+Scoping rules:
+    Blocks do not introduce scopes. Inside a function a name is local if it
+    is a parameter, declared (``variable_declaration``), defined as a nested
+    function, or assigned without being bound by an enclosing scope; other
+    assignments write the enclosing binding. Every module-level binding is
+    a module slot.
+
+A resolution refers to nodes by identity; rerun the resolver (or use the
+``resolution`` analysis of a ``PassManager``) after transforming the AST.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set
+
+from .ast_optimizer import (
+    assign_target,
+    function_name,
+    function_params,
+    name_of,
+    node_attrs,
+    node_kind,
+)
+
+_DECLARATION_TYPES = frozenset({"variable_declaration"})
+
+
+class _Unset:
+    """Marker stored in slots that have not been assigned yet."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<unset>"
+
+
+UNSET = _Unset()
+
+
+class SlotRef(NamedTuple):
+    """Address of a variable: frames to walk outward, then list index."""
+
+    depth: int
+    slot: int
+
+
+@dataclass
+class FrameLayout:
+    """Slot assignment for one function (or the module)."""
+
+    name: str
+    params: List[str]
+    names: List[str]  # slot -> name; parameters first
+    depth: int  # lexical nesting; 0 for the module
+    captured: Set[str] = field(default_factory=set)
+
+    @property
+    def size(self) -> int:
+        return len(self.names)
+
+    @property
+    def locals(self) -> List[str]:
+        """Non-parameter slots, in slot order."""
+        return self.names[len(self.params):]
+
+    def slot(self, name: str) -> Optional[int]:
+        try:
+            return self.names.index(name)
+        except ValueError:
+            return None
+
+    def new_slots(self) -> List[Any]:
+        """A fresh, unassigned slot list for a frame of this layout."""
+        return [UNSET] * len(self.names)
+
+
+class Frame:
+    """Activation record: fixed-size slot list plus the lexical parent."""
+
+    __slots__ = ("slots", "parent")
+
+    def __init__(self, slots: List[Any], parent: Optional[Frame] = None):
+        self.slots = slots
+        self.parent = parent
+
+    def load(self, ref: SlotRef) -> Any:
+        frame = self
+        for _ in range(ref.depth):
+            frame = frame.parent
+        return frame.slots[ref.slot]
+
+    def store(self, ref: SlotRef, value: Any) -> None:
+        frame = self
+        for _ in range(ref.depth):
+            frame = frame.parent
+        frame.slots[ref.slot] = value
+
+
+class Resolution:
+    """Result of resolving one AST."""
+
+    def __init__(self, module: FrameLayout):
+        self.module = module
+        self.layouts: Dict[int, FrameLayout] = {}
+        self.refs: Dict[int, SlotRef] = {}
+        self.free: Set[str] = set()
+
+    def layout_for(self, node: Any) -> FrameLayout:
+        """Layout of a function node, or of the module for the root."""
+        return self.layouts[id(node)]
+
+    def ref_for(self, node: Any) -> Optional[SlotRef]:
+        """Slot address used by a node; None for free names."""
+        return self.refs.get(id(node))
+
+    def get_stats(self) -> Dict[str, Any]:
+        layouts = list(self.layouts.values())
+        return {
+            "functions": len(layouts) - 1,
+            "slots": sum(layout.size for layout in layouts),
+            "references": len(self.refs),
+            "free_names": sorted(self.free),
+        }
+
+
+def _scope_nodes(node: Any) -> Iterator[Any]:
+    """Preorder walk of a scope body, yielding nested functions unopened."""
+    stack = list(reversed(node.children))
+    while stack:
+        current = stack.pop()
+        yield current
+        if node_kind(current) != "function":
+            stack.extend(reversed(current.children))
+
+
+class Resolver:
+    """Computes a ``Resolution`` for an AST."""
+
+    def resolve(self, ast: Any) -> Resolution:
+        module = self._layout(ast, "<module>", [], 0, None)
+        resolution = Resolution(module)
+        self._resolve_scope(ast, [module], resolution)
+        return resolution
+
+    def _layout(
+        self, node: Any, name: str, params: List[str], depth: int,
+        enclosing: Optional[List[FrameLayout]],
+    ) -> FrameLayout:
+        names = list(dict.fromkeys(params))
+        seen = set(names)
+
+        def bind(candidate: Optional[str]) -> None:
+            if candidate and candidate not in seen:
+                seen.add(candidate)
+                names.append(candidate)
+
+        for current in _scope_nodes(node):
+            kind = node_kind(current)
+            if kind == "function":
+                bind(function_name(current))
+            elif kind == "assign":
+                target = assign_target(current)
+                if (
+                    enclosing is None
+                    or current.node_type in _DECLARATION_TYPES
+                    or node_attrs(current).get("declaration")
+                    or not any(target in layout.names for layout in enclosing)
+                ):
+                    bind(target)
+        return FrameLayout(name, list(params), names, depth)
+
+    def _lookup(self, name: str, chain: List[FrameLayout]) -> Optional[SlotRef]:
+        for depth, layout in enumerate(reversed(chain)):
+            slot = layout.slot(name)
+            if slot is not None:
+                if depth and layout.depth:
+                    layout.captured.add(name)
+                return SlotRef(depth, slot)
+        return None
+
+    def _resolve_scope(
+        self, node: Any, chain: List[FrameLayout], resolution: Resolution
+    ) -> None:
+        resolution.layouts[id(node)] = chain[-1]
+        for current in _scope_nodes(node):
+            kind = node_kind(current)
+            if kind == "function":
+                name = function_name(current)
+            elif kind == "assign":
+                name = assign_target(current)
+            elif kind == "name":
+                name = name_of(current)
+            elif kind == "call":
+                name = node_attrs(current).get("name") or current.value
+            else:
+                continue
+
+            ref = self._lookup(name, chain) if name else None
+            if ref is not None:
+                resolution.refs[id(current)] = ref
+            elif name:
+                resolution.free.add(name)
+
+            if kind == "function":
+                layout = self._layout(
+                    current, name, function_params(current), len(chain), chain
+                )
+                self._resolve_scope(current, chain + [layout], resolution)
+
+
+def resolve(ast: Any) -> Resolution:
+    """Resolve ``ast`` with a default ``Resolver``."""
+    return Resolver().resolve(ast)
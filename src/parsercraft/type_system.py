@@ -7,7 +7,10 @@ Enables type annotations, type inference, and static analysis for custom languag
 Features:
     - Type annotations: `var: int = 5`
     - Type inference: Automatic type deduction
-    - Static type checking: Before runtime validation
+    - Static type checking: Before runtime validation, on the parsed AST
+      (undefined names, call arity, operand types, type changes)
+    - Module exports (``checker.exports``) for checking importers; see
+      ``typecheck_cache`` for per-file result caching across runs
     - Type errors and warnings: Clear error messages
     - Type aliases and generics
     - Structural typing and protocols
@@ -23,6 +26,12 @@ Usage:
     if errors:
         for error in errors:
             print(f"{error.location}: {error.message}")
+
+    # Share scope resolution with other PassManager consumers
+    manager = PassManager(language_config)
+    checker = TypeChecker(language_config, pass_manager=manager)
+    ast, import_statements = parse_module(language_config, source)
+    errors = checker.check_ast(ast, "program.lang", import_statements)
 """
 
 from __future__ import annotations
@@ -31,7 +40,25 @@ import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .ast_optimizer import (
+    assign_target,
+    assign_value,
+    function_name,
+    function_params,
+    if_parts,
+    literal_value,
+    name_of,
+    nested_functions,
+    node_attrs,
+    node_kind,
+)
+from .module_system import ModuleImport, ModuleLoader
+from .parser_generator import ParseError, ParserGenerator
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .pass_manager import PassManager
 
 
 class TypeKind(Enum):
@@ -57,7 +84,14 @@ class TypeKind(Enum):
 
 @dataclass
 class Type:
-    """Represents a type in the system."""
+    """Represents a type in the system.
+
+    The constructors (``Type.int()``, ``Type.list(...)``, ...) return
+    interned instances: one shared, immutable object per structure (see
+    ``TypeInterner``). Types built directly with ``Type(...)`` are ordinary
+    mutable objects until passed to ``intern_type``. Equality is structural
+    either way; between interned types it is identity.
+    """
 
     kind: TypeKind
     name: str = ""
@@ -65,6 +99,45 @@ class Type:
     nullable: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if "_hash" in self.__dict__:
+            raise AttributeError(f"Interned type {self} is immutable")
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies and unpickled types are not the canonical instance
+        state = dict(self.__dict__)
+        state.pop("_hash", None)
+        return state
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Type):
+            return NotImplemented
+        if self.metadata or other.metadata:
+            return (
+                self.kind == other.kind
+                and self.name == other.name
+                and self.nullable == other.nullable
+                and list(self.type_args) == list(other.type_args)
+                and self.metadata == other.metadata
+            )
+        return intern_type(self) is intern_type(other)
+
+    def __hash__(self) -> int:
+        cached = self.__dict__.get("_hash")
+        if cached is not None:
+            return cached
+        if self.metadata:
+            return hash((self.kind, self.name, self.nullable))
+        return hash(intern_type(self))
+
+    @property
+    def interned(self) -> bool:
+        """Whether this is the canonical instance of its structure."""
+        return "_hash" in self.__dict__
+
     def __str__(self) -> str:
         """String representation of type."""
         if self.kind == TypeKind.GENERIC and self.type_args:
@@ -82,7 +155,18 @@ class Type:
         return self.name or self.kind.value
 
     def is_compatible_with(self, other: Type) -> bool:
-        """Check if this type is compatible with another."""
+        """Check if this type is compatible with another.
+
+        Memoized by the interner; repeated checks are a dict lookup.
+        """
+        interner = _INTERNER
+        result = interner.compatibility.get((id(self), id(other)))
+        if result is None:
+            return interner.compatible(self, other)
+        interner.memo_hits += 1
+        return result
+
+    def _structurally_compatible(self, other: Type) -> bool:
         if self.kind == TypeKind.ANY or other.kind == TypeKind.ANY:
             return True
         if self.kind == other.kind:
@@ -96,37 +180,240 @@ class Type:
             return self.type_args[0].is_compatible_with(other)
         return False
 
+    @staticmethod
+    def any() -> Type:
+        return _INTERNER.make(TypeKind.ANY, "any")
+
+    @staticmethod
+    def none() -> Type:
+        return _INTERNER.make(TypeKind.NONE, "none")
+
     @staticmethod
     def int() -> Type:
-        return Type(kind=TypeKind.INT, name="int")
+        return _INTERNER.make(TypeKind.INT, "int")
 
     @staticmethod
     def float() -> Type:
-        return Type(kind=TypeKind.FLOAT, name="float")
+        return _INTERNER.make(TypeKind.FLOAT, "float")
 
     @staticmethod
     def str() -> Type:
-        return Type(kind=TypeKind.STR, name="str")
+        return _INTERNER.make(TypeKind.STR, "str")
 
     @staticmethod
     def bool() -> Type:
-        return Type(kind=TypeKind.BOOL, name="bool")
+        return _INTERNER.make(TypeKind.BOOL, "bool")
 
     @staticmethod
     def list(element_type: Type) -> Type:
-        return Type(kind=TypeKind.LIST, name="list", type_args=[element_type])
+        return _INTERNER.make(TypeKind.LIST, "list", (element_type,))
 
     @staticmethod
     def dict(key_type: Type, value_type: Type) -> Type:
-        return Type(kind=TypeKind.DICT, name="dict", type_args=[key_type, value_type])
+        return _INTERNER.make(TypeKind.DICT, "dict", (key_type, value_type))
 
     @staticmethod
     def optional(inner_type: Type) -> Type:
-        return Type(kind=TypeKind.OPTIONAL, name=f"{inner_type}?", type_args=[inner_type], nullable=True)
+        return _INTERNER.make(TypeKind.OPTIONAL, f"{inner_type}?", (inner_type,), nullable=True)
 
     @staticmethod
     def union(*types: Type) -> Type:
-        return Type(kind=TypeKind.UNION, name=" | ".join(str(t) for t in types), type_args=list(types))
+        """Union of ``types``: nested unions flattened, members deduplicated
+        and sorted; a single member is returned as is."""
+        return _INTERNER.make(TypeKind.UNION, "", types)
+
+
+class TypeInterner:
+    """Hash-consing table for ``Type``: one canonical instance per structure.
+
+    Canonical types are immutable, carry a precomputed hash and have
+    canonical arguments, so they are keyed by the identity of those
+    arguments and compare by identity. Unions are flattened, deduplicated
+    and sorted, so ``int | str`` and ``str | (int | str)`` are one object.
+    Types with ``metadata`` are not interned (it is not part of the
+    structure). Compatibility results are memoized per interned pair in a
+    table of at most ``memo_limit`` entries (oldest evicted first).
+    """
+
+    def __init__(self, memo_limit: int = 65536):
+        self.memo_limit = memo_limit
+        self.types: Dict[Tuple[Any, ...], Type] = {}
+        self.compatibility: Dict[Tuple[int, int], bool] = {}  # ids of interned pairs
+        self.parsed: Dict[str, Type] = {}
+        self.created = 0
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def make(
+        self,
+        kind: TypeKind,
+        name: str,
+        type_args: Tuple[Type, ...] = (),
+        nullable: bool = False,
+    ) -> Type:
+        """The canonical type with this structure."""
+        args = tuple(arg if "_hash" in arg.__dict__ else self.intern(arg) for arg in type_args)
+        if kind == TypeKind.UNION:
+            members: Dict[Type, None] = {}
+            for arg in args:
+                for member in arg.type_args if arg.kind == TypeKind.UNION else (arg,):
+                    members[member] = None
+            args = tuple(sorted(members, key=lambda member: (str(member), member.kind.value)))
+            if len(args) == 1:
+                return args[0]
+            name = " | ".join(str(member) for member in args)
+
+        key = (kind, name, tuple(map(id, args)), nullable)
+        canonical = self.types.get(key)
+        if canonical is None:
+            canonical = Type(kind=kind, name=name, type_args=args, nullable=nullable)
+            object.__setattr__(canonical, "_hash", hash(key))
+            self.types[key] = canonical  # keeps the argument objects (and so the ids) alive
+            self.created += 1
+        return canonical
+
+    def intern(self, type_: Type) -> Type:
+        """The canonical instance structurally equal to ``type_``."""
+        if "_hash" in type_.__dict__ or type_.metadata:
+            return type_
+        return self.make(type_.kind, type_.name, tuple(type_.type_args), type_.nullable)
+
+    def compatible(self, source: Type, target: Type) -> bool:
+        """``source.is_compatible_with(target)``, memoized on interned pairs."""
+        if source is target:
+            return True
+        source = self.intern(source)
+        target = self.intern(target)
+        if source is target:
+            return True
+        if source.metadata or target.metadata:
+            return source._structurally_compatible(target)
+        # Canonical types live as long as the table, so their ids are stable
+        key = (id(source), id(target))
+        result = self.compatibility.get(key)
+        if result is not None:
+            self.memo_hits += 1
+            return result
+        self.memo_misses += 1
+        result = source._structurally_compatible(target)
+        if len(self.compatibility) >= self.memo_limit:
+            del self.compatibility[next(iter(self.compatibility))]
+        self.compatibility[key] = result
+        return result
+
+    def parse(self, annotation: str) -> Type:
+        """``parse_type``, memoized per annotation text."""
+        found = self.parsed.get(annotation)
+        if found is None:
+            found = _parse_type(annotation.strip())
+            if len(self.parsed) >= self.memo_limit:
+                del self.parsed[next(iter(self.parsed))]
+            self.parsed[annotation] = found
+        return found
+
+    def stats(self) -> Dict[str, Any]:
+        """Table sizes and memo hit rate."""
+        lookups = self.memo_hits + self.memo_misses
+        return {
+            "types": len(self.types),
+            "memo_entries": len(self.compatibility),
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+            "memo_hit_rate": self.memo_hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Forget every entry; existing types stay valid but are no longer
+        canonical (equality falls back to re-interning)."""
+        for canonical in self.types.values():
+            object.__delattr__(canonical, "_hash")
+        self.types.clear()
+        self.compatibility.clear()
+        self.parsed.clear()
+
+
+_INTERNER = TypeInterner()
+
+
+def type_interner() -> TypeInterner:
+    """The process-wide interner used by the ``Type`` constructors."""
+    return _INTERNER
+
+
+def intern_type(type_: Type) -> Type:
+    """Canonical (shared, immutable) instance of ``type_``."""
+    return _INTERNER.intern(type_)
+
+
+def parse_type(annotation: str) -> Type:
+    """Interned type for an annotation such as ``dict[str, list[int]] | None``.
+
+    Understands ``?`` (optional), ``|`` unions, ``List``/``Dict``/``Set``/
+    ``Tuple``/``Optional``/``Union`` (any case) and other ``Name[...]``
+    generics; other names become class types.
+    """
+    return _INTERNER.parse(annotation)
+
+
+_BASIC_TYPES = {
+    "int": TypeKind.INT,
+    "float": TypeKind.FLOAT,
+    "str": TypeKind.STR,
+    "bool": TypeKind.BOOL,
+    "any": TypeKind.ANY,
+    "none": TypeKind.NONE,
+}
+
+_CONTAINER_TYPES = {
+    "list": TypeKind.LIST,
+    "dict": TypeKind.DICT,
+    "set": TypeKind.SET,
+    "tuple": TypeKind.TUPLE,
+}
+
+
+def _split_top_level(text: str, separator: str) -> List[str]:
+    """Split ``text`` at ``separator`` outside brackets."""
+    parts = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(text):
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:i].strip())
+            start = i + 1
+    parts.append(text[start:].strip())
+    return parts
+
+
+def _parse_type(text: str) -> Type:
+    members = _split_top_level(text, "|")
+    if len(members) > 1:
+        return Type.union(*(parse_type(member) for member in members))
+    if text.endswith("?"):
+        return Type.optional(parse_type(text[:-1]))
+
+    bracket = text.find("[")
+    if bracket > 0 and text.endswith("]"):
+        base = text[:bracket].strip()
+        args = [parse_type(arg) for arg in _split_top_level(text[bracket + 1:-1], ",") if arg]
+        lowered = base.lower()
+        if lowered == "optional" and len(args) == 1:
+            return Type.optional(args[0])
+        if lowered == "union" and args:
+            return Type.union(*args)
+        kind = _CONTAINER_TYPES.get(lowered)
+        if kind is not None:
+            return _INTERNER.make(kind, lowered, tuple(args))
+        return _INTERNER.make(TypeKind.GENERIC, base, tuple(args))
+
+    kind = _BASIC_TYPES.get(text.lower() if text in ("Any", "None") else text)
+    if kind is not None:
+        return _INTERNER.make(kind, kind.value)
+    return _INTERNER.make(TypeKind.CLASS, text)
 
 
 @dataclass
@@ -268,7 +555,7 @@ class TypeInference:
 
     def infer_binary_operation(self, left: Type, op: str, right: Type) -> Type:
         """Infer result type from binary operation."""
-        if op in ["+", "-", "*", "/"]:
+        if op in ["+", "-", "*", "/", "%", "//", "**"]:
             # Numeric operations
             if left.kind in [TypeKind.INT, TypeKind.FLOAT] and right.kind in [TypeKind.INT, TypeKind.FLOAT]:
                 if left.kind == TypeKind.FLOAT or right.kind == TypeKind.FLOAT:
@@ -287,58 +574,505 @@ class TypeInference:
         return Type(kind=TypeKind.UNKNOWN)
 
 
+# Interpreter builtins available under every configuration: name -> (arity, result)
+_HOST_BUILTINS = {
+    "len": (1, TypeKind.INT),
+    "abs": (1, TypeKind.ANY),
+    "min": (-1, TypeKind.ANY),
+    "max": (-1, TypeKind.ANY),
+    "range": (-1, TypeKind.ANY),
+    "round": (-1, TypeKind.ANY),
+    "sum": (-1, TypeKind.ANY),
+    "sorted": (-1, TypeKind.LIST),
+}
+
+# Result kinds of configured builtins, by implementation
+_BUILTIN_RESULTS = {
+    "print": TypeKind.NONE,
+    "builtin.print": TypeKind.NONE,
+    "builtin.to_string": TypeKind.STR,
+    "builtin.to_boolean": TypeKind.BOOL,
+    "builtin.list": TypeKind.LIST,
+    "len": TypeKind.INT,
+}
+
+_NUMERIC = frozenset({TypeKind.INT, TypeKind.FLOAT, TypeKind.BOOL})
+_CHECKED = _NUMERIC | {TypeKind.STR, TypeKind.NONE, TypeKind.LIST, TypeKind.DICT}
+_ARITHMETIC = frozenset({"+", "-", "*", "/", "%", "//", "**"})
+_ORDERING = frozenset({"<", ">", "<=", ">="})
+_COMPARISONS = _ORDERING | {"==", "!="}
+
+
+def _builtin_signature(arity: int, result: TypeKind) -> TypeSignature:
+    count = arity if arity >= 0 else 1
+    return TypeSignature(
+        param_types=[(f"arg{i}", Type.any()) for i in range(count)],
+        return_type=Type(kind=result, name=result.value),
+        is_variadic=arity < 0,
+    )
+
+
+def _is_known(type_: Type) -> bool:
+    """Whether a type is precise enough to report errors against."""
+    return type_.kind in _CHECKED
+
+
+def _assignable(source: Type, target: Type) -> bool:
+    if source.kind in _NUMERIC and target.kind in _NUMERIC:
+        return True
+    return source.is_compatible_with(target)
+
+
+def _operands_supported(symbol: str, left: Type, right: Type) -> bool:
+    """False only when the interpreter would certainly fail on these operands."""
+    if not (_is_known(left) and _is_known(right)):
+        return True
+    if symbol in _ARITHMETIC:
+        if left.kind in _NUMERIC and right.kind in _NUMERIC:
+            return True
+        if symbol == "+":
+            return left.kind == right.kind and left.kind in (TypeKind.STR, TypeKind.LIST)
+        if symbol == "*":
+            sequences = (TypeKind.STR, TypeKind.LIST)
+            return (left.kind in sequences and right.kind in (TypeKind.INT, TypeKind.BOOL)) or (
+                right.kind in sequences and left.kind in (TypeKind.INT, TypeKind.BOOL)
+            )
+        return symbol == "%" and left.kind == TypeKind.STR  # string formatting
+    if symbol in _ORDERING:
+        return (left.kind in _NUMERIC and right.kind in _NUMERIC) or left.kind == right.kind != TypeKind.NONE
+    return True
+
+
+def _join(types: List[Type]) -> Type:
+    """One type covering all of ``types``: the type itself, a union, or any."""
+    distinct: Dict[str, Type] = {}
+    for type_ in types:
+        if type_.kind in (TypeKind.ANY, TypeKind.UNKNOWN):
+            return Type.any()
+        distinct.setdefault(str(type_), type_)
+    if len(distinct) == 1:
+        return next(iter(distinct.values()))
+    return Type.union(*distinct.values())
+
+
+def _falls_through(statements: List[Any]) -> bool:
+    """Whether control can reach the end of a statement list."""
+    if not statements:
+        return True
+    last = statements[-1]
+    kind = node_kind(last)
+    if kind == "return":
+        return False
+    if kind == "if":
+        _, then_block, else_block = if_parts(last)
+        return (
+            then_block is None
+            or else_block is None
+            or _falls_through(then_block.children)
+            or _falls_through(else_block.children)
+        )
+    return True
+
+
+def parse_module(config: Any, source: str) -> Tuple[Any, List[Tuple[int, ModuleImport]]]:
+    """Parse ``source`` into an AST plus its (line, import) statements.
+
+    The parser has no import statement, so import lines are blanked first
+    (keeping line numbers).
+    """
+    lines = source.split("\n")
+    import_statements = ModuleLoader(config).parse_imports(source)
+    for line_number, _ in import_statements:
+        lines[line_number - 1] = ""
+    _, ast = ParserGenerator(config).parse("\n".join(lines))
+    return ast, import_statements
+
+
 class TypeChecker:
     """Main type checking engine."""
 
-    def __init__(self, language_config: Any, level: AnalysisLevel = AnalysisLevel.MODERATE):
+    def __init__(
+        self,
+        language_config: Any,
+        level: AnalysisLevel = AnalysisLevel.MODERATE,
+        pass_manager: Optional[PassManager] = None,
+    ):
         self.config = language_config
         self.level = level
+        self.pass_manager = pass_manager
+        self._resolution: Any = None
         self.global_env = TypeEnvironment()
         self._register_builtin_types()
         self.errors: List[TypeError] = []
         self.warnings: List[TypeError] = []
+        self.exports = TypeEnvironment()  # of the last file checked
+        self._file = "<string>"
+        self._report_undefined = True
 
     def _register_builtin_types(self) -> None:
         """Register built-in functions and types."""
-        # Register standard library functions
-        for func_config in self.config.built_in_functions:
-            params = [
-                (f"arg{i}", Type(kind=TypeKind.ANY))
-                for i in range(abs(func_config.arity) if func_config.arity >= 0 else 1)
-            ]
-            signature = TypeSignature(
-                param_types=params,
-                return_type=Type(kind=TypeKind.ANY),
-            )
-            self.global_env.define_function(func_config.name, signature)
+        # Functions the interpreter always provides, then the configured ones
+        for name, (arity, result) in _HOST_BUILTINS.items():
+            self.global_env.define_function(name, _builtin_signature(arity, result))
+        if self.config is None:
+            return
+        compiled = self.config.compiled()
+        for name, arity in compiled.function_arity.items():
+            result = _BUILTIN_RESULTS.get(compiled.function_map.get(name), TypeKind.ANY)
+            self.global_env.define_function(name, _builtin_signature(arity, result))
 
-    def check_file(self, file_path: str) -> List[TypeError]:
+    def check_file(
+        self,
+        file_path: str,
+        imports: Optional[Dict[str, TypeEnvironment]] = None,
+    ) -> List[TypeError]:
         """Type check an entire file."""
         try:
-            content = Path(file_path).read_text()
-        except FileNotFoundError:
-            return [
+            content = Path(file_path).read_text(encoding="utf-8")
+        except (FileNotFoundError, UnicodeDecodeError) as error:
+            message = (
+                f"File not found: {file_path}"
+                if isinstance(error, FileNotFoundError)
+                else f"Cannot decode {file_path}: {error}"
+            )
+            self.errors = [
                 TypeError(
                     kind="error",
                     code="E000",
-                    message=f"File not found: {file_path}",
-                    location=file_path,
+                    message=message,
+                    location=str(file_path),
                     line=0,
                     column=0,
                 )
             ]
+            self.warnings = []
+            self.exports = TypeEnvironment()
+            return list(self.errors)
 
-        self.errors.clear()
-        self.warnings.clear()
+        return self.check_source(content, str(file_path), imports)
 
-        lines = content.split("\n")
-        current_env = self.global_env
+    def check_source(
+        self,
+        source: str,
+        file_path: str = "<string>",
+        imports: Optional[Dict[str, TypeEnvironment]] = None,
+    ) -> List[TypeError]:
+        """Type check source text; returns errors, then warnings.
+
+        ``imports`` maps module names to the ``exports`` of modules checked
+        earlier. Names imported from modules missing there are untyped, and
+        while a whole-module import is unresolved undefined names are not
+        reported (they may come from that module). Afterwards ``exports``
+        holds this file's module-level functions and variables. A syntax
+        error is reported as E001 and nothing else is checked.
+        """
+        try:
+            ast, import_statements = parse_module(self.config, source)
+        except ParseError as error:
+            self._begin(file_path)
+            self.exports = TypeEnvironment()
+            self._report("E001", f"Syntax error: {error.message}", error)
+            return list(self.errors)
+        return self.check_ast(ast, file_path, import_statements, imports)
+
+    def check_ast(
+        self,
+        ast: Any,
+        file_path: str = "<string>",
+        import_statements: Iterable[Tuple[int, ModuleImport]] = (),
+        imports: Optional[Dict[str, TypeEnvironment]] = None,
+    ) -> List[TypeError]:
+        """Type check a module parsed by ``parse_module``.
+
+        ``import_statements`` are the (line, import) pairs it returned;
+        ``imports`` is as for ``check_source``. With a ``pass_manager``, the
+        scope resolution is shared with other consumers of ``ast``, such as
+        the LSP, and cached until the AST is invalidated.
+        """
+        self._begin(file_path)
+        module_env = self.global_env.create_child_scope()
+        for line_number, import_stmt in import_statements:
+            exported = (imports or {}).get(import_stmt.module_name)
+            self._bind_import(import_stmt, exported, module_env, line_number)
+        return self._check_module(ast, module_env)
+
+    def _begin(self, file_path: str) -> None:
+        self.errors = []
+        self.warnings = []
+        self._file = file_path
+        self._report_undefined = True
+
+    def _check_module(self, ast: Any, module_env: TypeEnvironment) -> List[TypeError]:
+        if self.pass_manager is not None:
+            self._resolution = self.pass_manager.get(ast, "resolution")
+        else:
+            from .resolver import Resolver
 
-        for line_num, line in enumerate(lines, 1):
-            self._check_line(line, line_num, file_path, current_env)
+            self._resolution = Resolver().resolve(ast)
+        try:
+            self._check_body(ast, ast.children, module_env, None)
+        finally:
+            self._resolution = None
 
+        self.exports = TypeEnvironment(
+            variables=dict(module_env.variables),
+            functions=dict(module_env.functions),
+        )
         return self.errors + self.warnings
 
+    # === AST checking ===
+
+    def _bind_import(
+        self,
+        import_stmt: ModuleImport,
+        exported: Optional[TypeEnvironment],
+        environment: TypeEnvironment,
+        line: int,
+    ) -> None:
+        if exported is None:
+            if not import_stmt.selected:
+                self._report_undefined = False
+            for name in import_stmt.selected or []:
+                environment.define_variable(name, Type.any())
+            return
+
+        names = import_stmt.selected or list(exported.functions) + list(exported.variables)
+        for name in names:
+            if name in exported.functions:
+                environment.define_function(name, exported.functions[name])
+            elif name in exported.variables:
+                environment.define_variable(name, exported.variables[name])
+            else:
+                self._report(
+                    "E204",
+                    f"Module '{import_stmt.module_name}' has no export '{name}'",
+                    None,
+                    line=line,
+                )
+                environment.define_variable(name, Type.any())
+
+    def _check_body(
+        self,
+        scope: Any,
+        statements: List[Any],
+        environment: TypeEnvironment,
+        returns: Optional[List[Type]],
+    ) -> None:
+        """Check a module or function body (one scope; blocks do not nest)."""
+        # Every name the resolver binds in the scope is bound for its whole
+        # body (assignments to enclosing names are not), and functions are
+        # hoisted, so their signatures are known at every call
+        layout = self._resolution.layout_for(scope)
+        skipped = set(layout.params) | {function_name(f) for f in nested_functions(scope)}
+        for name in layout.names:
+            if name not in skipped and environment.variables.get(name) is None:
+                environment.define_variable(name, Type.any())
+        functions = [statement for statement in statements if node_kind(statement) == "function"]
+        for function in functions:
+            self._declare_function(function, environment)
+        for function in functions:
+            self._check_function(function, environment)
+        for statement in statements:
+            if node_kind(statement) != "function":
+                self._check_statement(statement, environment, returns)
+
+    def _declare_function(self, node: Any, environment: TypeEnvironment) -> None:
+        params = [(param, Type.any()) for param in function_params(node)]
+        environment.define_function(
+            function_name(node), TypeSignature(param_types=params, return_type=Type.any())
+        )
+
+    def _check_function(self, node: Any, environment: TypeEnvironment) -> None:
+        local = environment.create_child_scope()
+        for param in function_params(node):
+            local.define_variable(param, Type.any())
+        returns: List[Type] = []
+        body: List[Any] = []
+        for child in node.children:
+            if node_kind(child) == "block":
+                body.extend(child.children)
+        self._check_body(node, body, local, returns)
+
+        if _falls_through(body):
+            returns.append(Type.none())
+        signature = environment.functions[function_name(node)]
+        signature.return_type = _join(returns)
+        if signature.return_type.kind == TypeKind.UNION and self.level == AnalysisLevel.VERY_STRICT:
+            self._report(
+                "W102",
+                f"Function '{function_name(node)}' returns {signature.return_type}",
+                node,
+                kind="warning",
+            )
+
+    def _check_statement(
+        self,
+        node: Any,
+        environment: TypeEnvironment,
+        returns: Optional[List[Type]],
+    ) -> None:
+        kind = node_kind(node)
+        if kind == "assign":
+            self._check_store(node, environment)
+        elif kind == "return":
+            value = self._infer(node.children[0], environment) if node.children else Type.none()
+            if returns is not None:
+                returns.append(value)
+        elif kind == "function":
+            self._declare_function(node, environment)
+            self._check_function(node, environment)
+        elif kind == "block":
+            for statement in node.children:
+                self._check_statement(statement, environment, returns)
+        elif kind in ("if", "loop", "expression"):
+            for child in node.children:
+                if node_kind(child) == "block":
+                    for statement in child.children:
+                        self._check_statement(statement, environment, returns)
+                elif node.node_type != "ForLoop":  # for headers are not expressions
+                    self._infer(child, environment)
+
+    def _check_store(self, node: Any, environment: TypeEnvironment) -> None:
+        name = assign_target(node)
+        value = assign_value(node)
+        new_type = self._infer(value, environment) if hasattr(value, "node_type") else Type.any()
+        old_type = environment.get_variable_type(name)
+        if (
+            old_type is not None
+            and _is_known(old_type)
+            and _is_known(new_type)
+            and not _assignable(new_type, old_type)
+            and self.level != AnalysisLevel.LENIENT
+        ):
+            if self.level == AnalysisLevel.MODERATE:
+                self._report(
+                    "W101",
+                    f"'{name}' changes type from {old_type} to {new_type}",
+                    node,
+                    kind="warning",
+                )
+            else:
+                self._report(
+                    "E101",
+                    f"Type mismatch: cannot assign {new_type} to '{name}' ({old_type})",
+                    node,
+                    suggestion=f"Use a new variable for the {new_type} value",
+                )
+        scope = environment
+        while name not in scope.variables and scope.parent is not None:
+            scope = scope.parent
+        if name not in scope.variables:
+            scope = environment
+        scope.define_variable(name, new_type)
+
+    def _infer(self, node: Any, environment: TypeEnvironment) -> Type:
+        """Type of an expression node, reporting errors found inside it."""
+        kind = node_kind(node)
+        if kind == "literal":
+            value = literal_value(node)
+            if isinstance(value, bool):
+                return Type.bool()
+            if isinstance(value, int):
+                return Type.int()
+            if isinstance(value, float):
+                return Type.float()
+            if isinstance(value, str):
+                return Type.str()
+            return Type.any()
+
+        if kind == "name":
+            name = name_of(node)
+            found = environment.get_variable_type(name)
+            if found is not None:
+                return found
+            if environment.get_function_signature(name) is not None:
+                return Type(kind=TypeKind.CALLABLE, name="function")
+            if self._report_undefined:
+                self._report("E201", f"Undefined name '{name}'", node)
+            return Type.any()
+
+        if kind == "binary":
+            symbol = node_attrs(node).get("operator", node.value)
+            operands = [self._infer(child, environment) for child in node.children]
+            if len(operands) != 2:
+                return Type.any()
+            left, right = operands
+            if not _operands_supported(symbol, left, right):
+                self._report(
+                    "E102",
+                    f"Unsupported operand types for {symbol}: {left} and {right}",
+                    node,
+                )
+                return Type.any()
+            if not (_is_known(left) and _is_known(right)):
+                return Type.bool() if symbol in _COMPARISONS else Type.any()
+            result = TypeInference(environment).infer_binary_operation(left, symbol, right)
+            return Type.any() if result.kind == TypeKind.UNKNOWN else result
+
+        if kind == "call":
+            return self._check_call(node, environment)
+
+        if kind == "unary":
+            for child in node.children:
+                self._infer(child, environment)
+            return Type.bool()
+
+        for child in node.children:
+            self._infer(child, environment)
+        return Type.any()
+
+    def _check_call(self, node: Any, environment: TypeEnvironment) -> Type:
+        name = node_attrs(node).get("name") or node.value
+        arg_nodes = node.children
+        if len(arg_nodes) == 1 and arg_nodes[0].node_type == "Arguments":
+            arg_nodes = arg_nodes[0].children
+        for arg in arg_nodes:
+            self._infer(arg, environment)
+
+        signature = environment.get_function_signature(name)
+        if signature is None:
+            variable = environment.get_variable_type(name)
+            if variable is None:
+                if self._report_undefined:
+                    self._report("E202", f"Call to undefined function '{name}'", node)
+            elif _is_known(variable) and variable.kind != TypeKind.CALLABLE:
+                self._report("E103", f"'{name}' is not callable ({variable})", node)
+            return Type.any()
+
+        expected = len(signature.param_types)
+        if not signature.is_variadic and len(arg_nodes) != expected:
+            self._report(
+                "E203",
+                f"'{name}' expects {expected} argument{'s' if expected != 1 else ''}, "
+                f"got {len(arg_nodes)}",
+                node,
+            )
+        return signature.return_type
+
+    def _report(
+        self,
+        code: str,
+        message: str,
+        node: Any,
+        kind: str = "error",
+        suggestion: Optional[str] = None,
+        line: int = 0,
+    ) -> None:
+        column = 0
+        token = getattr(node, "token", None)
+        if token is not None:
+            line, column = token.line, token.column
+        error = TypeError(
+            kind=kind,
+            code=code,
+            message=message,
+            location=f"{self._file}:{line}:{column}",
+            line=line,
+            column=column,
+            suggestion=suggestion,
+        )
+        (self.warnings if kind == "warning" else self.errors).append(error)
+
     def check_expression(self, expr: str, environment: TypeEnvironment) -> Type:
         """Type check an expression and return its type."""
         expr = expr.strip()
@@ -420,79 +1154,31 @@ class TypeChecker:
         )
         environment.define_function(func_name, signature)
 
-    def _check_line(
-        self,
-        line: str,
-        line_num: int,
-        file_path: str,
-        environment: TypeEnvironment,
-    ) -> None:
-        """Type check a single line."""
-        line = line.strip()
-
-        if not line or line.startswith("#"):
-            return
-
-        # Check for variable assignment
-        if "=" in line and not line.startswith("if") and not line.startswith("when"):
-            parts = line.split("=", 1)
-            if len(parts) == 2:
-                target, source = parts
-                self.check_assignment(target.strip(), source.strip(), environment)
-
     def _parse_type_annotation(self, annotation: str) -> Type:
         """Parse a type annotation string."""
-        annotation = annotation.strip().rstrip('?')
-        nullable = annotation.endswith('?')
+        return parse_type(annotation)
 
-        # Basic types
-        if annotation == "int":
-            return Type.int()
-        elif annotation == "float":
-            return Type.float()
-        elif annotation == "str":
-            return Type.str()
-        elif annotation == "bool":
-            return Type.bool()
-
-        # Generics: list[int], dict[str, int]
-        if '[' in annotation:
-            base = annotation.split('[')[0]
-            args_str = annotation[annotation.find('[') + 1:annotation.rfind(']')]
-            arg_types = [self._parse_type_annotation(arg.strip()) for arg in args_str.split(',')]
-
-            if base == "list":
-                return Type.list(arg_types[0] if arg_types else Type(kind=TypeKind.ANY))
-            elif base == "dict":
-                return Type.dict(
-                    arg_types[0] if len(arg_types) > 0 else Type(kind=TypeKind.ANY),
-                    arg_types[1] if len(arg_types) > 1 else Type(kind=TypeKind.ANY),
-                )
+    def get_type_error_summary(self) -> str:
+        """Get a summary of type errors."""
+        return summarize_type_errors(self.errors, self.warnings)
 
-        # Union types: int | str
-        if '|' in annotation:
-            types = [self._parse_type_annotation(t.strip()) for t in annotation.split('|')]
-            return Type.union(*types)
 
-        # Custom/class types
-        return Type(kind=TypeKind.CLASS, name=annotation, nullable=nullable)
+def summarize_type_errors(errors: List[TypeError], warnings: List[TypeError]) -> str:
+    """Counts and the first few errors and warnings, for display."""
+    if not errors and not warnings:
+        return "✓ No type errors found"
 
-    def get_type_error_summary(self) -> str:
-        """Get a summary of type errors."""
-        if not self.errors and not self.warnings:
-            return "✓ No type errors found"
-
-        summary = []
-        if self.errors:
-            summary.append(f"Errors ({len(self.errors)}):")
-            for error in self.errors[:5]:
-                summary.append(f"  {error}")
-        if self.warnings:
-            summary.append(f"Warnings ({len(self.warnings)}):")
-            for warning in self.warnings[:5]:
-                summary.append(f"  {warning}")
-
-        return "\n".join(summary)
+    summary = []
+    if errors:
+        summary.append(f"Errors ({len(errors)}):")
+        for error in errors[:5]:
+            summary.append(f"  {error}")
+    if warnings:
+        summary.append(f"Warnings ({len(warnings)}):")
+        for warning in warnings[:5]:
+            summary.append(f"  {warning}")
+
+    return "\n".join(summary)
 
 
 class TypeAwareAnalyzer:
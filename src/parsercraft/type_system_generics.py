@@ -9,7 +9,7 @@ Features:
     - Generic type parameters in functions and classes
     - Type constraint validation
     - Type variance checking
-    - Generic type inference
+    - Generic type inference by unification
     - Specialization and instantiation
     - Integration with type checker
 
@@ -22,7 +22,7 @@ Usage:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any, Dict, List, Optional, Tuple
 
 from .generics import (
@@ -30,10 +30,12 @@ from .generics import (
     GenericClass,
     GenericFunction,
     GenericType,
+    InstantiationCache,
     TypeParameter,
     Variance,
 )
-from .type_system import Type, TypeChecker, TypeKind
+from .type_system import Type, TypeChecker, TypeKind, intern_type, parse_type
+from .unification import Unifier
 
 
 @dataclass
@@ -53,6 +55,8 @@ class GenericsTypeChecker:
         self.generic_functions: Dict[str, GenericFunction] = {}
         self.generic_classes: Dict[str, GenericClass] = {}
         self.type_parameters: Dict[str, List[TypeParameter]] = {}
+        # Validated instantiations: (generic, interned type arguments) -> result
+        self.validated = InstantiationCache()
 
     def check_generic_function(
         self, func_name: str, type_params: List[str], func_def: Any
@@ -121,6 +125,9 @@ class GenericsTypeChecker:
     ) -> Tuple[bool, List[str]]:
         """Check generic type instantiation.
 
+        Results are cached per generic and interned type arguments (see
+        ``validated``), so repeated instantiations are not re-validated.
+
         Args:
             generic_name: Name of generic (function or class)
             type_args: Concrete type arguments
@@ -128,21 +135,36 @@ class GenericsTypeChecker:
         Returns:
             (success: bool, errors: List[str])
         """
-        errors = []
+        generic = self.generic_functions.get(generic_name) or self.generic_classes.get(
+            generic_name
+        )
+        if generic is None:
+            return False, [f"Unknown generic: {generic_name}"]
+
+        success, errors = self.validated.get_or_build(
+            generic,
+            tuple(map(parse_type, type_args)),
+            self._validate_instantiation,
+            generic_name,
+            type_args,
+        )
+        return success, list(errors)
 
-        # Check if it's a generic function
-        if generic_name in self.generic_functions:
-            # gen_func = self.generic_functions[generic_name]
-            type_params = self.type_parameters.get(generic_name, [])
+    def _validate_instantiation(
+        self, generic_name: str, type_args: List[str]
+    ) -> Tuple[bool, List[str]]:
+        errors = []
+        type_params = self.type_parameters.get(generic_name, [])
 
-            if len(type_args) != len(type_params):
-                errors.append(
-                    f"Generic {generic_name} expects {len(type_params)} "
-                    f"type arguments, got {len(type_args)}"
-                )
-                return False, errors
+        if len(type_args) != len(type_params):
+            errors.append(
+                f"Generic {generic_name} expects {len(type_params)} "
+                f"type arguments, got {len(type_args)}"
+            )
+            return False, errors
 
-            # Check constraints
+        # Constraints apply to generic functions
+        if generic_name in self.generic_functions:
             for param, arg in zip(type_params, type_args):
                 if param.constraint:
                     if not self._satisfies_constraint(arg, param.constraint):
@@ -150,24 +172,7 @@ class GenericsTypeChecker:
                             f"Type {arg} does not satisfy constraint {param.constraint}"
                         )
 
-            return len(errors) == 0, errors
-
-        # Check if it's a generic class
-        if generic_name in self.generic_classes:
-            # gen_class = self.generic_classes[generic_name]
-            type_params = self.type_parameters.get(generic_name, [])
-
-            if len(type_args) != len(type_params):
-                errors.append(
-                    f"Generic {generic_name} expects {len(type_params)} "
-                    f"type arguments, got {len(type_args)}"
-                )
-                return False, errors
-
-            return len(errors) == 0, errors
-
-        errors.append(f"Unknown generic: {generic_name}")
-        return False, errors
+        return len(errors) == 0, errors
 
     def infer_type_arguments(
         self, generic_name: str, actual_args: List[Type]
@@ -181,25 +186,25 @@ class GenericsTypeChecker:
         Returns:
             (inferred_types: List[str], errors: List[str])
         """
-        errors = []
-        inferred = []
-
         if generic_name not in self.generic_functions:
-            errors.append(f"Unknown generic: {generic_name}")
-            return [], errors
+            return [], [f"Unknown generic: {generic_name}"]
 
-        # Use generic checker to infer types
-        # gen_func = self.generic_functions[generic_name]
+        gen_func = self.generic_functions[generic_name]
         type_params = self.type_parameters.get(generic_name, [])
 
-        for param in type_params:
-            # Simple inference: use first argument type matching parameter
-            if actual_args:
-                inferred.append(str(actual_args[0]))
-            else:
-                inferred.append("unknown")
+        # Without recorded parameter types, the arguments bind the type
+        # parameters in order
+        expected = list(gen_func.parameter_types.values()) or [
+            param.name for param in type_params
+        ]
+        unifier = Unifier(type_params, self._satisfies_parameter_constraint)
+        for expected_type, actual in zip(expected, actual_args):
+            if not unifier.unify(expected_type, actual):
+                break
 
-        return inferred, errors
+        bindings = unifier.solve()
+        inferred = [bindings.get(param.name, "unknown") for param in type_params]
+        return inferred, unifier.errors
 
     def check_variance(
         self, generic_name: str, position: int, variance: Variance
@@ -234,6 +239,12 @@ class GenericsTypeChecker:
 
         return True, f"Variance check passed for {param.name}"
 
+    def _satisfies_parameter_constraint(self, param: TypeParameter, type_name: str) -> bool:
+        """Constraint check in the form ``Unifier`` expects."""
+        if not param.constraint:
+            return True
+        return self._satisfies_constraint(type_name, param.constraint)
+
     def _satisfies_constraint(self, type_name: str, constraint: str) -> bool:
         """Check if a type satisfies a constraint.
 
@@ -347,8 +358,8 @@ class TypeNarrowingPass:
             var_name: Variable name
             type_name: Type to narrow to
         """
-        self.narrowed_types[var_name] = Type(
-            kind=TypeKind.CLASS, name=type_name
+        self.narrowed_types[var_name] = intern_type(
+            Type(kind=TypeKind.CLASS, name=type_name)
         )
 
     def narrow_by_truthiness(self, var_name: str) -> None:
@@ -361,7 +372,8 @@ class TypeNarrowingPass:
         if var_name in self.narrowed_types:
             t = self.narrowed_types[var_name]
             if t.nullable:
-                t.nullable = False
+                # Types are shared (interned); narrow a copy
+                self.narrowed_types[var_name] = intern_type(replace(t, nullable=False))
 
     def narrow_by_comparison(
         self, var_name: str, op: str, value: Any
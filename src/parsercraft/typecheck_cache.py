@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Incremental Type Checking with a Per-File Result Cache
+
+``TypeChecker.check_file`` checks one file from scratch. Over a project most
+files are unchanged between runs, and a file only needs re-checking when its
+own text changes or when a module it imports changes what it exports. This
+module checks files in import order and reuses each file's stored result
+(diagnostics and exported signatures) while neither has happened.
+
+Features:
+    - Imports resolved through ``ModuleManager``; imported modules are
+      checked first and their exports passed to the importer
+    - Cache key: SHA-256 of the file content, the config fingerprint, the
+      analysis level and the export digests of the imported modules, so an
+      edit inside an imported function body does not re-check importers
+    - One pickle per source file, written atomically; corrupt entries ignored
+    - Per-run report: files re-checked vs. reused, diagnostics per file
+
+Usage:
+    from parsercraft.typecheck_cache import ProjectTypeChecker, TypeCheckCache
+
+    project = ProjectTypeChecker(config, cache=TypeCheckCache.default())
+    run = project.check(["src/main.lang"])    # imports are checked as well
+    print(run.format())
+
+Cache location:
+    $PARSERCRAFT_TYPECHECK_CACHE_DIR, else $XDG_CACHE_HOME/parsercraft/typecheck,
+    else ~/.cache/parsercraft/typecheck (created with mode 0700). Entries are
+    pickles, so only the owning user should be able to write the directory.
+    ``PARSERCRAFT_NO_TYPECHECK_CACHE=1`` disables the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .cache_store import cache_dir, write_pickle
+from .codegen_parallel import resolve_jobs
+from .compiled_language import config_fingerprint
+from .module_system import ModuleLoadError, ModuleManager, ModuleNotFoundError
+from .type_system import (
+    AnalysisLevel,
+    TypeChecker,
+    TypeEnvironment,
+    TypeError,
+    summarize_type_errors,
+)
+
+CACHE_DIR_ENV = "PARSERCRAFT_TYPECHECK_CACHE_DIR"
+DISABLE_ENV = "PARSERCRAFT_NO_TYPECHECK_CACHE"
+
+# Bump when the checker reports differently for the same input
+CACHE_FORMAT = 4
+
+# Extensions picked up when a directory is given
+SOURCE_EXTENSIONS = (".teach", ".lang", ".script")
+
+
+def default_cache_dir() -> Path:
+    """Directory holding cached type check results."""
+    return cache_dir(CACHE_DIR_ENV, "typecheck")
+
+
+def exports_digest(exports: TypeEnvironment) -> str:
+    """SHA-256 of a module's exported signatures (what importers depend on)."""
+    lines = [f"function {name}{signature}" for name, signature in exports.functions.items()]
+    lines.extend(f"variable {name}: {type_}" for name, type_ in exports.variables.items())
+    return hashlib.sha256("\n".join(sorted(lines)).encode("utf-8")).hexdigest()
+
+
+def collect_sources(inputs: Iterable[Path]) -> List[Path]:
+    """Source files named by ``inputs``; directories are searched recursively."""
+    sources: List[Path] = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            sources.extend(
+                sorted(p for p in path.rglob("*") if p.suffix in SOURCE_EXTENSIONS and p.is_file())
+            )
+        else:
+            sources.append(path)
+    return sources
+
+
+@dataclass
+class ExportSummary:
+    """What importers of a file see: its exports and their digest."""
+
+    path: str
+    exports: TypeEnvironment
+    digest: str
+
+
+@dataclass
+class ModuleGraph:
+    """Source files and the files their imports resolve to."""
+
+    imports: Dict[str, Dict[str, Optional[str]]] = field(default_factory=dict)  # path -> module -> path
+    sources: Dict[str, Optional[str]] = field(default_factory=dict)  # None when unreadable
+
+    def subgraph(self, paths: Iterable[str]) -> ModuleGraph:
+        """The entries of ``paths`` only (edges may leave the subgraph)."""
+        return ModuleGraph(
+            {path: self.imports[path] for path in paths},
+            {path: self.sources[path] for path in paths},
+        )
+
+    def dependencies(self, path: str) -> Set[str]:
+        """Files imported by ``path``."""
+        return {target for target in self.imports[path].values() if target is not None}
+
+    def components(self) -> List[List[str]]:
+        """Strongly connected components, each after every component it imports.
+
+        Tarjan's algorithm, iterative; files are visited in sorted order so
+        the result is deterministic.
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+
+        for root in sorted(self.imports):
+            if root in index:
+                continue
+            work = [(root, iter(sorted(self.dependencies(root))))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = len(index)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self.dependencies(child)))))
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(sorted(component))
+        return components
+
+
+@dataclass
+class FileResult:
+    """Diagnostics and exports of one checked file."""
+
+    path: str
+    errors: List[TypeError] = field(default_factory=list)  # errors, then warnings
+    exports: TypeEnvironment = field(default_factory=TypeEnvironment)
+    digest: str = ""  # of ``exports``
+    imports: Dict[str, Optional[str]] = field(default_factory=dict)  # module -> path
+    seconds: float = 0.0  # spent checking; 0 when reused
+    cached: bool = False
+
+    @property
+    def summary(self) -> ExportSummary:
+        return ExportSummary(self.path, self.exports, self.digest)
+
+    @property
+    def error_count(self) -> int:
+        return sum(1 for error in self.errors if error.kind == "error")
+
+    @property
+    def warning_count(self) -> int:
+        return sum(1 for error in self.errors if error.kind == "warning")
+
+
+@dataclass
+class TypeCheckRun:
+    """Results of one project check, in the order files were checked."""
+
+    results: List[FileResult] = field(default_factory=list)
+    seconds: float = 0.0  # wall time of the whole run
+
+    @property
+    def checked(self) -> int:
+        return sum(1 for result in self.results if not result.cached)
+
+    @property
+    def reused(self) -> int:
+        return len(self.results) - self.checked
+
+    @property
+    def error_count(self) -> int:
+        return sum(result.error_count for result in self.results)
+
+    @property
+    def warning_count(self) -> int:
+        return sum(result.warning_count for result in self.results)
+
+    def get_type_error_summary(self) -> str:
+        """``TypeChecker.get_type_error_summary`` over every file."""
+        errors = [error for result in self.results for error in result.errors]
+        return summarize_type_errors(
+            [error for error in errors if error.kind != "warning"],
+            [error for error in errors if error.kind == "warning"],
+        )
+
+    def format(self) -> str:
+        lines = []
+        for result in self.results:
+            status = "cached" if result.cached else f"{result.seconds * 1000:.1f}ms"
+            counts = f"{result.error_count} error(s), {result.warning_count} warning(s)"
+            lines.append(f"{result.path}: {counts} [{status}]")
+            for error in result.errors:
+                lines.append(f"  [{error.code}] {error.message} at {error.location}")
+                if error.suggestion:
+                    lines.append(f"    Suggestion: {error.suggestion}")
+        lines.append(
+            f"Files: {len(self.results)} ({self.checked} checked, {self.reused} reused); "
+            f"{self.error_count} error(s), {self.warning_count} warning(s) "
+            f"in {self.seconds * 1000:.1f}ms"
+        )
+        return "\n".join(lines)
+
+
+class TypeCheckCache:
+    """Pickled ``FileResult`` per source path, valid for one cache key."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @classmethod
+    def default(cls) -> Optional[TypeCheckCache]:
+        """Cache in the default directory, or None when caching is disabled."""
+        if os.environ.get(DISABLE_ENV):
+            return None
+        return cls()
+
+    def entry_path(self, source: Path) -> Path:
+        """Cache file used for ``source``."""
+        key = hashlib.sha256(str(Path(source).resolve()).encode("utf-8"))
+        return self.cache_dir / f"{key.hexdigest()[:32]}.pickle"
+
+    def get(self, source: Path, key: str) -> Optional[FileResult]:
+        """The stored result for ``source`` if it was stored under ``key``."""
+        try:
+            with open(self.entry_path(source), "rb") as handle:
+                entry = pickle.load(handle)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.errors += 1
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("format") != CACHE_FORMAT
+            or entry.get("key") != key
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["result"]
+
+    def put(self, source: Path, key: str, result: FileResult) -> None:
+        """Store ``result`` for ``source`` under ``key`` (replacing older entries)."""
+        try:
+            write_pickle(
+                self.entry_path(source),
+                {"format": CACHE_FORMAT, "key": key, "result": result},
+            )
+        except (OSError, pickle.PicklingError):
+            # Best-effort, like the config cache
+            self.errors += 1
+
+    def clear(self) -> int:
+        """Remove every cached entry; return how many were deleted."""
+        removed = 0
+        if not self.cache_dir.is_dir():
+            return removed
+        for path in self.cache_dir.glob("*.pickle"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+class ProjectTypeChecker:
+    """Checks files and their imports, reusing cached per-file results.
+
+    Files are grouped into the strongly connected components of the import
+    graph and checked dependencies first. Within an import cycle, files are
+    checked in path order and each sees the exports of those before it;
+    imports of later members are treated as unresolved.
+    """
+
+    def __init__(
+        self,
+        config: Any,
+        level: AnalysisLevel = AnalysisLevel.MODERATE,
+        cache: Optional[TypeCheckCache] = None,
+        search_paths: Optional[List[str]] = None,
+    ):
+        self.config = config
+        self.level = level
+        self.cache = cache
+        self.search_paths = search_paths
+        self.checker = TypeChecker(config, level)
+        # Module names resolve relative to the importing file first, so
+        # loaded modules must not be shared between directories
+        self.manager = ModuleManager(config, search_paths=search_paths, enable_caching=False)
+        self.fingerprint = config_fingerprint(config)
+        self._resolved: Dict[Tuple[str, Path], Optional[str]] = {}
+
+    def check(self, paths: Iterable[Path], jobs: Optional[int] = 1) -> TypeCheckRun:
+        """Check ``paths`` and everything they import, dependencies first.
+
+        With ``jobs`` other than 1, independent components are checked in
+        worker processes (0 or None: one per CPU); results are the same.
+        """
+        start = time.perf_counter()
+        graph = self.build_graph(paths)
+        if resolve_jobs(jobs) > 1:
+            from .typecheck_parallel import check_in_parallel
+
+            results = check_in_parallel(self, graph, jobs)
+        else:
+            summaries: Dict[str, ExportSummary] = {}
+            results = []
+            for component in graph.components():
+                checked = self.check_component(graph.subgraph(component), summaries)
+                summaries.update((result.path, result.summary) for result in checked)
+                results.extend(checked)
+        return TypeCheckRun(results, seconds=time.perf_counter() - start)
+
+    def build_graph(self, paths: Iterable[Path]) -> ModuleGraph:
+        """Load ``paths`` and every module they import (transitively)."""
+        graph = ModuleGraph()
+        pending = [str(Path(path).resolve()) for path in paths]
+        while pending:
+            path = pending.pop()
+            if path in graph.imports:
+                continue
+            graph.imports[path] = {}
+            try:
+                module = self.manager.loader.load_file(Path(path))
+            except (OSError, UnicodeDecodeError):
+                graph.sources[path] = None  # check_file reports it
+                continue
+            graph.sources[path] = module.content
+            for import_stmt in module.dependencies:
+                target = self.resolve(import_stmt.module_name, Path(path))
+                graph.imports[path][import_stmt.module_name] = target
+                if target is not None:
+                    pending.append(target)
+        return graph
+
+    def resolve(self, module_name: str, importer: Path) -> Optional[str]:
+        """Resolved path of an imported module, or None if it cannot be found."""
+        key = (module_name, importer.parent)
+        if key not in self._resolved:
+            try:
+                module = self.manager.load_module(module_name, search_relative_to=importer.parent)
+            except (ModuleNotFoundError, ModuleLoadError):
+                module = None
+            self._resolved[key] = str(Path(module.path).resolve()) if module is not None else None
+        return self._resolved[key]
+
+    def cache_key(self, content: str, imports: Dict[str, Optional[ExportSummary]]) -> str:
+        """Key of a file's result: its content, the config and imported exports."""
+        parts = (
+            CACHE_FORMAT,
+            hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            self.fingerprint,
+            self.level.name,
+            tuple(
+                (name, summary.digest if summary is not None else None)
+                for name, summary in sorted(imports.items())
+            ),
+        )
+        return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+    def check_component(
+        self, graph: ModuleGraph, summaries: Dict[str, ExportSummary]
+    ) -> List[FileResult]:
+        """Check the files of one component.
+
+        ``summaries`` holds the exports of already checked files; it must
+        cover every import that leaves the component.
+        """
+        known = dict(summaries)
+        results = []
+        for path in sorted(graph.imports):
+            imports = {
+                name: known.get(target) if target is not None else None
+                for name, target in graph.imports[path].items()
+            }
+            result = self.check_path(path, graph.sources[path], imports)
+            known[path] = result.summary
+            results.append(result)
+        return results
+
+    def check_path(
+        self,
+        path: str,
+        content: Optional[str],
+        imports: Dict[str, Optional[ExportSummary]],
+    ) -> FileResult:
+        """Check one file (or reuse its cached result)."""
+        if content is None:
+            errors = self.checker.check_file(path)
+            return FileResult(path, errors, TypeEnvironment(), exports_digest(TypeEnvironment()))
+
+        key = self.cache_key(content, imports)
+        result = self.cache.get(Path(path), key) if self.cache is not None else None
+        if result is not None:
+            result.cached = True
+            result.seconds = 0.0
+            return result
+
+        start = time.perf_counter()
+        errors = self.checker.check_source(
+            content,
+            path,
+            {name: summary.exports for name, summary in imports.items() if summary is not None},
+        )
+        exports = self.checker.exports
+        result = FileResult(
+            path=path,
+            errors=errors,
+            exports=exports,
+            digest=exports_digest(exports),
+            imports={name: summary.path if summary else None for name, summary in imports.items()},
+            seconds=time.perf_counter() - start,
+        )
+        if self.cache is not None:
+            self.cache.put(Path(path), key, result)
+        return result
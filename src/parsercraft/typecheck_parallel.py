@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Parallel Project-Wide Type Checking
+
+A file can be checked as soon as every module it imports has been, and
+files in an import cycle are checked together. ``ProjectTypeChecker``
+splits the import graph into strongly connected components; this module
+checks components whose dependencies are done on a process pool, so
+independent parts of a project proceed at the same time.
+
+Features:
+    - Components scheduled as their dependencies finish (not in waves)
+    - Workers receive only the export summaries of the files their
+      component imports and send back results with exports and timings
+    - Each worker builds its own ``ProjectTypeChecker`` and shares the
+      on-disk result cache, so cached files cost a lookup
+    - Results in the sequential order, whatever order workers finish in
+
+Usage:
+    from parsercraft.typecheck_cache import ProjectTypeChecker
+
+    run = ProjectTypeChecker(config).check(paths, jobs=4)
+    print(run.format())
+    print(run.get_type_error_summary())
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set
+
+from .codegen_parallel import resolve_jobs
+
+# Project checker of this worker process
+_WORKER: Any = None
+
+
+def _start_worker(config: Any, level: Any, cache: Any, search_paths: Optional[List[str]]) -> None:
+    global _WORKER  # pylint: disable=global-statement
+    from .typecheck_cache import ProjectTypeChecker
+
+    _WORKER = ProjectTypeChecker(config, level, cache=cache, search_paths=search_paths)
+
+
+def _check_component(graph: Any, summaries: Dict[str, Any]) -> List[Any]:
+    return _WORKER.check_component(graph, summaries)
+
+
+def check_in_parallel(project: Any, graph: Any, jobs: Optional[int]) -> List[Any]:
+    """``FileResult``s of every file in ``graph``, checked across processes.
+
+    ``project`` is the ``ProjectTypeChecker`` whose settings the workers
+    copy. Exceptions raised in a worker propagate to the caller.
+    """
+    components = graph.components()
+    owner = {path: number for number, component in enumerate(components) for path in component}
+    dependents: List[Set[int]] = [set() for _ in components]
+    waiting: List[int] = []
+    for number, component in enumerate(components):
+        needs = {owner[target] for path in component for target in graph.dependencies(path)}
+        needs.discard(number)
+        waiting.append(len(needs))
+        for dependency in needs:
+            dependents[dependency].add(number)
+
+    results: List[List[Any]] = [[] for _ in components]
+    summaries: Dict[str, Any] = {}
+    workers = min(resolve_jobs(jobs), len(components))
+    if workers <= 1:
+        for number, component in enumerate(components):
+            results[number] = project.check_component(graph.subgraph(component), summaries)
+            summaries.update((result.path, result.summary) for result in results[number])
+        return [result for checked in results for result in checked]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_start_worker,
+        initargs=(project.config, project.level, project.cache, project.search_paths),
+    ) as pool:
+        pending: Dict[Future, int] = {}
+
+        def submit(number: int) -> None:
+            subgraph = graph.subgraph(components[number])
+            imported = {
+                target: summaries[target]
+                for path in components[number]
+                for target in graph.dependencies(path)
+                if target in summaries
+            }
+            pending[pool.submit(_check_component, subgraph, imported)] = number
+
+        for number, count in enumerate(waiting):
+            if count == 0:
+                submit(number)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                number = pending.pop(future)
+                results[number] = future.result()
+                summaries.update((result.path, result.summary) for result in results[number])
+                for dependent in sorted(dependents[number]):
+                    waiting[dependent] -= 1
+                    if waiting[dependent] == 0:
+                        submit(dependent)
+
+    return [result for checked in results for result in checked]
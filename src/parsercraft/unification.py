@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Type Unification for Generic Type Argument Inference
+
+Infers the type arguments of a generic call by unifying the declared
+parameter types (``list[T]``, ``dict[K, list[V]]``) with the argument
+types. Each type parameter is a union-find variable. Unifying two variables
+merges their classes. Unifying a variable with a type binds its class.
+After all arguments are unified, ``solve`` substitutes the bindings and
+checks each solution against the parameter's constraint and bound.
+
+Features:
+    - Union-find type variables (path compression, union by rank)
+    - Occurs check: ``T = list[T]`` is an error, never an infinite type
+    - Unification, occurs check and substitution walk interned types
+      with explicit stacks (no recursion) and skip shared subterms by
+      identity
+    - Conflicting bindings resolved by the parameter's variance: widened
+      to a union (covariant), narrowed (contravariant) or rejected
+      (invariant)
+    - ``TypeParameter.constraint`` and ``bound`` checked on the solution;
+      ``default`` used for parameters no argument determines
+
+Usage:
+    from parsercraft.generics import TypeParameter
+    from parsercraft.unification import Unifier
+
+    unifier = Unifier([TypeParameter("K"), TypeParameter("V")])
+    unifier.unify("dict[K, list[V]]", "dict[str, list[int]]")
+    bindings = unifier.solve()  # {"K": "str", "V": "int"}
+    print(unifier.errors)       # [] when every parameter was inferred
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from .generics import TypeParameter, Variance
+from .type_system import Type, TypeKind, intern_type, parse_type, type_interner
+
+# id -> (type, names of the class types it mentions); the type is kept so
+# that the id cannot be reused while the entry exists
+_NAMES: Dict[int, Tuple[Type, FrozenSet[str]]] = {}
+_NAMES_LIMIT = 65536
+
+
+def _type_names(type_: Type) -> FrozenSet[str]:
+    """Names of the bare class types in ``type_`` (the candidate variables)."""
+    entry = _NAMES.get(id(type_))
+    if entry is not None and entry[0] is type_:
+        return entry[1]
+
+    # Post-order walk with an explicit stack; ``found`` holds this walk's
+    # results, so evictions from _NAMES during the walk do not matter
+    found: Dict[int, FrozenSet[str]] = {}
+    stack = [(type_, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in found:
+            continue
+        entry = _NAMES.get(id(node))
+        if entry is not None and entry[0] is node:
+            found[id(node)] = entry[1]
+            continue
+        if node.kind == TypeKind.CLASS and not node.type_args:
+            names = frozenset((node.name,))
+        elif not expanded:
+            stack.append((node, True))
+            stack.extend((arg, False) for arg in node.type_args)
+            continue
+        else:
+            names = frozenset().union(*(found[id(arg)] for arg in node.type_args))
+        found[id(node)] = names
+        if len(_NAMES) >= _NAMES_LIMIT:
+            del _NAMES[next(iter(_NAMES))]
+        _NAMES[id(node)] = (node, names)
+    return found[id(type_)]
+
+
+def _spelling(type_: Type) -> str:
+    """Annotation text for a solution (``parse_type`` reads it back)."""
+    return type_.name if type_.kind == TypeKind.UNION else str(type_)
+
+
+class TypeVariable:
+    """A type parameter during unification: one union-find node.
+
+    Only the root of a class carries the binding and the variance.
+    """
+
+    __slots__ = ("parameter", "parent", "rank", "binding", "variance")
+
+    def __init__(self, parameter: TypeParameter):
+        self.parameter = parameter
+        self.parent = self
+        self.rank = 0
+        self.binding: Optional[Type] = None
+        self.variance = parameter.variance
+
+    def __repr__(self) -> str:
+        return f"TypeVariable({self.parameter.name})"
+
+
+class Unifier:
+    """Unification of declared and actual types over some type parameters.
+
+    ``constraint_check(parameter, type_name)`` decides whether a solution
+    satisfies ``parameter.constraint`` (``GenericChecker.check_constraint``
+    has this signature). Errors are collected in ``errors``.
+    """
+
+    def __init__(
+        self,
+        type_parameters: List[TypeParameter],
+        constraint_check: Optional[Callable[[TypeParameter, str], bool]] = None,
+    ):
+        self.variables: Dict[str, TypeVariable] = {
+            param.name: TypeVariable(param) for param in type_parameters
+        }
+        self.names = frozenset(self.variables)
+        self.constraint_check = constraint_check
+        self.errors: List[str] = []
+
+    def find(self, variable: TypeVariable) -> TypeVariable:
+        """Root of ``variable``'s class, compressing the path to it."""
+        root = variable
+        while root.parent is not root:
+            root = root.parent
+        while variable.parent is not root:
+            variable.parent, variable = root, variable.parent
+        return root
+
+    def unify(self, expected: Union[str, Type], actual: Union[str, Type]) -> bool:
+        """Unify a declared type with an argument type.
+
+        Returns False (and records an error) when they cannot be unified;
+        bindings made before the failure are kept. Strings go through
+        ``parse_type``, which is recursive; pass ``Type`` objects for types
+        nested hundreds of levels deep.
+        """
+        stack = [(self._term(expected), self._term(actual))]
+        # Interned subterms are shared; unify each distinct pair once
+        seen = set()
+        while stack:
+            left, right = stack.pop()
+            if left is right:
+                continue
+            pair = (id(left), id(right))
+            if pair in seen:
+                continue
+            seen.add(pair)
+
+            left_var = self._variable_of(left)
+            right_var = self._variable_of(right)
+            if left_var is not None or right_var is not None:
+                if not self._unify_variables(left_var, left, right_var, right, stack):
+                    return False
+                continue
+
+            if left.kind == TypeKind.ANY or right.kind == TypeKind.ANY:
+                continue
+            if self._ground(left) and self._ground(right):
+                if not right.is_compatible_with(left):
+                    return self._fail(f"Cannot unify {left} with {right}")
+                continue
+
+            if right.kind == TypeKind.UNION and left.kind != TypeKind.UNION:
+                # Every member of the argument must fit the declared type
+                stack.extend((left, member) for member in right.type_args)
+            elif left.kind == TypeKind.OPTIONAL and right.kind != TypeKind.OPTIONAL:
+                if right.kind != TypeKind.NONE:
+                    stack.append((left.type_args[0], right))
+            elif left.kind == TypeKind.UNION:
+                members = right.type_args if right.kind == TypeKind.UNION else (right,)
+                for member in members:
+                    target = self._union_member(left, member)
+                    if target is None:
+                        return self._fail(f"Cannot unify {left} with {member}")
+                    stack.append((target, member))
+            elif (
+                left.kind != right.kind
+                or (left.kind in (TypeKind.CLASS, TypeKind.GENERIC) and left.name != right.name)
+                or len(left.type_args) != len(right.type_args)
+            ):
+                return self._fail(f"Cannot unify {left} with {right}")
+            else:
+                stack.extend(zip(left.type_args, right.type_args))
+        return True
+
+    def resolve(self, type_: Union[str, Type]) -> Type:
+        """``type_`` with every bound variable replaced by its binding."""
+        return self._resolve(self._term(type_), {})
+
+    def solve(self) -> Dict[str, str]:
+        """Type argument for each parameter that could be inferred.
+
+        Solutions are checked against constraints and bounds. Parameters
+        without a solution take their default or are reported in ``errors``.
+        """
+        bindings: Dict[str, str] = {}
+        memo: Dict[int, Type] = {}
+        for name, variable in self.variables.items():
+            param = variable.parameter
+            solution = self._resolve(self._term(name), memo)
+            if not self._ground(solution):
+                if param.default:
+                    bindings[name] = param.default
+                else:
+                    self.errors.append(f"Cannot infer type parameter {name}")
+                continue
+
+            satisfied = True
+            members = solution.type_args if solution.kind == TypeKind.UNION else (solution,)
+            for member in members:
+                if member.kind == TypeKind.ANY:
+                    continue
+                if self.constraint_check and not self.constraint_check(param, str(member)):
+                    self.errors.append(f"Type {member} does not satisfy constraint {param.constraint}")
+                    satisfied = False
+                if param.bound and not member.is_compatible_with(parse_type(param.bound)):
+                    self.errors.append(f"Type {member} is not within bound {param.bound} of {name}")
+                    satisfied = False
+            if satisfied:
+                bindings[name] = _spelling(solution)
+        return bindings
+
+    def _term(self, type_: Union[str, Type]) -> Type:
+        return parse_type(type_) if isinstance(type_, str) else intern_type(type_)
+
+    def _variable_of(self, type_: Type) -> Optional[TypeVariable]:
+        if type_.kind == TypeKind.CLASS and not type_.type_args:
+            return self.variables.get(type_.name)
+        return None
+
+    def _ground(self, type_: Type) -> bool:
+        return _type_names(type_).isdisjoint(self.names)
+
+    def _fail(self, message: str) -> bool:
+        self.errors.append(message)
+        return False
+
+    def _unify_variables(
+        self,
+        left_var: Optional[TypeVariable],
+        left: Type,
+        right_var: Optional[TypeVariable],
+        right: Type,
+        stack: List[Tuple[Type, Type]],
+    ) -> bool:
+        if left_var is not None and right_var is not None:
+            root, other = self.find(left_var), self.find(right_var)
+            if root is other:
+                return True
+            if root.rank < other.rank:
+                root, other = other, root
+            other.parent = root
+            if root.rank == other.rank:
+                root.rank += 1
+            if root.variance != other.variance:
+                root.variance = Variance.INVARIANT
+            if other.binding is None:
+                return True
+            if root.binding is None:
+                root.binding = other.binding
+                return True
+            return self._merge(root, other.binding, stack)
+
+        variable, term = (left_var, right) if left_var is not None else (right_var, left)
+        root = self.find(variable)
+        if self._occurs(root, term):
+            return self._fail(f"Type parameter {root.parameter.name} occurs in {term}")
+        if root.binding is None:
+            root.binding = term
+            return True
+        return self._merge(root, term, stack)
+
+    def _merge(self, root: TypeVariable, term: Type, stack: List[Tuple[Type, Type]]) -> bool:
+        """Reconcile ``root``'s binding with another type for it."""
+        old = root.binding
+        if old is term or term.kind == TypeKind.ANY:
+            return True
+        if old.kind == TypeKind.ANY:
+            root.binding = term
+            return True
+        if not (self._ground(old) and self._ground(term)):
+            stack.append((old, term))
+            return True
+
+        if root.variance == Variance.COVARIANT:
+            if not term.is_compatible_with(old):
+                root.binding = term if old.is_compatible_with(term) else Type.union(old, term)
+            return True
+        if root.variance == Variance.CONTRAVARIANT:
+            if old.is_compatible_with(term):
+                return True
+            if term.is_compatible_with(old):
+                root.binding = term
+                return True
+        return self._fail(
+            f"Conflicting types for {root.parameter.name}: {old} and {term}"
+        )
+
+    def _occurs(self, root: TypeVariable, term: Type) -> bool:
+        """Whether ``root``'s class occurs in ``term``, through bindings too."""
+        pending = [term]
+        seen = set()
+        while pending:
+            for name in _type_names(pending.pop()):
+                variable = self.variables.get(name)
+                if variable is None:
+                    continue
+                found = self.find(variable)
+                if found is root:
+                    return True
+                if found.binding is not None and id(found) not in seen:
+                    seen.add(id(found))
+                    pending.append(found.binding)
+        return False
+
+    def _union_member(self, union: Type, member: Type) -> Optional[Type]:
+        """The member of a declared union that an argument type unifies with."""
+        open_members = []
+        for candidate in union.type_args:
+            if not self._ground(candidate):
+                open_members.append(candidate)
+            elif member.is_compatible_with(candidate):
+                return candidate
+        if len(open_members) == 1:
+            return open_members[0]
+        for candidate in open_members:
+            if candidate.kind == member.kind and self._variable_of(candidate) is None:
+                return candidate
+        return None
+
+    def _resolve(self, type_: Type, memo: Dict[int, Type]) -> Type:
+        # Post-order walk with an explicit stack; ``memo`` maps the id of
+        # each finished subterm to its substitution. The occurs check keeps
+        # bindings acyclic, so the walk terminates.
+        stack = [type_]
+        while stack:
+            node = stack[-1]
+            if id(node) in memo:
+                stack.pop()
+                continue
+            if self._ground(node):
+                memo[id(node)] = node
+                stack.pop()
+                continue
+
+            variable = self._variable_of(node)
+            if variable is not None:
+                root = self.find(variable)
+                if root.binding is None:
+                    if root.parameter.default:
+                        resolved = parse_type(root.parameter.default)
+                    else:
+                        resolved = self._term(root.parameter.name)
+                elif id(root.binding) in memo:
+                    resolved = memo[id(root.binding)]
+                else:
+                    stack.append(root.binding)
+                    continue
+            else:
+                pending = [arg for arg in node.type_args if id(arg) not in memo]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                args = tuple(memo[id(arg)] for arg in node.type_args)
+                if node.kind == TypeKind.OPTIONAL:
+                    resolved = Type.optional(args[0])
+                elif node.kind == TypeKind.UNION:
+                    resolved = Type.union(*args)
+                else:
+                    resolved = type_interner().make(node.kind, node.name, args, node.nullable)
+            memo[id(node)] = resolved
+            stack.pop()
+        return memo[id(type_)]
@@ -0,0 +1,1191 @@
+#!/usr/bin/env python3
+"""
+Binary WebAssembly Encoding
+
+Encodes a ``WasmModule`` to the binary ``.wasm`` format without an
+external assembler. Function bodies are WAT instruction text, flat
+(``local.get $x``) or folded (``(i32.add (local.get $x) (i32.const 1))``),
+so the encoder tokenizes and assembles them into opcodes, resolving labels,
+locals and functions by name. That assembly is the bulk of the cost:
+``to_wasm()`` takes about ten times as long as ``to_wat()`` on the same
+module (see ``benchmarks/bench_wasm_binary.py``).
+
+Features:
+    - LEB128 varints (unsigned and signed)
+    - Type section with deduplicated signatures
+    - Import, function, memory, export, code and data sections
+    - "name" custom section so tools show function and local names
+    - Validation self-check: a decoder that checks section structure,
+      index ranges and operand-stack types of every function body
+
+Usage:
+    from parsercraft.wasm_binary import encode_module, validate_wasm
+
+    data = encode_module(module)          # or module.to_wasm()
+    sizes = validate_wasm(data)           # raises WasmValidationError
+    module.save("program.wasm")           # binary, chosen by suffix
+
+Supported instructions:
+    Control flow, calls, locals, memory loads/stores, constants and every
+    MVP numeric instruction (including sign extension). Block types may be
+    empty, a single result, or params/results through the type section.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import struct
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .codegen_wasm import WasmFunction, WasmModule
+
+WASM_MAGIC = b"\0asm"
+WASM_VERSION = b"\x01\0\0\0"
+PAGE_SIZE = 65536
+MAX_PAGES = 65536
+
+VALUE_TYPES = {"i32": 0x7F, "i64": 0x7E, "f32": 0x7D, "f64": 0x7C}
+_TYPE_NAMES = {code: name for name, code in VALUE_TYPES.items()}
+_EMPTY_BLOCK = 0x40
+_FUNC_FORM = 0x60
+
+SECTION_NAMES = {
+    0: "custom",
+    1: "type",
+    2: "import",
+    3: "function",
+    4: "table",
+    5: "memory",
+    6: "global",
+    7: "export",
+    8: "start",
+    9: "element",
+    10: "code",
+    11: "data",
+    12: "datacount",
+}
+
+
+class WasmEncodingError(Exception):
+    """Raised when a module or instruction cannot be encoded."""
+
+
+class WasmValidationError(Exception):
+    """Raised when a binary module fails the validation self-check."""
+
+
+# === LEB128 ===
+
+_SMALL_UNSIGNED = tuple(bytes((value,)) for value in range(128))
+
+
+def encode_unsigned(value: int) -> bytes:
+    """Unsigned LEB128 encoding of ``value``."""
+    if 0 <= value < 128:
+        return _SMALL_UNSIGNED[value]
+    if value < 0:
+        raise WasmEncodingError(f"Negative value for unsigned LEB128: {value}")
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def encode_signed(value: int) -> bytes:
+    """Signed LEB128 encoding of ``value``."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if (value == 0 and not byte & 0x40) or (value == -1 and byte & 0x40):
+            out.append(byte)
+            return bytes(out)
+        out.append(byte | 0x80)
+
+
+def decode_unsigned(data: bytes, offset: int, bits: int = 32) -> Tuple[int, int]:
+    """Decode an unsigned LEB128 of at most ``bits`` bits; returns (value, next offset)."""
+    result = shift = 0
+    limit = offset + (bits + 6) // 7
+    while True:
+        if offset >= len(data):
+            raise WasmValidationError("unexpected end of data in LEB128")
+        if offset >= limit:
+            raise WasmValidationError(f"LEB128 longer than {bits} bits")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+    if result >> bits:
+        raise WasmValidationError(f"LEB128 value does not fit in {bits} bits")
+    return result, offset
+
+
+def decode_signed(data: bytes, offset: int, bits: int = 32) -> Tuple[int, int]:
+    """Decode a signed LEB128 of at most ``bits`` bits; returns (value, next offset)."""
+    result = shift = 0
+    limit = offset + (bits + 6) // 7
+    while True:
+        if offset >= len(data):
+            raise WasmValidationError("unexpected end of data in LEB128")
+        if offset >= limit:
+            raise WasmValidationError(f"LEB128 longer than {bits} bits")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+    if byte & 0x40:
+        result -= 1 << shift
+    if not -(1 << (bits - 1)) <= result < (1 << (bits - 1)):
+        raise WasmValidationError(f"LEB128 value does not fit in {bits} bits")
+    return result, offset
+
+
+def _name(text: str) -> bytes:
+    raw = text.encode("utf-8")
+    return encode_unsigned(len(raw)) + raw
+
+
+def _vector(items: Sequence[bytes]) -> bytes:
+    return encode_unsigned(len(items)) + b"".join(items)
+
+
+def _section(section_id: int, payload: bytes) -> bytes:
+    return bytes((section_id,)) + encode_unsigned(len(payload)) + payload
+
+
+# === Opcodes ===
+
+# name -> (opcode bytes, immediate kind)
+OPCODES: Dict[str, Tuple[bytes, Optional[str]]] = {
+    "unreachable": (b"\x00", None),
+    "nop": (b"\x01", None),
+    "br": (b"\x0c", "label"),
+    "br_if": (b"\x0d", "label"),
+    "br_table": (b"\x0e", "labels"),
+    "return": (b"\x0f", None),
+    "call": (b"\x10", "func"),
+    "drop": (b"\x1a", None),
+    "select": (b"\x1b", None),
+    "local.get": (b"\x20", "local"),
+    "local.set": (b"\x21", "local"),
+    "local.tee": (b"\x22", "local"),
+    "global.get": (b"\x23", "global"),
+    "global.set": (b"\x24", "global"),
+    "memory.size": (b"\x3f", "zero"),
+    "memory.grow": (b"\x40", "zero"),
+    "i32.const": (b"\x41", "i32"),
+    "i64.const": (b"\x42", "i64"),
+    "f32.const": (b"\x43", "f32"),
+    "f64.const": (b"\x44", "f64"),
+}
+_BLOCK_OPCODES = {"block": 0x02, "loop": 0x03, "if": 0x04}
+
+_MEMORY_OPS = (
+    "i32.load i64.load f32.load f64.load "
+    "i32.load8_s i32.load8_u i32.load16_s i32.load16_u "
+    "i64.load8_s i64.load8_u i64.load16_s i64.load16_u i64.load32_s i64.load32_u "
+    "i32.store i64.store f32.store f64.store "
+    "i32.store8 i32.store16 i64.store8 i64.store16 i64.store32"
+).split()
+
+_NUMERIC_OPS = (
+    "i32.eqz i32.eq i32.ne i32.lt_s i32.lt_u i32.gt_s i32.gt_u "
+    "i32.le_s i32.le_u i32.ge_s i32.ge_u "
+    "i64.eqz i64.eq i64.ne i64.lt_s i64.lt_u i64.gt_s i64.gt_u "
+    "i64.le_s i64.le_u i64.ge_s i64.ge_u "
+    "f32.eq f32.ne f32.lt f32.gt f32.le f32.ge "
+    "f64.eq f64.ne f64.lt f64.gt f64.le f64.ge "
+    "i32.clz i32.ctz i32.popcnt i32.add i32.sub i32.mul i32.div_s i32.div_u "
+    "i32.rem_s i32.rem_u i32.and i32.or i32.xor i32.shl i32.shr_s i32.shr_u "
+    "i32.rotl i32.rotr "
+    "i64.clz i64.ctz i64.popcnt i64.add i64.sub i64.mul i64.div_s i64.div_u "
+    "i64.rem_s i64.rem_u i64.and i64.or i64.xor i64.shl i64.shr_s i64.shr_u "
+    "i64.rotl i64.rotr "
+    "f32.abs f32.neg f32.ceil f32.floor f32.trunc f32.nearest f32.sqrt "
+    "f32.add f32.sub f32.mul f32.div f32.min f32.max f32.copysign "
+    "f64.abs f64.neg f64.ceil f64.floor f64.trunc f64.nearest f64.sqrt "
+    "f64.add f64.sub f64.mul f64.div f64.min f64.max f64.copysign "
+    "i32.wrap_i64 i32.trunc_f32_s i32.trunc_f32_u i32.trunc_f64_s i32.trunc_f64_u "
+    "i64.extend_i32_s i64.extend_i32_u i64.trunc_f32_s i64.trunc_f32_u "
+    "i64.trunc_f64_s i64.trunc_f64_u "
+    "f32.convert_i32_s f32.convert_i32_u f32.convert_i64_s f32.convert_i64_u "
+    "f32.demote_f64 "
+    "f64.convert_i32_s f64.convert_i32_u f64.convert_i64_s f64.convert_i64_u "
+    "f64.promote_f32 "
+    "i32.reinterpret_f32 i64.reinterpret_f64 f32.reinterpret_i32 f64.reinterpret_i64 "
+    "i32.extend8_s i32.extend16_s i64.extend8_s i64.extend16_s i64.extend32_s"
+).split()
+
+for _code, _op in enumerate(_MEMORY_OPS, 0x28):
+    OPCODES[_op] = (bytes((_code,)), "memarg")
+for _code, _op in enumerate(_NUMERIC_OPS, 0x45):
+    OPCODES[_op] = (bytes((_code,)), None)
+
+_UNARY = frozenset(
+    "clz ctz popcnt abs neg ceil floor trunc nearest sqrt extend8_s extend16_s "
+    "extend32_s".split()
+)
+_CONVERSION = re.compile(r"[a-z]+_([if](?:32|64))(?:_[su])?$")
+
+
+def _natural_alignment(op: str) -> int:
+    """log2 of the access size in bytes of a load or store."""
+    width = re.search(r"(?:load|store)(8|16|32)", op)
+    bits = int(width.group(1)) if width else int(op[1:3])
+    return {8: 0, 16: 1, 32: 2, 64: 3}[bits]
+
+
+def _numeric_signature(op: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    operand, name = op.split(".")
+    if name == "eqz":
+        return (operand,), ("i32",)
+    if name.split("_")[0] in ("eq", "ne", "lt", "gt", "le", "ge"):
+        return (operand, operand), ("i32",)
+    conversion = _CONVERSION.match(name)
+    if conversion:
+        return (conversion.group(1),), (operand,)
+    if name in _UNARY:
+        return (operand,), (operand,)
+    return (operand, operand), (operand,)
+
+
+# Opcode byte tables for the validator
+_SIGNATURES = {
+    OPCODES[op][0][0]: _numeric_signature(op) for op in _NUMERIC_OPS
+}
+_MEMORY = {
+    OPCODES[op][0][0]: (op, op.split(".")[0], "store" in op, _natural_alignment(op))
+    for op in _MEMORY_OPS
+}
+
+
+# === Instruction Assembly ===
+
+_TOKEN = re.compile(r'\s+|;;[^\n]*|\(;.*?;\)|(\(|\)|"(?:[^"\\]|\\.)*"|[^\s()";]+)', re.S)
+_INT32_RANGE = (-(1 << 31), 1 << 32)
+_INT64_RANGE = (-(1 << 63), 1 << 64)
+
+
+def _parse_int(text: str, bits: int) -> int:
+    clean = text.replace("_", "")
+    try:
+        value = int(clean, 0) if "x" in clean.lower() else int(clean, 10)
+    except ValueError:
+        raise WasmEncodingError(f"Invalid i{bits} literal: {text}") from None
+    low, high = _INT32_RANGE if bits == 32 else _INT64_RANGE
+    if not low <= value < high:
+        raise WasmEncodingError(f"i{bits} literal out of range: {text}")
+    # Unsigned spellings of negative values wrap to the signed encoding
+    return value - (1 << bits) if value >= 1 << (bits - 1) else value
+
+
+def _parse_float(text: str, bits: int) -> bytes:
+    clean = text.replace("_", "")
+    sign = -1.0 if clean.startswith("-") else 1.0
+    magnitude = clean.lstrip("+-")
+    try:
+        if magnitude.startswith("nan"):
+            value = math.copysign(math.nan, sign)
+            if magnitude.startswith("nan:"):
+                payload = int(magnitude[4:], 0)
+                if bits == 32:
+                    raw = (0xFF << 23) | (payload & 0x7FFFFF) | ((sign < 0) << 31)
+                    return struct.pack("<I", raw)
+                raw = (0x7FF << 52) | (payload & ((1 << 52) - 1)) | ((sign < 0) << 63)
+                return struct.pack("<Q", raw)
+        elif magnitude.startswith("0x"):
+            value = sign * float.fromhex(magnitude)
+        else:
+            value = sign * float(magnitude)
+        return struct.pack("<f" if bits == 32 else "<d", value)
+    except (ValueError, OverflowError, struct.error):
+        raise WasmEncodingError(f"Invalid f{bits} literal: {text}") from None
+
+
+def _is_label(token: Optional[str]) -> bool:
+    """True for a label immediate: ``$name`` or a relative depth."""
+    return token is not None and (token.startswith("$") or token.isdigit())
+
+
+class _FoldedIf:
+    """An open ``(if ...`` on the folded-expression stack."""
+
+    __slots__ = ("label", "blocktype", "state")
+
+    def __init__(self, label: Optional[str], blocktype: bytes):
+        self.label = label
+        self.blocktype = blocktype
+        self.state = 0  # 0 condition, 1 in then, 2 then closed, 3 in else, 4 else closed
+
+
+# What a ")" emits besides pending opcode bytes: a block's "end", or nothing
+_END_BLOCK = "end"
+_CLOSE_ARM = "arm"
+
+
+# Tokens whose encoding depends on the surrounding blocks
+_CONTEXT_TOKENS = frozenset({"block", "loop", "if", "then", "else", "end", "br", "br_if", "br_table"})
+
+
+def _self_contained(tokens: List[str]) -> bool:
+    """True if a line's tokens are balanced and refer to no labels."""
+    depth = 0
+    for token in tokens:
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            if depth < 0:
+                return False
+        elif token in _CONTEXT_TOKENS:
+            return False
+    return depth == 0
+
+
+class _FunctionAssembler:
+    """Assembles the WAT instruction text of one function body.
+
+    Folded expressions are handled without recursion: ``(op ...`` pushes what
+    its ``)`` has to emit (the operator's bytes, or a block's ``end``), so
+    operands are written before their operator. Body lines that stand alone
+    (balanced, no labels) are cached by the encoder per local layout, so
+    repeated lines are assembled once per module.
+    """
+
+    def __init__(self, encoder: WasmBinaryEncoder, func: WasmFunction):
+        self.encoder = encoder
+        self.func = func
+        names = [name for name, _ in func.params] + [local.name for local in func.locals]
+        self.locals = {name: index for index, name in enumerate(names)}
+        self.layout = tuple(names)
+        self.labels: List[Optional[str]] = []
+        self.tokens: List[str] = []
+        self.pos = 0
+        self.lines = iter(func.body)
+        self.crossed = False  # the current line read tokens of a later line
+
+    def assemble(self) -> bytes:
+        tokens = self.tokens
+        labels = self.labels
+        simple = self._simple
+        cache = self.encoder.line_cache
+        layout = self.layout
+        pending: List[object] = []
+        out = bytearray()
+        line: Optional[str] = None
+        line_tokens: List[str] = []
+        mark = 0
+
+        while True:
+            if self.pos == len(tokens):
+                # Line boundary: everything read so far has been assembled
+                if line is not None and not self.crossed and _self_contained(line_tokens):
+                    cache[(line, layout)] = bytes(out[mark:])
+                line = next(self.lines, None)
+                if line is None:
+                    break
+                cached = cache.get((line, layout))
+                if cached is not None:
+                    out += cached
+                    line = None
+                    continue
+                line_tokens = [token for token in _TOKEN.findall(line) if token]
+                tokens.extend(line_tokens)
+                mark = len(out)
+                self.crossed = False
+                continue
+
+            token = tokens[self.pos]
+            self.pos += 1
+            if token == "(":
+                op = self._next()
+                if op in ("block", "loop"):
+                    label = self._label_definition()
+                    out.append(_BLOCK_OPCODES[op])
+                    out += self._blocktype()
+                    labels.append(label)
+                    pending.append(_END_BLOCK)
+                elif op == "if":
+                    label = self._label_definition()
+                    pending.append(_FoldedIf(label, self._blocktype()))
+                elif op in ("then", "else"):
+                    folded = pending[-1] if pending else None
+                    if folded.__class__ is not _FoldedIf or folded.state != (
+                        0 if op == "then" else 2
+                    ):
+                        raise self._error(f"misplaced '({op}'")
+                    if op == "then":
+                        out.append(0x04)
+                        out += folded.blocktype
+                        labels.append(folded.label)
+                    else:
+                        out.append(0x05)
+                    folded.state += 1
+                    pending.append(_CLOSE_ARM)
+                else:
+                    pending.append(simple(op))
+            elif token == ")":
+                if not pending:
+                    raise self._error("unbalanced ')'")
+                item = pending.pop()
+                if item.__class__ is bytes:
+                    out += item
+                elif item is _END_BLOCK:
+                    labels.pop()
+                    out.append(0x0B)
+                elif item is _CLOSE_ARM:
+                    pending[-1].state += 1
+                else:
+                    if item.state not in (2, 4):
+                        raise self._error("folded 'if' without '(then ...)'")
+                    labels.pop()
+                    out.append(0x0B)
+            elif token in _BLOCK_OPCODES:
+                label = self._label_definition()
+                out.append(_BLOCK_OPCODES[token])
+                out += self._blocktype()
+                labels.append(label)
+            elif token == "else":
+                self._label_definition()
+                out.append(0x05)
+            elif token == "end":
+                self._label_definition()
+                if not labels:
+                    raise self._error("'end' without an open block")
+                labels.pop()
+                out.append(0x0B)
+            else:
+                out += simple(token)
+
+        if pending:
+            raise self._error("missing ')'")
+        if labels:
+            raise self._error("block without 'end'")
+        out.append(0x0B)
+        return bytes(out)
+
+    def _error(self, message: str) -> WasmEncodingError:
+        return WasmEncodingError(f"In function ${self.func.name}: {message}")
+
+    # --- Token stream ---
+
+    def _load_line(self) -> bool:
+        """Tokenize the next body line; False at the end of the body."""
+        line = next(self.lines, None)
+        if line is None:
+            return False
+        self.tokens.extend(token for token in _TOKEN.findall(line) if token)
+        self.crossed = True
+        return True
+
+    def _peek(self, ahead: int = 0) -> Optional[str]:
+        index = self.pos + ahead
+        while index >= len(self.tokens):
+            if not self._load_line():
+                return None
+        return self.tokens[index]
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise self._error("unexpected end of instructions")
+        self.pos += 1
+        return token
+
+    def _expect(self, token: str) -> None:
+        found = self._next()
+        if found != token:
+            raise self._error(f"expected '{token}', found '{found}'")
+
+    def _atom(self) -> Optional[str]:
+        """Next token if it is an immediate (not a parenthesis)."""
+        token = self._peek()
+        if token is None or token in ("(", ")"):
+            return None
+        self.pos += 1
+        return token
+
+    def _label_definition(self) -> Optional[str]:
+        token = self._peek()
+        if token is not None and token.startswith("$"):
+            self.pos += 1
+            return token
+        return None
+
+    def _blocktype(self) -> bytes:
+        params: List[str] = []
+        results: List[str] = []
+        while self._peek() == "(" and self._peek(1) in ("param", "result", "type"):
+            self.pos += 1
+            kind = self._next()
+            if kind == "type":
+                index = self._next()
+                self._expect(")")
+                return encode_signed(int(index))
+            values = params if kind == "param" else results
+            while self._peek() not in (")", None):
+                values.append(self._valtype(self._next()))
+            self._expect(")")
+        if not params and not results:
+            return bytes((_EMPTY_BLOCK,))
+        if not params and len(results) == 1:
+            return bytes((VALUE_TYPES[results[0]],))
+        return encode_signed(self.encoder.type_index(params, results))
+
+    def _valtype(self, token: str) -> str:
+        if token not in VALUE_TYPES:
+            raise self._error(f"unknown value type '{token}'")
+        return token
+
+    # --- Instructions with immediates ---
+
+    def _simple(self, op: str) -> bytes:
+        spec = OPCODES.get(op)
+        if spec is None:
+            raise self._error(f"unknown instruction '{op}'")
+        code, kind = spec
+        if kind is None:
+            return code
+        if kind == "local":
+            return code + encode_unsigned(self._index(self.locals, "local"))
+        if kind == "func":
+            return code + encode_unsigned(self._index(self.encoder.function_indices, "function"))
+        if kind == "global":
+            return code + encode_unsigned(self._index({}, "global"))
+        if kind == "label":
+            return code + encode_unsigned(self._label())
+        if kind == "labels":
+            targets = []
+            while _is_label(self._peek()):
+                targets.append(self._label())
+            if not targets:
+                raise self._error("br_table needs at least a default label")
+            return code + _vector([encode_unsigned(t) for t in targets[:-1]]) + encode_unsigned(
+                targets[-1]
+            )
+        if kind == "zero":
+            return code + b"\x00"
+        if kind == "memarg":
+            return code + self._memarg(op)
+        literal = self._atom()
+        if literal is None:
+            raise self._error(f"'{op}' needs a value")
+        try:
+            if kind == "i32":
+                return code + encode_signed(_parse_int(literal, 32))
+            if kind == "i64":
+                return code + encode_signed(_parse_int(literal, 64))
+            return code + _parse_float(literal, 32 if kind == "f32" else 64)
+        except WasmEncodingError as error:
+            raise self._error(str(error)) from None
+
+    def _index(self, names: Dict[str, int], what: str) -> int:
+        token = self._atom()
+        if token is None:
+            raise self._error(f"missing {what} index")
+        if token.startswith("$"):
+            index = names.get(token[1:])
+            if index is None:
+                raise self._error(f"unknown {what} '{token}'")
+            return index
+        try:
+            return int(token)
+        except ValueError:
+            raise self._error(f"invalid {what} index '{token}'") from None
+
+    def _label(self) -> int:
+        token = self._atom()
+        if token is None:
+            raise self._error("missing label")
+        if token.startswith("$"):
+            for depth, label in enumerate(reversed(self.labels)):
+                if label == token:
+                    return depth
+            raise self._error(f"unknown label '{token}'")
+        if not token.isdigit():
+            raise self._error(f"invalid label '{token}'")
+        return int(token)
+
+    def _memarg(self, op: str) -> bytes:
+        natural = _natural_alignment(op)
+        offset, align = 0, natural
+        while self._peek() is not None and self._peek().startswith(("offset=", "align=")):
+            key, _, value = self._next().partition("=")
+            number = int(value.replace("_", ""), 0)
+            if key == "offset":
+                offset = number
+            else:
+                if number <= 0 or number & (number - 1):
+                    raise self._error(f"alignment must be a power of two: {number}")
+                align = number.bit_length() - 1
+        return encode_unsigned(align) + encode_unsigned(offset)
+
+
+# === Module Encoding ===
+
+
+def _wasm_type(value: object) -> str:
+    return getattr(value, "value", value)
+
+
+class WasmBinaryEncoder:
+    """Encodes one ``WasmModule`` to the binary format."""
+
+    def __init__(self, module: WasmModule, names: bool = True):
+        self.module = module
+        self.names = names
+        self.types: List[Tuple[Tuple[str, ...], Tuple[str, ...]]] = []
+        self._type_indices: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], int] = {}
+        self.function_indices: Dict[str, int] = {}
+        # (line, local names) -> bytes of a self-contained body line
+        self.line_cache: Dict[Tuple[str, Tuple[str, ...]], bytes] = {}
+
+    def type_index(self, params: Sequence[str], results: Sequence[str]) -> int:
+        """Index of a function type, adding it once per distinct signature."""
+        signature = (tuple(params), tuple(results))
+        index = self._type_indices.get(signature)
+        if index is None:
+            index = self._type_indices[signature] = len(self.types)
+            self.types.append(signature)
+        return index
+
+    def _signature(self, params: Sequence[Tuple[str, object]], result: object) -> int:
+        return self.type_index(
+            [_wasm_type(kind) for _, kind in params],
+            [_wasm_type(result)] if result is not None else [],
+        )
+
+    def encode(self) -> bytes:
+        module = self.module
+        imports = list(module.imports.values())
+        functions = list(module.functions.values())
+        for index, name in enumerate(
+            [imp.name for imp in imports] + [func.name for func in functions]
+        ):
+            if name in self.function_indices:
+                raise WasmEncodingError(f"Duplicate function name '${name}'")
+            self.function_indices[name] = index
+
+        import_entries = [
+            _name(imp.module) + _name(imp.name) + b"\x00"
+            + encode_unsigned(self._signature(imp.params, imp.return_type))
+            for imp in imports
+        ]
+        function_types = [
+            encode_unsigned(self._signature(func.params, func.return_type))
+            for func in functions
+        ]
+        code_entries = []
+        for func in functions:
+            body = self._locals(func) + _FunctionAssembler(self, func).assemble()
+            code_entries.append(encode_unsigned(len(body)) + body)
+        exports = [
+            _name(func.name) + b"\x00" + encode_unsigned(self.function_indices[func.name])
+            for func in functions
+            if func.is_export
+        ]
+        if not 0 <= module.memory_size <= MAX_PAGES:
+            raise WasmEncodingError(f"Memory size out of range: {module.memory_size} pages")
+
+        out = bytearray(WASM_MAGIC + WASM_VERSION)
+        out += _section(1, _vector([
+            bytes((_FUNC_FORM,))
+            + _vector([bytes((VALUE_TYPES[t],)) for t in params])
+            + _vector([bytes((VALUE_TYPES[t],)) for t in results])
+            for params, results in self.types
+        ]))
+        if import_entries:
+            out += _section(2, _vector(import_entries))
+        if function_types:
+            out += _section(3, _vector(function_types))
+        out += _section(5, _vector([b"\x00" + encode_unsigned(module.memory_size)]))
+        if exports:
+            out += _section(7, _vector(exports))
+        if code_entries:
+            out += _section(10, _vector(code_entries))
+        if module.data_segment:
+            out += _section(11, _vector([
+                b"\x00\x41" + encode_signed(_parse_int(str(address), 32)) + b"\x0b"
+                + encode_unsigned(len(data)) + bytes(data)
+                for address, data in sorted(module.data_segment.items())
+            ]))
+        if self.names:
+            out += self._name_section(imports, functions)
+        return bytes(out)
+
+    def _locals(self, func: WasmFunction) -> bytes:
+        """Local declarations, run-length encoded by type."""
+        groups: List[List] = []
+        for local in func.locals:
+            kind = _wasm_type(local.wasm_type)
+            if groups and groups[-1][1] == kind:
+                groups[-1][0] += 1
+            else:
+                groups.append([1, kind])
+        return _vector([
+            encode_unsigned(count) + bytes((VALUE_TYPES[kind],)) for count, kind in groups
+        ])
+
+    def _name_section(self, imports: List, functions: List) -> bytes:
+        function_names = [
+            encode_unsigned(index) + _name(name)
+            for name, index in self.function_indices.items()
+        ]
+        local_names = []
+        for func in functions:
+            names = [name for name, _ in func.params] + [local.name for local in func.locals]
+            local_names.append(
+                encode_unsigned(self.function_indices[func.name])
+                + _vector([encode_unsigned(i) + _name(n) for i, n in enumerate(names)])
+            )
+        payload = _name("name")
+        for subsection, content in (
+            (0, _name(self.module.name)),
+            (1, _vector(function_names)),
+            (2, _vector(local_names)),
+        ):
+            payload += bytes((subsection,)) + encode_unsigned(len(content)) + content
+        return _section(0, payload)
+
+
+def encode_module(module: WasmModule, names: bool = True, validate: bool = False) -> bytes:
+    """Binary encoding of ``module``; ``validate`` runs ``validate_wasm`` on it."""
+    data = WasmBinaryEncoder(module, names=names).encode()
+    if validate:
+        validate_wasm(data)
+    return data
+
+
+# === Validation ===
+
+
+class _Frame:
+    __slots__ = ("opcode", "params", "results", "height", "unreachable")
+
+    def __init__(self, opcode: int, params: Tuple[str, ...], results: Tuple[str, ...], height: int):
+        self.opcode = opcode
+        self.params = params
+        self.results = results
+        self.height = height
+        self.unreachable = False
+
+    def label_types(self) -> Tuple[str, ...]:
+        return self.params if self.opcode == 0x03 else self.results
+
+
+class WasmValidator:
+    """Decodes a binary module and checks it (structure, indices and types)."""
+
+    def __init__(self, data: bytes):
+        self.data = bytes(data)
+        self.types: List[Tuple[Tuple[str, ...], Tuple[str, ...]]] = []
+        self.functions: List[int] = []  # type index per function (imports first)
+        self.imported_functions = 0
+        self.memories = 0
+        self.section_sizes: Dict[str, int] = {}
+        self.code_count: Optional[int] = None
+
+    def validate(self) -> Dict[str, int]:
+        """Validate the module; returns the byte size of each section."""
+        data = self.data
+        if data[:4] != WASM_MAGIC:
+            raise WasmValidationError("missing \\0asm magic number")
+        if data[4:8] != WASM_VERSION:
+            raise WasmValidationError("unsupported binary version")
+        offset = 8
+        last_id = 0
+        while offset < len(data):
+            section_id = data[offset]
+            size, start = decode_unsigned(data, offset + 1)
+            end = start + size
+            if end > len(data):
+                raise WasmValidationError(f"section {section_id} runs past the end of the module")
+            if section_id not in SECTION_NAMES:
+                raise WasmValidationError(f"unknown section id {section_id}")
+            if section_id:
+                if section_id <= last_id:
+                    raise WasmValidationError(
+                        f"section '{SECTION_NAMES[section_id]}' out of order or repeated"
+                    )
+                last_id = section_id
+            reader = getattr(self, f"_section_{SECTION_NAMES[section_id]}", None)
+            if reader is None:
+                raise WasmValidationError(
+                    f"section '{SECTION_NAMES[section_id]}' is not supported by the self-check"
+                )
+            if reader(start, end) != end:
+                raise WasmValidationError(
+                    f"section '{SECTION_NAMES[section_id]}' size does not match its contents"
+                )
+            name = SECTION_NAMES[section_id]
+            self.section_sizes[name] = self.section_sizes.get(name, 0) + end - offset
+            offset = end
+
+        defined = len(self.functions) - self.imported_functions
+        if defined != (self.code_count or 0):
+            raise WasmValidationError(
+                f"{defined} function declarations but {self.code_count or 0} bodies"
+            )
+        return self.section_sizes
+
+    # --- Helpers ---
+
+    def _u32(self, offset: int) -> Tuple[int, int]:
+        return decode_unsigned(self.data, offset)
+
+    def _byte(self, offset: int, end: int) -> int:
+        if offset >= end:
+            raise WasmValidationError("unexpected end of section")
+        return self.data[offset]
+
+    def _string(self, offset: int, end: int) -> Tuple[str, int]:
+        length, offset = self._u32(offset)
+        if offset + length > end:
+            raise WasmValidationError("name runs past the end of its section")
+        try:
+            return self.data[offset:offset + length].decode("utf-8"), offset + length
+        except UnicodeDecodeError:
+            raise WasmValidationError("name is not valid UTF-8") from None
+
+    def _valtype(self, offset: int, end: int) -> str:
+        code = self._byte(offset, end)
+        if code not in _TYPE_NAMES:
+            raise WasmValidationError(f"invalid value type 0x{code:02x}")
+        return _TYPE_NAMES[code]
+
+    def _type_index(self, index: int) -> int:
+        if index >= len(self.types):
+            raise WasmValidationError(f"type index {index} out of range")
+        return index
+
+    def _limits(self, offset: int, end: int) -> int:
+        flag = self._byte(offset, end)
+        minimum, offset = self._u32(offset + 1)
+        maximum = None
+        if flag == 1:
+            maximum, offset = self._u32(offset)
+        elif flag != 0:
+            raise WasmValidationError(f"invalid limits flag {flag}")
+        if minimum > MAX_PAGES or (maximum is not None and not minimum <= maximum <= MAX_PAGES):
+            raise WasmValidationError("memory limits out of range")
+        return offset
+
+    # --- Sections ---
+
+    def _section_custom(self, start: int, end: int) -> int:
+        self._string(start, end)
+        return end
+
+    def _section_type(self, start: int, end: int) -> int:
+        count, offset = self._u32(start)
+        for _ in range(count):
+            if self._byte(offset, end) != _FUNC_FORM:
+                raise WasmValidationError("function type must start with 0x60")
+            offset += 1
+            signature = []
+            for _ in range(2):
+                length, offset = self._u32(offset)
+                values = []
+                for _ in range(length):
+                    values.append(self._valtype(offset, end))
+                    offset += 1
+                signature.append(tuple(values))
+            self.types.append((signature[0], signature[1]))
+        return offset
+
+    def _section_import(self, start: int, end: int) -> int:
+        count, offset = self._u32(start)
+        for _ in range(count):
+            _, offset = self._string(offset, end)
+            _, offset = self._string(offset, end)
+            kind = self._byte(offset, end)
+            if kind == 0:
+                index, offset = self._u32(offset + 1)
+                self.functions.append(self._type_index(index))
+                self.imported_functions += 1
+            elif kind == 2:
+                offset = self._limits(offset + 1, end)
+                self.memories += 1
+            else:
+                raise WasmValidationError(f"import kind {kind} is not supported by the self-check")
+        return offset
+
+    def _section_function(self, start: int, end: int) -> int:
+        count, offset = self._u32(start)
+        for _ in range(count):
+            index, offset = self._u32(offset)
+            self.functions.append(self._type_index(index))
+        return offset
+
+    def _section_memory(self, start: int, end: int) -> int:
+        count, offset = self._u32(start)
+        for _ in range(count):
+            offset = self._limits(offset, end)
+            self.memories += 1
+        if self.memories > 1:
+            raise WasmValidationError("at most one memory is allowed")
+        return offset
+
+    def _section_export(self, start: int, end: int) -> int:
+        count, offset = self._u32(start)
+        seen = set()
+        for _ in range(count):
+            name, offset = self._string(offset, end)
+            if name in seen:
+                raise WasmValidationError(f"duplicate export name '{name}'")
+            seen.add(name)
+            kind = self._byte(offset, end)
+            index, offset = self._u32(offset + 1)
+            limit = {0: len(self.functions), 2: self.memories}.get(kind)
+            if limit is None:
+                raise WasmValidationError(f"export kind {kind} is not supported by the self-check")
+            if index >= limit:
+                raise WasmValidationError(f"export '{name}' index {index} out of range")
+        return offset
+
+    def _section_code(self, start: int, end: int) -> int:
+        count, offset = self._u32(start)
+        self.code_count = count
+        for number in range(count):
+            size, body = self._u32(offset)
+            offset = body + size
+            if offset > end:
+                raise WasmValidationError(f"function body {number} runs past the code section")
+            function_index = self.imported_functions + number
+            if function_index >= len(self.functions):
+                raise WasmValidationError("more function bodies than declarations")
+            try:
+                self._function_body(self.types[self.functions[function_index]], body, offset)
+            except WasmValidationError as error:
+                raise WasmValidationError(f"function {function_index}: {error}") from None
+        return offset
+
+    def _section_data(self, start: int, end: int) -> int:
+        count, offset = self._u32(start)
+        for number in range(count):
+            flag, offset = self._u32(offset)
+            if flag == 2:
+                memory, offset = self._u32(offset)
+                flag = 0 if memory == 0 else flag
+            if flag != 0:
+                raise WasmValidationError(f"data segment {number}: unsupported mode {flag}")
+            if not self.memories:
+                raise WasmValidationError(f"data segment {number} without a memory")
+            if self._byte(offset, end) != 0x41:
+                raise WasmValidationError(f"data segment {number}: offset must be i32.const")
+            address, offset = decode_signed(self.data, offset + 1, 32)
+            if self._byte(offset, end) != 0x0B:
+                raise WasmValidationError(f"data segment {number}: offset expression not ended")
+            length, offset = self._u32(offset + 1)
+            offset += length
+            if offset > end:
+                raise WasmValidationError(f"data segment {number} runs past its section")
+            if address < 0:
+                raise WasmValidationError(f"data segment {number} has a negative address")
+        return offset
+
+    # --- Function bodies ---
+
+    def _function_body(
+        self, signature: Tuple[Tuple[str, ...], Tuple[str, ...]], offset: int, end: int
+    ) -> None:
+        data = self.data
+        params, results = signature
+        local_types = list(params)
+        groups, offset = self._u32(offset)
+        for _ in range(groups):
+            count, offset = self._u32(offset)
+            if len(local_types) + count > 50000:
+                raise WasmValidationError("too many locals")
+            local_types.extend([self._valtype(offset, end)] * count)
+            offset += 1
+
+        values: List[Optional[str]] = []
+        frames = [_Frame(0x02, (), results, 0)]
+
+        def pop(expected: Optional[str] = None) -> Optional[str]:
+            frame = frames[-1]
+            if len(values) == frame.height:
+                if frame.unreachable:
+                    return expected
+                raise WasmValidationError(
+                    f"operand stack underflow at byte {offset}"
+                )
+            actual = values.pop()
+            if actual is not None and expected is not None and actual != expected:
+                raise WasmValidationError(
+                    f"type mismatch at byte {offset}: expected {expected}, found {actual}"
+                )
+            return actual if actual is not None else expected
+
+        def pop_all(types: Sequence[str]) -> None:
+            for kind in reversed(types):
+                pop(kind)
+
+        def end_frame() -> _Frame:
+            frame = frames[-1]
+            pop_all(frame.results)
+            if len(values) != frame.height:
+                raise WasmValidationError(f"values left on the stack at byte {offset}")
+            return frames.pop()
+
+        def unreachable() -> None:
+            frame = frames[-1]
+            del values[frame.height:]
+            frame.unreachable = True
+
+        def label(depth: int) -> _Frame:
+            if depth >= len(frames):
+                raise WasmValidationError(f"branch depth {depth} out of range")
+            return frames[-1 - depth]
+
+        while frames:
+            if offset >= end:
+                raise WasmValidationError("function body does not end with 'end'")
+            opcode = data[offset]
+            offset += 1
+
+            if opcode in _SIGNATURES:
+                inputs, outputs = _SIGNATURES[opcode]
+                pop_all(inputs)
+                values.extend(outputs)
+            elif opcode in (0x02, 0x03, 0x04):
+                if opcode == 0x04:
+                    pop("i32")
+                block_params, block_results, offset = self._blocktype(offset, end)
+                pop_all(block_params)
+                frames.append(_Frame(opcode, block_params, block_results, len(values)))
+                values.extend(block_params)
+            elif opcode == 0x05:
+                frame = end_frame()
+                if frame.opcode != 0x04:
+                    raise WasmValidationError("'else' without 'if'")
+                frames.append(_Frame(0x05, frame.params, frame.results, len(values)))
+                values.extend(frame.params)
+            elif opcode == 0x0B:
+                frame = end_frame()
+                if frame.opcode == 0x04 and frame.params != frame.results:
+                    raise WasmValidationError("'if' without 'else' must not change the stack")
+                values.extend(frame.results)
+            elif opcode == 0x0C:
+                depth, offset = self._u32(offset)
+                pop_all(label(depth).label_types())
+                unreachable()
+            elif opcode == 0x0D:
+                depth, offset = self._u32(offset)
+                pop("i32")
+                types = label(depth).label_types()
+                pop_all(types)
+                values.extend(types)
+            elif opcode == 0x0E:
+                count, offset = self._u32(offset)
+                depths = []
+                for _ in range(count + 1):
+                    depth, offset = self._u32(offset)
+                    depths.append(depth)
+                pop("i32")
+                arity = len(label(depths[-1]).label_types())
+                if any(len(label(depth).label_types()) != arity for depth in depths):
+                    raise WasmValidationError("br_table targets have different arities")
+                pop_all(label(depths[-1]).label_types())
+                unreachable()
+            elif opcode == 0x0F:
+                pop_all(results)
+                unreachable()
+            elif opcode == 0x10:
+                index, offset = self._u32(offset)
+                if index >= len(self.functions):
+                    raise WasmValidationError(f"call to unknown function {index}")
+                callee_params, callee_results = self.types[self.functions[index]]
+                pop_all(callee_params)
+                values.extend(callee_results)
+            elif opcode in (0x20, 0x21, 0x22):
+                index, offset = self._u32(offset)
+                if index >= len(local_types):
+                    raise WasmValidationError(f"local index {index} out of range")
+                kind = local_types[index]
+                if opcode == 0x20:
+                    values.append(kind)
+                else:
+                    pop(kind)
+                    if opcode == 0x22:
+                        values.append(kind)
+            elif opcode in _MEMORY:
+                name, kind, is_store, natural = _MEMORY[opcode]
+                if not self.memories:
+                    raise WasmValidationError(f"'{name}' without a memory")
+                align, offset = self._u32(offset)
+                _, offset = self._u32(offset)
+                if align > natural:
+                    raise WasmValidationError(f"'{name}' alignment larger than natural")
+                if is_store:
+                    pop(kind)
+                    pop("i32")
+                else:
+                    pop("i32")
+                    values.append(kind)
+            elif opcode in (0x3F, 0x40):
+                if not self.memories:
+                    raise WasmValidationError("memory instruction without a memory")
+                if self._byte(offset, end) != 0:
+                    raise WasmValidationError("memory.size/grow reserved byte must be 0")
+                offset += 1
+                if opcode == 0x40:
+                    pop("i32")
+                values.append("i32")
+            elif opcode == 0x41:
+                _, offset = decode_signed(data, offset, 32)
+                values.append("i32")
+            elif opcode == 0x42:
+                _, offset = decode_signed(data, offset, 64)
+                values.append("i64")
+            elif opcode in (0x43, 0x44):
+                offset += 4 if opcode == 0x43 else 8
+                if offset > end:
+                    raise WasmValidationError("float constant runs past the body")
+                values.append("f32" if opcode == 0x43 else "f64")
+            elif opcode == 0x00:
+                unreachable()
+            elif opcode == 0x01:
+                pass
+            elif opcode == 0x1A:
+                pop()
+            elif opcode == 0x1B:
+                pop("i32")
+                first = pop()
+                second = pop(first)
+                values.append(first or second)
+            else:
+                raise WasmValidationError(f"unknown opcode 0x{opcode:02x} at byte {offset - 1}")
+
+        if offset != end:
+            raise WasmValidationError("instructions after the final 'end'")
+
+    def _blocktype(self, offset: int, end: int) -> Tuple[Tuple[str, ...], Tuple[str, ...], int]:
+        code = self._byte(offset, end)
+        if code == _EMPTY_BLOCK:
+            return (), (), offset + 1
+        if code in _TYPE_NAMES:
+            return (), (_TYPE_NAMES[code],), offset + 1
+        index, offset = decode_signed(self.data, offset, 33)
+        if index < 0:
+            raise WasmValidationError(f"invalid block type {index}")
+        params, results = self.types[self._type_index(index)]
+        return params, results, offset
+
+
+def validate_wasm(data: bytes) -> Dict[str, int]:
+    """Validate a binary module; returns section sizes or raises WasmValidationError."""
+    return WasmValidator(data).validate()
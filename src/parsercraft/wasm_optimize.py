@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+WebAssembly Function Optimizer
+
+Cleans up generated ``WasmFunction`` bodies before they are written out.
+Bodies are flattened to one instruction per line (folded expressions are
+unfolded in evaluation order), rewritten, and stored back flat.
+
+Features:
+    - Liveness-based local reuse: locals of the same type whose live ranges
+      never overlap share one slot; unused locals are removed
+    - Dead stores: a ``local.set`` nobody reads becomes ``drop``
+    - Peephole rules:
+        local.set $x; local.get $x      -> local.tee $x
+        local.tee $x; drop              -> local.set $x
+        local.get $x; local.set $x      -> (removed)
+        <const/local.get>; drop         -> (removed)
+        i32.const c; i32.eqz            -> i32.const !c
+        i32.const c; br_if L            -> br L, or nothing when c == 0
+        i32.const c; if ... else ... end -> block with the taken arm
+        code after br/return/unreachable -> (removed up to its block's end)
+    - Instruction and local counts before and after, per function
+
+Usage:
+    from parsercraft.wasm_optimize import WasmOptimizer
+
+    report = WasmOptimizer().optimize_module(module)
+    print(report.format())
+
+    gen = WasmGenerator(optimize=True)   # runs it after generate_from_ast()
+
+A body that cannot be parsed (unknown instruction, unbalanced parentheses)
+is left unchanged and listed in ``report.skipped``.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from .wasm_binary import _TOKEN, OPCODES, WasmEncodingError, _is_label  # shared WAT lexing
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .codegen_wasm import WasmFunction, WasmModule
+
+# One flat instruction: the operator followed by its immediates as WAT text,
+# e.g. ("local.get", "$x") or ("block", "$exit", "(result i32)")
+Instr = Tuple[str, ...]
+
+_BLOCKS = frozenset({"block", "loop", "if"})
+_TERMINATORS = frozenset({"br", "br_table", "return", "unreachable"})
+_PURE = frozenset(
+    {"i32.const", "i64.const", "f32.const", "f64.const", "local.get", "global.get",
+     "memory.size"}
+)
+_LOCAL_OPS = frozenset({"local.get", "local.set", "local.tee"})
+
+
+# === Flattening ===
+
+
+class _Flattener:
+    """Turns WAT instruction text into a flat instruction list."""
+
+    def __init__(self, text: str):
+        self.tokens = [token for token in _TOKEN.findall(text) if token]
+        self.pos = 0
+
+    def run(self) -> List[Instr]:
+        out: List[Instr] = []
+        # What each open "(" emits when it closes: an instruction, "end",
+        # or a folded if ([header, arms seen])
+        pending: List[object] = []
+        while self.pos < len(self.tokens):
+            token = self._next()
+            if token == "(":
+                op = self._next()
+                if op in ("block", "loop"):
+                    out.append(self._block_header(op))
+                    pending.append(("end",))
+                elif op == "if":
+                    pending.append([self._block_header(op), 0])
+                elif op in ("then", "else"):
+                    folded = pending[-1] if pending else None
+                    if not isinstance(folded, list) or folded[1] != (0 if op == "then" else 1):
+                        raise WasmEncodingError(f"misplaced '({op}'")
+                    out.append(folded[0] if op == "then" else ("else",))
+                    folded[1] += 1
+                    pending.append(None)
+                else:
+                    pending.append(self._instruction(op))
+            elif token == ")":
+                if not pending:
+                    raise WasmEncodingError("unbalanced ')'")
+                item = pending.pop()
+                if isinstance(item, tuple):
+                    out.append(item)
+                elif isinstance(item, list):
+                    if not item[1]:
+                        raise WasmEncodingError("folded 'if' without '(then ...)'")
+                    out.append(("end",))
+            elif token in _BLOCKS:
+                out.append(self._block_header(token))
+            elif token in ("else", "end"):
+                self._label()
+                out.append((token,))
+            else:
+                out.append(self._instruction(token))
+        if pending:
+            raise WasmEncodingError("missing ')'")
+        return out
+
+    def _peek(self, ahead: int = 0) -> Optional[str]:
+        index = self.pos + ahead
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise WasmEncodingError("unexpected end of instructions")
+        self.pos += 1
+        return token
+
+    def _atom(self) -> Optional[str]:
+        token = self._peek()
+        if token is None or token in ("(", ")"):
+            return None
+        self.pos += 1
+        return token
+
+    def _label(self) -> Tuple[str, ...]:
+        token = self._peek()
+        if token is not None and token.startswith("$"):
+            self.pos += 1
+            return (token,)
+        return ()
+
+    def _block_header(self, op: str) -> Instr:
+        header = [op, *self._label()]
+        while self._peek() == "(" and self._peek(1) in ("param", "result", "type"):
+            self.pos += 1
+            group = [self._next()]
+            while self._peek() not in (")", None):
+                group.append(self._next())
+            self._next()
+            header.append("(" + " ".join(group) + ")")
+        return tuple(header)
+
+    def _instruction(self, op: str) -> Instr:
+        spec = OPCODES.get(op)
+        if spec is None:
+            raise WasmEncodingError(f"unknown instruction '{op}'")
+        kind = spec[1]
+        if kind is None or kind == "zero":
+            return (op,)
+        if kind in ("labels", "memarg"):
+            immediates = []
+            while (
+                _is_label(self._peek()) if kind == "labels"
+                else (self._peek() or "").startswith(("offset=", "align="))
+            ):
+                immediates.append(self._next())
+            return (op, *immediates)
+        immediate = self._atom()
+        if immediate is None:
+            raise WasmEncodingError(f"'{op}' needs an immediate")
+        return (op, immediate)
+
+
+def flatten_body(body: Sequence[str]) -> List[Instr]:
+    """Flat instruction list of a function body (raises WasmEncodingError)."""
+    return _Flattener("\n".join(body)).run()
+
+
+def _const_value(instr: Instr) -> Optional[int]:
+    """Value of an ``i32.const``, or None."""
+    if instr[0] != "i32.const":
+        return None
+    try:
+        return int(instr[1].replace("_", ""), 0)
+    except ValueError:
+        return None
+
+
+# === Control Flow ===
+
+
+class _ControlFlow:
+    """Successors of each instruction of a flat body.
+
+    Index ``len(instrs)`` stands for the function exit.
+    """
+
+    def __init__(self, instrs: List[Instr]):
+        count = len(instrs)
+        openers: List[Tuple[int, Optional[str]]] = []  # (index, label) of open blocks
+        end_of: Dict[int, int] = {}
+        else_of: Dict[int, int] = {}
+        if_of: Dict[int, int] = {}
+        branches: List[Tuple[int, List[int]]] = []
+
+        for index, instr in enumerate(instrs):
+            op = instr[0]
+            if op in _BLOCKS:
+                label = instr[1] if len(instr) > 1 and instr[1].startswith("$") else None
+                openers.append((index, label))
+            elif op == "else":
+                else_of[openers[-1][0]] = index
+                if_of[index] = openers[-1][0]
+            elif op == "end":
+                if openers:
+                    end_of[openers.pop()[0]] = index
+            elif op in ("br", "br_if", "br_table"):
+                # Targets are opener indices until every end is known
+                branches.append((index, [self._frame(openers, token) for token in instr[1:]]))
+        if openers:
+            raise WasmEncodingError("block without 'end'")
+
+        self.successors: List[Tuple[int, ...]] = []
+        for index, instr in enumerate(instrs):
+            op = instr[0]
+            if op in _TERMINATORS or op == "br_if":
+                self.successors.append(())
+            elif op == "if":
+                skip = else_of[index] + 1 if index in else_of else end_of[index]
+                self.successors.append((index + 1, skip))
+            elif op == "else":
+                self.successors.append((end_of[if_of[index]],))
+            else:
+                self.successors.append((index + 1,))
+
+        for index, frames in branches:
+            targets = [
+                count if start < 0 else start if instrs[start][0] == "loop" else end_of[start] + 1
+                for start in frames
+            ]
+            if instrs[index][0] == "br_if":
+                targets.append(index + 1)
+            self.successors[index] = tuple(targets)
+
+    @staticmethod
+    def _frame(openers: List[Tuple[int, Optional[str]]], token: str) -> int:
+        """Index of the block a label refers to; -1 for the function body."""
+        if token.startswith("$"):
+            for start, label in reversed(openers):
+                if label == token:
+                    return start
+            raise WasmEncodingError(f"unknown label '{token}'")
+        if not token.isdigit():
+            raise WasmEncodingError(f"invalid label '{token}'")
+        depth = int(token)
+        if depth > len(openers):
+            raise WasmEncodingError(f"label depth {depth} out of range")
+        return -1 if depth == len(openers) else openers[-1 - depth][0]
+
+
+# === Local Analysis ===
+
+
+class _Locals:
+    """Local indices of a function, with liveness over a flat body."""
+
+    def __init__(self, func: WasmFunction):
+        self.params = len(func.params)
+        self.names = [name for name, _ in func.params] + [local.name for local in func.locals]
+        self.types = [getattr(kind, "value", kind) for _, kind in func.params] + [
+            getattr(local.wasm_type, "value", local.wasm_type) for local in func.locals
+        ]
+        self.index = {name: position for position, name in enumerate(self.names)}
+
+    def resolve(self, token: str) -> int:
+        if token.startswith("$"):
+            position = self.index.get(token[1:])
+            if position is None:
+                raise WasmEncodingError(f"unknown local '{token}'")
+            return position
+        return int(token)
+
+    def liveness(self, instrs: List[Instr], flow: _ControlFlow) -> Tuple[List[int], List[int]]:
+        """(live-in, live-out) bitsets of locals for every instruction."""
+        count = len(instrs)
+        uses = [0] * count
+        defs = [0] * count
+        for position, instr in enumerate(instrs):
+            if instr[0] in _LOCAL_OPS:
+                bit = 1 << self.resolve(instr[1])
+                if instr[0] == "local.get":
+                    uses[position] = bit
+                else:
+                    defs[position] = bit
+        live_in = [0] * (count + 1)
+        live_out = [0] * count
+        changed = True
+        while changed:
+            changed = False
+            for position in range(count - 1, -1, -1):
+                out = 0
+                for successor in flow.successors[position]:
+                    out |= live_in[successor]
+                live_out[position] = out
+                value = uses[position] | (out & ~defs[position])
+                if value != live_in[position]:
+                    live_in[position] = value
+                    changed = True
+        return live_in, live_out
+
+
+# === Report ===
+
+
+@dataclass
+class FunctionOptimization:
+    """Before/after counts for one function."""
+
+    name: str
+    instructions_before: int
+    instructions_after: int
+    locals_before: int
+    locals_after: int
+
+
+@dataclass
+class WasmOptimizationReport:
+    """Per-function results of one optimizer run."""
+
+    functions: List[FunctionOptimization] = field(default_factory=list)
+    skipped: Dict[str, str] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def instructions_before(self) -> int:
+        return sum(entry.instructions_before for entry in self.functions)
+
+    @property
+    def instructions_after(self) -> int:
+        return sum(entry.instructions_after for entry in self.functions)
+
+    @property
+    def locals_before(self) -> int:
+        return sum(entry.locals_before for entry in self.functions)
+
+    @property
+    def locals_after(self) -> int:
+        return sum(entry.locals_after for entry in self.functions)
+
+    def format(self) -> str:
+        """Human-readable before/after table."""
+        lines = [f"{'function':28} {'instructions':>16} {'locals':>12}"]
+        for entry in self.functions:
+            lines.append(
+                f"{entry.name:28} {entry.instructions_before:7d} -> {entry.instructions_after:5d}"
+                f" {entry.locals_before:5d} -> {entry.locals_after:3d}"
+            )
+        lines.append(
+            f"{'total':28} {self.instructions_before:7d} -> {self.instructions_after:5d}"
+            f" {self.locals_before:5d} -> {self.locals_after:3d}"
+        )
+        for name, reason in self.skipped.items():
+            lines.append(f"{name:28} skipped: {reason}")
+        return "\n".join(lines)
+
+
+# === Optimizer ===
+
+
+class WasmOptimizer:
+    """Peephole and local-reuse optimizer for ``WasmFunction`` bodies."""
+
+    def __init__(self, reuse_locals: bool = True, peephole: bool = True, max_rounds: int = 8):
+        self.reuse_locals = reuse_locals
+        self.peephole = peephole
+        self.max_rounds = max_rounds
+
+    def optimize_module(self, module: WasmModule) -> WasmOptimizationReport:
+        """Optimize every function of ``module`` in place."""
+        report = WasmOptimizationReport()
+        start = time.perf_counter()
+        for func in module.functions.values():
+            try:
+                report.functions.append(self.optimize_function(func))
+            except WasmEncodingError as error:
+                report.skipped[func.name] = str(error)
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def optimize_function(self, func: WasmFunction) -> FunctionOptimization:
+        """Optimize ``func`` in place (raises WasmEncodingError if unparsable)."""
+        instrs = flatten_body(func.body)
+        result = FunctionOptimization(
+            name=func.name,
+            instructions_before=len(instrs),
+            instructions_after=len(instrs),
+            locals_before=len(func.locals),
+            locals_after=len(func.locals),
+        )
+        local_info = _Locals(func)
+
+        for _ in range(self.max_rounds):
+            size = len(instrs)
+            if self.peephole:
+                instrs = self._peephole(instrs)
+                instrs = self._fold_ifs(instrs)
+                instrs = self._remove_unreachable(instrs)
+            instrs, stores = self._remove_dead_stores(instrs, local_info)
+            if len(instrs) == size and not stores:
+                break
+
+        if self.reuse_locals:
+            instrs = self._share_locals(func, instrs, local_info)
+            if self.peephole:
+                instrs = self._peephole(instrs)
+
+        func.body = [" ".join(instr) for instr in instrs]
+        result.instructions_after = len(instrs)
+        result.locals_after = len(func.locals)
+        return result
+
+    # --- Peephole rules ---
+
+    @staticmethod
+    def _peephole(instrs: List[Instr]) -> List[Instr]:
+        """One pass of the local rewrites; ``out`` acts as a stack so rules cascade."""
+        out: List[Instr] = []
+        for instr in instrs:
+            op = instr[0]
+            prev = out[-1] if out else None
+            if prev is not None:
+                prev_op = prev[0]
+                if op == "local.get" and prev_op == "local.set" and prev[1] == instr[1]:
+                    out[-1] = ("local.tee", instr[1])
+                    continue
+                if op == "local.set" and prev_op == "local.get" and prev[1] == instr[1]:
+                    out.pop()
+                    continue
+                if op == "drop" and prev_op in _PURE:
+                    out.pop()
+                    continue
+                if op == "drop" and prev_op == "local.tee":
+                    out[-1] = ("local.set", prev[1])
+                    continue
+                value = _const_value(prev)
+                if value is not None:
+                    if op == "i32.eqz":
+                        out[-1] = ("i32.const", "0" if value else "1")
+                        continue
+                    if op == "br_if":
+                        out.pop()
+                        if value:
+                            out.append(("br", instr[1]))
+                        continue
+            out.append(instr)
+        return out
+
+    @staticmethod
+    def _fold_ifs(instrs: List[Instr]) -> List[Instr]:
+        """``i32.const c; if`` -> a block holding only the arm that runs."""
+        position = 1
+        while position < len(instrs):
+            instr = instrs[position]
+            value = _const_value(instrs[position - 1]) if instr[0] == "if" else None
+            if value is None:
+                position += 1
+                continue
+            depth, middle, end = 0, None, None
+            for scan in range(position + 1, len(instrs)):
+                op = instrs[scan][0]
+                if op in _BLOCKS:
+                    depth += 1
+                elif op == "else" and depth == 0:
+                    middle = scan
+                elif op == "end":
+                    if depth == 0:
+                        end = scan
+                        break
+                    depth -= 1
+            if end is None:
+                raise WasmEncodingError("'if' without 'end'")
+            header = ("block",) + instr[1:]
+            if value:
+                arm = instrs[position + 1 : middle if middle is not None else end]
+            else:
+                arm = instrs[middle + 1 : end] if middle is not None else []
+            replacement = [header, *arm, ("end",)]
+            if not arm and len(header) == 1:
+                replacement = []
+            instrs = instrs[: position - 1] + replacement + instrs[end + 1 :]
+            position = max(position - 1, 1)
+        return instrs
+
+    @staticmethod
+    def _remove_unreachable(instrs: List[Instr]) -> List[Instr]:
+        """Drop code between a br/return/unreachable and the end of its block."""
+        out: List[Instr] = []
+        skipping = False
+        nesting = 0
+        for instr in instrs:
+            op = instr[0]
+            if skipping:
+                if op in _BLOCKS:
+                    nesting += 1
+                    continue
+                if nesting:
+                    if op == "end":
+                        nesting -= 1
+                    continue
+                if op not in ("else", "end"):
+                    continue
+                skipping = False
+            out.append(instr)
+            if op in _TERMINATORS:
+                skipping = True
+                nesting = 0
+        return out
+
+    # --- Liveness-based rewrites ---
+
+    @staticmethod
+    def _remove_dead_stores(
+        instrs: List[Instr], local_info: _Locals
+    ) -> Tuple[List[Instr], int]:
+        """``local.set`` of a value never read -> ``drop``; such a ``local.tee`` goes."""
+        if not any(instr[0] in ("local.set", "local.tee") for instr in instrs):
+            return instrs, 0
+        _, live_out = local_info.liveness(instrs, _ControlFlow(instrs))
+        out: List[Instr] = []
+        removed = 0
+        for position, instr in enumerate(instrs):
+            op = instr[0]
+            if op in ("local.set", "local.tee"):
+                if not live_out[position] >> local_info.resolve(instr[1]) & 1:
+                    removed += 1
+                    if op == "local.set":
+                        out.append(("drop",))
+                    continue
+            out.append(instr)
+        return out, removed
+
+    @staticmethod
+    def _share_locals(func: WasmFunction, instrs: List[Instr], local_info: _Locals) -> List[Instr]:
+        """Give locals with disjoint live ranges (and the same type) one slot."""
+        live_in, live_out = local_info.liveness(instrs, _ControlFlow(instrs))
+        count = len(local_info.names)
+        interference = [0] * count
+        used = 0
+        for position, instr in enumerate(instrs):
+            if instr[0] in _LOCAL_OPS:
+                local = local_info.resolve(instr[1])
+                used |= 1 << local
+                if instr[0] != "local.get":
+                    others = live_out[position] & ~(1 << local)
+                    interference[local] |= others
+                    for other in range(count):
+                        if others >> other & 1:
+                            interference[other] |= 1 << local
+
+        # Locals read before any write rely on zero-initialization: keep them
+        entry = live_in[0] if instrs else 0
+        slots: List[List[int]] = []  # members, first member names the slot
+        slot_of: Dict[int, int] = {}
+        for local in range(local_info.params, count):
+            if not used >> local & 1:
+                continue
+            if not entry >> local & 1:
+                for number, members in enumerate(slots):
+                    first = members[0]
+                    if (
+                        local_info.types[first] == local_info.types[local]
+                        and not entry >> first & 1
+                        and not any(interference[local] >> member & 1 for member in members)
+                    ):
+                        members.append(local)
+                        slot_of[local] = number
+                        break
+            if local not in slot_of:
+                slot_of[local] = len(slots)
+                slots.append([local])
+
+        kept = {slot[0] for slot in slots}
+        func.locals = [
+            local for position, local in enumerate(func.locals, local_info.params)
+            if position in kept
+        ]
+        renamed = {
+            local: "$" + local_info.names[slots[slot][0]] for local, slot in slot_of.items()
+        }
+        return [
+            (instr[0], renamed.get(local_info.resolve(instr[1]), instr[1]))
+            if instr[0] in _LOCAL_OPS else instr
+            for instr in instrs
+        ]
+
+
+def optimize_module(module: WasmModule, **options) -> WasmOptimizationReport:
+    """Run ``WasmOptimizer(**options)`` over ``module`` in place."""
+    return WasmOptimizer(**options).optimize_module(module)
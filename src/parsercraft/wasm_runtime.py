@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+WebAssembly Runtime: Allocator, Strings and Arrays
+
+A small runtime written in WAT and emitted into a ``WasmModule`` next to the
+generated code, so guest programs can build strings and collections in
+linear memory without calling back into the host.
+
+Features:
+    - Arena allocator: bump allocation with per-size-class free lists
+      (16..4096 byte blocks), memory.grow on demand, reset of the whole heap
+    - Length-prefixed strings: new, len, at, concat, slice, eq
+    - Growable arrays of i32 (ints or pointers): new, len, get, set, push,
+      pop, free; capacity doubles when full
+    - Interned string literals laid out once in a data segment
+
+Memory layout:
+    0     heap top (next free byte)
+    4     heap base (first byte after the static data)
+    8     free-list heads, one i32 per size class
+    64    interned literals, then the heap
+
+    A block is [size: i32][payload]; pointers point at the payload. Strings
+    are [length: i32][bytes]; arrays are [length][capacity][elements ptr].
+    Out-of-range indexes trap (``unreachable``).
+
+Usage:
+    from parsercraft.wasm_runtime import WasmRuntime
+
+    runtime = WasmRuntime(module)
+    hello = runtime.intern("hello")        # address of a static string
+    body = [f"(call $rt_str_len (i32.const {hello}))"]
+    runtime.install()                      # functions + data segments
+
+    gen = WasmGenerator()
+    gen.generate_string_literal("hi")      # installs in generate_from_ast()
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Dict, List, Optional
+
+from .codegen_wasm import WasmFunction, WasmLocal, WasmModule, WasmType
+
+HEAP_TOP = 0
+HEAP_BASE = 4
+FREE_LISTS = 8
+STATIC_BASE = 64
+MIN_BLOCK = 16
+SIZE_CLASSES = 9  # 16, 32, ..., 4096 bytes
+PAGE_SIZE = 65536
+
+_I32 = WasmType.I32
+
+
+def _function(
+    name: str, params: str, body: List[str], result: bool = True, local_names: str = ""
+) -> WasmFunction:
+    """An all-i32 runtime function; params and locals are space-separated names."""
+    return WasmFunction(
+        name=name,
+        params=[(param, _I32) for param in params.split()],
+        return_type=_I32 if result else None,
+        locals=[WasmLocal(local, _I32) for local in local_names.split()],
+        body=body,
+    )
+
+
+def _check_index(index: str, length: str) -> str:
+    return f"(if (i32.ge_u {index} {length}) (then unreachable))"
+
+
+def _allocator() -> List[WasmFunction]:
+    free_list = f"offset={FREE_LISTS} (i32.shl (local.get $class) (i32.const 2))"
+    return [
+        _function("rt_size_class", "total", [
+            f"(local.set $size (i32.const {MIN_BLOCK}))",
+            "(block $done",
+            "  (loop $next",
+            f"    (br_if $done (i32.ge_u (local.get $class) (i32.const {SIZE_CLASSES})))",
+            "    (br_if $done (i32.le_u (local.get $total) (local.get $size)))",
+            "    (local.set $size (i32.shl (local.get $size) (i32.const 1)))",
+            "    (local.set $class (i32.add (local.get $class) (i32.const 1)))",
+            "    (br $next)))",
+            f"(if (result i32) (i32.lt_u (local.get $class) (i32.const {SIZE_CLASSES}))",
+            "  (then (local.get $class))",
+            "  (else (i32.const -1)))",
+        ], local_names="class size"),
+        _function("rt_alloc", "size", [
+            "(local.set $total (i32.add (local.get $size) (i32.const 4)))",
+            "(local.set $class (call $rt_size_class (local.get $total)))",
+            "(if (i32.ge_s (local.get $class) (i32.const 0))",
+            "  (then",
+            f"    (local.set $block (i32.load {free_list}))",
+            "    (if (local.get $block)",
+            "      (then",
+            f"        (i32.store {free_list} (i32.load offset=4 (local.get $block)))",
+            "        (return (i32.add (local.get $block) (i32.const 4)))))",
+            f"    (local.set $total (i32.shl (i32.const {MIN_BLOCK}) (local.get $class))))",
+            "  (else",
+            "    (local.set $total (i32.and (i32.add (local.get $total) (i32.const 7)) (i32.const -8)))))",
+            f"(local.set $block (i32.load (i32.const {HEAP_TOP})))",
+            "(local.set $top (i32.add (local.get $block) (local.get $total)))",
+            "(local.set $limit (i32.shl (memory.size) (i32.const 16)))",
+            "(if (i32.gt_u (local.get $top) (local.get $limit))",
+            "  (then",
+            "    (if (i32.lt_s",
+            "          (memory.grow (i32.shr_u",
+            "            (i32.add (i32.sub (local.get $top) (local.get $limit)) (i32.const 65535))",
+            "            (i32.const 16)))",
+            "          (i32.const 0))",
+            "      (then unreachable))))",
+            f"(i32.store (i32.const {HEAP_TOP}) (local.get $top))",
+            "(i32.store (local.get $block) (local.get $total))",
+            "(i32.add (local.get $block) (i32.const 4))",
+        ], local_names="total class block top limit"),
+        _function("rt_free", "ptr", [
+            # Null, static data and big blocks are not recycled
+            f"(if (i32.lt_u (local.get $ptr) (i32.load (i32.const {HEAP_BASE}))) (then (return)))",
+            "(local.set $block (i32.sub (local.get $ptr) (i32.const 4)))",
+            "(local.set $class (call $rt_size_class (i32.load (local.get $block))))",
+            "(if (i32.lt_s (local.get $class) (i32.const 0)) (then (return)))",
+            f"(i32.store (local.get $ptr) (i32.load {free_list}))",
+            f"(i32.store {free_list} (local.get $block))",
+        ], result=False, local_names="block class"),
+        _function("rt_reset", "", [
+            f"(i32.store (i32.const {HEAP_TOP}) (i32.load (i32.const {HEAP_BASE})))",
+        ] + [
+            f"(i32.store (i32.const {FREE_LISTS + 4 * index}) (i32.const 0))"
+            for index in range(SIZE_CLASSES)
+        ], result=False),
+        _function("rt_copy", "dst src n", [
+            "(block $words",
+            "  (loop $word",
+            "    (br_if $words (i32.gt_u (i32.add (local.get $i) (i32.const 4)) (local.get $n)))",
+            "    (i32.store (i32.add (local.get $dst) (local.get $i))",
+            "               (i32.load (i32.add (local.get $src) (local.get $i))))",
+            "    (local.set $i (i32.add (local.get $i) (i32.const 4)))",
+            "    (br $word)))",
+            "(block $done",
+            "  (loop $byte",
+            "    (br_if $done (i32.ge_u (local.get $i) (local.get $n)))",
+            "    (i32.store8 (i32.add (local.get $dst) (local.get $i))",
+            "                (i32.load8_u (i32.add (local.get $src) (local.get $i))))",
+            "    (local.set $i (i32.add (local.get $i) (i32.const 1)))",
+            "    (br $byte)))",
+        ], result=False, local_names="i"),
+    ]
+
+
+def _strings() -> List[WasmFunction]:
+    return [
+        _function("rt_str_new", "length", [
+            "(local.set $s (call $rt_alloc (i32.add (local.get $length) (i32.const 4))))",
+            "(i32.store (local.get $s) (local.get $length))",
+            "(local.get $s)",
+        ], local_names="s"),
+        _function("rt_str_len", "s", ["(i32.load (local.get $s))"]),
+        _function("rt_str_at", "s i", [
+            _check_index("(local.get $i)", "(i32.load (local.get $s))"),
+            "(i32.load8_u offset=4 (i32.add (local.get $s) (local.get $i)))",
+        ]),
+        _function("rt_str_concat", "a b", [
+            "(local.set $la (i32.load (local.get $a)))",
+            "(local.set $lb (i32.load (local.get $b)))",
+            "(local.set $r (call $rt_str_new (i32.add (local.get $la) (local.get $lb))))",
+            "(call $rt_copy (i32.add (local.get $r) (i32.const 4))",
+            "               (i32.add (local.get $a) (i32.const 4)) (local.get $la))",
+            "(call $rt_copy (i32.add (i32.add (local.get $r) (i32.const 4)) (local.get $la))",
+            "               (i32.add (local.get $b) (i32.const 4)) (local.get $lb))",
+            "(local.get $r)",
+        ], local_names="la lb r"),
+        _function("rt_str_slice", "s start end", [
+            "(if (i32.gt_u (local.get $start) (local.get $end)) (then unreachable))",
+            "(if (i32.gt_u (local.get $end) (i32.load (local.get $s))) (then unreachable))",
+            "(local.set $r (call $rt_str_new (i32.sub (local.get $end) (local.get $start))))",
+            "(call $rt_copy (i32.add (local.get $r) (i32.const 4))",
+            "               (i32.add (i32.add (local.get $s) (i32.const 4)) (local.get $start))",
+            "               (i32.sub (local.get $end) (local.get $start)))",
+            "(local.get $r)",
+        ], local_names="r"),
+        _function("rt_str_eq", "a b", [
+            "(if (i32.eq (local.get $a) (local.get $b)) (then (return (i32.const 1))))",
+            "(local.set $n (i32.load (local.get $a)))",
+            "(if (i32.ne (local.get $n) (i32.load (local.get $b))) (then (return (i32.const 0))))",
+            "(block $done",
+            "  (loop $next",
+            "    (br_if $done (i32.ge_u (local.get $i) (local.get $n)))",
+            "    (if (i32.ne (i32.load8_u offset=4 (i32.add (local.get $a) (local.get $i)))",
+            "                (i32.load8_u offset=4 (i32.add (local.get $b) (local.get $i))))",
+            "      (then (return (i32.const 0))))",
+            "    (local.set $i (i32.add (local.get $i) (i32.const 1)))",
+            "    (br $next)))",
+            "(i32.const 1)",
+        ], local_names="n i"),
+    ]
+
+
+def _arrays() -> List[WasmFunction]:
+    element = "(i32.add (i32.load offset=8 (local.get $a)) (i32.shl (local.get $i) (i32.const 2)))"
+    return [
+        _function("rt_arr_new", "capacity", [
+            "(if (i32.lt_u (local.get $capacity) (i32.const 4))",
+            "  (then (local.set $capacity (i32.const 4))))",
+            "(local.set $a (call $rt_alloc (i32.const 12)))",
+            "(i32.store (local.get $a) (i32.const 0))",
+            "(i32.store offset=4 (local.get $a) (local.get $capacity))",
+            "(i32.store offset=8 (local.get $a)",
+            "  (call $rt_alloc (i32.shl (local.get $capacity) (i32.const 2))))",
+            "(local.get $a)",
+        ], local_names="a"),
+        _function("rt_arr_len", "a", ["(i32.load (local.get $a))"]),
+        _function("rt_arr_get", "a i", [
+            _check_index("(local.get $i)", "(i32.load (local.get $a))"),
+            f"(i32.load {element})",
+        ]),
+        _function("rt_arr_set", "a i value", [
+            _check_index("(local.get $i)", "(i32.load (local.get $a))"),
+            f"(i32.store {element} (local.get $value))",
+        ], result=False),
+        _function("rt_arr_push", "a value", [
+            "(local.set $i (i32.load (local.get $a)))",
+            "(local.set $capacity (i32.load offset=4 (local.get $a)))",
+            "(if (i32.eq (local.get $i) (local.get $capacity))",
+            "  (then",
+            "    (local.set $data (call $rt_alloc (i32.shl (local.get $capacity) (i32.const 3))))",
+            "    (call $rt_copy (local.get $data) (i32.load offset=8 (local.get $a))",
+            "                   (i32.shl (local.get $i) (i32.const 2)))",
+            "    (call $rt_free (i32.load offset=8 (local.get $a)))",
+            "    (i32.store offset=8 (local.get $a) (local.get $data))",
+            "    (i32.store offset=4 (local.get $a) (i32.shl (local.get $capacity) (i32.const 1)))))",
+            f"(i32.store {element} (local.get $value))",
+            "(i32.store (local.get $a) (i32.add (local.get $i) (i32.const 1)))",
+        ], result=False, local_names="i capacity data"),
+        _function("rt_arr_pop", "a", [
+            "(local.set $i (i32.load (local.get $a)))",
+            "(if (i32.eqz (local.get $i)) (then unreachable))",
+            "(local.set $i (i32.sub (local.get $i) (i32.const 1)))",
+            "(i32.store (local.get $a) (local.get $i))",
+            f"(i32.load {element})",
+        ], local_names="i"),
+        _function("rt_arr_free", "a", [
+            "(call $rt_free (i32.load offset=8 (local.get $a)))",
+            "(call $rt_free (local.get $a))",
+        ], result=False),
+    ]
+
+
+def runtime_functions() -> List[WasmFunction]:
+    """Fresh copies of every runtime function."""
+    return _allocator() + _strings() + _arrays()
+
+
+class WasmRuntime:
+    """Installs the runtime into one module and interns its string literals."""
+
+    def __init__(self, module: WasmModule, export: bool = False):
+        self.module = module
+        self.export = export
+        self.literals: Dict[str, int] = {}  # text -> address
+        self.static = bytearray()  # literal bytes from STATIC_BASE on
+        self.installed_size: Optional[int] = None  # len(static) at the last install
+
+    @property
+    def heap_base(self) -> int:
+        end = STATIC_BASE + len(self.static)
+        return (end + 7) & ~7
+
+    def intern(self, text: str) -> int:
+        """Address of a length-prefixed static copy of ``text`` (UTF-8)."""
+        address = self.literals.get(text)
+        if address is None:
+            data = text.encode("utf-8")
+            address = STATIC_BASE + len(self.static)
+            self.static += struct.pack("<I", len(data)) + data
+            self.static += bytes(-len(self.static) % 4)
+            self.literals[text] = address
+        return address
+
+    def install(self) -> None:
+        """Add the runtime functions and data segments.
+
+        Idempotent: a repeated call does nothing, unless literals were
+        interned since the last one. In that case it rewrites this
+        runtime's two segments (they are keyed by address, so nothing is
+        added twice).
+        """
+        if self.installed_size == len(self.static):
+            return
+        self.installed_size = len(self.static)
+        for func in runtime_functions():
+            if func.name not in self.module.functions:
+                func.is_export = self.export
+                self.module.add_function(func)
+        heap_base = self.heap_base
+        self.module.add_data(HEAP_TOP, struct.pack("<II", heap_base, heap_base))
+        if self.static:
+            self.module.add_data(STATIC_BASE, bytes(self.static))
+        pages = -(-heap_base // PAGE_SIZE)
+        if self.module.memory_size < pages:
+            self.module.set_memory_size(pages)
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+File Watching for ParserCraft Commands
+
+Keeps a language configuration warm in a single process and re-runs work
+whenever source files change on disk.
+
+Features:
+    - Stat-based change detection (no inotify or external services needed)
+    - Directory scanning with glob patterns
+    - Reverse module dependency graph built from import statements
+    - Minimal re-processing: changed files plus their dependents
+
+Usage:
+    from parsercraft.watch import DependencyGraph, StatScanner, watch_loop
+
+    scanner = StatScanner(files=[config_path], directories=[(src_dir, "*.lang")])
+    graph = DependencyGraph(config)
+    graph.update_many(scanner.files())
+
+    def on_change(changes):
+        for path in graph.dependents(changes.changed):
+            rebuild(path)
+
+    watch_loop(scanner, on_change)
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .module_system import ModuleLoader
+
+
+@dataclass(frozen=True)
+class FileStamp:
+    """Cheap identity of a file's contents taken from ``os.stat``."""
+
+    mtime_ns: int
+    size: int
+
+    @classmethod
+    def from_stat(cls, stat_result: os.stat_result) -> FileStamp:
+        """Build a stamp from a stat result."""
+        return cls(stat_result.st_mtime_ns, stat_result.st_size)
+
+
+@dataclass
+class ChangeSet:
+    """Files that changed between two scans."""
+
+    added: Set[Path] = field(default_factory=set)
+    modified: Set[Path] = field(default_factory=set)
+    removed: Set[Path] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+    @property
+    def changed(self) -> Set[Path]:
+        """Files that exist and have new content (added or modified)."""
+        return self.added | self.modified
+
+    @property
+    def touched(self) -> Set[Path]:
+        """Every path involved in the change, including removals."""
+        return self.added | self.modified | self.removed
+
+    def describe(self) -> str:
+        """Short human-readable summary."""
+        parts = []
+        for label, paths in (
+            ("added", self.added),
+            ("modified", self.modified),
+            ("removed", self.removed),
+        ):
+            if paths:
+                names = ", ".join(sorted(p.name for p in paths))
+                parts.append(f"{label}: {names}")
+        return "; ".join(parts) if parts else "no changes"
+
+
+class StatScanner:
+    """Detects file changes by comparing ``stat`` results between polls.
+
+    Individual files and (directory, glob pattern) pairs can be watched.
+    Simple patterns are matched with ``os.scandir`` so a poll costs one
+    directory listing plus one stat per matching entry.
+    """
+
+    def __init__(
+        self,
+        files: Iterable[Path] = (),
+        directories: Iterable[Tuple[Path, str]] = (),
+    ):
+        self._files: Set[Path] = {Path(p) for p in files}
+        self._directories: List[Tuple[Path, str]] = [
+            (Path(d), pattern) for d, pattern in directories
+        ]
+        self._stamps: Dict[Path, FileStamp] = self.snapshot()
+
+    def add_file(self, path: Path) -> None:
+        """Start watching an additional file."""
+        path = Path(path)
+        if path in self._files:
+            return
+        self._files.add(path)
+        stamp = self._stat(path)
+        if stamp is not None:
+            self._stamps[path] = stamp
+
+    def add_directory(self, directory: Path, pattern: str) -> List[Path]:
+        """Start watching a directory; return the files it currently holds."""
+        entry = (Path(directory), pattern)
+        if entry in self._directories:
+            return []
+        self._directories.append(entry)
+        found = self._scan_directory(*entry)
+        new_files = [path for path in found if path not in self._stamps]
+        self._stamps.update(found)
+        return sorted(new_files)
+
+    def files(self) -> List[Path]:
+        """Files present in the most recent snapshot."""
+        return sorted(self._stamps)
+
+    def snapshot(self) -> Dict[Path, FileStamp]:
+        """Stat every watched path."""
+        stamps: Dict[Path, FileStamp] = {}
+
+        for path in self._files:
+            stamp = self._stat(path)
+            if stamp is not None:
+                stamps[path] = stamp
+
+        for directory, pattern in self._directories:
+            stamps.update(self._scan_directory(directory, pattern))
+
+        return stamps
+
+    def poll(self) -> ChangeSet:
+        """Rescan and return what changed since the previous poll."""
+        current = self.snapshot()
+        previous = self._stamps
+
+        changes = ChangeSet()
+        for path, stamp in current.items():
+            old = previous.get(path)
+            if old is None:
+                changes.added.add(path)
+            elif old != stamp:
+                changes.modified.add(path)
+        changes.removed = set(previous) - set(current)
+
+        self._stamps = current
+        return changes
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[FileStamp]:
+        try:
+            return FileStamp.from_stat(os.stat(path))
+        except OSError:
+            return None
+
+    @staticmethod
+    def _scan_directory(directory: Path, pattern: str) -> Dict[Path, FileStamp]:
+        stamps: Dict[Path, FileStamp] = {}
+
+        if "/" in pattern or os.sep in pattern or "**" in pattern:
+            # Recursive patterns: defer to pathlib for matching
+            for path in directory.glob(pattern):
+                if path.is_file():
+                    stamp = StatScanner._stat(path)
+                    if stamp is not None:
+                        stamps[path] = stamp
+            return stamps
+
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return stamps
+
+        with entries:
+            for entry in entries:
+                if not fnmatch.fnmatch(entry.name, pattern):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stamps[directory / entry.name] = FileStamp.from_stat(entry.stat())
+                except OSError:
+                    continue
+
+        return stamps
+
+
+class DependencyGraph:
+    """Reverse import graph over a set of source files.
+
+    Module names are file stems, matching how ``ModuleManager`` resolves
+    ``import name`` statements.
+    """
+
+    def __init__(self, config: Any):
+        self.loader = ModuleLoader(config)
+        self.imports: Dict[Path, Set[str]] = {}
+        self.by_name: Dict[str, Path] = {}
+
+    def update(self, path: Path) -> None:
+        """(Re)read the imports of a single file."""
+        path = Path(path)
+        try:
+            module = self.loader.load_file(path)
+        except (FileNotFoundError, IOError):
+            self.remove(path)
+            return
+
+        self.imports[path] = {dep.module_name for dep in module.dependencies}
+        self.by_name[path.stem] = path
+
+    def update_many(self, paths: Iterable[Path]) -> None:
+        """Refresh imports for several files."""
+        for path in paths:
+            self.update(path)
+
+    def remove(self, path: Path) -> None:
+        """Forget a deleted file."""
+        path = Path(path)
+        self.imports.pop(path, None)
+        if self.by_name.get(path.stem) == path:
+            del self.by_name[path.stem]
+
+    def apply(self, changes: ChangeSet) -> None:
+        """Bring the graph up to date with a change set."""
+        for path in changes.removed:
+            self.remove(path)
+        self.update_many(changes.changed)
+
+    def dependents(self, paths: Iterable[Path]) -> Set[Path]:
+        """Return ``paths`` plus every file that transitively imports them."""
+        importers: Dict[str, Set[Path]] = {}
+        for importer, names in self.imports.items():
+            for name in names:
+                importers.setdefault(name, set()).add(importer)
+
+        affected: Set[Path] = set()
+        pending = [Path(p) for p in paths]
+        while pending:
+            current = pending.pop()
+            if current in affected:
+                continue
+            affected.add(current)
+            pending.extend(importers.get(current.stem, ()))
+
+        return affected
+
+
+def watch_loop(
+    scanner: StatScanner,
+    on_change: Callable[[ChangeSet], None],
+    interval: float = 0.5,
+    max_cycles: Optional[int] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """Poll ``scanner`` until interrupted, calling ``on_change`` on changes.
+
+    Args:
+        scanner: Scanner holding the watched paths
+        on_change: Callback receiving each non-empty change set
+        interval: Seconds between polls
+        max_cycles: Stop after this many polls (None = run until Ctrl+C)
+        sleep: Sleep function (injectable for embedding)
+
+    Returns:
+        Process exit code (always 0)
+    """
+    print(f"\nWatching for changes every {interval:g}s (Ctrl+C to stop)...")
+
+    cycles = 0
+    try:
+        while max_cycles is None or cycles < max_cycles:
+            sleep(interval)
+            cycles += 1
+
+            changes = scanner.poll()
+            if not changes:
+                continue
+
+            print(f"\n[watch] {changes.describe()}")
+            start = time.perf_counter()
+            on_change(changes)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"[watch] Rebuilt in {elapsed:.1f} ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+    return 0